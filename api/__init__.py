@@ -0,0 +1,87 @@
+"""
+API Package - Flask JSON API over the service layer
+Lets several storefronts and terminals share one backend; run it under the
+pre-fork server in api/server.py (python -m api.server)
+"""
+import os
+import secrets
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
+
+from services.pagination import InvalidPageToken
+
+
+class ServiceJSONProvider(DefaultJSONProvider):
+    """JSON for service rows: ISO dates, Decimals as numbers"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, (datetime, date)):
+            return o.isoformat()
+        if isinstance(o, Decimal):
+            return float(o)
+        if isinstance(o, timedelta):
+            return o.total_seconds()
+        return DefaultJSONProvider.default(o)
+
+
+def api_secret(debug=False):
+    """Token signing key from GROCERY_API_SECRET
+
+    Every worker must sign with the same key, and a known default would let
+    anyone forge staff tokens, so without it this raises RuntimeError - except
+    for debug/testing, which get a random per-process key.
+    """
+    secret = os.environ.get('GROCERY_API_SECRET')
+    if secret:
+        return secret
+    if not debug:
+        raise RuntimeError("GROCERY_API_SECRET is not set - refusing to start without a token signing key")
+    print("GROCERY_API_SECRET not set - using a random key (debug/testing only)")
+    return secrets.token_hex(32)
+
+
+def create_app(config=None):
+    """Create the Flask application (one per worker process)"""
+    app = Flask(__name__)
+    app.json = ServiceJSONProvider(app)
+    app.config['TOKEN_MAX_AGE'] = int(os.environ.get('GROCERY_API_TOKEN_MAX_AGE', 12 * 3600))
+    if config:
+        app.config.update(config)
+    if not app.config.get('SECRET_KEY'):
+        app.config['SECRET_KEY'] = api_secret(app.debug or app.testing)
+
+    from .auth import bp as auth_bp
+    from .catalog import bp as catalog_bp
+    from .orders import bp as orders_bp
+    from .inventory import bp as inventory_bp
+    from .payments import bp as payments_bp
+
+    for blueprint in (auth_bp, catalog_bp, orders_bp, inventory_bp, payments_bp):
+        app.register_blueprint(blueprint, url_prefix='/api')
+
+    @app.errorhandler(HTTPException)
+    def http_error(e):
+        return jsonify(error=e.description), e.code
+
+    @app.errorhandler(InvalidPageToken)
+    def bad_page_token(e):
+        return jsonify(error=str(e)), 400
+
+    @app.errorhandler(Exception)
+    def server_error(e):
+        print(f"API error: {e}")
+        return jsonify(error="Internal server error"), 500
+
+    @app.get('/api/health')
+    def health():
+        return jsonify(status='ok')
+
+    return app
+
+
+__all__ = ['create_app', 'api_secret']
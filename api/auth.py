@@ -0,0 +1,203 @@
+"""
+Auth Endpoints - Login, registration and bearer tokens
+Tokens are signed (itsdangerous, shipped with Flask) rather than stored, so
+any worker process can verify them without a session table
+"""
+from datetime import date
+from functools import wraps
+
+from flask import Blueprint, abort, current_app, g, jsonify, request
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+
+from services import UserService
+
+from .serializers import STAFF_FIELDS, USER_FIELDS, to_dict
+
+bp = Blueprint('auth', __name__)
+
+
+# ==================== TOKENS ====================
+
+def _serializer():
+    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt='grocery-api-token')
+
+
+def issue_token(kind, account_id, role=None):
+    """Signed bearer token for a customer or staff account"""
+    return _serializer().dumps({'kind': kind, 'id': account_id, 'role': role})
+
+
+def _token_claims():
+    header = request.headers.get('Authorization', '')
+    if not header.startswith('Bearer '):
+        abort(401, "Missing bearer token")
+    try:
+        return _serializer().loads(header[len('Bearer '):],
+                                   max_age=current_app.config['TOKEN_MAX_AGE'])
+    except SignatureExpired:
+        abort(401, "Token expired")
+    except BadSignature:
+        abort(401, "Invalid token")
+
+
+def customer_required(view):
+    """Endpoint for logged-in customers; sets g.user_id"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        claims = _token_claims()
+        if claims.get('kind') != 'customer':
+            abort(403, "Customer account required")
+        g.user_id = claims['id']
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def staff_required(*roles):
+    """Endpoint for staff (optionally only the given roles); sets g.staff_id and g.role"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            claims = _token_claims()
+            if claims.get('kind') != 'staff' or (roles and claims.get('role') not in roles):
+                abort(403, "Staff account required")
+            g.staff_id = claims['id']
+            g.role = claims.get('role')
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def json_body(*required):
+    """Request JSON object; 400 if it is missing any of the required fields"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        abort(400, "Expected a JSON object")
+    missing = [field for field in required if data.get(field) in (None, '')]
+    if missing:
+        abort(400, f"Missing fields: {', '.join(missing)}")
+    return data
+
+
+def int_field(data, field, minimum=None, default=None):
+    """data[field] as an int (default if absent); 400 if it is not a whole number"""
+    value = data.get(field, default)
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        value = None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        abort(400, f"{field} must be a whole number")
+    if minimum is not None and number < minimum:
+        abort(400, f"{field} must be at least {minimum}")
+    return number
+
+
+def number_field(data, field, minimum=0):
+    """data[field] as a finite float; 400 otherwise"""
+    value = data.get(field)
+    try:
+        if isinstance(value, bool):
+            raise ValueError
+        number = float(value)
+    except (TypeError, ValueError):
+        abort(400, f"{field} must be a number")
+    if number != number or number in (float('inf'), float('-inf')) or number < minimum:
+        abort(400, f"{field} must be a number of at least {minimum}")
+    return number
+
+
+def date_field(data, field):
+    """data[field] as a YYYY-MM-DD string, or None when absent; 400 if malformed"""
+    value = data.get(field)
+    if value in (None, ''):
+        return None
+    try:
+        return date.fromisoformat(str(value)).isoformat()
+    except ValueError:
+        abort(400, f"{field} must be a date (YYYY-MM-DD)")
+
+
+def flag(value):
+    """Boolean from JSON or a query string: true/1/yes/on (any case) are true, anything else false"""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# ==================== ENDPOINTS ====================
+
+@bp.post('/auth/login')
+def login():
+    data = json_body('username', 'password')
+    user = UserService.login_user(data['username'], data['password'])
+    if not user:
+        abort(401, "Invalid credentials")
+    return jsonify(token=issue_token('customer', user[0]), user=to_dict(user, USER_FIELDS))
+
+
+@bp.post('/auth/staff/login')
+def staff_login():
+    data = json_body('username', 'password')
+    staff = UserService.login_staff(data['username'], data['password'])
+    if not staff:
+        abort(401, "Invalid credentials")
+    return jsonify(token=issue_token('staff', staff[0], UserService.get_staff_role(staff)),
+                   staff=to_dict(staff, STAFF_FIELDS))
+
+
+@bp.post('/auth/register')
+def register():
+    data = json_body('username', 'password', 'email')
+    success, result = UserService.register_user(
+        data['username'], data['password'], data['email'],
+        data.get('full_name', ''), data.get('phone', ''), data.get('address', ''))
+    if not success:
+        abort(409, result)
+    return jsonify(user_id=result), 201
+
+
+@bp.post('/auth/password')
+@customer_required
+def change_password():
+    data = json_body('old_password', 'new_password')
+    success, msg = UserService.change_password(g.user_id, data['old_password'], data['new_password'])
+    if not success:
+        abort(400, msg)
+    return jsonify(message=msg)
+
+
+@bp.get('/me')
+@customer_required
+def me():
+    return jsonify(to_dict(UserService.get_user_info(g.user_id), USER_FIELDS))
+
+
+@bp.put('/me')
+@customer_required
+def update_me():
+    data = json_body('full_name', 'phone', 'address')
+    UserService.update_user_profile(g.user_id, data['full_name'], data['phone'], data['address'])
+    if data.get('username'):
+        success, msg = UserService.update_username(g.user_id, data['username'])
+        if not success:
+            abort(409, msg)
+    return jsonify(to_dict(UserService.get_user_info(g.user_id), USER_FIELDS))
+
+
+@bp.get('/staff')
+@staff_required('admin')
+def list_staff():
+    fields = ('staff_id', 'username', 'email', 'full_name', 'phone', 'role', 'is_active', 'created_at')
+    return jsonify([dict(zip(fields, row)) for row in UserService.get_all_staff()])
+
+
+@bp.post('/staff')
+@staff_required('admin')
+def add_staff():
+    data = json_body('username', 'password', 'email', 'full_name')
+    success, result = UserService.register_staff(data['username'], data['password'], data['email'],
+                                                 data['full_name'], data.get('phone', ''),
+                                                 data.get('role', 'staff'))
+    if not success:
+        abort(409, result)
+    return jsonify(staff_id=result), 201
@@ -0,0 +1,173 @@
+"""
+Catalog Endpoints - Categories, products, search and best sellers
+Reads are public; product writes need a staff token. Catalog reads carry an
+ETag and Last-Modified from the catalog version, so clients revalidating with
+If-None-Match / If-Modified-Since get a 304 without the rows being read.
+"""
+from datetime import timezone
+
+from flask import Blueprint, abort, current_app, jsonify, request
+
+from services import ProductService
+
+from .auth import flag, int_field, json_body, number_field, staff_required
+from .serializers import (BEST_SELLER_FIELDS, CATEGORY_COUNT_FIELDS, CATEGORY_FIELDS,
+                          CATEGORY_PRODUCT_FIELDS, PRODUCT_DETAIL_FIELDS, PRODUCT_FIELDS,
+                          to_dict, to_list)
+
+bp = Blueprint('catalog', __name__)
+
+MAX_PRODUCT_PAGE = 200
+
+
+# ==================== CONDITIONAL GET ====================
+
+def conditional(version, build):
+    """Answer 304 if the client's copy matches version, else build() the response
+
+    version comes from ProductService.get_*_version() and must be read before
+    the rows build() serves, so the etag is never newer than the body.
+    """
+    etag, last_modified = version
+    if last_modified is not None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    if request.if_none_match:
+        fresh = request.if_none_match.contains(etag)
+    elif request.if_modified_since and last_modified is not None:
+        fresh = last_modified.replace(microsecond=0) <= request.if_modified_since
+    else:
+        fresh = False
+    response = current_app.response_class(status=304) if fresh else build()
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.no_cache = True  # cache, but revalidate every time
+    return response
+
+
+# ==================== READS ====================
+
+@bp.get('/categories')
+def categories():
+    with_counts = flag(request.args.get('with_counts', ''))
+    if with_counts:
+        build = lambda: jsonify(to_list(ProductService.get_categories_with_count(), CATEGORY_COUNT_FIELDS))
+    else:
+        build = lambda: jsonify(to_list(ProductService.get_all_categories(), CATEGORY_FIELDS))
+    return conditional(ProductService.get_categories_version(with_counts), build)
+
+
+@bp.get('/products')
+def products():
+    """Available products, optionally in one category: ?category_id=&offset=&limit="""
+    category_id = request.args.get('category_id', type=int)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = min(max(request.args.get('limit', 60, type=int), 1), MAX_PRODUCT_PAGE)
+    return conditional(ProductService.get_catalog_version(category_id), lambda: jsonify(
+        total=ProductService.count_products(category_id),
+        offset=offset,
+        products=to_list(ProductService.get_products_page(category_id, offset, limit), PRODUCT_FIELDS),
+    ))
+
+
+@bp.get('/products/search')
+def search():
+    term = request.args.get('q', '').strip()
+    if not term:
+        abort(400, "Missing search term (q)")
+    return conditional(ProductService.get_catalog_version(),
+                       lambda: jsonify(to_list(ProductService.search_products(term), PRODUCT_FIELDS)))
+
+
+@bp.get('/products/<int:product_id>')
+def product_detail(product_id):
+    version = ProductService.get_product_version(product_id)
+    if version is None:
+        abort(404, "Product not found")
+    return conditional(version, lambda: jsonify(
+        to_dict(ProductService.get_product_details(product_id), PRODUCT_DETAIL_FIELDS)))
+
+
+@bp.get('/categories/<int:category_id>/products')
+def category_products(category_id):
+    """In-stock products of a category, keyset paged: ?page_token=&page_size="""
+    def build():
+        rows, next_token = ProductService.get_products_in_category_page(
+            category_id, request.args.get('page_token'), request.args.get('page_size', type=int))
+        return jsonify(products=to_list(rows, CATEGORY_PRODUCT_FIELDS), next_token=next_token)
+    return conditional(ProductService.get_catalog_version(category_id), build)
+
+
+@bp.get('/best-sellers')
+def best_sellers():
+    window = request.args.get('window', '30d')
+    if window not in ('7d', '30d', 'lifetime'):
+        abort(400, "window must be 7d, 30d or lifetime")
+    rows = ProductService.get_best_sellers(window, min(request.args.get('limit', 20, type=int), 100),
+                                           request.args.get('category_id', type=int))
+    return jsonify(to_list(rows, BEST_SELLER_FIELDS))
+
+
+# ==================== WRITES (STAFF) ====================
+
+PRODUCT_WRITE_FIELDS = ('name', 'category_id', 'unit_price', 'unit', 'stock_quantity')
+
+
+def product_write_body():
+    """Validated product fields for add/update"""
+    data = json_body(*PRODUCT_WRITE_FIELDS)
+    data['category_id'] = int_field(data, 'category_id')
+    data['unit_price'] = number_field(data, 'unit_price')
+    data['stock_quantity'] = int_field(data, 'stock_quantity', minimum=0)
+    data['min_stock_level'] = int_field(data, 'min_stock_level', minimum=0, default=5)
+    return data
+
+
+@bp.post('/products')
+@staff_required()
+def add_product():
+    data = product_write_body()
+    product_id = ProductService.add_product(
+        data['name'], data['category_id'], data.get('description', ''), data.get('image_path'),
+        data['unit_price'], data['unit'], data['stock_quantity'], data['min_stock_level'])
+    return jsonify(product_id=product_id), 201
+
+
+@bp.put('/products/<int:product_id>')
+@staff_required()
+def update_product(product_id):
+    data = product_write_body()
+    ProductService.update_product(
+        product_id, data['name'], data['category_id'], data.get('description', ''),
+        data.get('image_path'), data['unit_price'], data['unit'], data['stock_quantity'],
+        data['min_stock_level'])
+    return jsonify(to_dict(ProductService.get_product_details(product_id), PRODUCT_DETAIL_FIELDS))
+
+
+@bp.delete('/products/<int:product_id>')
+@staff_required('admin', 'manager')
+def delete_product(product_id):
+    ProductService.delete_product(product_id)
+    return '', 204
+
+
+@bp.post('/products/<int:product_id>/availability')
+@staff_required()
+def set_availability(product_id):
+    data = json_body('is_available')
+    ProductService.toggle_product_availability(product_id, flag(data['is_available']))
+    return '', 204
+
+
+@bp.post('/products/<int:product_id>/stock')
+@staff_required()
+def adjust_stock(product_id):
+    data = json_body('quantity_change')
+    ProductService.update_product_stock(product_id, int_field(data, 'quantity_change'))
+    return '', 204
+
+
+@bp.get('/products/low-stock')
+@staff_required()
+def low_stock():
+    return jsonify([list(row) for row in ProductService.get_low_stock_products()])
@@ -0,0 +1,78 @@
+"""
+Inventory Endpoints - Batches, expiry tracking and dashboard figures (staff only)
+"""
+from flask import Blueprint, abort, g, jsonify, request
+
+from services import DashboardService, InventoryService, ProductService
+
+from .auth import date_field, int_field, json_body, number_field, staff_required
+from .serializers import (EXPIRED_FIELDS, EXPIRING_FIELDS, INVENTORY_FIELDS, PRODUCT_BATCH_FIELDS,
+                          to_list)
+
+bp = Blueprint('inventory', __name__)
+
+
+@bp.get('/inventory')
+@staff_required()
+def inventory():
+    """All batches, soonest expiry first, keyset paged: ?page_token=&page_size="""
+    rows, next_token = InventoryService.get_inventory_page(request.args.get('page_token'),
+                                                           request.args.get('page_size', type=int))
+    return jsonify(batches=to_list(rows, INVENTORY_FIELDS), next_token=next_token)
+
+
+@bp.get('/products/<int:product_id>/inventory')
+@staff_required()
+def product_inventory(product_id):
+    return jsonify(to_list(InventoryService.get_product_inventory(product_id), PRODUCT_BATCH_FIELDS))
+
+
+@bp.post('/inventory')
+@staff_required()
+def add_batch():
+    data = json_body('product_id', 'quantity_received', 'purchase_price', 'received_date')
+    product_id = int_field(data, 'product_id')
+    quantity_received = int_field(data, 'quantity_received', minimum=1)
+    purchase_price = number_field(data, 'purchase_price')
+    received_date, expiry_date = date_field(data, 'received_date'), date_field(data, 'expiry_date')
+    if not ProductService.get_product_details(product_id):
+        abort(404, "Product not found")
+    inventory_id = InventoryService.add_inventory_batch(
+        product_id, quantity_received, purchase_price, data.get('supplier_name', ''),
+        received_date, expiry_date, g.staff_id, data.get('batch_number', ''), data.get('notes', ''))
+    return jsonify(inventory_id=inventory_id), 201
+
+
+@bp.post('/inventory/<int:inventory_id>/quantity')
+@staff_required()
+def adjust_batch(inventory_id):
+    InventoryService.update_inventory_quantity(inventory_id,
+                                               int_field(json_body('quantity_change'), 'quantity_change'))
+    return '', 204
+
+
+@bp.get('/inventory/expiring')
+@staff_required()
+def expiring():
+    days = min(max(request.args.get('days', 7, type=int), 0), 365)
+    return jsonify(to_list(InventoryService.get_expiring_soon(days), EXPIRING_FIELDS))
+
+
+@bp.get('/inventory/expired')
+@staff_required()
+def expired():
+    return jsonify(to_list(InventoryService.get_expired_inventory(), EXPIRED_FIELDS))
+
+
+@bp.post('/inventory/<int:inventory_id>/dispose')
+@staff_required('admin', 'manager')
+def dispose(inventory_id):
+    if not InventoryService.dispose_expired_inventory(inventory_id):
+        abort(404, "Batch not found")
+    return '', 204
+
+
+@bp.get('/dashboard')
+@staff_required()
+def dashboard():
+    return jsonify(DashboardService.get_dashboard_stats())
@@ -0,0 +1,167 @@
+"""
+Order Endpoints - Cart, checkout, order history and notifications
+Customer endpoints act on the token's user only; order management needs staff
+"""
+from flask import Blueprint, abort, g, jsonify, request
+
+from services import OrderService, ProductService
+from services.order_service import PaymentMismatch
+
+from .auth import customer_required, flag, int_field, json_body, staff_required
+from .payments import PaymentRequired, verified_transaction
+from .serializers import (ADMIN_ORDER_FIELDS, CART_FIELDS, NOTIFICATION_FIELDS,
+                          ORDER_DETAIL_FIELDS, ORDER_FIELDS, ORDER_ITEM_FIELDS, to_dict, to_list)
+
+bp = Blueprint('orders', __name__)
+
+ORDER_STATUSES = ('pending', 'confirmed', 'processing', 'shipped', 'delivered', 'cancelled')
+PAYMENT_METHODS = ('cash', 'card', 'online')
+
+
+# ==================== CART ====================
+
+def _cart_response():
+    items = OrderService.get_cart_items(g.user_id)
+    return jsonify(items=to_list(items, CART_FIELDS), total=sum(item[6] for item in items))
+
+
+@bp.get('/cart')
+@customer_required
+def get_cart():
+    return _cart_response()
+
+
+@bp.post('/cart')
+@customer_required
+def add_to_cart():
+    data = json_body('product_id')
+    success, msg = OrderService.add_to_cart(g.user_id, int_field(data, 'product_id'),
+                                            int_field(data, 'quantity', minimum=1, default=1))
+    if not success:
+        abort(409, msg)
+    return _cart_response()
+
+
+@bp.put('/cart/<int:product_id>')
+@customer_required
+def set_cart_quantity(product_id):
+    quantity = int_field(json_body('quantity'), 'quantity', minimum=0)
+    if quantity > 0:
+        product = ProductService.get_product_details(product_id)
+        if not product:
+            abort(404, "Product not found")
+        if product[6] < quantity:
+            abort(409, "Insufficient stock")
+    OrderService.set_cart_quantity(g.user_id, product_id, quantity)
+    return _cart_response()
+
+
+@bp.delete('/cart/<int:product_id>')
+@customer_required
+def remove_from_cart(product_id):
+    OrderService.set_cart_quantity(g.user_id, product_id, 0)
+    return _cart_response()
+
+
+@bp.delete('/cart')
+@customer_required
+def clear_cart():
+    OrderService.clear_cart(g.user_id)
+    return _cart_response()
+
+
+# ==================== CHECKOUT & ORDERS ====================
+
+@bp.post('/orders')
+@customer_required
+def place_order():
+    """Check out the cart: {delivery_address, delivery_phone, payment_method, payment_token}
+
+    card and online orders need the payment_token from POST /api/payments/<method>
+    """
+    data = json_body('delivery_address', 'delivery_phone')
+    payment_method = data.get('payment_method', 'cash')
+    if payment_method not in PAYMENT_METHODS:
+        abort(400, f"payment_method must be one of {', '.join(PAYMENT_METHODS)}")
+    transaction_id = paid_amount = None
+    if payment_method != 'cash':
+        if not data.get('payment_token'):
+            raise PaymentRequired("payment_token required for card and online orders")
+        transaction_id, paid_amount = verified_transaction(data['payment_token'], g.user_id,
+                                                           payment_method)
+    try:
+        success, msg = OrderService.place_order(g.user_id, data['delivery_address'],
+                                                data['delivery_phone'], payment_method,
+                                                transaction_id=transaction_id, paid_amount=paid_amount)
+    except PaymentMismatch as e:
+        raise PaymentRequired(str(e))
+    if not success:
+        abort(409, msg)
+    return jsonify(message=msg), 201
+
+
+@bp.get('/orders')
+@customer_required
+def my_orders():
+    orders = OrderService.get_user_orders(g.user_id, request.args.get('limit', type=int))
+    return jsonify(to_list(orders, ORDER_FIELDS))
+
+
+@bp.get('/orders/<int:order_id>')
+@customer_required
+def my_order(order_id):
+    order, items = OrderService.get_order_details(order_id)
+    if not order or order[1] != g.user_id:
+        abort(404, "Order not found")
+    return jsonify(order=to_dict(order, ORDER_DETAIL_FIELDS), items=to_list(items, ORDER_ITEM_FIELDS))
+
+
+# ==================== NOTIFICATIONS ====================
+
+@bp.get('/notifications')
+@customer_required
+def notifications():
+    rows = OrderService.get_user_notifications(g.user_id, flag(request.args.get('unread_only', '')))
+    return jsonify(unread=OrderService.get_unread_count(g.user_id),
+                   notifications=to_list(rows, NOTIFICATION_FIELDS))
+
+
+@bp.post('/notifications/read')
+@customer_required
+def mark_notifications_read():
+    """Mark everything up to {up_to_id} (default: all) as read"""
+    data = request.get_json(silent=True) or {}
+    up_to_id = int_field(data, 'up_to_id') if data.get('up_to_id') is not None else None
+    if not OrderService.mark_all_notifications_read(g.user_id, up_to_id):
+        abort(500, "Could not update notifications")
+    return jsonify(unread=OrderService.get_unread_count(g.user_id))
+
+
+# ==================== ORDER MANAGEMENT (STAFF) ====================
+
+@bp.get('/admin/orders')
+@staff_required()
+def admin_orders():
+    """All orders, newest first, keyset paged: ?page_token=&page_size="""
+    rows, next_token = OrderService.get_admin_orders_page(request.args.get('page_token'),
+                                                          request.args.get('page_size', type=int))
+    return jsonify(orders=to_list(rows, ADMIN_ORDER_FIELDS), next_token=next_token)
+
+
+@bp.get('/admin/orders/<int:order_id>')
+@staff_required()
+def admin_order(order_id):
+    order, items = OrderService.get_order_details(order_id)
+    if not order:
+        abort(404, "Order not found")
+    return jsonify(order=to_dict(order, ORDER_DETAIL_FIELDS), items=to_list(items, ORDER_ITEM_FIELDS))
+
+
+@bp.post('/admin/orders/<int:order_id>/status')
+@staff_required()
+def update_order_status(order_id):
+    status = json_body('status')['status']
+    if status not in ORDER_STATUSES:
+        abort(400, f"status must be one of {', '.join(ORDER_STATUSES)}")
+    OrderService.update_order_status(order_id, status)
+    return '', 204
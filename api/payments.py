@@ -0,0 +1,90 @@
+"""
+Payment Endpoints - Simulated card / PayPal / Google Pay / net banking payments
+The cart total is read server-side, so clients cannot choose the amount. A
+successful payment returns a signed payment_token; POST /api/orders needs it
+for card and online orders, which is the only way an order becomes paid
+"""
+from flask import Blueprint, abort, current_app, g, jsonify
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from werkzeug.exceptions import HTTPException
+
+from services import OrderService, PaymentService
+
+from .auth import customer_required, json_body
+
+bp = Blueprint('payments', __name__)
+
+# method -> (required fields, processor taking those fields and then the amount)
+PROCESSORS = {
+    'card': (('card_number', 'expiry', 'cvv', 'cardholder_name'),
+             lambda d, amount: PaymentService.process_card_payment(
+                 d['card_number'], d['expiry'], d['cvv'], amount, d['cardholder_name'])),
+    'paypal': (('email',),
+               lambda d, amount: PaymentService.process_paypal_payment(d['email'], amount)),
+    'gpay': (('phone',),
+             lambda d, amount: PaymentService.process_gpay_payment(d['phone'], amount)),
+    'net_banking': (('bank_name', 'account_number'),
+                    lambda d, amount: PaymentService.process_net_banking_payment(
+                        d['bank_name'], d['account_number'], amount)),
+}
+
+PAYMENT_TOKEN_MAX_AGE = 15 * 60  # seconds from payment to checkout
+
+
+class PaymentRequired(HTTPException):
+    """402 - werkzeug's abort() has no exception for it"""
+    code = 402
+    description = "Payment required"
+
+
+# ==================== PAYMENT TOKENS ====================
+
+def _serializer():
+    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt='grocery-payment')
+
+
+def verified_transaction(token, user_id, payment_method):
+    """(transaction id, amount paid) of a payment this server processed for
+    user_id with payment_method ('card' or 'online'); PaymentRequired otherwise
+
+    The amount is checked against the cart total inside the checkout
+    transaction (OrderService.place_order's paid_amount).
+    """
+    try:
+        claims = _serializer().loads(token, max_age=PAYMENT_TOKEN_MAX_AGE)
+    except SignatureExpired:
+        raise PaymentRequired("Payment expired, please pay again")
+    except BadSignature:
+        raise PaymentRequired("Invalid payment_token")
+    if claims.get('user') != user_id or claims.get('payment_method') != payment_method:
+        raise PaymentRequired("payment_token does not match this order")
+    return claims['transaction_id'], claims['amount']
+
+
+# ==================== ENDPOINTS ====================
+
+
+@bp.post('/payments/<method>')
+@customer_required
+def pay(method):
+    if method not in PROCESSORS:
+        abort(404, "Unknown payment method")
+    required, process = PROCESSORS[method]
+    data = json_body(*required)
+    # The processors parse these as text (e.g. card_number.replace)
+    not_text = [field for field in required if not isinstance(data[field], str)]
+    if not_text:
+        abort(400, f"{', '.join(not_text)} must be text")
+    amount = float(OrderService.get_cart_total(g.user_id))
+    if amount <= 0:
+        abort(409, "Cart is empty")
+    success, result = process(data, amount)
+    if not success:
+        raise PaymentRequired(result)
+    payment_token = _serializer().dumps({
+        'user': g.user_id,
+        'transaction_id': result['transaction_id'],
+        'payment_method': 'card' if method == 'card' else 'online',
+        'amount': amount,
+    })
+    return jsonify(dict(result, payment_token=payment_token))
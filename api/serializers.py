@@ -0,0 +1,54 @@
+"""
+Serializers - Turn service rows (tuples) into JSON-ready dicts
+Field lists follow the column order of the service queries they describe;
+None entries are columns that are never sent to clients
+"""
+
+CATEGORY_FIELDS = ('category_id', 'category_name', 'icon')
+CATEGORY_COUNT_FIELDS = ('category_id', 'category_name', 'item_count')
+PRODUCT_FIELDS = ('product_id', 'name', 'description', 'image_path', 'unit_price', 'unit',
+                  'stock_quantity', 'is_available', 'discount_percent', 'category_name')
+PRODUCT_DETAIL_FIELDS = PRODUCT_FIELDS + ('category_id', 'min_stock_level')
+CATEGORY_PRODUCT_FIELDS = ('product_id', 'name', 'stock_quantity', 'unit_price', 'unit', 'expiry_date')
+BEST_SELLER_FIELDS = ('product_id', 'name', 'category_name', 'units', 'revenue')
+
+CART_FIELDS = ('cart_id', 'product_id', 'name', 'image_path', 'unit_price', 'quantity',
+               'subtotal', 'stock_quantity', 'discount_percent')
+ORDER_FIELDS = ('order_id', 'order_number', 'total_amount', 'discount_amount', 'final_amount',
+                'payment_method', 'payment_status', 'order_status', 'delivery_address',
+                'order_date', 'delivered_at')
+ORDER_DETAIL_FIELDS = ('order_id', 'user_id', 'full_name', 'email', 'order_date', 'final_amount',
+                       'delivery_address', 'payment_method', 'payment_status', 'order_status',
+                       'confirmed_at')
+ORDER_ITEM_FIELDS = ('product_id', 'product_name', 'quantity', 'unit_price', 'subtotal')
+ADMIN_ORDER_FIELDS = ('order_id', 'user_id', 'full_name', 'phone', 'order_date', 'total_amount',
+                      'delivery_address', 'item_count')
+NOTIFICATION_FIELDS = ('notification_id', 'type', 'title', 'message', 'order_id', 'is_read',
+                       'created_at')
+
+INVENTORY_FIELDS = ('inventory_id', 'product_name', 'batch_number', 'quantity_received',
+                    'quantity_remaining', 'purchase_price', 'supplier_name', 'received_date',
+                    'expiry_date')
+PRODUCT_BATCH_FIELDS = ('inventory_id', 'batch_number', 'quantity_received', 'quantity_remaining',
+                        'purchase_price', 'supplier_name', 'received_date', 'expiry_date',
+                        'added_by_name', 'notes', 'created_at')
+EXPIRING_FIELDS = ('inventory_id', 'product_name', 'batch_number', 'quantity_remaining',
+                   'expiry_date', 'days_until_expiry')
+EXPIRED_FIELDS = ('inventory_id', 'product_name', 'batch_number', 'quantity_remaining', 'expiry_date')
+
+USER_FIELDS = ('user_id', 'username', None, 'email', 'full_name', 'phone', 'address',
+               'created_at', 'last_login', 'is_active')
+STAFF_FIELDS = ('staff_id', 'username', None, 'email', 'full_name', 'phone', 'role',
+                'created_at', 'last_login', 'is_active')
+
+
+def to_dict(row, fields):
+    """One row as a dict (None if there is no row)"""
+    if row is None:
+        return None
+    return {field: value for field, value in zip(fields, row) if field is not None}
+
+
+def to_list(rows, fields):
+    """Rows as a list of dicts"""
+    return [to_dict(row, fields) for row in rows]
@@ -0,0 +1,80 @@
+"""
+API Server - Pre-fork multi-worker launcher for the Flask API (gunicorn)
+Usage: python -m api.server --bind 0.0.0.0:8000 --workers 4 --threads 4
+
+Each worker is a separate process with its own connection pool, catalog
+cache and search index; threads within a worker share them. Settings can
+also come from GROCERY_API_BIND / GROCERY_API_WORKERS / GROCERY_API_THREADS.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gunicorn.app.base import BaseApplication
+
+
+def default_workers():
+    return int(os.environ.get('GROCERY_API_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+
+def post_fork(server, worker):
+    # preload_app imports the app in the master; never share its DB sockets
+    from config.db_config import reset_pool
+    reset_pool()
+
+
+class GroceryAPIServer(BaseApplication):
+    """gunicorn application wrapping api.create_app()"""
+
+    def __init__(self, options):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from api import create_app
+        return create_app()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bind', default=os.environ.get('GROCERY_API_BIND', '127.0.0.1:8000'))
+    parser.add_argument('--workers', type=int, default=default_workers())
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('GROCERY_API_THREADS', 4)),
+                        help="threads per worker (bcrypt and DB waits release the GIL)")
+    parser.add_argument('--timeout', type=int, default=30)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # Workers inherit the environment: one signing key for all of them (the
+    # same check as api.wsgi, before gunicorn starts), and a pool with a
+    # connection per thread
+    from api import api_secret
+    try:
+        api_secret()
+    except RuntimeError as e:
+        sys.exit(str(e))
+    os.environ.setdefault('GROCERY_DB_POOL_SIZE', str(args.threads))
+
+    GroceryAPIServer({
+        'bind': args.bind,
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread',
+        'timeout': args.timeout,
+        'preload_app': True,
+        'post_fork': post_fork,
+        'accesslog': os.environ.get('GROCERY_API_ACCESS_LOG'),
+    }).run()
+
+
+if __name__ == "__main__":
+    main()
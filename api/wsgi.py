@@ -0,0 +1,12 @@
+"""
+WSGI entry point - gunicorn api.wsgi:app (see api/server.py for the tuned launcher)
+Like api.server, refuses to start unless GROCERY_API_SECRET is set
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import create_app
+
+app = create_app()
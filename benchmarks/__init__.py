@@ -0,0 +1,4 @@
+"""
+Benchmarks Package - Latency measurements for service methods
+Run individual benchmarks as modules, e.g. python -m benchmarks.place_order_bench
+"""
@@ -0,0 +1,217 @@
+"""
+API Load Test - Requests/sec and latency percentiles for the HTTP API
+Concurrent clients run catalog-browse sessions (categories -> product page
+-> product detail) and/or checkout sessions (add to cart -> place order)
+against a running server (python -m api.server).
+
+Usage:
+    python -m benchmarks.api_load_test --scenario browse --clients 32 --seconds 20
+    python -m benchmarks.api_load_test --scenario checkout --clients 8 --base-url http://host:8000
+The checkout scenario registers bench_load_* customers and places real cash
+orders (stock goes down); point it at a test database. --cleanup removes
+those customers and their orders afterwards (needs local DB access).
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BENCH_PREFIX = "bench_load"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--scenario', choices=['browse', 'checkout', 'mixed'], default='browse')
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=15.0)
+    parser.add_argument('--cleanup', action='store_true', help="delete bench customers and orders afterwards")
+    return parser.parse_args()
+
+
+class Client:
+    """Minimal JSON HTTP client recording latency per endpoint"""
+
+    def __init__(self, base_url, recorder):
+        self.base_url = base_url.rstrip('/')
+        self.recorder = recorder
+        self.token = None
+
+    def call(self, method, path, body=None, label=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(self.base_url + path, data=data, method=method)
+        request.add_header('Content-Type', 'application/json')
+        if self.token:
+            request.add_header('Authorization', f"Bearer {self.token}")
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                payload = response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            payload, status = e.read(), e.code
+        except OSError:
+            payload, status = b'', 0
+        self.recorder.record(label or f"{method} {path}", (time.perf_counter() - started) * 1000, status)
+        try:
+            return status, json.loads(payload) if payload else None
+        except ValueError:
+            return status, None
+
+
+class Recorder:
+    """Thread-safe latency and status collection"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.recording = False
+
+    def record(self, label, ms, status):
+        if not self.recording:
+            return
+        with self._lock:
+            self.latencies[label].append(ms)
+            if status == 0 or status >= 500:
+                self.errors[label] += 1
+
+    def report(self, elapsed):
+        print(f"{'endpoint':<34} {'requests':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6}")
+        everything = []
+        for label in sorted(self.latencies):
+            samples = sorted(self.latencies[label])
+            everything.extend(samples)
+            print(f"{label:<34} {len(samples):>8} {len(samples) / elapsed:>8.1f} "
+                  f"{percentile(samples, 50):>8.1f} {percentile(samples, 99):>8.1f} "
+                  f"{self.errors[label]:>6}")
+        everything.sort()
+        print(f"{'TOTAL':<34} {len(everything):>8} {len(everything) / elapsed:>8.1f} "
+              f"{percentile(everything, 50):>8.1f} {percentile(everything, 99):>8.1f} "
+              f"{sum(self.errors.values()):>6}")
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+# ==================== SCENARIOS ====================
+
+def browse_session(client, rng):
+    status, categories = client.call('GET', '/api/categories', label='GET /api/categories')
+    if status != 200 or not categories:
+        return
+    category_id = rng.choice(categories)['category_id']
+    status, page = client.call('GET', f"/api/products?category_id={category_id}&limit=60",
+                               label='GET /api/products?category_id')
+    if status == 200 and page['products']:
+        product_id = rng.choice(page['products'])['product_id']
+        client.call('GET', f"/api/products/{product_id}", label='GET /api/products/<id>')
+
+
+def checkout_session(client, rng, product_ids):
+    product_id = rng.choice(product_ids)
+    status, _ = client.call('POST', '/api/cart', {'product_id': product_id, 'quantity': 1},
+                            label='POST /api/cart')
+    if status == 200:
+        client.call('POST', '/api/orders', {'delivery_address': 'Load Test Lane',
+                                            'delivery_phone': '0700000000',
+                                            'payment_method': 'cash'},
+                    label='POST /api/orders (checkout)')
+
+
+def register_customer(client, index):
+    username = f"{BENCH_PREFIX}_{os.getpid()}_{index}"
+    password = "load-test-password"
+    client.call('POST', '/api/auth/register', {'username': username, 'password': password,
+                                               'email': f"{username}@example.com"})
+    status, result = client.call('POST', '/api/auth/login', {'username': username, 'password': password})
+    if status != 200:
+        raise RuntimeError(f"Could not log in bench customer {username}: {result}")
+    client.token = result['token']
+    return result['user']['user_id']
+
+
+def in_stock_products(client):
+    status, page = client.call('GET', '/api/products?limit=200')
+    if status != 200:
+        raise RuntimeError(f"Catalog unavailable (HTTP {status})")
+    return [p['product_id'] for p in page['products'] if p['stock_quantity'] > 0]
+
+
+def cleanup(user_ids):
+    from config.db_config import connect_db
+
+    placeholders = ', '.join(['%s'] * len(user_ids))
+    db = connect_db()
+    cursor = db.cursor()
+    cursor.execute(f"DELETE FROM notifications WHERE user_id IN ({placeholders})", tuple(user_ids))
+    cursor.execute(f"""
+        DELETE oi FROM order_items oi JOIN orders o ON oi.order_id = o.order_id
+        WHERE o.user_id IN ({placeholders})
+    """, tuple(user_ids))
+    cursor.execute(f"DELETE FROM orders WHERE user_id IN ({placeholders})", tuple(user_ids))
+    cursor.execute(f"DELETE FROM users WHERE user_id IN ({placeholders})", tuple(user_ids))
+    db.commit()
+    db.close()
+
+
+def main():
+    args = parse_args()
+    recorder = Recorder()
+    clients = [Client(args.base_url, recorder) for _ in range(args.clients)]
+
+    # Setup is not measured
+    user_ids, product_ids = [], []
+    if args.scenario in ('checkout', 'mixed'):
+        product_ids = in_stock_products(clients[0])
+        if not product_ids:
+            sys.exit("No in-stock products to check out")
+        for index, client in enumerate(clients):
+            user_ids.append(register_customer(client, index))
+
+    stop = threading.Event()
+    start_gate = threading.Barrier(args.clients + 1)
+
+    def run_client(index, client):
+        rng = random.Random(index)
+        start_gate.wait()
+        while not stop.is_set():
+            if args.scenario == 'browse' or (args.scenario == 'mixed' and index % 2):
+                browse_session(client, rng)
+            else:
+                checkout_session(client, rng, product_ids)
+
+    threads = [threading.Thread(target=run_client, args=(i, c), daemon=True) for i, c in enumerate(clients)]
+    for thread in threads:
+        thread.start()
+    recorder.recording = True
+    start_gate.wait()
+    started = time.perf_counter()
+    time.sleep(args.seconds)
+    stop.set()
+    elapsed = time.perf_counter() - started
+    recorder.recording = False
+    for thread in threads:
+        thread.join(timeout=30)
+
+    print(f"{args.scenario}: {args.clients} clients for {args.seconds:.0f}s against {args.base_url}")
+    recorder.report(elapsed)
+
+    if args.cleanup and user_ids:
+        cleanup(user_ids)
+        print(f"Removed {len(user_ids)} bench customers and their orders")
+
+
+if __name__ == "__main__":
+    main()
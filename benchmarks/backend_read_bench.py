@@ -0,0 +1,148 @@
+"""
+Backend Read Benchmark - Catalog and cart read latency, MySQL vs embedded SQLite
+Runs the same service calls against each storage backend with the catalog
+cache disabled, so every call is a round trip to the backend.
+
+Usage:
+    python -m benchmarks.backend_read_bench                          # both backends
+    python -m benchmarks.backend_read_bench --backends sqlite --products 2000
+    python -m benchmarks.backend_read_bench --sqlite-path /tmp/bench.db --iterations 1000
+Each backend gets bench_backend_* products and a customer with a cart; they
+are removed afterwards. Without --sqlite-path a throwaway database is used.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db_config import connect_db, use_backend
+from services import OrderService, ProductService, UserService
+from services.catalog_cache import catalog_cache
+
+BENCH_PREFIX = "bench_backend"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backends', default='mysql,sqlite', help="comma separated: mysql,sqlite")
+    parser.add_argument('--sqlite-path', help="SQLite database file (default: a temporary one)")
+    parser.add_argument('--products', type=int, default=500, help="bench products to create")
+    parser.add_argument('--cart-lines', type=int, default=10)
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=20)
+    return parser.parse_args()
+
+
+# ==================== FIXTURES ====================
+
+def seed(products, cart_lines):
+    """Create bench products and a customer with a cart; returns (category_id, product_ids, user_id)"""
+    category_id = ProductService.get_all_categories()[0][0]
+    product_ids = [
+        ProductService.add_product(f"{BENCH_PREFIX}_{i:05d}", category_id, "Backend benchmark item",
+                                   None, 10 + i % 90, 'unit', 1000, 5)
+        for i in range(products)
+    ]
+    username = f"{BENCH_PREFIX}_{os.getpid()}"
+    _, user_id = UserService.register_user(username, "bench-password", f"{username}@example.com")
+    for product_id in product_ids[:cart_lines]:
+        OrderService.add_to_cart(user_id, product_id, 1)
+    return category_id, product_ids, user_id
+
+
+def cleanup(product_ids, user_id):
+    db = connect_db()
+    cursor = db.cursor()
+    cursor.execute("DELETE FROM shopping_cart WHERE user_id = %s", (user_id,))
+    cursor.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
+    db.commit()
+    db.close()
+    for product_id in product_ids:
+        ProductService.delete_product(product_id)  # keeps the dashboard summary right
+
+
+# ==================== MEASUREMENT ====================
+
+def operations(category_id, product_ids, user_id):
+    middle = len(product_ids) // 2
+    return [
+        ('catalog: categories', lambda: ProductService.get_all_categories()),
+        ('catalog: count', lambda: ProductService.count_products(category_id)),
+        ('catalog: first page (60)', lambda: ProductService.get_products_page(category_id, 0, 60)),
+        ('catalog: deep page (60)', lambda: ProductService.get_products_page(category_id, middle, 60)),
+        ('catalog: product detail', lambda: ProductService.get_product_details(product_ids[middle])),
+        ('catalog: version', lambda: ProductService.get_catalog_version(category_id)),
+        ('cart: items', lambda: OrderService.get_cart_items(user_id)),
+        ('cart: total', lambda: OrderService.get_cart_total(user_id)),
+    ]
+
+
+def measure(func, iterations, warmup):
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'p50': samples[len(samples) // 2],
+        'p99': samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        'mean': statistics.mean(samples),
+    }
+
+
+def run_backend(backend, args, sqlite_path):
+    use_backend(backend, sqlite_path)
+    category_id, product_ids, user_id = seed(args.products, args.cart_lines)
+    try:
+        return {name: measure(func, args.iterations, args.warmup)
+                for name, func in operations(category_id, product_ids, user_id)}
+    finally:
+        cleanup(product_ids, user_id)
+
+
+def report(results):
+    backends = list(results)
+    header = f"{'operation':<28}" + ''.join(f"{b + ' p50':>13}{b + ' p99':>13}" for b in backends)
+    print(header)
+    print('-' * len(header))
+    for name in results[backends[0]]:
+        line = f"{name:<28}"
+        for backend in backends:
+            figures = results[backend][name]
+            line += f"{figures['p50']:>13.3f}{figures['p99']:>13.3f}"
+        print(line)
+    print("(milliseconds per call, catalog cache disabled)")
+
+
+def main():
+    args = parse_args()
+    backends = [b.strip() for b in args.backends.split(',') if b.strip()]
+    catalog_cache.ttl = 0  # every read goes to the backend
+
+    temp_dir = None
+    sqlite_path = args.sqlite_path
+    if 'sqlite' in backends and not sqlite_path:
+        temp_dir = tempfile.TemporaryDirectory(prefix=BENCH_PREFIX)
+        sqlite_path = os.path.join(temp_dir.name, 'grocery_app.db')
+
+    results = {}
+    for backend in backends:
+        print(f"Running {backend} ({args.products} products, {args.cart_lines} cart lines, "
+              f"{args.iterations} iterations per operation)...")
+        results[backend] = run_backend(backend, args, sqlite_path)
+    report(results)
+
+    if temp_dir is not None:
+        use_backend('mysql')  # release the temporary file before removing it
+        temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""
+Benchmark Cases - One timed call per public service method, fed from a datagen manifest
+Reads pick random generated rows; writes go to the manifest's reserved bench
+customer/staff and to rows the cases create and remove themselves, so a
+dataset can be benchmarked again and again.
+"""
+import itertools
+import random
+from datetime import date, timedelta
+
+from config.db_config import connect_db
+from services import InventoryService, OrderService, ProductService, UserService
+
+SERVICES = {
+    'OrderService': OrderService,
+    'ProductService': ProductService,
+    'InventoryService': InventoryService,
+    'UserService': UserService,
+}
+
+SEARCH_TERMS = ['mango', 'coconut milk', 'fresh', 'ceylon tea', 'rice', 'chilli']
+
+
+class Case:
+    """A benchmarked call: call(ctx, prepared) after an untimed setup(ctx) per call"""
+
+    def __init__(self, name, call, setup=None, teardown=None):
+        self.name = name
+        self.call = call
+        self.setup = setup or (lambda ctx: None)
+        self.teardown = teardown
+
+
+class BenchContext:
+    """Random picks from the generated dataset plus the bench rows writes may touch"""
+
+    def __init__(self, manifest, seed=0):
+        self.manifest = manifest
+        self.rng = random.Random(seed)
+        self.password = manifest['password']
+        self.bench_user = manifest['bench_user']['user_id']
+        self.bench_username = manifest['bench_user']['username']
+        self.bench_staff = manifest['bench_staff']['staff_id']
+        self.bench_staff_username = manifest['bench_staff']['username']
+        self.tag = manifest['tag']
+        self._serial = itertools.count()
+        self._bench_product = None
+        self._bench_batch = None
+        self._password_hash = None
+        self._staff_row = None
+        self._created_products = []
+        self._created_users = []
+        self._created_staff = []
+
+    # -------- random picks --------
+
+    def _in(self, name):
+        low, high = self.manifest['ranges'][name]
+        return self.rng.randint(low, high)
+
+    def user(self):
+        return self._in('users')
+
+    def cart_user(self):
+        return self.rng.choice(self.manifest['cart_user_ids'])
+
+    def product(self):
+        return self._in('products')
+
+    def products(self, count):
+        low, high = self.manifest['ranges']['products']
+        return self.rng.sample(range(low, high + 1), min(count, high - low + 1))
+
+    def category(self):
+        return self.rng.choice(self.manifest['category_ids'])
+
+    def order(self):
+        return self._in('orders')
+
+    def inventory(self):
+        return self._in('inventory')
+
+    def term(self):
+        return self.rng.choice(SEARCH_TERMS)
+
+    def serial(self):
+        return next(self._serial)
+
+    # -------- bench rows --------
+
+    def bench_product(self):
+        """A product owned by the run (created on first use, deleted in close())"""
+        if self._bench_product is None:
+            self._bench_product = self.new_product()
+        return self._bench_product
+
+    def new_product(self):
+        return ProductService.add_product(f"{self.tag}_bench_{self.serial()}", self.category(),
+                                          "Benchmark product", None, 100, 'unit', 100000, 5)
+
+    def remove_product_later(self, product_id):
+        self._created_products.append(product_id)
+
+    def bench_batch(self):
+        if self._bench_batch is None:
+            self._bench_batch = self.new_batch()
+        return self._bench_batch
+
+    def password_hash(self):
+        if self._password_hash is None:
+            self._password_hash = UserService.hash_password(self.password)
+        return self._password_hash
+
+    def staff_row(self):
+        if self._staff_row is None:
+            self._staff_row = UserService.login_staff(self.bench_staff_username, self.password)
+        return self._staff_row
+
+    def new_batch(self):
+        return InventoryService.add_inventory_batch(
+            self.bench_product(), 10, 50, "Bench Supplier", date.today(),
+            date.today() - timedelta(days=1), self.bench_staff, '', '')
+
+    def fill_bench_cart(self, lines=3):
+        for product_id in self.products(lines):
+            OrderService.add_to_cart(self.bench_user, product_id, 1)
+
+    def bench_cart_line(self):
+        """cart_id of a line in the bench customer's cart"""
+        OrderService.add_to_cart(self.bench_user, self.product(), 1)
+        return OrderService.get_cart_items(self.bench_user)[0][0]
+
+    def bench_order(self):
+        """One of the bench customer's orders (placing one if there is none)"""
+        orders = OrderService.get_user_orders(self.bench_user, 1)
+        if orders:
+            return orders[0][0]
+        self.fill_bench_cart()
+        OrderService.place_order(self.bench_user, "Bench Road", "0700000000")
+        return OrderService.get_user_orders(self.bench_user, 1)[0][0]
+
+    def bench_notification(self):
+        notifications = OrderService.get_user_notifications(self.bench_user)
+        if not notifications:
+            self.bench_order()
+            notifications = OrderService.get_user_notifications(self.bench_user)
+        return notifications[0][0]
+
+    def new_username(self):
+        return f"{self.tag}_reg_{self.serial()}"
+
+    def remember_user(self, result):
+        if result and result[0]:
+            self._created_users.append(result[1])
+
+    def remember_staff(self, result):
+        if result and result[0]:
+            self._created_staff.append(result[1])
+
+    def clear_bench_cart(self):
+        OrderService.clear_cart(self.bench_user)
+
+    def close(self):
+        """Remove what the run created"""
+        self.clear_bench_cart()
+        UserService.update_username(self.bench_user, self.bench_username)
+        db = connect_db()
+        cursor = db.cursor()
+        for user_id in self._created_users:
+            cursor.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
+        for staff_id in self._created_staff:
+            cursor.execute("DELETE FROM staff WHERE staff_id = %s", (staff_id,))
+        db.commit()
+        db.close()
+        if self._bench_product is not None:
+            self._created_products.append(self._bench_product)
+        for product_id in self._created_products:
+            ProductService.delete_product(product_id)
+
+
+def _alternate(values):
+    cycle = itertools.cycle(values)
+    return lambda: next(cycle)
+
+
+def build_cases():
+    """All cases, named Service.method"""
+    next_status = _alternate(['confirmed', 'shipped', 'delivered'])
+    next_delta = _alternate([1, -1])
+    cases = [
+        # ==================== OrderService ====================
+        Case('OrderService.add_to_cart', lambda c, _: OrderService.add_to_cart(c.bench_user, c.product(), 1),
+             teardown=lambda c: c.clear_bench_cart()),
+        Case('OrderService.get_cart_items', lambda c, _: OrderService.get_cart_items(c.cart_user())),
+        Case('OrderService.update_cart_quantity', lambda c, cart_id: OrderService.update_cart_quantity(cart_id, 2),
+             setup=lambda c: c.bench_cart_line(), teardown=lambda c: c.clear_bench_cart()),
+        Case('OrderService.set_cart_quantity',
+             lambda c, _: OrderService.set_cart_quantity(c.bench_user, c.product(), 2),
+             teardown=lambda c: c.clear_bench_cart()),
+        Case('OrderService.remove_from_cart', lambda c, cart_id: OrderService.remove_from_cart(cart_id),
+             setup=lambda c: c.bench_cart_line(), teardown=lambda c: c.clear_bench_cart()),
+        Case('OrderService.clear_cart', lambda c, _: OrderService.clear_cart(c.bench_user),
+             setup=lambda c: c.fill_bench_cart()),
+        Case('OrderService.get_cart_total', lambda c, _: OrderService.get_cart_total(c.cart_user())),
+        Case('OrderService.place_order',
+             lambda c, _: OrderService.place_order(c.bench_user, "Bench Road", "0700000000"),
+             setup=lambda c: c.fill_bench_cart()),
+        Case('OrderService.get_user_orders', lambda c, _: OrderService.get_user_orders(c.user())),
+        Case('OrderService.get_order_details', lambda c, _: OrderService.get_order_details(c.order())),
+        Case('OrderService.get_all_orders', lambda c, _: OrderService.get_all_orders(None, 100)),
+        Case('OrderService.update_order_status',
+             lambda c, order_id: OrderService.update_order_status(order_id, next_status()),
+             setup=lambda c: c.bench_order()),
+        Case('OrderService.get_user_notifications', lambda c, _: OrderService.get_user_notifications(c.user())),
+        Case('OrderService.mark_notification_read',
+             lambda c, notification_id: OrderService.mark_notification_read(notification_id),
+             setup=lambda c: c.bench_notification()),
+        Case('OrderService.mark_all_notifications_read',
+             lambda c, _: OrderService.mark_all_notifications_read(c.bench_user)),
+        Case('OrderService.get_unread_count', lambda c, _: OrderService.get_unread_count(c.user())),
+        Case('OrderService.get_all_admin_orders', lambda c, _: OrderService.get_all_admin_orders()),
+        Case('OrderService.get_admin_orders_page', lambda c, _: OrderService.get_admin_orders_page(None, 50)),
+        Case('OrderService.view_orders', lambda c, _: OrderService.view_orders(c.user())),
+        Case('OrderService.update_order_item_status',
+             lambda c, order_id: OrderService.update_order_item_status(order_id, c.product(), 'delivered'),
+             setup=lambda c: c.bench_order()),
+        Case('OrderService.get_order_items_with_status',
+             lambda c, _: OrderService.get_order_items_with_status(c.order())),
+
+        # ==================== ProductService ====================
+        Case('ProductService.get_all_categories', lambda c, _: ProductService.get_all_categories()),
+        Case('ProductService.get_categories_with_count', lambda c, _: ProductService.get_categories_with_count()),
+        Case('ProductService.get_products_by_category',
+             lambda c, _: ProductService.get_products_by_category(c.category())),
+        Case('ProductService.count_products', lambda c, _: ProductService.count_products(c.category())),
+        Case('ProductService.get_products_page',
+             lambda c, _: ProductService.get_products_page(c.category(), c.rng.randrange(0, 600, 60), 60)),
+        Case('ProductService.search_products', lambda c, _: ProductService.search_products(c.term())),
+        Case('ProductService.search_product_ids', lambda c, _: ProductService.search_product_ids(c.term())),
+        Case('ProductService.get_products_by_ids', lambda c, _: ProductService.get_products_by_ids(c.products(20))),
+        Case('ProductService.get_product_details', lambda c, _: ProductService.get_product_details(c.product())),
+        Case('ProductService.get_product_by_id_full', lambda c, _: ProductService.get_product_by_id_full(c.product())),
+        Case('ProductService.get_products_in_category',
+             lambda c, _: ProductService.get_products_in_category(c.category())),
+        Case('ProductService.get_products_in_category_page',
+             lambda c, _: ProductService.get_products_in_category_page(c.category())),
+        Case('ProductService.add_product', lambda c, _: c.remove_product_later(c.new_product())),
+        Case('ProductService.update_product',
+             lambda c, _: ProductService.update_product(c.bench_product(), f"{c.tag}_bench_upd", c.category(),
+                                                        "Benchmark product", None, 100, 'unit', 100000, 5)),
+        Case('ProductService.update_product_details',
+             lambda c, _: ProductService.update_product_details(c.bench_product(), f"{c.tag}_bench_upd",
+                                                                c.category(), "Benchmark product", None,
+                                                                100, 'unit', 100000, 5)),
+        Case('ProductService.delete_product', lambda c, product_id: ProductService.delete_product(product_id),
+             setup=lambda c: c.new_product()),
+        Case('ProductService.delete_product_by_id',
+             lambda c, product_id: ProductService.delete_product_by_id(product_id),
+             setup=lambda c: c.new_product()),
+        Case('ProductService.toggle_product_availability',
+             lambda c, _: ProductService.toggle_product_availability(c.bench_product(), True)),
+        Case('ProductService.update_product_stock',
+             lambda c, _: ProductService.update_product_stock(c.bench_product(), next_delta())),
+        Case('ProductService.set_product_dates',
+             lambda c, _: ProductService.set_product_dates(c.bench_product(), date.today() - timedelta(days=30),
+                                                           date.today() + timedelta(days=30))),
+        Case('ProductService.get_low_stock_products', lambda c, _: ProductService.get_low_stock_products()),
+        Case('ProductService.invalidate_catalog_cache', lambda c, _: ProductService.invalidate_catalog_cache()),
+        Case('ProductService.get_catalog_cache_stats', lambda c, _: ProductService.get_catalog_cache_stats()),
+        Case('ProductService.get_catalog_version', lambda c, _: ProductService.get_catalog_version(c.category())),
+        Case('ProductService.get_categories_version', lambda c, _: ProductService.get_categories_version()),
+        Case('ProductService.get_product_version', lambda c, _: ProductService.get_product_version(c.product())),
+        Case('ProductService.calculate_discounted_price',
+             lambda c, _: ProductService.calculate_discounted_price(250.0, 10)),
+        Case('ProductService.get_product_sold_count',
+             lambda c, _: ProductService.get_product_sold_count(c.product())),
+        Case('ProductService.get_best_sellers', lambda c, _: ProductService.get_best_sellers('30d')),
+        Case('ProductService.get_inventory_stats', lambda c, _: ProductService.get_inventory_stats()),
+        Case('ProductService.get_expiring_soon_items', lambda c, _: ProductService.get_expiring_soon_items()),
+        Case('ProductService.get_expired_items', lambda c, _: ProductService.get_expired_items()),
+        Case('ProductService.remove_expired_item',
+             lambda c, _: ProductService.remove_expired_item(c.bench_product())),
+        Case('ProductService.get_inventory_by_category', lambda c, _: ProductService.get_inventory_by_category()),
+        Case('ProductService.view_all_products', lambda c, _: ProductService.view_all_products()),
+
+        # ==================== InventoryService ====================
+        Case('InventoryService.add_inventory_batch', lambda c, _: c.new_batch()),
+        Case('InventoryService.get_product_inventory',
+             lambda c, _: InventoryService.get_product_inventory(c.product())),
+        Case('InventoryService.get_all_inventory', lambda c, _: InventoryService.get_all_inventory()),
+        Case('InventoryService.get_inventory_page', lambda c, _: InventoryService.get_inventory_page(None, 50)),
+        Case('InventoryService.update_inventory_quantity',
+             lambda c, batch_id: InventoryService.update_inventory_quantity(batch_id, next_delta()),
+             setup=lambda c: c.bench_batch()),
+        Case('InventoryService.get_expiring_soon', lambda c, _: InventoryService.get_expiring_soon(7)),
+        Case('InventoryService.get_expired_inventory', lambda c, _: InventoryService.get_expired_inventory()),
+        Case('InventoryService.dispose_expired_inventory',
+             lambda c, batch_id: InventoryService.dispose_expired_inventory(batch_id),
+             setup=lambda c: c.new_batch()),
+        Case('InventoryService.get_inventory_stats', lambda c, _: InventoryService.get_inventory_stats()),
+
+        # ==================== UserService ====================
+        Case('UserService.hash_password', lambda c, _: UserService.hash_password(c.password)),
+        Case('UserService.check_password', lambda c, hashed: UserService.check_password(c.password, hashed),
+             setup=lambda c: c.password_hash()),
+        Case('UserService.needs_rehash', lambda c, hashed: UserService.needs_rehash(hashed),
+             setup=lambda c: c.password_hash()),
+        Case('UserService.register_user',
+             lambda c, name: c.remember_user(UserService.register_user(name, c.password, f"{name}@example.com")),
+             setup=lambda c: c.new_username()),
+        Case('UserService.login_user', lambda c, _: UserService.login_user(c.bench_username, c.password)),
+        Case('UserService.update_user_profile',
+             lambda c, _: UserService.update_user_profile(c.bench_user, "Bench Customer", "0700000000",
+                                                          "Bench Road")),
+        Case('UserService.get_user_info', lambda c, _: UserService.get_user_info(c.user())),
+        Case('UserService.change_password',
+             lambda c, _: UserService.change_password(c.bench_user, c.password, c.password)),
+        Case('UserService.update_username',
+             lambda c, _: UserService.update_username(c.bench_user, f"{c.bench_username}_{c.serial() % 2}"),
+             teardown=lambda c: UserService.update_username(c.bench_user, c.bench_username)),
+        Case('UserService.login_staff', lambda c, _: UserService.login_staff(c.bench_staff_username, c.password)),
+        Case('UserService.register_staff',
+             lambda c, name: c.remember_staff(UserService.register_staff(name, c.password, f"{name}@example.com",
+                                                                         "Bench Staff")),
+             setup=lambda c: c.new_username()),
+        Case('UserService.get_staff_role', lambda c, staff: UserService.get_staff_role(staff),
+             setup=lambda c: c.staff_row()),
+        Case('UserService.is_admin', lambda c, staff: UserService.is_admin(staff), setup=lambda c: c.staff_row()),
+        Case('UserService.get_all_staff', lambda c, _: UserService.get_all_staff()),
+        Case('UserService.toggle_staff_status',
+             lambda c, _: UserService.toggle_staff_status(c.bench_staff, True)),
+        Case('UserService.change_staff_password',
+             lambda c, _: UserService.change_staff_password(c.bench_staff, c.password, c.password)),
+        Case('UserService.get_user_role', lambda c, user: UserService.get_user_role(user),
+             setup=lambda c: UserService.get_user_info(c.user())),
+        Case('UserService.get_role', lambda c, staff: UserService.get_role(staff), setup=lambda c: c.staff_row()),
+    ]
+    return cases
+
+
+def uncovered(cases):
+    """Public methods of the benchmarked services that have no case"""
+    covered = {case.name for case in cases}
+    missing = []
+    for service_name, service in SERVICES.items():
+        for name, member in vars(service).items():
+            if not name.startswith('_') and isinstance(member, staticmethod) \
+                    and f"{service_name}.{name}" not in covered:
+                missing.append(f"{service_name}.{name}")
+    return missing
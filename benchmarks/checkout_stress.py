@@ -0,0 +1,136 @@
+"""
+Checkout Stress Test - Proves place_order cannot oversell under concurrency
+N buyer threads race to check out the last units of the same products, each
+with its cart lines in a different order to provoke lock-order deadlocks.
+
+Usage: python -m benchmarks.checkout_stress --buyers 32 --products 4 --stock 10
+Needs a reachable local MySQL/MariaDB grocery_app_db; exits non-zero on oversell.
+All rows it creates are removed afterwards.
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BENCH_PREFIX = "bench_stress"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--buyers', type=int, default=32)
+    parser.add_argument('--products', type=int, default=4)
+    parser.add_argument('--stock', type=int, default=10, help="initial stock per product")
+    parser.add_argument('--units', type=int, default=1, help="units of each product per cart")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # One pooled connection per buyer so every thread really runs concurrently
+    os.environ.setdefault('GROCERY_DB_POOL_SIZE', str(args.buyers))
+
+    from config.db_config import connect_db
+    from services.order_service import OrderService
+    from services.product_service import ProductService
+
+    db = connect_db()
+    cursor = db.cursor()
+    cursor.execute("SELECT MIN(category_id) FROM categories")
+    category_id = cursor.fetchone()[0]
+    db.close()
+    # Through ProductService so the dashboard summary counts them (checkout
+    # retracts and re-adds their contribution)
+    product_ids = [
+        ProductService.add_product(f"{BENCH_PREFIX} item {i}", category_id, None, None, 100, 'unit', args.stock)
+        for i in range(args.products)
+    ]
+
+    db = connect_db()
+    cursor = db.cursor()
+    user_ids = []
+    for i in range(args.buyers):
+        cursor.execute("""
+            INSERT INTO users (username, password, email) VALUES (%s, 'x', %s)
+        """, (f"{BENCH_PREFIX}_{os.getpid()}_{i}", f"{BENCH_PREFIX}_{os.getpid()}_{i}@example.com"))
+        user_id = cursor.lastrowid
+        user_ids.append(user_id)
+        lines = product_ids[:]
+        random.shuffle(lines)
+        for product_id in lines:
+            cursor.execute("""
+                INSERT INTO shopping_cart (user_id, product_id, quantity) VALUES (%s, %s, %s)
+            """, (user_id, product_id, args.units))
+    db.commit()
+    db.close()
+
+    outcomes = Counter()
+    outcomes_lock = threading.Lock()
+    start_gate = threading.Barrier(args.buyers)
+
+    def buyer(user_id):
+        start_gate.wait()
+        try:
+            success, msg = OrderService.place_order(user_id, "Stress Street", "0700000000")
+            outcome = 'placed' if success else 'rejected: ' + msg.split(' for ')[0]
+        except Exception as e:
+            outcome = f"error {getattr(e, 'errno', type(e).__name__)}"
+        with outcomes_lock:
+            outcomes[outcome] += 1
+
+    threads = [threading.Thread(target=buyer, args=(user_id,)) for user_id in user_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    db = connect_db()
+    cursor = db.cursor()
+    placeholders = ', '.join(['%s'] * len(product_ids))
+    cursor.execute(f"SELECT product_id, stock_quantity FROM products WHERE product_id IN ({placeholders})",
+                   tuple(product_ids))
+    final_stock = dict(cursor.fetchall())
+    cursor.execute(f"""
+        SELECT product_id, SUM(quantity) FROM order_items
+        WHERE product_id IN ({placeholders}) GROUP BY product_id
+    """, tuple(product_ids))
+    sold = {product_id: int(total) for product_id, total in cursor.fetchall()}
+
+    # Cleanup
+    user_placeholders = ', '.join(['%s'] * len(user_ids))
+    cursor.execute(f"DELETE FROM notifications WHERE user_id IN ({user_placeholders})", tuple(user_ids))
+    cursor.execute(f"""
+        DELETE FROM order_items
+        WHERE order_id IN (SELECT order_id FROM orders WHERE user_id IN ({user_placeholders}))
+    """, tuple(user_ids))
+    cursor.execute(f"DELETE FROM orders WHERE user_id IN ({user_placeholders})", tuple(user_ids))
+    cursor.execute(f"DELETE FROM users WHERE user_id IN ({user_placeholders})", tuple(user_ids))
+    db.commit()
+    db.close()
+    for product_id in product_ids:
+        ProductService.delete_product(product_id)
+
+    print(f"{args.buyers} buyers, {args.products} products x {args.stock} units, "
+          f"{args.units} unit(s) per line")
+    for outcome, count in sorted(outcomes.items()):
+        print(f"  {outcome}: {count}")
+
+    oversold = False
+    for product_id in product_ids:
+        units_sold = sold.get(product_id, 0)
+        consistent = final_stock[product_id] >= 0 and units_sold + final_stock[product_id] == args.stock
+        oversold = oversold or not consistent
+        print(f"  product {product_id}: sold {units_sold}, remaining {final_stock[product_id]}"
+              f"{'' if consistent else '  <-- OVERSOLD / INCONSISTENT'}")
+
+    if oversold:
+        print("FAIL: stock oversold")
+        sys.exit(1)
+    print("OK: no oversell")
+
+
+if __name__ == "__main__":
+    main()
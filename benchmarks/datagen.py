@@ -0,0 +1,328 @@
+"""
+Dataset Generator - Deterministic synthetic grocery data for the benchmark runner
+Seeds users, products, inventory batches, carts, orders, order_items and
+notifications at a scale set by the order count (1k to 10M), then rebuilds
+the maintained tables (sales rollups, dashboard summary, unread counters).
+
+Usage:
+    python -m benchmarks.datagen --orders 100000                   # current backend
+    python -m benchmarks.datagen --orders 1000 --seed 7 --manifest small.json
+    GROCERY_DB_BACKEND=sqlite python -m benchmarks.datagen --orders 1000000
+    python -m benchmarks.datagen --drop --manifest small.json       # remove a dataset
+
+The same --orders and --seed always produce the same rows (ids are offset
+from the tables' current maximum). Generated rows are prefixed gen_; the
+manifest records their id ranges, the shared password and the reserved
+bench customer/staff rows that benchmarks.runner writes to.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import db_config
+from config.db_config import connect_db
+
+GEN_PREFIX = "gen"
+DATASET_PASSWORD = "gen-password"
+DEFAULT_MANIFEST = "bench_dataset.json"
+BATCH_ROWS = 2000
+
+ORDER_STATUSES = [('delivered', 70), ('shipped', 10), ('confirmed', 15), ('cancelled', 5)]
+PAYMENT_METHODS = [('cash', 55), ('card', 35), ('online', 7), ('wallet', 3)]
+UNITS = ['unit', 'kg', 'g', 'liter', 'pack', 'dozen']
+WORDS = ['fresh', 'organic', 'ceylon', 'red', 'green', 'sweet', 'spicy', 'roasted', 'salted',
+         'coconut', 'mango', 'banana', 'rice', 'dhal', 'milk', 'curd', 'tea', 'bread', 'fish',
+         'chicken', 'onion', 'chilli', 'lime', 'papaya', 'cashew', 'jaggery', 'kithul', 'pol']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--orders', type=int, default=1000, help="orders to generate (1k - 10M)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--days', type=int, default=365, help="order history span")
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST)
+    parser.add_argument('--drop', action='store_true', help="delete the dataset in --manifest")
+    return parser.parse_args()
+
+
+def plan(orders):
+    """Row counts derived from the order count"""
+    users = max(50, orders // 5)
+    return {
+        'orders': orders,
+        'users': users,
+        'products': min(max(100, orders // 50), 50000),
+        'cart_users': max(10, users // 5),
+    }
+
+
+def weighted(rng, choices):
+    return rng.choices([value for value, _ in choices], [weight for _, weight in choices])[0]
+
+
+# ==================== WRITING ====================
+
+class BulkWriter:
+    """executemany in batches, committing each batch"""
+
+    def __init__(self):
+        self.db = connect_db()
+        self.cursor = self.db.cursor()
+        self.rows_written = 0
+
+    def write(self, table, columns, rows):
+        sql = (f"INSERT INTO {table} ({', '.join(columns)}) "
+               f"VALUES ({', '.join(['%s'] * len(columns))})")
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= BATCH_ROWS:
+                self._flush(sql, batch)
+                batch = []
+        if batch:
+            self._flush(sql, batch)
+
+    def _flush(self, sql, batch):
+        self.cursor.executemany(sql, batch)
+        self.db.commit()
+        self.rows_written += len(batch)
+
+    def scalar(self, sql, params=None):
+        self.cursor.execute(sql, params)
+        return self.cursor.fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
+
+def next_id(writer, table, column):
+    return writer.scalar(f"SELECT COALESCE(MAX({column}), 0) + 1 FROM {table}")
+
+
+# ==================== GENERATION ====================
+
+def generate(args):
+    from services import DashboardService, ProductService, SalesService, UserService
+
+    counts = plan(args.orders)
+    rng_for = lambda name: random.Random(f"{args.seed}-{name}")
+    password_hash = UserService.hash_password(DATASET_PASSWORD)
+    now = datetime.now().replace(microsecond=0)
+    today = now.date()
+
+    writer = BulkWriter()
+    category_ids = [row[0] for row in ProductService.get_all_categories()]
+    ids = {table: next_id(writer, table, column) for table, column in (
+        ('users', 'user_id'), ('staff', 'staff_id'), ('products', 'product_id'),
+        ('inventory', 'inventory_id'), ('orders', 'order_id'), ('order_items', 'order_item_id'),
+        ('notifications', 'notification_id'))}
+    tag = f"{GEN_PREFIX}{args.seed}_{ids['users']}"
+    started = time.perf_counter()
+
+    # Staff: one reserved for runner writes, one adding inventory
+    staff_id = ids['staff']
+    writer.write('staff', ('staff_id', 'username', 'password', 'email', 'full_name', 'role'), [
+        (staff_id, f"{tag}_staff", password_hash, f"{tag}_staff@example.com", "Bench Staff", 'manager'),
+        (staff_id + 1, f"{tag}_stock", password_hash, f"{tag}_stock@example.com", "Bench Stock", 'staff'),
+    ])
+
+    # Users (the first one is the runner's bench customer: no cart, no orders)
+    rng = rng_for('users')
+    first_user = ids['users']
+    writer.write('users', ('user_id', 'username', 'password', 'email', 'full_name', 'phone',
+                           'address', 'created_at', 'is_active'), (
+        (first_user + i, f"{tag}_u{i}", password_hash, f"{tag}_u{i}@example.com",
+         f"Customer {i}", f"07{rng.randrange(10 ** 8):08d}", f"{rng.randrange(1, 400)} Galle Road",
+         now - timedelta(days=rng.randrange(args.days + 30)), True)
+        for i in range(counts['users'])))
+
+    # Products, kept in memory for order lines (at most 50k)
+    rng = rng_for('products')
+    first_product = ids['products']
+    products = []
+    for i in range(counts['products']):
+        price = round(rng.uniform(40, 4000), 2)
+        expiry = today + timedelta(days=rng.randrange(-10, 180)) if rng.random() < 0.6 else None
+        products.append((first_product + i, f"{tag}_{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+                         rng.choice(category_ids), "Generated product", None, price,
+                         rng.choice(UNITS), rng.randrange(5000, 20000), 5, rng.random() < 0.97,
+                         rng.choice([0, 0, 0, 5, 10]), expiry and expiry - timedelta(days=200), expiry))
+    writer.write('products', ('product_id', 'name', 'category_id', 'description', 'image_path',
+                              'unit_price', 'unit', 'stock_quantity', 'min_stock_level',
+                              'is_available', 'discount_percent', 'manufactured_date', 'expiry_date'),
+                 products)
+
+    # Inventory: 1-3 batches per product
+    rng = rng_for('inventory')
+    batches = []
+    for product in products:
+        for _ in range(rng.randrange(1, 4)):
+            received = today - timedelta(days=rng.randrange(120))
+            quantity = rng.randrange(20, 500)
+            batches.append((ids['inventory'] + len(batches), product[0],
+                            f"{tag}_B{len(batches)}", quantity, rng.randrange(quantity + 1),
+                            round(float(product[5]) * 0.7, 2), f"Supplier {rng.randrange(40)}",
+                            received, received + timedelta(days=rng.randrange(5, 200)), staff_id + 1, ''))
+    writer.write('inventory', ('inventory_id', 'product_id', 'batch_number', 'quantity_received',
+                               'quantity_remaining', 'purchase_price', 'supplier_name',
+                               'received_date', 'expiry_date', 'added_by', 'notes'), batches)
+
+    # Carts of a fifth of the customers (never the bench customer)
+    rng = rng_for('carts')
+    cart_rows = []
+    for user_index in rng.sample(range(1, counts['users']), min(counts['cart_users'], counts['users'] - 1)):
+        for product in rng.sample(products, rng.randrange(1, 7)):
+            cart_rows.append((first_user + user_index, product[0], rng.randrange(1, 5)))
+    writer.write('shopping_cart', ('user_id', 'product_id', 'quantity'), cart_rows)
+
+    # Orders with their items and notifications, streamed in order_id order
+    last_notification = write_orders(writer, rng_for('orders'), counts, ids, first_user, products,
+                                     now, args.days, tag)
+
+    # notification_state for the generated customers
+    writer.cursor.execute("""
+        INSERT INTO notification_state (user_id, last_read_id, unread_count)
+        SELECT user_id, 0, SUM(is_read = FALSE) FROM notifications
+        WHERE user_id BETWEEN %s AND %s
+        GROUP BY user_id
+    """, (first_user, first_user + counts['users'] - 1))
+    writer.db.commit()
+    writer.close()
+
+    print("Rebuilding sales rollups and dashboard summary...")
+    SalesService.backfill()
+    DashboardService.rebuild()
+    ProductService.invalidate_catalog_cache()
+
+    manifest = {
+        'backend': db_config.DB_BACKEND,
+        'seed': args.seed,
+        'tag': tag,
+        'counts': counts,
+        'password': DATASET_PASSWORD,
+        'generated_at': now.isoformat(),
+        'rows_written': writer.rows_written,
+        'seconds': round(time.perf_counter() - started, 1),
+        'category_ids': category_ids,
+        'ranges': {
+            'users': [first_user, first_user + counts['users'] - 1],
+            'staff': [staff_id, staff_id + 1],
+            'products': [first_product, first_product + counts['products'] - 1],
+            'inventory': [ids['inventory'], ids['inventory'] + len(batches) - 1],
+            'orders': [ids['orders'], ids['orders'] + counts['orders'] - 1],
+            'notifications': [ids['notifications'], last_notification],
+        },
+        'bench_user': {'user_id': first_user, 'username': f"{tag}_u0"},
+        'bench_staff': {'staff_id': staff_id, 'username': f"{tag}_staff"},
+        'cart_user_ids': sorted({row[0] for row in cart_rows})[:1000],  # a sample
+    }
+    with open(args.manifest, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"{writer.rows_written} rows in {manifest['seconds']}s; manifest written to {args.manifest}")
+
+
+def write_orders(writer, rng, counts, ids, first_user, products, now, days, tag):
+    order_columns = ('order_id', 'user_id', 'order_number', 'total_amount', 'discount_amount',
+                     'final_amount', 'payment_method', 'payment_status', 'order_status',
+                     'delivery_address', 'delivery_phone', 'order_date', 'confirmed_at', 'delivered_at')
+    item_columns = ('order_item_id', 'order_id', 'product_id', 'product_name', 'quantity',
+                    'unit_price', 'subtotal')
+    notification_columns = ('notification_id', 'user_id', 'type', 'title', 'message', 'order_id',
+                            'is_read', 'created_at')
+    start = now - timedelta(days=days)
+    span = (now - start).total_seconds()
+    item_id, notification_id = ids['order_items'], ids['notifications']
+    total = counts['orders']
+    chunk = 10000
+
+    for chunk_start in range(0, total, chunk):
+        orders, items, notifications = [], [], []
+        for i in range(chunk_start, min(chunk_start + chunk, total)):
+            order_id = ids['orders'] + i
+            user_id = first_user + rng.randrange(1, counts['users'])
+            order_date = start + timedelta(seconds=span * i / total + rng.random() * 60)
+            order_date = order_date.replace(microsecond=0)
+            status = weighted(rng, ORDER_STATUSES)
+            method = weighted(rng, PAYMENT_METHODS)
+            order_total = 0.0
+            for product in rng.sample(products, rng.randrange(1, 7)):
+                quantity = rng.randrange(1, 5)
+                subtotal = round(float(product[5]) * quantity, 2)
+                order_total += subtotal
+                items.append((item_id, order_id, product[0], product[1], quantity, product[5], subtotal))
+                item_id += 1
+            order_total = round(order_total, 2)
+            number = f"ORD-{order_date:%Y%m%d%H%M%S}-{tag.upper()}-{i:08d}"
+            delivered_at = order_date + timedelta(days=2) if status == 'delivered' else None
+            orders.append((order_id, user_id, number, order_total, 0, order_total, method,
+                           'pending' if method == 'cash' and status != 'delivered' else 'paid',
+                           status, "Generated address", "0700000000", order_date, order_date,
+                           delivered_at))
+            old = (now - order_date).days > 7
+            notifications.append((notification_id, user_id, 'order_placed', "Order Placed Successfully!",
+                                  f"Your order {number} has been placed successfully.", order_id,
+                                  old or rng.random() < 0.5, order_date))
+            notification_id += 1
+            if delivered_at:
+                notifications.append((notification_id, user_id, 'order_delivered', "Order Delivered",
+                                      f"Your order {number} has been delivered!", order_id,
+                                      old or rng.random() < 0.5, delivered_at))
+                notification_id += 1
+        writer.write('orders', order_columns, orders)
+        writer.write('order_items', item_columns, items)
+        writer.write('notifications', notification_columns, notifications)
+        print(f"  orders {min(chunk_start + chunk, total)}/{total}", end='\r', flush=True)
+    print()
+    return notification_id - 1
+
+
+# ==================== REMOVAL ====================
+
+def drop(manifest_path):
+    from services import DashboardService, ProductService, SalesService
+
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    ranges = manifest['ranges']
+    users = tuple(ranges['users'])
+    db = connect_db()
+    cursor = db.cursor()
+    for table in ('notifications', 'notification_state', 'shopping_cart'):
+        cursor.execute(f"DELETE FROM {table} WHERE user_id BETWEEN %s AND %s", users)
+    # Orders placed by the runner's bench customer fall in the user range too
+    cursor.execute("""
+        DELETE FROM order_items WHERE order_id IN
+            (SELECT order_id FROM orders WHERE user_id BETWEEN %s AND %s)
+    """, users)
+    cursor.execute("DELETE FROM orders WHERE user_id BETWEEN %s AND %s", users)
+    cursor.execute("DELETE FROM users WHERE user_id BETWEEN %s AND %s", users)
+    cursor.execute("DELETE FROM inventory WHERE product_id BETWEEN %s AND %s", tuple(ranges['products']))
+    cursor.execute("DELETE FROM products WHERE product_id BETWEEN %s AND %s AND name LIKE %s",
+                   (*ranges['products'], f"{manifest['tag']}%"))
+    cursor.execute("DELETE FROM inventory WHERE added_by BETWEEN %s AND %s", tuple(ranges['staff']))
+    cursor.execute("DELETE FROM staff WHERE staff_id BETWEEN %s AND %s", tuple(ranges['staff']))
+    db.commit()
+    db.close()
+    SalesService.backfill()
+    DashboardService.rebuild()
+    ProductService.invalidate_catalog_cache()
+    os.remove(manifest_path)
+    print(f"Removed dataset {manifest['tag']}")
+
+
+def main():
+    args = parse_args()
+    if args.drop:
+        drop(args.manifest)
+    else:
+        generate(args)
+
+
+if __name__ == "__main__":
+    main()
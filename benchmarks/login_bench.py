@@ -0,0 +1,117 @@
+"""
+Login Throughput Benchmark - Logins per second under concurrent attempts
+Runs N threads of back-to-back logins and reports throughput and latency
+percentiles per thread count, for each bcrypt work factor given. bcrypt
+releases the GIL, so throughput should scale with threads up to the cores.
+
+Usage:
+    python -m benchmarks.login_bench                          # bcrypt only, no DB
+    python -m benchmarks.login_bench --rounds 10 12 --threads 1 2 4 8
+    python -m benchmarks.login_bench --db                     # UserService.login_user on grocery_app_db
+With --db a temporary user is created per work factor and removed afterwards.
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.user_service import UserService
+
+BENCH_PREFIX = "bench_login"
+PASSWORD = "correct horse battery staple"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, nargs='+', default=[10, 12], help="bcrypt work factors")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seconds', type=float, default=3.0, help="duration of each run")
+    parser.add_argument('--db', action='store_true', help="log in through UserService against the live DB")
+    return parser.parse_args()
+
+
+def run(login, threads, seconds):
+    """(logins per second, latencies in ms) for threads running login() for seconds"""
+    latencies = [[] for _ in range(threads)]
+    start_gate = threading.Barrier(threads + 1)
+    stop = threading.Event()
+
+    def worker(index):
+        start_gate.wait()
+        while not stop.is_set():
+            started = time.perf_counter()
+            if not login():
+                raise RuntimeError("login failed")
+            latencies[index].append((time.perf_counter() - started) * 1000)
+
+    workers = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_gate.wait()
+    started = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    samples = [ms for per_thread in latencies for ms in per_thread]
+    return len(samples) / elapsed, samples
+
+
+def db_user(rounds):
+    """Create a bench user hashed at rounds; returns (username, cleanup)"""
+    from config.db_config import connect_db
+
+    username = f"{BENCH_PREFIX}_{os.getpid()}_{rounds}"
+    db = connect_db()
+    cursor = db.cursor()
+    cursor.execute("INSERT INTO users (username, password, email) VALUES (%s, %s, %s)",
+                   (username, UserService.hash_password(PASSWORD, rounds), f"{username}@example.com"))
+    user_id = cursor.lastrowid
+    db.commit()
+    db.close()
+
+    def cleanup():
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
+        db.commit()
+        db.close()
+    return username, cleanup
+
+
+def main():
+    args = parse_args()
+    if args.db:
+        # One pooled connection per login thread
+        os.environ.setdefault('GROCERY_DB_POOL_SIZE', str(max(args.threads)))
+
+    print(f"{'rounds':>6} {'threads':>7} {'logins/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for rounds in args.rounds:
+        # Same cost for stored hashes and for new ones, so logins never trigger a rehash
+        UserService.BCRYPT_ROUNDS = rounds
+        if args.db:
+            username, cleanup = db_user(rounds)
+            login = lambda: UserService.login_user(username, PASSWORD) is not None
+        else:
+            hashed = UserService.hash_password(PASSWORD, rounds)
+            login = lambda: UserService.check_password(PASSWORD, hashed)
+            cleanup = None
+        try:
+            for threads in args.threads:
+                throughput, samples = run(login, threads, args.seconds)
+                samples.sort()
+                p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                print(f"{rounds:>6} {threads:>7} {throughput:>9.1f} {statistics.median(samples):>8.1f} "
+                      f"{p95:>8.1f} {samples[-1]:>8.1f}")
+        finally:
+            if cleanup:
+                cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Place Order Benchmark - Checkout latency against basket size
+Compares the set-based OrderService.place_order with the old per-line pipeline
+(one SELECT name + INSERT + UPDATE per cart line).
+
+Usage: python -m benchmarks.place_order_bench --sizes 1 5 10 20 40 --repeat 20
+Needs a reachable grocery_app_db; all rows it creates are removed afterwards.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db_config import connect_db
+from services.order_service import OrderService
+
+BENCH_PREFIX = "bench_place_order"
+
+
+def place_order_per_line(user_id, delivery_address, delivery_phone, payment_method='cash'):
+    """Reference implementation: the previous 3N-round-trip checkout"""
+    db = connect_db()
+    cursor = db.cursor()
+    cursor.execute("""
+        SELECT sc.product_id, sc.quantity, p.unit_price, p.stock_quantity
+        FROM shopping_cart sc
+        JOIN products p ON sc.product_id = p.product_id
+        WHERE sc.user_id = %s
+    """, (user_id,))
+    cart_items = cursor.fetchall()
+    total_amount = sum(item[1] * item[2] for item in cart_items)
+    order_number = f"ORD-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+    cursor.execute("""
+        INSERT INTO orders (user_id, order_number, total_amount, final_amount,
+                           payment_method, payment_status, delivery_address, delivery_phone,
+                           order_status, confirmed_at)
+        VALUES (%s, %s, %s, %s, %s, 'pending', %s, %s, 'confirmed', %s)
+    """, (user_id, order_number, total_amount, total_amount, payment_method,
+          delivery_address, delivery_phone, datetime.now()))
+    order_id = cursor.lastrowid
+    for product_id, quantity, price, stock in cart_items:
+        cursor.execute("SELECT name FROM products WHERE product_id = %s", (product_id,))
+        product_name = cursor.fetchone()[0]
+        cursor.execute("""
+            INSERT INTO order_items (order_id, product_id, product_name, quantity,
+                                   unit_price, subtotal)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, (order_id, product_id, product_name, quantity, price, quantity * price))
+        cursor.execute("""
+            UPDATE products SET stock_quantity = stock_quantity - %s WHERE product_id = %s
+        """, (quantity, product_id))
+    cursor.execute("DELETE FROM shopping_cart WHERE user_id = %s", (user_id,))
+    db.commit()
+    db.close()
+    return True, f"Order {order_number} placed successfully!"
+
+
+def setup_fixture(max_lines):
+    """Create a benchmark user and enough products for the largest basket"""
+    db = connect_db()
+    cursor = db.cursor()
+    cursor.execute("SELECT MIN(category_id) FROM categories")
+    category_id = cursor.fetchone()[0]
+    cursor.execute("""
+        INSERT INTO users (username, password, email, full_name)
+        VALUES (%s, 'x', %s, 'Benchmark User')
+    """, (f"{BENCH_PREFIX}_{os.getpid()}", f"{BENCH_PREFIX}_{os.getpid()}@example.com"))
+    user_id = cursor.lastrowid
+    product_ids = []
+    for i in range(max_lines):
+        cursor.execute("""
+            INSERT INTO products (name, category_id, unit_price, stock_quantity)
+            VALUES (%s, %s, %s, %s)
+        """, (f"{BENCH_PREFIX} item {i}", category_id, 100 + i, 10 ** 9))
+        product_ids.append(cursor.lastrowid)
+    db.commit()
+    db.close()
+    return user_id, product_ids
+
+
+def fill_cart(user_id, product_ids):
+    db = connect_db()
+    cursor = db.cursor()
+    cursor.executemany("""
+        INSERT INTO shopping_cart (user_id, product_id, quantity) VALUES (%s, %s, 1)
+    """, [(user_id, product_id) for product_id in product_ids])
+    db.commit()
+    db.close()
+
+
+def teardown_fixture(user_id, product_ids):
+    db = connect_db()
+    cursor = db.cursor()
+    cursor.execute("DELETE FROM notifications WHERE user_id = %s", (user_id,))
+    cursor.execute("""
+        DELETE oi FROM order_items oi JOIN orders o ON oi.order_id = o.order_id
+        WHERE o.user_id = %s
+    """, (user_id,))
+    cursor.execute("DELETE FROM orders WHERE user_id = %s", (user_id,))
+    cursor.execute("DELETE FROM shopping_cart WHERE user_id = %s", (user_id,))
+    cursor.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
+    cursor.executemany("DELETE FROM products WHERE product_id = %s",
+                       [(product_id,) for product_id in product_ids])
+    db.commit()
+    db.close()
+
+
+def time_checkout(checkout, user_id, product_ids, repeat):
+    """Time `repeat` checkouts of a basket holding every product in product_ids"""
+    samples = []
+    for _ in range(repeat):
+        fill_cart(user_id, product_ids)
+        start = time.perf_counter()
+        success, msg = checkout(user_id, "Benchmark Street", "0700000000")
+        samples.append((time.perf_counter() - start) * 1000)
+        if not success:
+            raise RuntimeError(msg)
+        # Order numbers are second-resolution; keep consecutive runs apart
+        time.sleep(1.01 - (time.perf_counter() - start) % 1)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 5, 10, 20, 40])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    user_id, product_ids = setup_fixture(max(args.sizes))
+    try:
+        print(f"{'lines':>6} {'per-line p50 ms':>16} {'set-based p50 ms':>17} {'speedup':>8}")
+        for size in args.sizes:
+            basket = product_ids[:size]
+            legacy = statistics.median(time_checkout(place_order_per_line, user_id, basket, args.repeat))
+            set_based = statistics.median(time_checkout(OrderService.place_order, user_id, basket, args.repeat))
+            print(f"{size:>6} {legacy:>16.2f} {set_based:>17.2f} {legacy / set_based:>7.1f}x")
+    finally:
+        teardown_fixture(user_id, product_ids)
+
+
+if __name__ == "__main__":
+    main()
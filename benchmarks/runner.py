@@ -0,0 +1,197 @@
+"""
+Benchmark Runner - Times every Order/Product/Inventory/User service method on a generated dataset
+Reports p50/p95/p99 latency and rows/sec per method and can save the results
+as a baseline or diff them against one.
+
+Usage:
+    python -m benchmarks.datagen --orders 100000                    # once
+    python -m benchmarks.runner --save-baseline baseline.json
+    python -m benchmarks.runner --baseline baseline.json --fail-on-regression
+    python -m benchmarks.runner --only 'ProductService.*' 'OrderService.get_*' --iterations 500
+The catalog cache is off unless --cache is given, so reads measure the
+backend. A method is a regression when its p50 or p95 is more than
+--threshold percent slower than the baseline's (and its p50 at least
+NOISE_MS slower).
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.cases import BenchContext, build_cases, uncovered
+from benchmarks.datagen import DEFAULT_MANIFEST
+from config import db_config
+from services.catalog_cache import catalog_cache
+
+NOISE_MS = 0.05  # slowdowns smaller than this are timer jitter, not regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST, help="written by benchmarks.datagen")
+    parser.add_argument('--only', nargs='+', metavar='PATTERN', help="Service.method glob patterns")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--max-seconds', type=float, default=10.0,
+                        help="stop a method early after this long (bcrypt calls are slow)")
+    parser.add_argument('--cache', action='store_true', help="leave the catalog cache on")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random row picks")
+    parser.add_argument('--save-baseline', metavar='PATH')
+    parser.add_argument('--baseline', metavar='PATH', help="diff against a saved baseline")
+    parser.add_argument('--threshold', type=float, default=10.0, help="regression threshold, percent")
+    parser.add_argument('--fail-on-regression', action='store_true', help="exit 1 on any regression")
+    return parser.parse_args()
+
+
+# ==================== MEASUREMENT ====================
+
+def count_rows(result):
+    """Rows a call returned: list length, first element of a (rows, token) page, else 1"""
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], list):
+        return len(result[0])
+    return 1
+
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def measure(case, ctx, iterations, warmup, max_seconds):
+    """Time case.call; setup runs untimed before each call"""
+    for _ in range(warmup):
+        case.call(ctx, case.setup(ctx))
+    samples, rows = [], 0
+    deadline = time.perf_counter() + max_seconds
+    for _ in range(iterations):
+        prepared = case.setup(ctx)
+        start = time.perf_counter()
+        result = case.call(ctx, prepared)
+        samples.append((time.perf_counter() - start) * 1000)
+        rows += count_rows(result)
+        if time.perf_counter() > deadline:
+            break
+    samples.sort()
+    total_seconds = sum(samples) / 1000
+    return {
+        'calls': len(samples),
+        'p50': samples[len(samples) // 2],
+        'p95': percentile(samples, 0.95),
+        'p99': percentile(samples, 0.99),
+        'mean': statistics.mean(samples),
+        'rows_per_sec': rows / total_seconds if total_seconds else 0.0,
+    }
+
+
+def run(cases, ctx, args):
+    results, errors = {}, {}
+    for case in cases:
+        print(f"  {case.name}...", end='\r', flush=True)
+        try:
+            results[case.name] = measure(case, ctx, args.iterations, args.warmup, args.max_seconds)
+        except Exception as e:
+            errors[case.name] = f"{type(e).__name__}: {e}"
+        finally:
+            if case.teardown:
+                case.teardown(ctx)
+        print(' ' * 60, end='\r')
+    return results, errors
+
+
+# ==================== REPORTING ====================
+
+def report(results, errors, missing):
+    header = (f"{'method':<48}{'calls':>7}{'p50':>10}{'p95':>10}{'p99':>10}"
+              f"{'mean':>10}{'rows/sec':>12}")
+    print(header)
+    print('-' * len(header))
+    for name, figures in results.items():
+        print(f"{name:<48}{figures['calls']:>7}{figures['p50']:>10.3f}{figures['p95']:>10.3f}"
+              f"{figures['p99']:>10.3f}{figures['mean']:>10.3f}{figures['rows_per_sec']:>12.0f}")
+    print("(milliseconds per call)")
+    for name, error in errors.items():
+        print(f"ERROR {name}: {error}")
+    if missing:
+        print(f"No case for: {', '.join(missing)}")
+
+
+def diff(results, baseline, threshold):
+    """Print the change against a baseline; returns the regressed method names"""
+    regressions = []
+    print(f"\nAgainst baseline from {baseline['run_at']} ({baseline['backend']}):")
+    print(f"{'method':<48}{'p50 base':>10}{'p50 now':>10}{'change':>9}{'p95 change':>12}")
+    for name, figures in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            print(f"{name:<48}{'-':>10}{figures['p50']:>10.3f}{'new':>9}")
+            continue
+        changes = [(figures[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+                   for key in ('p50', 'p95')]
+        flag = ''
+        if max(changes) > threshold and figures['p50'] - before['p50'] > NOISE_MS:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<48}{before['p50']:>10.3f}{figures['p50']:>10.3f}{changes[0]:>+8.1f}%"
+              f"{changes[1]:>+11.1f}%{flag}")
+    not_run = [name for name in baseline['results'] if name not in results]
+    if not_run:
+        print(f"({len(not_run)} baseline methods not run)")
+    print(f"{len(regressions)} regression(s) over {threshold:g}%")
+    return regressions
+
+
+def main():
+    args = parse_args()
+    with open(args.manifest, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest['backend'] != db_config.DB_BACKEND:
+        sys.exit(f"The dataset was generated on {manifest['backend']} but the backend is "
+                 f"{db_config.DB_BACKEND} (set GROCERY_DB_BACKEND)")
+    if not args.cache:
+        catalog_cache.ttl = 0
+
+    cases = build_cases()
+    missing = uncovered(cases)
+    if args.only:
+        cases = [case for case in cases
+                 if any(fnmatch.fnmatchcase(case.name, pattern) for pattern in args.only)]
+    print(f"Running {len(cases)} methods on {manifest['backend']} "
+          f"({manifest['counts']['orders']} orders, {args.iterations} iterations)...")
+
+    ctx = BenchContext(manifest, args.seed)
+    try:
+        results, errors = run(cases, ctx, args)
+    finally:
+        ctx.close()
+    report(results, errors, missing)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'run_at': datetime.now().isoformat(timespec='seconds'),
+                'backend': manifest['backend'],
+                'python': platform.python_version(),
+                'counts': manifest['counts'],
+                'iterations': args.iterations,
+                'cache': args.cache,
+                'results': results,
+            }, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = diff(results, json.load(f), args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Search Index Benchmark - Build time and query latency of the in-memory
+product search index at 10k / 100k / 1M synthetic products, plus an
+optional comparison of LIKE '%term%', FULLTEXT and the index on the live DB.
+
+Usage:
+    python -m benchmarks.search_index_bench                       # 10k, 100k, 1M
+    python -m benchmarks.search_index_bench --sizes 10000 100000
+    python -m benchmarks.search_index_bench --db                  # live grocery_app_db
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.search_index import ProductSearchIndex
+
+ADJECTIVES = ["fresh", "organic", "frozen", "sweet", "spicy", "smoked", "roasted", "natural",
+              "premium", "local", "creamy", "crispy", "salted", "unsalted", "whole", "sliced"]
+NOUNS = ["mango", "banana", "coconut", "milk", "bread", "cake", "chicken", "fish", "rice",
+         "lentils", "tea", "coffee", "cheese", "yogurt", "butter", "juice", "biscuits",
+         "noodles", "papaya", "pineapple", "onion", "potato", "carrot", "cabbage", "soap",
+         "shampoo", "sugar", "flour", "chilli", "curry", "cinnamon", "cardamom"]
+BRANDS = ["lanka", "ceylon", "kandy", "galle", "jaffna", "colombo", "nuwara", "matara"]
+UNITS = ["100g", "250g", "500g", "1kg", "1l", "400ml", "pack", "6pcs"]
+
+QUERIES = {
+    'exact': ["coconut milk", "mango", "ceylon tea", "chicken curry"],
+    'prefix': ["coco", "pinea", "card", "shamp"],
+    'typo': ["cocnut", "mnago", "pinapple", "cinamon"],
+    'multi-word': ["fresh organic mango", "kandy premium tea 500g", "spicy chicken"],
+}
+
+
+def synthetic_rows(count, seed=42):
+    rng = random.Random(seed)
+    for product_id in range(1, count + 1):
+        name = (f"{rng.choice(BRANDS).title()} {rng.choice(ADJECTIVES).title()} "
+                f"{rng.choice(NOUNS).title()} {rng.choice(UNITS)}")
+        description = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} from {rng.choice(BRANDS)}"
+        yield product_id, name, description, rng.random() > 0.05
+
+
+def time_queries(search, repeat):
+    results = {}
+    for kind, queries in QUERIES.items():
+        samples = []
+        for _ in range(repeat):
+            for query in queries:
+                start = time.perf_counter()
+                search(query)
+                samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        results[kind] = (statistics.median(samples), samples[int(len(samples) * 0.95) - 1])
+    return results
+
+
+def bench_memory(sizes, repeat):
+    print(f"{'products':>9} {'build s':>8} " + ' '.join(f"{k + ' p50/p95 ms':>22}" for k in QUERIES))
+    for size in sizes:
+        index = ProductSearchIndex()
+        start = time.perf_counter()
+        index.build(synthetic_rows(size))
+        build_s = time.perf_counter() - start
+        timings = time_queries(lambda q: index.search(q, limit=100), repeat)
+        cells = ' '.join(f"{p50:>10.2f} / {p95:>9.2f}" for p50, p95 in timings.values())
+        print(f"{size:>9} {build_s:>8.2f} {cells}")
+
+
+def bench_db(repeat):
+    from config.db_config import connect_db
+    from services.product_service import ProductService, product_search_index
+
+    def like_search(term):
+        db = connect_db()
+        cursor = db.cursor()
+        pattern = f"%{term}%"
+        cursor.execute("""
+            SELECT product_id FROM products
+            WHERE (name LIKE %s OR description LIKE %s) AND is_available = TRUE
+            ORDER BY name
+        """, (pattern, pattern))
+        cursor.fetchall()
+        db.close()
+
+    product_search_index.build()
+    backends = {
+        "LIKE '%term%'": like_search,
+        'FULLTEXT': lambda q: ProductService._fulltext_search_ids(q, 100),
+        'memory index': lambda q: product_search_index.search(q, 100),
+    }
+    print(f"live DB: {len(product_search_index)} products")
+    print(f"{'backend':>14} " + ' '.join(f"{k + ' p50/p95 ms':>22}" for k in QUERIES))
+    for name, search in backends.items():
+        timings = time_queries(search, repeat)
+        cells = ' '.join(f"{p50:>10.2f} / {p95:>9.2f}" for p50, p95 in timings.values())
+        print(f"{name:>14} {cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--db', action='store_true', help="compare backends on the live database")
+    args = parser.parse_args()
+
+    if args.db:
+        bench_db(args.repeat)
+    else:
+        bench_memory(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
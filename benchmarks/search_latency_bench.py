@@ -0,0 +1,150 @@
+"""
+Search Latency Harness - Replays keystroke traces through DebouncedSearch
+Reports how many queries each trace issues, how many stale results are
+dropped and the delay from the last keystroke to the final render, next to
+the per-keystroke baseline the shop screen used to run on the Tk thread.
+
+Usage:
+    python -m benchmarks.search_latency_bench                  # built-in traces, live DB
+    python -m benchmarks.search_latency_bench --fake-ms 40     # simulated 40ms query, no DB
+    python -m benchmarks.search_latency_bench --traces my_traces.json --delay-ms 200
+
+Trace file format: {"name": [[offset_ms, "entry text"], ...], ...}
+"""
+import argparse
+import heapq
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui.ui_components import DebouncedSearch
+
+
+def typed(text, interval_ms, start_ms=0):
+    """Trace for typing text at a steady pace"""
+    return [[start_ms + i * interval_ms, text[:i + 1]] for i in range(len(text))]
+
+
+BUILTIN_TRACES = {
+    'coconut milk (steady 110ms)': typed("coconut milk", 110),
+    'coconut milk (fast 60ms)': typed("coconut milk", 60),
+    'mango with typo + backspace': (
+        typed("mnag", 140)
+        + [[700, "mna"], [820, "mn"], [940, "m"]]
+        + typed("mango", 130, start_ms=1200)[1:]
+    ),
+    'bread (hunt and peck 320ms)': typed("bread", 320),
+}
+
+
+class ReplayScheduler:
+    """Headless stand-in for Tk's after()/after_cancel() running in real time"""
+
+    def __init__(self):
+        self._queue = []
+        self._ids = itertools.count()
+        self._cancelled = set()
+        self.start = time.perf_counter()
+
+    def now_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def after(self, ms, func, *args):
+        timer_id = next(self._ids)
+        heapq.heappush(self._queue, (self.now_ms() + ms, timer_id, func, args))
+        return timer_id
+
+    def at(self, due_ms, func, *args):
+        timer_id = next(self._ids)
+        heapq.heappush(self._queue, (due_ms, timer_id, func, args))
+        return timer_id
+
+    def after_cancel(self, timer_id):
+        self._cancelled.add(timer_id)
+
+    def run(self):
+        while self._queue:
+            due, timer_id, func, args = heapq.heappop(self._queue)
+            if timer_id in self._cancelled:
+                continue
+            wait = (due - self.now_ms()) / 1000
+            if wait > 0:
+                time.sleep(wait)
+            func(*args)
+
+
+def replay(trace, search_fn, delay_ms):
+    """Replay one trace; returns a metrics dict"""
+    scheduler = ReplayScheduler()
+    renders = []
+
+    def on_results(term, results):
+        renders.append((scheduler.now_ms(), term, len(results or [])))
+
+    pipeline = DebouncedSearch(scheduler, search_fn, on_results, delay_ms=delay_ms, poll_ms=10)
+    for offset_ms, text in trace:
+        scheduler.at(offset_ms, pipeline.submit, text)
+    scheduler.run()
+    pipeline.close()
+
+    last_key_ms = trace[-1][0]
+    final = renders[-1] if renders else (None, None, 0)
+    return {
+        'keystrokes': len(trace),
+        'queries': pipeline.stats['queries'],
+        'dropped': pipeline.stats['dropped'] + pipeline.stats['skipped'],
+        'renders': len(renders),
+        'final_term': final[1],
+        'final_rows': final[2],
+        'settle_ms': (final[0] - last_key_ms) if final[0] is not None else None,
+    }
+
+
+def baseline(trace, search_fn):
+    """Old behaviour: one synchronous query (and grid rebuild) per keystroke"""
+    blocked = 0.0
+    for _, text in trace:
+        start = time.perf_counter()
+        search_fn(text)
+        blocked += (time.perf_counter() - start) * 1000
+    return {'queries': len(trace), 'ui_blocked_ms': blocked}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--traces', help="JSON file of recorded keystroke traces")
+    parser.add_argument('--delay-ms', type=int, default=250, help="debounce delay")
+    parser.add_argument('--fake-ms', type=float, help="simulate a query of this many ms instead of MySQL")
+    args = parser.parse_args()
+
+    traces = BUILTIN_TRACES
+    if args.traces:
+        with open(args.traces, encoding='utf-8') as f:
+            traces = json.load(f)
+
+    if args.fake_ms is not None:
+        def search_fn(term):
+            time.sleep(args.fake_ms / 1000)
+            return [term]
+    else:
+        from services.product_service import ProductService
+        search_fn = ProductService.search_products
+
+    print(f"debounce {args.delay_ms}ms, query "
+          f"{'%.0fms simulated' % args.fake_ms if args.fake_ms is not None else 'ProductService.search_products'}")
+    print(f"{'trace':<30} {'keys':>5} {'old q':>6} {'old UI blocked ms':>18} "
+          f"{'new q':>6} {'dropped':>8} {'renders':>8} {'settle ms':>10}")
+    for name, trace in traces.items():
+        old = baseline(trace, search_fn)
+        new = replay(trace, search_fn, args.delay_ms)
+        settle = f"{new['settle_ms']:.0f}" if new['settle_ms'] is not None else '-'
+        print(f"{name[:30]:<30} {new['keystrokes']:>5} {old['queries']:>6} {old['ui_blocked_ms']:>18.1f} "
+              f"{new['queries']:>6} {new['dropped']:>8} {new['renders']:>8} {settle:>10}")
+
+
+if __name__ == "__main__":
+    main()
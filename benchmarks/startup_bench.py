@@ -0,0 +1,148 @@
+"""
+Startup Benchmark - GUI import time and time to first frame in fresh interpreters
+Each run starts a new Python process, so nothing is warm except the OS file
+cache. Reports the medians and which heavy modules (Pillow, bcrypt, the
+MySQL driver, the screen modules) were already loaded - none should be
+before the login window shows.
+
+Usage:
+    python -m benchmarks.startup_bench                               # 10 runs
+    python -m benchmarks.startup_bench --runs 20 --save-baseline startup.json
+    python -m benchmarks.startup_bench --baseline startup.json --fail-on-regression
+Time to first frame needs a display (it is skipped without one); the login
+screen is built and painted with root.update(), then the window is closed.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('PIL', 'PIL.ImageTk', 'bcrypt', 'mysql.connector', 'gui.screens.shop',
+                 'gui.screens.admin', 'gui.screens.admin_products', 'gui.screens.checkout')
+
+IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import gui.modern_app
+elapsed = (time.perf_counter() - started) * 1000
+print('RESULT ' + json.dumps({'ms': elapsed, 'loaded': [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+FRAME_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import tkinter
+from gui.modern_app import ModernGroceryApp
+try:
+    root = tkinter.Tk()
+except tkinter.TclError as e:
+    print('RESULT ' + json.dumps({'skipped': str(e)}))
+    sys.exit(0)
+app = ModernGroceryApp(root)
+root.update()
+elapsed = (time.perf_counter() - started) * 1000
+loaded = [m for m in %r if m in sys.modules]
+root.destroy()
+print('RESULT ' + json.dumps({'ms': elapsed, 'loaded': loaded}))
+""" % (HEAVY_MODULES,)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--save-baseline', metavar='PATH')
+    parser.add_argument('--baseline', metavar='PATH')
+    parser.add_argument('--threshold', type=float, default=15.0, help="regression threshold, percent")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    return parser.parse_args()
+
+
+# ==================== MEASUREMENT ====================
+
+def probe(code):
+    """Run code in a fresh interpreter; (its RESULT dict, wall ms including interpreter start)"""
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+    wall = (time.perf_counter() - started) * 1000
+    for line in completed.stdout.splitlines():
+        if line.startswith('RESULT '):
+            return json.loads(line[len('RESULT '):]), wall
+    raise RuntimeError(f"Probe failed:\n{completed.stderr.strip()}")
+
+
+def measure(code, runs):
+    samples, walls, loaded = [], [], set()
+    for _ in range(runs):
+        result, wall = probe(code)
+        if 'skipped' in result:
+            return {'skipped': result['skipped']}
+        samples.append(result['ms'])
+        walls.append(wall)
+        loaded.update(result['loaded'])
+    return {
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'process_ms': statistics.median(walls),
+        'loaded': sorted(loaded),
+    }
+
+
+# ==================== REPORTING ====================
+
+def report(results):
+    for name, figures in results.items():
+        if 'skipped' in figures:
+            print(f"{name:<16} skipped: {figures['skipped']}")
+            continue
+        print(f"{name:<16} median {figures['median_ms']:8.1f} ms   min {figures['min_ms']:8.1f} ms   "
+              f"process {figures['process_ms']:8.1f} ms")
+        if figures['loaded']:
+            print(f"{'':<16} already loaded: {', '.join(figures['loaded'])}")
+
+
+def diff(results, baseline, threshold):
+    regressions = []
+    for name, figures in results.items():
+        before = baseline['results'].get(name, {})
+        if 'median_ms' not in figures or 'median_ms' not in before:
+            continue
+        change = (figures['median_ms'] - before['median_ms']) / before['median_ms'] * 100
+        newly_loaded = sorted(set(figures['loaded']) - set(before['loaded']))
+        flag = ''
+        if change > threshold or newly_loaded:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<16} {before['median_ms']:8.1f} -> {figures['median_ms']:8.1f} ms ({change:+.1f}%)"
+              f"{' newly loaded: ' + ', '.join(newly_loaded) if newly_loaded else ''}{flag}")
+    return regressions
+
+
+def main():
+    args = parse_args()
+    print(f"Measuring startup over {args.runs} fresh interpreters...")
+    results = {
+        'import': measure(IMPORT_PROBE, args.runs),
+        'first_frame': measure(FRAME_PROBE, args.runs),
+    }
+    report(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'runs': args.runs, 'results': results}, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = diff(results, json.load(f), args.threshold)
+        print(f"{len(regressions)} regression(s)")
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
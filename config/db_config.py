@@ -1,24 +1,129 @@
-import mysql.connector
+# Configuration module
+import os
+import sqlite3
+import threading
+
+mysql = None  # mysql.connector, imported with the first MySQL connection (slow to import)
+
+# Always through the config package: a second copy of db_pool under another
+# module name would have its own per-thread usage counters
+from config.db_pool import ConnectionPool, PoolTimeoutError
+from config import sqlite_backend
+
+# Storage backend: 'mysql' (shared server) or 'sqlite' (embedded file, for
+# offline terminals and tests; schema created from database_schema.sql)
+DB_BACKEND = os.environ.get('GROCERY_DB_BACKEND', 'mysql')
+SQLITE_PATH = os.environ.get('GROCERY_SQLITE_PATH',
+                             os.path.join(os.path.expanduser('~'), '.buyme_grocery', 'grocery_app.db'))
+
+DB_CONFIG = {
+    'host': "localhost",
+    'user': "root",
+    'password': "root123",   # 🔁 Replace this with your actual MySQL root password
+    'database': "grocery_app_db",
+}
+
+# Pool settings (override with environment variables on busy terminals)
+POOL_CONFIG = {
+    'size': int(os.environ.get('GROCERY_DB_POOL_SIZE', 5)),
+    'min_idle': int(os.environ.get('GROCERY_DB_POOL_MIN_IDLE', 1)),
+    'idle_timeout': float(os.environ.get('GROCERY_DB_POOL_IDLE_TIMEOUT', 300)),
+    'health_check_interval': float(os.environ.get('GROCERY_DB_POOL_HEALTH_CHECK', 30)),
+    'acquire_timeout': float(os.environ.get('GROCERY_DB_POOL_ACQUIRE_TIMEOUT', 10)),
+}
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _open_connection():
+    """Open a brand new (unpooled) connection to the grocery_app_db database"""
+    global mysql
+    if DB_BACKEND == 'sqlite':
+        return sqlite_backend.connect(SQLITE_PATH, timeout=POOL_CONFIG['acquire_timeout'])
+    if mysql is None:
+        import mysql.connector
+    return mysql.connector.connect(autocommit=False, **DB_CONFIG)
+
+
+def db_errors():
+    """Driver exception classes of the backends in use (catch with ``except db_errors()``)"""
+    return (sqlite3.Error,) + ((mysql.connector.Error,) if mysql else ())
+
+
+def use_backend(backend, sqlite_path=None):
+    """Switch the storage backend ('mysql' or 'sqlite') for connections opened from now on
+
+    Idle pooled connections to the old backend are closed; borrowed ones
+    finish on it.
+    """
+    global DB_BACKEND, SQLITE_PATH, _pool
+    if backend not in ('mysql', 'sqlite'):
+        raise ValueError(f"Unknown storage backend: {backend}")
+    with _pool_lock:
+        old_pool, _pool = _pool, None
+        DB_BACKEND = backend
+        if sqlite_path:
+            SQLITE_PATH = sqlite_path
+    if old_pool is not None:
+        old_pool.close_all()
+
+
+def get_pool():
+    """Get the shared connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(_open_connection, **POOL_CONFIG)
+    return _pool
+
+
+def reset_pool():
+    """Forget the inherited pool in a forked child (its sockets belong to the parent)
+
+    The child opens its own connections on next use. The old ones are not
+    closed here - that would end the parent's sessions.
+    """
+    global _pool
+    with _pool_lock:
+        _pool = None
+
 
 def connect_db():
-    """Connect to the grocery_app_db database"""
-    return mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="root123",   # 🔁 Replace this with your actual MySQL root password
-        database="grocery_app_db"
-    )
+    """Borrow a connection to the grocery_app_db database from the pool
+
+    Calling close() on the returned connection hands it back to the pool.
+    """
+    return get_pool().acquire()
+
+
+def pooled_connection():
+    """Context manager: ``with pooled_connection() as db: ...``
+
+    Commits when the block succeeds, rolls back on error, then returns
+    the connection to the pool.
+    """
+    return get_pool().acquire()
+
+
+def get_pool_stats():
+    """Get pool hit/miss/wait metrics"""
+    return get_pool().stats()
+
+
+def warm_up():
+    """Open a pooled connection ahead of the first query (run it off the UI thread)"""
+    try:
+        connect_db().close()
+    except Exception as err:
+        print(f"Database warm-up failed: {err}")
+
 
 def get_db_connection():
     """Alternative connection method with error handling"""
     try:
-        return mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password="root123",
-            database="grocery_app_db",
-            autocommit=False
-        )
-    except mysql.connector.Error as err:
+        return connect_db()
+    except db_errors() + (PoolTimeoutError,) as err:
         print(f"Database connection error: {err}")
         return None
@@ -0,0 +1,288 @@
+"""
+Database Connection Pool - Reuses MySQL connections across service calls
+Bounded pool with health checks, idle reaping and hit/miss/wait metrics
+"""
+import threading
+import time
+from collections import deque
+
+from config.query_log import query_log
+
+_thread_usage = threading.local()
+
+
+def thread_db_seconds():
+    """Total seconds the calling thread has held pooled connections (for profilers)"""
+    return getattr(_thread_usage, 'seconds', 0.0)
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available within the acquire timeout"""
+
+
+class PooledConnection:
+    """Proxy around a raw connection that returns it to the pool on close()
+
+    Behaves like the mysql.connector connection it wraps, so existing code
+    that does ``db = connect_db() ... db.close()`` keeps working unchanged.
+    Also usable as a context manager: commits on success, rolls back on error.
+    """
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self._operation = None  # query_log operation, on the first instrumented cursor
+        self._borrowed_at = time.perf_counter()
+
+    def __getattr__(self, name):
+        raw = self.__dict__.get('_raw')
+        if raw is None:
+            raise AttributeError(f"Connection already returned to pool (accessing '{name}')")
+        return getattr(raw, name)
+
+    def cursor(self, *args, **kwargs):
+        """Open a cursor (timed by query_log while it is enabled)"""
+        cursor = self.__getattr__('cursor')(*args, **kwargs)
+        if not query_log.is_recording():
+            return cursor
+        if self._operation is None:
+            self._operation = query_log.begin()
+        return query_log.wrap(cursor, self._operation)
+
+    def close(self):
+        """Return the connection to the pool instead of closing the socket"""
+        operation, self._operation = self._operation, None
+        if operation is not None:
+            query_log.end(operation)
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            _thread_usage.seconds = thread_db_seconds() + time.perf_counter() - self._borrowed_at
+            self._pool.release(raw)
+
+    def __del__(self):
+        # Connection dropped without close() (e.g. an exception skipped it):
+        # its session state is unknown, so free the slot by closing it outright.
+        # The garbage collector can run this on any thread, even one already
+        # holding the pool lock, so it must not take the lock itself
+        raw = self.__dict__.get('_raw')
+        if raw is not None:
+            self._raw = None
+            self._pool._abandon(raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._raw is not None:
+                if exc_type is None:
+                    self._raw.commit()
+                else:
+                    self._raw.rollback()
+        finally:
+            self.close()
+        return False
+
+
+class ConnectionPool:
+    """Thread-safe pool of database connections
+
+    - size: maximum number of open connections
+    - min_idle: connections kept open even when idle reaping runs
+    - idle_timeout: seconds an idle connection may sit before it is closed
+    - health_check_interval: idle seconds after which a connection is pinged
+      before being handed out
+    - acquire_timeout: seconds to wait for a free connection when the pool is full
+    """
+
+    ABANDONED_CHECK_INTERVAL = 0.5  # seconds between looks for slots freed by __del__
+
+    def __init__(self, factory, size=5, min_idle=1, idle_timeout=300,
+                 health_check_interval=30, acquire_timeout=10):
+        self._factory = factory
+        self.size = max(1, int(size))
+        self.min_idle = max(0, min(int(min_idle), self.size))
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._idle = deque()  # (raw_connection, returned_at), most recent on the right
+        self._open_count = 0
+        self._abandoned = deque()  # slots freed by PooledConnection.__del__, not yet counted
+        self._last_reap = time.monotonic()
+
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'timeouts': 0,
+            'created': 0,
+            'closed': 0,
+            'health_check_failures': 0,
+            'reaped': 0,
+        }
+
+    # ==================== ACQUIRE & RELEASE ====================
+
+    def acquire(self, timeout=None):
+        """Borrow a connection from the pool (returns a PooledConnection)"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited = False
+        wait_started = None
+
+        while True:
+            raw = None
+            create = False
+            with self._lock:
+                while True:
+                    self._settle_abandoned()
+                    if self._idle:
+                        raw, returned_at = self._idle.pop()
+                        break
+                    if self._open_count < self.size:
+                        self._open_count += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        if waited:
+                            self._stats['wait_time_total'] += time.monotonic() - wait_started
+                        raise PoolTimeoutError(
+                            f"No database connection available after {timeout}s "
+                            f"(pool size {self.size})")
+                    if not waited:
+                        waited = True
+                        wait_started = time.monotonic()
+                        self._stats['waits'] += 1
+                    # Bounded: a slot freed by __del__ comes without a notify
+                    self._available.wait(min(remaining, self.ABANDONED_CHECK_INTERVAL))
+
+                if waited:
+                    self._stats['wait_time_total'] += time.monotonic() - wait_started
+                    waited = False
+
+            if create:
+                try:
+                    raw = self._factory()
+                except Exception:
+                    with self._lock:
+                        self._open_count -= 1
+                        self._available.notify()
+                    raise
+                with self._lock:
+                    self._stats['misses'] += 1
+                    self._stats['created'] += 1
+                return PooledConnection(self, raw)
+
+            # Reused connection - ping it first if it has been idle for a while
+            if time.monotonic() - returned_at >= self.health_check_interval and not self._is_healthy(raw):
+                with self._lock:
+                    self._stats['health_check_failures'] += 1
+                self._discard(raw)
+                continue
+
+            with self._lock:
+                self._stats['hits'] += 1
+            return PooledConnection(self, raw)
+
+    def release(self, raw):
+        """Return a raw connection to the pool, resetting any leftover state"""
+        try:
+            if getattr(raw, 'unread_result', False):
+                raw.consume_results()
+            if getattr(raw, 'in_transaction', False):
+                raw.rollback()
+        except Exception:
+            self._discard(raw)
+            return
+
+        with self._lock:
+            self._idle.append((raw, time.monotonic()))
+            self._available.notify()
+        self._maybe_reap()
+
+    def connection(self):
+        """Context-manager friendly alias for acquire()"""
+        return self.acquire()
+
+    # ==================== MAINTENANCE ====================
+
+    def reap_idle(self):
+        """Close connections idle longer than idle_timeout (keeps min_idle open)"""
+        now = time.monotonic()
+        stale = []
+        with self._lock:
+            self._last_reap = now
+            # Oldest connections sit on the left of the deque
+            while len(self._idle) > self.min_idle and now - self._idle[0][1] >= self.idle_timeout:
+                stale.append(self._idle.popleft()[0])
+            self._stats['reaped'] += len(stale)
+        for raw in stale:
+            self._discard(raw)
+        return len(stale)
+
+    def close_all(self):
+        """Close every idle connection (borrowed ones are unaffected)"""
+        with self._lock:
+            idle = [raw for raw, _ in self._idle]
+            self._idle.clear()
+        for raw in idle:
+            self._discard(raw)
+
+    def stats(self):
+        """Snapshot of pool metrics"""
+        with self._lock:
+            self._settle_abandoned()
+            stats = dict(self._stats)
+            stats['size'] = self.size
+            stats['open'] = self._open_count
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = self._open_count - len(self._idle)
+        borrowed = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / borrowed if borrowed else 0.0
+        stats['avg_wait'] = stats['wait_time_total'] / stats['waits'] if stats['waits'] else 0.0
+        return stats
+
+    # ==================== INTERNAL HELPERS ====================
+
+    def _maybe_reap(self):
+        if time.monotonic() - self._last_reap >= min(self.idle_timeout, 60):
+            self.reap_idle()
+
+    @staticmethod
+    def _is_healthy(raw):
+        try:
+            return raw.is_connected()
+        except Exception:
+            return False
+
+    def _abandon(self, raw):
+        # Lock-free: only closes the socket and records the freed slot
+        try:
+            raw.close()
+        except Exception:
+            pass
+        self._abandoned.append(None)  # deque.append is thread-safe
+
+    def _settle_abandoned(self):
+        # Caller holds self._lock
+        while self._abandoned:
+            self._abandoned.popleft()
+            self._open_count -= 1
+            self._stats['closed'] += 1
+            self._available.notify()
+
+    def _discard(self, raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._open_count -= 1
+            self._stats['closed'] += 1
+            self._available.notify()
@@ -0,0 +1,368 @@
+"""
+Query Log - SQL instrumentation for pooled connections
+Records every statement's fingerprint, duration, rows and calling service
+method, writes slow SELECTs with their EXPLAIN plan to the slow-query log and
+flags a fingerprint repeated within one connection borrow as N+1.
+Off unless GROCERY_SQL_LOG=1 (or query_log.enable()); per-screen report via
+query_log.format_report().
+"""
+import contextlib
+import functools
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+SERVICES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'services')
+NOT_CALLERS = {os.path.join(SERVICES_DIR, 'catalog_cache.py')}  # decorator machinery around services
+NO_SCREEN = '-'
+
+_LITERALS = re.compile(r"'(?:[^'\\]|\\.)*'|\b\d+(?:\.\d+)?\b|%s|\?")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LISTS = re.compile(r"(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+
+
+@functools.lru_cache(maxsize=1024)
+def fingerprint(sql):
+    """Statement shape: literals and placeholders become ?, IN lists collapse"""
+    shape = _LITERALS.sub('?', ' '.join(sql.split()))
+    shape = _IN_LISTS.sub('IN (...)', shape)
+    return _VALUES_LISTS.sub(r'\1, ...', shape)
+
+
+def _caller():
+    """Outermost service method on the stack (else the nearest caller outside config/)"""
+    frame = sys._getframe(2)
+    found = nearest = None
+    while frame is not None:
+        code = frame.f_code
+        name = getattr(code, 'co_qualname', code.co_name)  # co_qualname is Python 3.11+
+        if code.co_filename.startswith(SERVICES_DIR):
+            if '<locals>' not in name and code.co_filename not in NOT_CALLERS:
+                found = name
+        elif nearest is None and os.path.basename(os.path.dirname(code.co_filename)) != 'config':
+            nearest = f"{os.path.splitext(os.path.basename(code.co_filename))[0]}.{name}"
+        frame = frame.f_back
+    return found or nearest or '?'
+
+
+class QueryRecord:
+    """One executed statement"""
+    __slots__ = ('sql', 'params', 'fingerprint', 'caller', 'screen', 'at', 'duration_ms', 'rows')
+
+    def __init__(self, sql, params, caller, screen, duration_ms, rows):
+        self.sql = sql
+        self.params = params
+        self.fingerprint = fingerprint(sql)
+        self.caller = caller
+        self.screen = screen
+        self.at = datetime.now()
+        self.duration_ms = duration_ms
+        self.rows = rows
+
+
+class Operation:
+    """Statements run on one connection borrow - a service method's unit of work"""
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.counts = {}  # fingerprint -> executions
+        self.pending = []  # records still collecting fetch time and rows
+
+
+class InstrumentedCursor:
+    """Cursor proxy that times execute/fetch and reports to the query log"""
+
+    def __init__(self, log, cursor, operation):
+        self._log = log
+        self._cursor = cursor
+        self._operation = operation
+        self._record = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def execute(self, sql, params=None):
+        caller = _caller()
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(sql, params)
+        finally:
+            self._started(sql, params, caller, start)
+
+    def executemany(self, sql, seq_params):
+        seq_params = list(seq_params)
+        caller = _caller()
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(sql, seq_params)
+        finally:
+            self._started(sql, None, caller, start)
+            self._record.rows = len(seq_params)
+
+    def _started(self, sql, params, caller, start):
+        self._log.finish_pending(self._operation)
+        # SELECT rows are counted as they are fetched; writes report rowcount
+        reads = sql.lstrip()[:6].upper() == 'SELECT'
+        rows = 0 if reads else max(getattr(self._cursor, 'rowcount', 0), 0)
+        self._record = QueryRecord(sql, params, caller, self._operation.screen,
+                                   (time.perf_counter() - start) * 1000, rows)
+        self._operation.pending.append(self._record)
+
+    def _fetched(self, start, rows):
+        if self._record is not None:
+            self._record.duration_ms += (time.perf_counter() - start) * 1000
+            self._record.rows += rows
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(start, 1 if row is not None else 0)
+        return row
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(start, len(rows))
+        return rows
+
+    def fetchmany(self, size=1):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._fetched(start, len(rows))
+        return rows
+
+
+class QueryLog:
+    """Process-wide statement statistics, slow-query log and N+1 detector
+
+    - slow_ms: statements at least this slow go to the slow-query log
+    - n_plus_one: executions of one fingerprint within a single connection
+      borrow that count as N+1
+    - log_path: slow-query log file (EXPLAIN plans are attached by a
+      background thread so the caller never waits for them)
+    """
+
+    def __init__(self, enabled=False, slow_ms=100.0, n_plus_one=3, log_path=None):
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.n_plus_one = n_plus_one
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._screen = NO_SCREEN
+        self._screens = {}  # screen -> {'visits': n, 'fingerprints': {fingerprint: stats}}
+        self._slow = deque(maxlen=200)
+        self._n_plus_one_seen = deque(maxlen=200)
+        self._explain_queue = None
+
+    # ==================== SWITCHES ====================
+
+    def enable(self, slow_ms=None, log_path=None):
+        if slow_ms is not None:
+            self.slow_ms = slow_ms
+        if log_path is not None:
+            self.log_path = log_path
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    @contextlib.contextmanager
+    def paused(self):
+        """Don't record statements run by this thread inside the block"""
+        self._local.paused = True
+        try:
+            yield
+        finally:
+            self._local.paused = False
+
+    def is_recording(self):
+        return self.enabled and not getattr(self._local, 'paused', False)
+
+    def set_screen(self, name):
+        """Attribute statements from now on to a screen (one visit per call)"""
+        with self._lock:
+            self._screen = name or NO_SCREEN
+            self._screen_entry(self._screen)['visits'] += 1
+
+    # ==================== RECORDING ====================
+
+    def begin(self):
+        """Start an operation (called on a connection's first instrumented cursor)"""
+        return Operation(self._screen)
+
+    def wrap(self, cursor, operation):
+        return InstrumentedCursor(self, cursor, operation)
+
+    def end(self, operation):
+        """Connection handed back: account for its last statements"""
+        self.finish_pending(operation)
+
+    def finish_pending(self, operation):
+        pending, operation.pending = operation.pending, []
+        for record in pending:
+            self._finish(operation, record)
+
+    def _finish(self, operation, record):
+        count = operation.counts.get(record.fingerprint, 0) + 1
+        operation.counts[record.fingerprint] = count
+        n_plus_one = count == self.n_plus_one
+        slow = record.duration_ms >= self.slow_ms
+
+        with self._lock:
+            stats = self._screen_entry(record.screen)['fingerprints'].setdefault(record.fingerprint, {
+                'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0, 'callers': set(),
+                'n_plus_one': 0, 'slow': 0,
+            })
+            stats['count'] += 1
+            stats['total_ms'] += record.duration_ms
+            stats['max_ms'] = max(stats['max_ms'], record.duration_ms)
+            stats['rows'] += record.rows
+            stats['callers'].add(record.caller)
+            stats['n_plus_one'] += n_plus_one
+            stats['slow'] += slow
+            if n_plus_one:
+                self._n_plus_one_seen.append((record.screen, record.caller, record.fingerprint))
+            if slow:
+                self._slow.append(record)
+
+        if n_plus_one:
+            print(f"N+1 query: {record.caller} ran this {count}+ times in one operation "
+                  f"(screen {record.screen}): {record.fingerprint[:160]}")
+        if slow and self.log_path:
+            self._queue_explain(record)
+
+    def _screen_entry(self, screen):
+        return self._screens.setdefault(screen, {'visits': 0, 'fingerprints': {}})
+
+    # ==================== SLOW-QUERY LOG ====================
+
+    def _queue_explain(self, record):
+        if self._explain_queue is None:
+            with self._lock:
+                if self._explain_queue is None:
+                    self._explain_queue = queue.Queue()
+                    threading.Thread(target=self._explain_worker, name="query-log-explain",
+                                     daemon=True).start()
+        self._explain_queue.put(record)
+
+    def _explain_worker(self):
+        while True:
+            record = self._explain_queue.get()
+            try:
+                plan = self.explain(record.sql, record.params)
+            except Exception as e:
+                plan = f"(EXPLAIN failed: {e})"
+            try:
+                self._write_slow(record, plan)
+            except OSError as e:
+                print(f"Could not write slow-query log {self.log_path}: {e}")
+
+    def explain(self, sql, params=None):
+        """EXPLAIN (EXPLAIN QUERY PLAN on SQLite) of a SELECT, as text"""
+        from config import db_config
+
+        statement = sql.strip()
+        if not statement[:6].upper() == 'SELECT':
+            return "(not a SELECT - no plan)"
+        statement = re.sub(r"\s+FOR\s+UPDATE\s*$", '', statement, flags=re.IGNORECASE)
+        prefix = 'EXPLAIN QUERY PLAN ' if db_config.DB_BACKEND == 'sqlite' else 'EXPLAIN '
+        with self.paused():
+            db = db_config.connect_db()
+            try:
+                cursor = db.cursor()
+                cursor.execute(prefix + statement, params)
+                columns = [column[0] for column in cursor.description or ()]
+                rows = cursor.fetchall()
+            finally:
+                db.close()
+        lines = [' | '.join(columns)]
+        lines += [' | '.join('' if value is None else str(value) for value in row) for row in rows]
+        return '\n'.join(lines)
+
+    def _write_slow(self, record, plan):
+        directory = os.path.dirname(self.log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(f"# {record.at:%Y-%m-%d %H:%M:%S}  {record.duration_ms:.1f} ms  rows={record.rows}  "
+                    f"screen={record.screen}  {record.caller}\n")
+            f.write(' '.join(record.sql.split()) + '\n')
+            if record.params:
+                f.write(f"-- params: {record.params!r}\n")
+            f.write('\n'.join(f"-- {line}" for line in plan.splitlines()) + '\n\n')
+
+    # ==================== REPORTS ====================
+
+    def screen_report(self):
+        """{screen: {'visits', 'queries', 'total_ms', 'fingerprints': [stats...]}}, slowest first"""
+        with self._lock:
+            report = {}
+            for screen, entry in self._screens.items():
+                fingerprints = [dict(stats, fingerprint=fp, callers=sorted(stats['callers']))
+                                for fp, stats in entry['fingerprints'].items()]
+                fingerprints.sort(key=lambda stats: stats['total_ms'], reverse=True)
+                report[screen] = {
+                    'visits': entry['visits'],
+                    'queries': sum(stats['count'] for stats in fingerprints),
+                    'total_ms': sum(stats['total_ms'] for stats in fingerprints),
+                    'fingerprints': fingerprints,
+                }
+        return report
+
+    def format_report(self, top=10):
+        """Per-screen report as text: busiest statements, N+1 and slow flags"""
+        lines = []
+        for screen, entry in sorted(self.screen_report().items(),
+                                    key=lambda item: item[1]['total_ms'], reverse=True):
+            if not entry['queries']:
+                continue
+            visits = max(entry['visits'], 1)
+            lines.append(f"== {screen}: {entry['visits']} visit(s), {entry['queries'] / visits:.1f} "
+                         f"queries and {entry['total_ms'] / visits:.1f} ms per visit")
+            for stats in entry['fingerprints'][:top]:
+                flags = ''
+                if stats['n_plus_one']:
+                    flags += ' N+1'
+                elif stats['count'] / visits >= self.n_plus_one:
+                    flags += ' REPEATED'  # once per call, but many service calls per visit
+                if stats['slow']:
+                    flags += ' SLOW'
+                lines.append(f"  {stats['count']:>6}x {stats['total_ms']:>9.1f} ms "
+                             f"(max {stats['max_ms']:.1f}) rows={stats['rows']}{flags}  "
+                             f"{', '.join(stats['callers'])}")
+                lines.append(f"           {stats['fingerprint'][:200]}")
+        return '\n'.join(lines) if lines else "(no statements recorded)"
+
+    def slow_queries(self):
+        with self._lock:
+            return list(self._slow)
+
+    def n_plus_one_flags(self):
+        """(screen, caller, fingerprint) of every N+1 detection"""
+        with self._lock:
+            return list(self._n_plus_one_seen)
+
+    def reset(self):
+        with self._lock:
+            self._screens.clear()
+            self._slow.clear()
+            self._n_plus_one_seen.clear()
+
+
+# Shared query log (GROCERY_SQL_LOG=1 turns it on for the whole process)
+query_log = QueryLog(
+    enabled=os.environ.get('GROCERY_SQL_LOG', '0') == '1',
+    slow_ms=float(os.environ.get('GROCERY_SQL_SLOW_MS', 100)),
+    n_plus_one=int(os.environ.get('GROCERY_SQL_N_PLUS_ONE', 3)),
+    log_path=os.environ.get('GROCERY_SQL_SLOW_LOG',
+                            os.path.join(os.path.expanduser('~'), '.buyme_grocery', 'slow_queries.log')),
+)
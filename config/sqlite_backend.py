@@ -0,0 +1,448 @@
+"""
+SQLite Backend - Embedded storage for offline terminals and MySQL-free tests
+Connections look like mysql.connector ones to the services: %s parameters,
+tuple rows, datetime/date/Decimal values, lastrowid/rowcount. Statements are
+translated from the MySQL dialect the services are written in, and the schema
+is built from database_schema.sql (ENUM -> CHECK, ON UPDATE -> trigger).
+"""
+import functools
+import itertools
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'database_schema.sql')
+
+# MySQL error numbers the services react to
+ER_LOCK_WAIT_TIMEOUT = 1205
+ER_DUP_ENTRY = 1062
+ER_FT_MATCHING_KEY_NOT_FOUND = 1191
+
+_connection_ids = itertools.count(1)
+_schema_lock = threading.Lock()
+
+
+# ==================== VALUE CONVERSION ====================
+
+def _convert_timestamp(value):
+    try:
+        return datetime.fromisoformat(value.decode())
+    except ValueError:
+        return value.decode()
+
+
+def _convert_date(value):
+    try:
+        return date.fromisoformat(value.decode()[:10])
+    except ValueError:
+        return value.decode()
+
+
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_converter('TIMESTAMP', _convert_timestamp)
+sqlite3.register_converter('DATETIME', _convert_timestamp)
+sqlite3.register_converter('DATE', _convert_date)
+sqlite3.register_converter('DECIMAL', lambda value: Decimal(value.decode()))
+
+# Declared columns are converted by type; expressions (MAX(updated_at),
+# DATE(order_date), ...) come back as text and are recognised by shape
+_TIMESTAMP_TEXT = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d{1,6})?\Z')
+
+
+def _convert_row(row):
+    if row is None:
+        return None
+    if any(type(value) is str and _TIMESTAMP_TEXT.match(value) for value in row):
+        return tuple(datetime.fromisoformat(value)
+                     if type(value) is str and _TIMESTAMP_TEXT.match(value) else value
+                     for value in row)
+    return row
+
+
+# ==================== MYSQL FUNCTIONS ====================
+
+def _as_date(value):
+    if isinstance(value, (date, datetime)):
+        return value if not isinstance(value, datetime) else value.date()
+    return date.fromisoformat(str(value)[:10])
+
+
+def _date_add_days(value, days):
+    if value is None or days is None:
+        return None
+    text = str(value)
+    if len(text) > 10:
+        return (datetime.fromisoformat(text) + timedelta(days=int(days))).isoformat(' ')
+    return (_as_date(text) + timedelta(days=int(days))).isoformat()
+
+
+def _datediff(first, second):
+    if first is None or second is None:
+        return None
+    return (_as_date(first) - _as_date(second)).days
+
+
+def _concat(*values):
+    if any(value is None for value in values):
+        return None
+    return ''.join(str(value) for value in values)
+
+
+def _register_functions(raw, connection_id):
+    raw.create_function('NOW', 0, lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    raw.create_function('CURDATE', 0, lambda: date.today().isoformat())
+    raw.create_function('CONNECTION_ID', 0, lambda: connection_id, deterministic=True)
+    raw.create_function('DATEDIFF', 2, _datediff, deterministic=True)
+    raw.create_function('DATE_ADD_DAYS', 2, _date_add_days, deterministic=True)
+    raw.create_function('CONCAT', -1, _concat, deterministic=True)
+    raw.create_function('MOD', 2, lambda a, b: None if a is None or not b else a % b, deterministic=True)
+
+
+# ==================== STATEMENT TRANSLATION ====================
+
+_INTERVAL_CALL = re.compile(r'\bDATE_(ADD|SUB)\s*\((.+?),\s*INTERVAL\s+(\S+)\s+DAY\s*\)', re.I)
+_INTERVAL_ARITHMETIC = re.compile(
+    r'((?:\w+\.)?\w+(?:\(\))?)\s*([+-])\s*INTERVAL\s+(%s|\?|\d+)\s+DAY\b', re.I)
+_ON_DUPLICATE = re.compile(r'\bON\s+DUPLICATE\s+KEY\s+UPDATE\b', re.I)
+_VALUES_REFERENCE = re.compile(r'\bVALUES\s*\(\s*(\w+)\s*\)', re.I)
+_MULTI_TABLE_UPDATE = re.compile(r'^\s*UPDATE\s+(\w+)\s+(\w+)\s+(LEFT\s+)?JOIN\s+', re.I)
+_WRITE_STATEMENT = re.compile(r'^\s*(INSERT|UPDATE|DELETE|REPLACE)\b', re.I)
+
+
+class Statement:
+    """A translated statement: SQLite text plus how to run it"""
+
+    __slots__ = ('sql', 'writes', 'locks', 'fulltext')
+
+    def __init__(self, sql, writes=False, locks=False, fulltext=False):
+        self.sql = sql
+        self.writes = writes
+        self.locks = locks
+        self.fulltext = fulltext
+
+
+@functools.lru_cache(maxsize=1024)
+def translate(sql, has_params=True):
+    """Translate one MySQL statement to SQLite (cached per statement text)"""
+    if re.search(r'\bMATCH\s*\(.+?\)\s*AGAINST\b', sql, re.I | re.S):
+        # No FULLTEXT indexes here; answer the way MySQL does without one
+        return Statement(sql, fulltext=True)
+
+    locks = bool(re.search(r'\bFOR\s+UPDATE\s*$', sql, re.I))
+    if locks:
+        sql = re.sub(r'\bFOR\s+UPDATE\s*$', '', sql, flags=re.I)
+
+    if _MULTI_TABLE_UPDATE.match(sql):
+        sql = _translate_multi_table_update(sql)
+
+    sql = re.sub(r'\bINSERT\s+IGNORE\b', 'INSERT OR IGNORE', sql, flags=re.I)
+    duplicate = _ON_DUPLICATE.search(sql)
+    if duplicate:
+        head, tail = sql[:duplicate.start()], sql[duplicate.end():]
+        sql = head + 'ON CONFLICT DO UPDATE SET' + _VALUES_REFERENCE.sub(r'excluded.\1', tail)
+
+    sql = _INTERVAL_CALL.sub(
+        lambda m: f"DATE_ADD_DAYS({m.group(2)}, {'-' if m.group(1).upper() == 'SUB' else ''}({m.group(3)}))",
+        sql)
+    sql = _INTERVAL_ARITHMETIC.sub(
+        lambda m: f"DATE_ADD_DAYS({m.group(1)}, {'-' if m.group(2) == '-' else ''}({m.group(3)}))", sql)
+    sql = re.sub(r'\bGREATEST\s*\(', 'MAX(', sql, flags=re.I)
+    sql = re.sub(r'\bLEAST\s*\(', 'MIN(', sql, flags=re.I)
+
+    if has_params:
+        sql = sql.replace('%s', '?').replace('%%', '%')
+    return Statement(sql, writes=bool(_WRITE_STATEMENT.match(sql)), locks=locks)
+
+
+def _split_top_level(text, separator):
+    """Split text on separator (a regex) outside parentheses and quotes"""
+    parts, depth, quote, start = [], 0, None, 0
+    pattern = re.compile(separator, re.I)
+    keyword = separator[0].isalpha()
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif depth == 0:
+            match = pattern.match(text, i)
+            if match and not (keyword and i and (text[i - 1].isalnum() or text[i - 1] in '_.')):
+                parts.append(text[start:i])
+                start = i = match.end()
+                continue
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _translate_multi_table_update(sql):
+    """UPDATE t a [LEFT] JOIN src b ON cond SET a.x = ... WHERE w -> UPDATE ... FROM
+
+    SQLite's UPDATE ... FROM is an inner join against the target, so the
+    MySQL join (inner or left) is done inside a derived table keyed by the
+    target's rowid. Only the first table may be assigned to.
+    """
+    head = _MULTI_TABLE_UPDATE.match(sql)
+    table, alias, left = head.group(1), head.group(2), head.group(3)
+    source_and_rest = sql[head.end():]
+    source_part, set_and_where = (_split_top_level(source_and_rest, r'SET\s') + [''])[:2]
+    source, condition = _split_top_level(source_part, r'ON\s')[:2]
+    source_tokens = source.strip().rsplit(None, 1)
+    source, source_alias = source_tokens[0], source_tokens[1]
+    pieces = _split_top_level(set_and_where, r'WHERE\s')
+    assignments, where = pieces[0], (pieces[1] if len(pieces) > 1 else None)
+
+    targets = []
+    for assignment in _split_top_level(assignments, r','):
+        column, expression = assignment.split('=', 1)
+        owner, _, column = column.strip().rpartition('.')
+        if owner and owner != alias:
+            raise sqlite3.NotSupportedError(
+                f"SQLite cannot update several tables in one statement ({owner}.{column})")
+        targets.append(f"{column} = {expression.strip()}")
+
+    return (f"UPDATE {table} AS {alias} SET {', '.join(targets)} "
+            f"FROM (SELECT {alias}.rowid AS target_rowid__, {source_alias}.* "
+            f"FROM {table} AS {alias} {'LEFT ' if left else ''}JOIN {source.strip()} AS {source_alias} "
+            f"ON {condition.strip()}) AS {source_alias} "
+            f"WHERE {source_alias}.target_rowid__ = {alias}.rowid"
+            + (f" AND ({where.strip()})" if where else ""))
+
+
+# ==================== CONNECTION ====================
+
+class SQLiteCursor:
+    """mysql.connector-style cursor over a sqlite3 cursor"""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._cursor = connection._raw.cursor()
+
+    def execute(self, sql, params=None):
+        statement = translate(sql, params is not None)
+        if statement.fulltext:
+            error = sqlite3.OperationalError("Can't find FULLTEXT index matching the column list")
+            error.errno = ER_FT_MATCHING_KEY_NOT_FOUND
+            raise error
+        if (statement.writes or statement.locks) and not self._connection.in_transaction:
+            # Take the write lock up front (waits busy_timeout) instead of
+            # failing to upgrade a read transaction later
+            self._run("BEGIN IMMEDIATE", ())
+        self._run(statement.sql, params or ())
+        return self
+
+    def executemany(self, sql, seq_params):
+        statement = translate(sql, True)
+        if not self._connection.in_transaction:
+            self._run("BEGIN IMMEDIATE", ())
+        try:
+            self._cursor.executemany(statement.sql, seq_params)
+        except sqlite3.Error as e:
+            raise _with_errno(e)
+        return self
+
+    def _run(self, sql, params):
+        try:
+            self._cursor.execute(sql, params)
+        except sqlite3.Error as e:
+            raise _with_errno(e)
+
+    def fetchone(self):
+        return _convert_row(self._cursor.fetchone())
+
+    def fetchall(self):
+        return [_convert_row(row) for row in self._cursor.fetchall()]
+
+    def fetchmany(self, size=1):
+        return [_convert_row(row) for row in self._cursor.fetchmany(size)]
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def column_names(self):
+        return tuple(column[0] for column in self._cursor.description or ())
+
+    def close(self):
+        self._cursor.close()
+
+
+def _with_errno(error):
+    """Tag sqlite3 errors with the MySQL errno the services check for"""
+    message = str(error)
+    if 'locked' in message or 'busy' in message:
+        error.errno = ER_LOCK_WAIT_TIMEOUT
+    elif isinstance(error, sqlite3.IntegrityError) and 'UNIQUE' in message:
+        error.errno = ER_DUP_ENTRY
+    return error
+
+
+class SQLiteConnection:
+    """mysql.connector-style connection: autocommit off, explicit commit()/rollback()"""
+
+    def __init__(self, path, timeout=10.0):
+        self.path = path
+        self.connection_id = next(_connection_ids)
+        self._raw = sqlite3.connect(path, timeout=timeout, isolation_level=None,
+                                    detect_types=sqlite3.PARSE_DECLTYPES,
+                                    check_same_thread=False)  # the pool hands it between threads
+        self._raw.execute("PRAGMA foreign_keys = ON")
+        self._raw.execute("PRAGMA journal_mode = WAL")
+        self._raw.execute("PRAGMA synchronous = NORMAL")
+        _register_functions(self._raw, self.connection_id)
+
+    def cursor(self, *args, **kwargs):
+        return SQLiteCursor(self)
+
+    @property
+    def in_transaction(self):
+        return self._raw is not None and self._raw.in_transaction
+
+    def commit(self):
+        if self._raw.in_transaction:
+            self._raw.execute("COMMIT")
+
+    def rollback(self):
+        if self._raw.in_transaction:
+            self._raw.execute("ROLLBACK")
+
+    def is_connected(self):
+        if self._raw is None:
+            return False
+        try:
+            self._raw.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self):
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            raw.close()
+
+
+def connect(path, timeout=10.0):
+    """Open a connection to the SQLite database at path, creating the schema if needed"""
+    if path != ':memory:':
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    connection = SQLiteConnection(path, timeout)
+    with _schema_lock:
+        ensure_schema(connection)
+    return connection
+
+
+# ==================== SCHEMA ====================
+
+def ensure_schema(connection, schema_path=SCHEMA_PATH):
+    """Create the tables and default data on an empty database (no-op otherwise)"""
+    raw = connection._raw
+    raw.execute("BEGIN IMMEDIATE")  # one process creates it, the others wait
+    try:
+        if raw.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'").fetchone():
+            raw.execute("ROLLBACK")
+            return False
+        with open(schema_path, encoding='utf-8') as schema:
+            for statement in schema_statements(schema.read()):
+                raw.execute(statement)
+        raw.execute("COMMIT")
+        return True
+    except Exception:
+        raw.execute("ROLLBACK")
+        raise
+
+
+def schema_statements(mysql_script):
+    """SQLite statements equivalent to a MySQL schema script"""
+    script = re.sub(r'--[^\n]*', '', mysql_script)
+    statements = []
+    for statement in _split_top_level(script, r';'):
+        statement = statement.strip()
+        if not statement or re.match(r'(DROP|CREATE)\s+DATABASE|USE\s|SELECT\s', statement, re.I):
+            continue
+        table = re.match(r'CREATE\s+TABLE\s+(\w+)\s*\((.*)\)\s*[^)]*$', statement, re.I | re.S)
+        if table:
+            statements.extend(_create_table(table.group(1), table.group(2)))
+        else:
+            statements.append(translate(statement, has_params=False).sql)
+    return statements
+
+
+_NOW_MICROS = "(strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'))"
+_NOW_SECONDS = "(datetime('now', 'localtime'))"
+
+
+def _create_table(table, body):
+    """CREATE TABLE plus its indexes and ON UPDATE triggers"""
+    columns, definitions, constraints, indexes, on_update = [], [], [], [], []
+    for item in _split_top_level(body, r','):
+        item = ' '.join(item.split())
+        if not item:
+            continue
+        keyword = item.split(None, 1)[0].upper()
+        index = re.match(r'(UNIQUE\s+)?(?:INDEX|KEY)\s+(\w+)\s*\((.+)\)$', item, re.I)
+        if index:
+            unique = 'UNIQUE ' if index.group(1) else ''
+            # Index names are per table in MySQL but per database in SQLite
+            indexes.append(f"CREATE {unique}INDEX {table}_{index.group(2)} ON {table} ({index.group(3)})")
+        elif keyword == 'FULLTEXT':
+            continue
+        elif keyword in ('PRIMARY', 'FOREIGN', 'CHECK', 'CONSTRAINT', 'UNIQUE'):
+            constraints.append(item)
+        else:
+            name = item.split(None, 1)[0]
+            columns.append(name)
+            definitions.append(_column(item, name))
+            if re.search(r'\bON\s+UPDATE\s+CURRENT_TIMESTAMP', item, re.I):
+                on_update.append(name)
+
+    statements = [f"CREATE TABLE {table} (" + ", ".join(definitions + constraints) + ")"]
+    statements.extend(indexes)
+    for column in on_update:
+        # MySQL only bumps the stamp when some other column really changed
+        changed = ' OR '.join(f"NEW.{other} IS NOT OLD.{other}" for other in columns if other != column)
+        statements.append(
+            f"CREATE TRIGGER {table}_{column}_on_update AFTER UPDATE ON {table} FOR EACH ROW "
+            f"WHEN NEW.{column} IS OLD.{column} AND ({changed}) "
+            f"BEGIN UPDATE {table} SET {column} = {_NOW_MICROS} WHERE rowid = NEW.rowid; END")
+    return statements
+
+
+def _column(definition, name):
+    """Translate one MySQL column definition"""
+    definition = re.sub(r'\b(?:BIG)?INT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b',
+                        'INTEGER PRIMARY KEY AUTOINCREMENT', definition, flags=re.I)
+    enum = re.search(r'\bENUM\s*\(([^)]*)\)', definition, re.I)
+    if enum:
+        definition = (definition[:enum.start()] + 'TEXT' + definition[enum.end():]
+                      + f" CHECK ({name} IN ({enum.group(1)}))")
+    definition = re.sub(r'\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP(\(\d\))?', '', definition, flags=re.I)
+    definition = re.sub(r'\bDEFAULT\s+CURRENT_TIMESTAMP\(\d\)', f'DEFAULT {_NOW_MICROS}', definition, flags=re.I)
+    definition = re.sub(r'\bDEFAULT\s+CURRENT_TIMESTAMP\b', f'DEFAULT {_NOW_SECONDS}', definition, flags=re.I)
+    definition = re.sub(r'\b(TIMESTAMP|DATETIME)\(\d\)', r'\1', definition, flags=re.I)
+    definition = re.sub(r'\s+UNSIGNED\b', '', definition, flags=re.I)
+    return definition
@@ -55,6 +55,9 @@ CREATE TABLE categories (
     description TEXT,
     icon VARCHAR(50),  -- emoji or icon name
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Catalog fingerprint (existing databases: ALTER TABLE categories ADD COLUMN updated_at
+    -- TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);)
+    updated_at TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
     INDEX idx_name (category_name)
 );
 
@@ -73,12 +76,30 @@ CREATE TABLE products (
     min_stock_level INT DEFAULT 5,  -- Alert threshold
     is_available BOOLEAN DEFAULT TRUE,
     discount_percent DECIMAL(5, 2) DEFAULT 0.00,
+    -- Set from the admin product form (existing databases: ALTER TABLE products
+    -- ADD COLUMN manufactured_date DATE NULL, ADD COLUMN expiry_date DATE NULL;)
+    manufactured_date DATE NULL,
+    expiry_date DATE NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    -- Microseconds so two edits in the same second still change the catalog
+    -- fingerprint (existing databases: ALTER TABLE products MODIFY updated_at
+    -- TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);)
+    updated_at TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
     FOREIGN KEY (category_id) REFERENCES categories(category_id) ON DELETE CASCADE,
     INDEX idx_category (category_id),
     INDEX idx_available (is_available),
-    INDEX idx_name (name)
+    INDEX idx_name (name),
+    -- Keyset pages of a category ordered by (name, product_id) (existing databases:
+    -- ALTER TABLE products ADD INDEX idx_category_name (category_id, name);)
+    INDEX idx_category_name (category_id, name),
+    -- Catalog fingerprints: COUNT/MAX(updated_at) per category and overall (existing databases:
+    -- ALTER TABLE products ADD INDEX idx_category_updated (category_id, updated_at),
+    --                      ADD INDEX idx_updated (updated_at);)
+    INDEX idx_category_updated (category_id, updated_at),
+    INDEX idx_updated (updated_at),
+    -- Product search (existing databases:
+    -- ALTER TABLE products ADD FULLTEXT INDEX ft_product_search (name, description);)
+    FULLTEXT INDEX ft_product_search (name, description)
 );
 
 -- ====================================================================
@@ -125,12 +146,15 @@ CREATE TABLE shopping_cart (
 CREATE TABLE orders (
     order_id INT AUTO_INCREMENT PRIMARY KEY,
     user_id INT NOT NULL,
-    order_number VARCHAR(50) UNIQUE NOT NULL,  -- ORD-20250101-001
+    order_number VARCHAR(50) UNIQUE NOT NULL,  -- ORD-20250101093015-0F8M3Q2ZK81C (services/id_generator.py)
     total_amount DECIMAL(10, 2) NOT NULL,
     discount_amount DECIMAL(10, 2) DEFAULT 0.00,
     final_amount DECIMAL(10, 2) NOT NULL,
     payment_method ENUM('cash', 'card', 'online', 'wallet') DEFAULT 'cash',
     payment_status ENUM('pending', 'paid', 'failed') DEFAULT 'pending',
+    -- PaymentService transaction that paid for the order (existing databases:
+    -- ALTER TABLE orders ADD COLUMN transaction_id VARCHAR(64) NULL UNIQUE AFTER payment_status;)
+    transaction_id VARCHAR(64) NULL UNIQUE,
     order_status ENUM('pending', 'confirmed', 'processing', 'shipped', 'delivered', 'cancelled') DEFAULT 'pending',
     delivery_address TEXT NOT NULL,
     delivery_phone VARCHAR(20),
@@ -176,8 +200,69 @@ CREATE TABLE notifications (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
     FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE,
-    INDEX idx_user (user_id),
-    INDEX idx_read (is_read)
+    -- Newest-first list per user (existing databases:
+    -- ALTER TABLE notifications ADD INDEX idx_user_created (user_id, created_at),
+    --     DROP INDEX idx_user, DROP INDEX idx_read;)
+    INDEX idx_user_created (user_id, created_at)
+);
+
+-- Per-user read watermark and unread counter, maintained by OrderService
+-- (existing databases:
+-- INSERT INTO notification_state (user_id, unread_count)
+--     SELECT user_id, SUM(is_read = FALSE) FROM notifications GROUP BY user_id;)
+CREATE TABLE notification_state (
+    user_id INT PRIMARY KEY,
+    last_read_id INT NOT NULL DEFAULT 0,   -- every notification_id <= this is read
+    unread_count INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+
+-- ====================================================================
+-- 10. DASHBOARD_EXPIRY_SUMMARY TABLE - Maintained admin dashboard totals
+-- ====================================================================
+-- One row per source, expiry day and slot (NULL expiry -> 9999-12-31).
+-- Kept current by DashboardService.tracking() in the service write paths;
+-- rebuilt from scratch by jobs/reconcile_dashboard.py
+CREATE TABLE dashboard_expiry_summary (
+    source ENUM('products', 'inventory') NOT NULL,
+    expiry_date DATE NOT NULL,
+    slot TINYINT UNSIGNED NOT NULL DEFAULT 0,
+    item_count INT NOT NULL DEFAULT 0,
+    units INT NOT NULL DEFAULT 0,
+    stock_value DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, expiry_date, slot)
+);
+
+-- ====================================================================
+-- 11. PRODUCT_SALES TABLES - Per-product sales rollups
+-- ====================================================================
+-- Updated in the checkout transaction by SalesService.record_order();
+-- rebuilt from order history by jobs/backfill_product_sales.py
+CREATE TABLE product_sales_daily (
+    product_id INT NOT NULL,
+    sale_date DATE NOT NULL,
+    units INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (product_id, sale_date),
+    FOREIGN KEY (product_id) REFERENCES products(product_id) ON DELETE CASCADE,
+    INDEX idx_sale_date (sale_date)
+);
+
+CREATE TABLE product_sales (
+    product_id INT PRIMARY KEY,
+    units_sold INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    units_7d INT NOT NULL DEFAULT 0,
+    revenue_7d DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    units_30d INT NOT NULL DEFAULT 0,
+    revenue_30d DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    windows_as_of DATE NOT NULL,
+    last_sold_at TIMESTAMP NULL,
+    FOREIGN KEY (product_id) REFERENCES products(product_id) ON DELETE CASCADE,
+    INDEX idx_units_7d (units_7d),
+    INDEX idx_units_30d (units_30d),
+    INDEX idx_units_sold (units_sold),
+    INDEX idx_windows_as_of (windows_as_of)
 );
 
 -- ====================================================================
@@ -0,0 +1,81 @@
+"""
+Auth Worker - Runs bcrypt-backed UserService calls off the Tk thread
+Login, registration and password changes run on a small thread pool (bcrypt
+releases the GIL while hashing); results come back to the Tk loop through
+after() polling and are handed to the caller's callback
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from services import UserService
+
+
+class AuthWorker:
+    """Background authentication for the login, register and profile screens
+
+    Every method takes a callback(result) that runs on the Tk thread with
+    whatever the UserService call returned; on_error(exception) runs instead
+    if it raised (default: print and pass None to callback).
+    """
+
+    def __init__(self, root, workers=2, poll_ms=25):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="auth-worker")
+        self._done = queue.Queue()
+        self._pending = 0
+        self._poller = None
+
+    # ==================== TK THREAD API ====================
+
+    def login(self, user_type, username, password, callback, on_error=None):
+        """UserService.login_user / login_staff; callback(row or None)"""
+        login = UserService.login_user if user_type == 'customer' else UserService.login_staff
+        self._submit(login, (username, password), callback, on_error)
+
+    def register(self, username, password, email, full_name, phone, address, callback, on_error=None):
+        """UserService.register_user; callback((success, user_id or message))"""
+        self._submit(UserService.register_user, (username, password, email, full_name, phone, address),
+                     callback, on_error)
+
+    def change_password(self, user_id, old_password, new_password, callback, on_error=None):
+        """UserService.change_password; callback((success, message))"""
+        self._submit(UserService.change_password, (user_id, old_password, new_password),
+                     callback, on_error)
+
+    @property
+    def busy(self):
+        """True while a submitted call has not reported back yet"""
+        return self._pending > 0
+
+    def shutdown(self):
+        """Stop accepting work; calls already running finish in the background"""
+        self._pool.shutdown(wait=False)
+
+    def _submit(self, func, args, callback, on_error):
+        self._pending += 1
+        future = self._pool.submit(func, *args)
+        future.add_done_callback(lambda f: self._done.put((f, callback, on_error)))
+        if self._poller is None:
+            self._poller = self.root.after(self.poll_ms, self._poll)
+
+    # ==================== POLLING (TK THREAD) ====================
+
+    def _poll(self):
+        self._poller = None
+        while True:
+            try:
+                future, callback, on_error = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            error = future.exception()
+            if error is None:
+                callback(future.result())
+            elif on_error:
+                on_error(error)
+            else:
+                print(f"Authentication call failed: {error}")
+                callback(None)
+        if self._pending:
+            self._poller = self.root.after(self.poll_ms, self._poll)
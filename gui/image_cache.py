@@ -0,0 +1,138 @@
+"""
+Image Cache - Bounded LRU cache of decoded product images for the Tk GUI
+Keyed by (path, size, mtime) so edited files are picked up, sized by pixel
+bytes so a long admin session cannot grow memory without limit
+"""
+import os
+import threading
+from collections import OrderedDict
+
+from services import ImageService
+
+
+class ImageCache:
+    """Byte-budgeted LRU of PIL images and their Tk PhotoImages
+
+    PIL images may be added from worker threads (put_pil); PhotoImages are
+    only ever created on the Tk thread (get_photo). Labels showing a cached
+    photo keep their own reference (label.image), so evicting an entry never
+    blanks a widget that is still on screen.
+    """
+
+    PHOTO_BYTES_PER_PIXEL = 4  # Tk stores photo images as 32-bit RGBA
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> [pil_image, photo_or_None, nbytes]
+        self._bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    # ==================== KEYS ====================
+
+    @staticmethod
+    def make_key(image_path, size):
+        """(resolved path, size, mtime) - or a placeholder key when the file is missing"""
+        path = ImageService.resolve_image_path(image_path)
+        if path is None:
+            return (None, tuple(size), None)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return (None, tuple(size), None)
+        return (os.path.abspath(path), tuple(size), mtime)
+
+    # ==================== LOOKUPS ====================
+
+    def get_pil(self, key):
+        """Cached PIL image for key, or None (counts as hit/miss)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[0]
+
+    def put_pil(self, key, img):
+        """Store a decoded PIL image (safe to call from worker threads)"""
+        nbytes = img.width * img.height * len(img.getbands())
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = [img, None, nbytes]
+            self._bytes += nbytes
+            self._evict()
+
+    def get_photo(self, image_path, size):
+        """PhotoImage of image_path at size (Tk thread only), decoding on a miss"""
+        key = self.make_key(image_path, size)
+        return self.photo_for_key(key, lambda: self._decode(key, image_path, size))
+
+    def photo_for_key(self, key, decode, count=True):
+        """PhotoImage for key; decode() supplies the PIL image on a miss
+
+        Pass count=False when the lookup was already counted (e.g. by get_pil).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if count:
+                    self.stats['hits'] += 1
+                if entry[1] is not None:
+                    return entry[1]
+            elif count:
+                self.stats['misses'] += 1
+
+        from PIL import ImageTk  # Pillow is slow to import; load it on first use
+
+        img = entry[0] if entry is not None else decode()
+        photo = ImageTk.PhotoImage(img)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            photo_bytes = img.width * img.height * self.PHOTO_BYTES_PER_PIXEL
+            if entry is None:
+                nbytes = img.width * img.height * len(img.getbands()) + photo_bytes
+                self._entries[key] = [img, photo, nbytes]
+                self._bytes += nbytes
+            elif entry[1] is None:
+                entry[1] = photo
+                entry[2] += photo_bytes
+                self._bytes += photo_bytes
+            self._evict()
+        return photo
+
+    def _decode(self, key, image_path, size):
+        if key[0] is None:
+            from PIL import Image
+            return Image.new('RGB', tuple(size), color='#E0E0E0')
+        return ImageService.load_pil_image(key[0], tuple(size))
+
+    # ==================== HOUSEKEEPING ====================
+
+    def _evict(self):
+        # Caller holds the lock; never evict the entry just touched
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+            self.stats['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self):
+        """Hit/miss/eviction counters plus current size"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+            stats['max_bytes'] = self.max_bytes
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,130 @@
+"""
+Image Loader - Background decode worker pool feeding the Tk main loop
+Workers decode and resize into PIL images; the Tk thread polls a queue
+with after() and only turns finished images into PhotoImages
+"""
+import itertools
+import queue
+import threading
+
+from services import ImageService
+
+
+class ImageLoader:
+    """Thread-pool image loader for product cards and detail views
+
+    request() shows a cached photo immediately when there is one; otherwise
+    the label keeps its placeholder and a decode job is queued by priority
+    (lower runs first - pass the card's position so visible cards win).
+    Requests for the same image/size are coalesced into one decode. A label
+    only ever shows its latest request, so recycled widgets are safe, and a
+    queued decode nobody waits for any more is skipped.
+    """
+
+    def __init__(self, root, cache, workers=3, poll_ms=30):
+        self.root = root
+        self.cache = cache
+        self.poll_ms = poll_ms
+        self._jobs = queue.PriorityQueue()
+        self._done = queue.Queue()
+        self._waiting = {}  # key -> [(label, on_loaded), ...]
+        self._label_keys = {}  # label -> key it is waiting for
+        self._sequence = itertools.count()
+        self._generation = 0
+        self._poller = None
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"image-loader-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    # ==================== TK THREAD API ====================
+
+    def request(self, label, image_path, size, priority=0, on_loaded=None):
+        """Show image_path on label once decoded; on_loaded(label, photo) runs after"""
+        self._forget(label)
+        key = self.cache.make_key(image_path, size)
+        if key[0] is None:
+            return  # No file - keep the placeholder
+        img = self.cache.get_pil(key)
+        if img is not None:
+            self._apply(label, self.cache.photo_for_key(key, lambda: img, count=False), on_loaded)
+            return
+        self._label_keys[label] = key
+        waiting = self._waiting.get(key)
+        if waiting is None:
+            self._waiting[key] = [(label, on_loaded)]
+            self._jobs.put((priority, next(self._sequence), self._generation, key, size))
+        else:
+            waiting.append((label, on_loaded))
+        self._ensure_polling()
+
+    def cancel_all(self):
+        """Drop queued jobs (e.g. when leaving a screen); running decodes finish into the cache"""
+        self._generation += 1
+        self._waiting.clear()
+        self._label_keys.clear()
+
+    def _forget(self, label):
+        # The label is about to show something else; drop its pending request
+        key = self._label_keys.pop(label, None)
+        if key is None:
+            return
+        waiters = [w for w in self._waiting.get(key, ()) if w[0] is not label]
+        if waiters:
+            self._waiting[key] = waiters
+        else:
+            self._waiting.pop(key, None)
+
+    # ==================== WORKERS ====================
+
+    def _worker(self):
+        while True:
+            priority, _, generation, key, size = self._jobs.get()
+            if generation != self._generation or key not in self._waiting:
+                continue  # Screen changed or the card was recycled while queued
+            try:
+                img = ImageService.load_pil_image(key[0], size)
+                self.cache.put_pil(key, img)
+                self._done.put((key, img))
+            except Exception as e:
+                print(f"Background image load failed for {key[0]}: {e}")
+                self._done.put((key, None))
+
+    # ==================== POLLING (TK THREAD) ====================
+
+    def _ensure_polling(self):
+        if self._poller is None:
+            self._poller = self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._poller = None
+        while True:
+            try:
+                key, img = self._done.get_nowait()
+            except queue.Empty:
+                break
+            waiters = self._waiting.pop(key, [])
+            for label, _ in waiters:
+                self._label_keys.pop(label, None)
+            if img is None or not waiters:
+                continue
+            photo = self.cache.photo_for_key(key, lambda: img, count=False)
+            for label, on_loaded in waiters:
+                self._apply(label, photo, on_loaded)
+        if self._waiting:
+            self._ensure_polling()
+
+    @staticmethod
+    def _apply(label, photo, on_loaded):
+        try:
+            if not label.winfo_exists():
+                return
+            label.config(image=photo, text="")
+            label.image = photo  # keep alive even if the cache evicts it
+            if on_loaded:
+                on_loaded(label, photo)
+        except Exception as e:
+            # Widget destroyed between the check and the update
+            print(f"Could not show image: {e}")
@@ -0,0 +1,174 @@
+"""
+Screen Cache - Keeps recently used screens alive but hidden between visits
+A retained screen's top-level widgets are taken out of the geometry manager
+when the user navigates away and put back when they return, so the screen is
+not rebuilt; its refresh hook then updates only what changed. Bounded by a
+screen count and a widget budget, least recently used evicted first
+"""
+from collections import OrderedDict
+
+GEOMETRY_MANAGERS = ('pack', 'grid', 'place')
+
+
+class ScreenCache:
+    """Widget-budgeted LRU of hidden screens for one Tk root
+
+    Hooks given to retain():
+    - refresh(): runs each time the screen is shown again; return False when
+      the screen is too stale to patch and should be rebuilt instead
+    - on_hide(): runs when the screen is hidden (cancel timers, searches)
+    - on_evict(): runs before its widgets are destroyed
+    max_screens=0 turns retention off.
+    """
+
+    def __init__(self, root, max_screens=4, max_widgets=3000):
+        self.root = root
+        self.max_screens = max_screens
+        self.max_widgets = max_widgets
+        self._entries = OrderedDict()  # name -> entry dict, least recently used first
+        self._owners = {}  # top-level widget path -> screen name
+        self._showing = None  # retained screen currently on the root, if any
+        self.stats = {'retained': 0, 'restores': 0, 'stale': 0, 'evictions': 0, 'rejected': 0}
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    # ==================== RETAIN & RESTORE ====================
+
+    def retain(self, name, refresh=None, on_hide=None, on_evict=None):
+        """Keep the screen just built on the root (its top-level widgets) as name
+
+        Returns False when it is over the widget budget on its own (it is then
+        destroyed on navigation like any other screen).
+        """
+        if self.max_screens <= 0:
+            return False
+        self.discard(name)
+        widgets = [w for w in self.root.winfo_children()
+                   if str(w) not in self._owners and w.winfo_manager() in GEOMETRY_MANAGERS]
+        entry = {
+            'widgets': widgets,
+            'layout': None,
+            'bg': None,
+            'size': sum(self.count_widgets(w) for w in widgets),
+            'refresh': refresh,
+            'on_hide': on_hide,
+            'on_evict': on_evict,
+        }
+        if entry['size'] > self.max_widgets:
+            self.stats['rejected'] += 1
+            return False
+        self._entries[name] = entry
+        for widget in widgets:
+            self._owners[str(widget)] = name
+        self._showing = name
+        self.stats['retained'] += 1
+        self._evict(keep=name)
+        return True
+
+    def restore(self, name):
+        """Show retained screen name again (after hide()) and run its refresh hook
+
+        Returns False if it is not retained or its refresh hook asked for a
+        rebuild (the stale screen is discarded then).
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return False
+        self._entries.move_to_end(name)
+        self.root.configure(bg=entry['bg'])
+        for widget, manager, info in entry['layout']:
+            getattr(widget, manager)(**info)
+        self._showing = name
+        try:
+            fresh = entry['refresh']() if entry['refresh'] else True
+        except Exception as e:
+            print(f"Refreshing retained screen '{name}' failed: {e}")
+            fresh = False
+        if fresh is False:
+            self.stats['stale'] += 1
+            self.discard(name)
+            return False
+        self.stats['restores'] += 1
+        return True
+
+    def hide(self):
+        """Take the retained screen on the root (if any) off it; True if there was one"""
+        name, self._showing = self._showing, None
+        entry = self._entries.get(name)
+        if entry is None:
+            return False
+        # Re-pack in stacking order, not creation order
+        order = {str(w): i for i, w in enumerate(self.root.pack_slaves())}
+        entry['widgets'] = sorted((w for w in entry['widgets'] if w.winfo_exists()),
+                                  key=lambda w: order.get(str(w), len(order)))
+        layout = []
+        for widget in entry['widgets']:
+            manager = widget.winfo_manager()
+            if manager not in GEOMETRY_MANAGERS:
+                continue
+            layout.append((widget, manager, getattr(widget, f'{manager}_info')()))
+            getattr(widget, f'{manager}_forget')()
+        entry['layout'] = layout
+        entry['bg'] = self.root.cget('bg')
+        if entry['on_hide']:
+            entry['on_hide']()
+        # Screens such as the shop grid grow while in use
+        entry['size'] = sum(self.count_widgets(w) for w in entry['widgets'])
+        self._evict()
+        return True
+
+    def owns(self, widget):
+        """True for top-level widgets of retained screens (not to be destroyed)"""
+        return str(widget) in self._owners
+
+    # ==================== HOUSEKEEPING ====================
+
+    def _evict(self, keep=None):
+        while self._entries and (len(self._entries) > self.max_screens or
+                                 self._widget_count() > self.max_widgets):
+            victim = next((name for name in self._entries if name != keep), keep)
+            self.discard(victim)
+            self.stats['evictions'] += 1
+            if victim == keep:
+                break
+
+    def discard(self, name):
+        """Forget a retained screen and destroy its widgets"""
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            return
+        if self._showing == name:
+            self._showing = None
+        if entry['on_evict']:
+            entry['on_evict']()
+        for widget in entry['widgets']:
+            self._owners.pop(str(widget), None)
+            if widget.winfo_exists():
+                widget.destroy()
+
+    def clear(self):
+        """Drop every retained screen (e.g. on logout)"""
+        for name in list(self._entries):
+            self.discard(name)
+
+    def _widget_count(self):
+        return sum(entry['size'] for entry in self._entries.values())
+
+    @staticmethod
+    def count_widgets(widget):
+        """Widgets in the tree under (and including) widget"""
+        count, stack = 0, [widget]
+        while stack:
+            current = stack.pop()
+            count += 1
+            stack.extend(current.winfo_children())
+        return count
+
+    def get_stats(self):
+        """Retain/restore/eviction counters plus current size"""
+        stats = dict(self.stats)
+        stats['screens'] = list(self._entries)
+        stats['widgets'] = self._widget_count()
+        stats['max_widgets'] = self.max_widgets
+        return stats
@@ -0,0 +1,72 @@
+"""
+Screens Package - ModernGroceryApp's screens, imported the first time they are shown
+Each module holds a class of methods written against the app (self is the
+ModernGroceryApp); the app's __getattr__ finds them through METHODS, so
+startup only imports the module of the first screen
+"""
+import importlib
+
+# module -> (class, the app methods it provides)
+MODULES = {
+    'gui.screens.auth': ('AuthScreens', (
+        'show_login_screen',
+        'show_registration_screen',
+    )),
+    'gui.screens.customer': ('CustomerScreens', (
+        'show_customer_dashboard',
+        'show_order_history',
+        'show_notifications',
+        'show_profile_screen',
+    )),
+    'gui.screens.shop': ('ShopScreens', (
+        'show_shop_screen',
+        'load_products',
+        'display_search_results',
+        'build_product_card',
+        'bind_product_card',
+        'show_product_detail',
+    )),
+    'gui.screens.checkout': ('CheckoutScreens', (
+        'show_cart_screen',
+        'show_checkout_screen',
+        'show_payment_portal',
+    )),
+    'gui.screens.admin': ('AdminScreens', (
+        'show_admin_dashboard',
+        'show_best_sellers_screen',
+        'show_admin_orders_screen',
+        'show_order_details_screen',
+    )),
+    'gui.screens.admin_products': ('ProductAdminScreens', (
+        'show_add_product_screen',
+        'show_manage_products_screen',
+        'show_manage_category_products',
+        'show_edit_product_screen',
+        'delete_product',
+    )),
+    'gui.screens.admin_inventory': ('InventoryAdminScreens', (
+        'show_inventory_screen',
+        'show_inventory_category_products',
+        'show_expiring_soon_screen',
+        'show_expired_items_screen',
+        'show_items_by_category',
+        'show_category_products',
+    )),
+}
+
+METHODS = {name: module for module, (_, names) in MODULES.items() for name in names}
+
+_functions = {}  # method name -> plain function, once its module is imported
+
+
+def function(name):
+    """The function behind screen method name (importing its module on first use)"""
+    func = _functions.get(name)
+    if func is None:
+        module = METHODS[name]
+        class_name, names = MODULES[module]
+        screen_class = getattr(importlib.import_module(module), class_name)
+        for method in names:
+            _functions[method] = vars(screen_class)[method]
+        func = _functions[name]
+    return func
@@ -0,0 +1,574 @@
+"""
+Admin Screens - Dashboard, orders and best sellers
+Methods of ModernGroceryApp (self is the app), imported on first use through
+gui.screens
+"""
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from gui.ui_components import InfiniteScroll
+
+from services import ProductService, OrderService, DashboardService
+
+
+class AdminScreens:
+    """Admin dashboard and order management screens"""
+
+    # ==================== ADMIN DASHBOARD ====================
+
+    def show_admin_dashboard(self):
+        """Show admin dashboard"""
+        self.clear_window()
+        self.current_screen = 'admin_dashboard'
+        
+        # Configure root background
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['primary'], height=100)
+        header.pack(fill=tk.X)
+        
+        # Header content
+        header_left = tk.Frame(header, bg=self.colors['primary'])
+        header_left.pack(side=tk.LEFT, padx=30, pady=25)
+        
+        tk.Label(
+            header_left,
+            text="👨‍💼 Admin Panel",
+            font=('Segoe UI', 20, 'bold'),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(anchor=tk.W)
+        
+        tk.Label(
+            header_left,
+            text=f"Welcome, {self.current_staff[4]}",
+            font=('Segoe UI', 11),
+            bg=self.colors['primary'],
+            fg='#E0E0E0'
+        ).pack(anchor=tk.W, pady=(5, 0))
+        
+        self.create_button(header, "🚪 Logout", self.logout, 'danger', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
+        
+        # Quick stats section
+        stats_label = tk.Label(
+            main_frame,
+            text="📊 Quick Stats",
+            font=('Segoe UI', 14, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        )
+        stats_label.pack(anchor=tk.W, pady=(0, 15))
+        
+        # Stats cards - simplified
+        stats_frame = tk.Frame(main_frame, bg=self.colors['bg'])
+        stats_frame.pack(fill=tk.X, pady=(0, 30))
+        
+        # Get statistics (one query against the maintained summary table)
+        product_stats = DashboardService.get_dashboard_stats()['products']
+        
+        stats = [
+            (f"🔢\nTotal Items\n{product_stats['total_items']}", self.show_items_by_category, self.colors['secondary']),
+            (f"⚠️\nExpiring Soon\n{product_stats['expiring_soon']}", self.show_expiring_soon_screen, self.colors['accent']),
+            (f"❌\nExpired\n{product_stats['expired']}", self.show_expired_items_screen, self.colors['danger']),
+        ]
+        
+        for title, command, color in stats:
+            card = self.create_card(stats_frame, width=200, height=140)
+            card.pack(side=tk.LEFT, padx=15)
+            card.pack_propagate(False)
+            card.config(cursor='hand2')
+            card.config(bg=color)
+            
+            # Bind click
+            card.bind('<Button-1>', lambda e, cmd=command: cmd())
+            
+            # Title label
+            title_label = tk.Label(
+                card,
+                text=title,
+                font=('Segoe UI', 13, 'bold'),
+                bg=color,
+                fg='white',
+                cursor='hand2'
+            )
+            title_label.pack(pady=20)
+            title_label.bind('<Button-1>', lambda e, cmd=command: cmd())
+            
+            # Bind click events to all child widgets
+            for widget in card.winfo_children():
+                widget.bind('<Button-1>', lambda e, cmd=command: cmd())
+        
+        # Main menu section
+        menu_label = tk.Label(
+            main_frame,
+            text="🎯 Main Menu",
+            font=('Segoe UI', 14, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        )
+        menu_label.pack(anchor=tk.W, pady=(20, 15))
+        
+        # Menu options in grid layout
+        menu_frame = tk.Frame(main_frame, bg=self.colors['bg'])
+        menu_frame.pack(fill=tk.BOTH, expand=True)
+        
+        menus = [
+            ("📝\nAdd Product", self.show_add_product_screen, self.colors['success']),
+            ("📋\nManage Products", self.show_manage_products_screen, self.colors['primary']),
+            ("📊\nInventory", self.show_inventory_screen, self.colors['secondary']),
+            ("📦\nView Orders", self.show_admin_orders_screen, self.colors['accent']),
+            ("📈\nBest Sellers", self.show_best_sellers_screen, self.colors['primary_dark']),
+        ]
+        
+        # Create 2x2 grid
+        for i, (title, command, color) in enumerate(menus):
+            # Create row frame if needed
+            if i % 2 == 0:
+                row_frame = tk.Frame(menu_frame, bg=self.colors['bg'])
+                row_frame.pack(fill=tk.X, pady=10)
+            
+            # Create menu card
+            card = self.create_card(row_frame, width=280, height=120)
+            card.pack(side=tk.LEFT, padx=15, expand=True, fill=tk.BOTH)
+            card.pack_propagate(False)
+            card.config(cursor='hand2')
+            
+            # Card background with color
+            card_inner = tk.Frame(card, bg=color)
+            card_inner.pack(fill=tk.BOTH, expand=True)
+            
+            # Title with emoji on multiple lines
+            title_label = tk.Label(
+                card_inner,
+                text=title,
+                font=('Segoe UI', 12, 'bold'),
+                bg=color,
+                fg='white',
+                justify=tk.CENTER,
+                cursor='hand2'
+            )
+            title_label.pack(expand=True, pady=10)
+            title_label.bind('<Button-1>', lambda e, cmd=command: cmd())
+            
+            # Bind card click
+            card.bind('<Button-1>', lambda e, cmd=command: cmd())
+            card_inner.bind('<Button-1>', lambda e, cmd=command: cmd())
+            for widget in card_inner.winfo_children():
+                widget.bind('<Button-1>', lambda e, cmd=command: cmd())
+    
+    def show_best_sellers_screen(self, window='30d'):
+        """Show best-selling products (read from the product_sales rollup)"""
+        self.clear_window()
+        self.current_screen = 'best_sellers'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['primary_dark'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="📈 Best Sellers",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['primary_dark'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_admin_dashboard, 'secondary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Window selector
+        tabs = tk.Frame(main_frame, bg=self.colors['bg'])
+        tabs.pack(anchor=tk.W, pady=(0, 15))
+        for key, label in (('7d', "Last 7 days"), ('30d', "Last 30 days"), ('lifetime', "All time")):
+            selected = key == window
+            tk.Button(
+                tabs,
+                text=label,
+                command=lambda w=key: self.show_best_sellers_screen(w),
+                bg=self.colors['primary'] if selected else self.colors['card'],
+                fg='white' if selected else self.colors['text'],
+                font=('Segoe UI', 10, 'bold' if selected else 'normal'),
+                relief=tk.FLAT,
+                padx=15,
+                pady=6,
+                cursor='hand2'
+            ).pack(side=tk.LEFT, padx=(0, 8))
+        
+        best_sellers = ProductService.get_best_sellers(window, limit=20)
+        
+        if not best_sellers:
+            tk.Label(
+                main_frame,
+                text="No sales in this period yet",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['text_light']
+            ).pack(pady=50)
+            return
+        
+        for rank, (product_id, name, category_name, units, revenue) in enumerate(best_sellers, 1):
+            row = tk.Frame(main_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+            row.pack(fill=tk.X, pady=3)
+            
+            tk.Label(
+                row,
+                text=f"#{rank}",
+                font=('Segoe UI', 11, 'bold'),
+                bg=self.colors['card'],
+                fg=self.colors['primary'],
+                width=4
+            ).pack(side=tk.LEFT, padx=(10, 5), pady=8)
+            
+            tk.Label(
+                row,
+                text=f"{name}  •  {category_name}",
+                font=('Segoe UI', 10),
+                bg=self.colors['card'],
+                fg=self.colors['text'],
+                anchor='w'
+            ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+            
+            tk.Label(
+                row,
+                text=f"{units} units  |  LKR {revenue:.2f}",
+                font=('Segoe UI', 10, 'bold'),
+                bg=self.colors['card'],
+                fg=self.colors['text']
+            ).pack(side=tk.RIGHT, padx=15)
+    
+    # ==================== ORDER MANAGEMENT ====================
+
+    def show_admin_orders_screen(self):
+        """Show all orders for admin"""
+        self.clear_window()
+        self.current_screen = 'admin_orders'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['accent'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="📦 Customer Orders",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['accent'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_admin_dashboard, 'primary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # First page of orders, newest first; later pages load on scroll
+        orders, next_token = OrderService.get_admin_orders_page()
+        
+        if not orders:
+            tk.Label(
+                main_frame,
+                text="✅ No orders yet!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display orders
+            def render_order(row):
+                order_id, user_id, customer_name, phone, order_date, total_amount, delivery_address, item_count = row
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=8, padx=10)
+                card.config(cursor='hand2')
+                
+                # Bind click
+                card.bind('<Button-1>', lambda e, oid=order_id: self.show_order_details_screen(oid))
+                
+                # Order info
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=12)
+                
+                # Order header
+                tk.Label(
+                    info_frame,
+                    text=f"📋 Order #{order_id} • Customer ID: {user_id}",
+                    font=('Segoe UI', 11, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['text'],
+                    cursor='hand2'
+                ).pack(anchor=tk.W)
+                
+                # Customer info
+                tk.Label(
+                    info_frame,
+                    text=f"👤 {customer_name} | 📞 {phone}",
+                    font=('Segoe UI', 9),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light'],
+                    cursor='hand2'
+                ).pack(anchor=tk.W, pady=(3, 0))
+                
+                # Order details
+                order_date_str = order_date.strftime('%d-%m-%Y %H:%M') if hasattr(order_date, 'strftime') else str(order_date)
+                details_text = f"📅 {order_date_str} | 🛒 {item_count} items | 💰 LKR {total_amount}"
+                
+                tk.Label(
+                    info_frame,
+                    text=details_text,
+                    font=('Segoe UI', 9),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light'],
+                    cursor='hand2'
+                ).pack(anchor=tk.W, pady=(3, 0))
+                
+                # Arrow
+                arrow_frame = tk.Frame(card, bg=self.colors['card'])
+                arrow_frame.pack(side=tk.RIGHT, padx=20)
+                
+                arrow_label = tk.Label(
+                    arrow_frame,
+                    text="→",
+                    font=('Segoe UI', 16),
+                    bg=self.colors['card'],
+                    fg=self.colors['accent'],
+                    cursor='hand2'
+                )
+                arrow_label.pack()
+                arrow_label.bind('<Button-1>', lambda e, oid=order_id: self.show_order_details_screen(oid))
+            
+            InfiniteScroll(
+                canvas,
+                scrollbar,
+                OrderService.get_admin_orders_page,
+                render_order,
+                first_page=(orders, next_token)
+            )
+    
+    def show_order_details_screen(self, order_id):
+        """Show detailed items in an order"""
+        self.clear_window()
+        self.current_screen = 'order_details'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['accent'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text=f"📦 Order #{order_id} Details",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['accent'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_admin_orders_screen, 'primary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Get order details
+        order_info, items = OrderService.get_order_details(order_id)
+        
+        if not order_info:
+            tk.Label(
+                main_frame,
+                text="❌ Order not found!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['danger']
+            ).pack(pady=50)
+            return
+        
+        order_id_val, user_id, customer_name, email, order_date, total_amount, delivery_address, payment_method, payment_status, order_status, confirmed_at = order_info
+        
+        # Calculate delivery date (7 days from order date)
+        from datetime import timedelta
+        if order_date and hasattr(order_date, 'strftime'):
+            delivery_date = order_date + timedelta(days=7)
+        else:
+            delivery_date = None
+        
+        # Order info section
+        info_card = self.create_card(main_frame, width=600, height=250)
+        info_card.pack(fill=tk.X, pady=10)
+        
+        order_date_str = order_date.strftime('%d-%m-%Y %H:%M') if hasattr(order_date, 'strftime') else str(order_date)
+        confirmed_date_str = confirmed_at.strftime('%d-%m-%Y %H:%M') if confirmed_at and hasattr(confirmed_at, 'strftime') else 'Not confirmed'
+        delivery_date_str = delivery_date.strftime('%d-%m-%Y') if delivery_date and hasattr(delivery_date, 'strftime') else 'Not set'
+        
+        # Determine payment status color
+        payment_status_color = self.colors['success'] if payment_status and payment_status.lower() == 'paid' else self.colors['danger']
+        payment_status_emoji = '✅' if payment_status and payment_status.lower() == 'paid' else '❌'
+        
+        # Determine order status color
+        order_status_color = self.colors['success'] if order_status and order_status.lower() == 'confirmed' else self.colors['warning']
+        
+        info_text = f"""
+        Order #: {order_id_val}  |  Customer ID: {user_id}
+        Customer: {customer_name}  |  Email: {email}
+        Order Date: {order_date_str}  |  Confirmed: {confirmed_date_str}
+        Delivery Date: {delivery_date_str}
+        Delivery Address: {delivery_address}
+        Total Amount: LKR {total_amount}
+        Payment Method: {payment_method.title() if payment_method else 'N/A'}  |  Payment Status: {payment_status_emoji} {payment_status.upper() if payment_status else 'PENDING'}
+        Order Status: {order_status.upper() if order_status else 'PENDING'}
+        """
+        
+        tk.Label(
+            info_card,
+            text=info_text.strip(),
+            font=('Segoe UI', 10),
+            bg=self.colors['card'],
+            fg=self.colors['text'],
+            justify=tk.LEFT
+        ).pack(anchor=tk.W, padx=20, pady=15)
+        
+        # Items section
+        items_label = tk.Label(
+            main_frame,
+            text="📦 Ordered Items",
+            font=('Segoe UI', 12, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        )
+        items_label.pack(anchor=tk.W, pady=(20, 10))
+        
+        if not items:
+            tk.Label(
+                main_frame,
+                text="No items in this order",
+                font=('Segoe UI', 10),
+                bg=self.colors['bg'],
+                fg=self.colors['text_light']
+            ).pack(pady=20)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0, height=300)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display items
+            for item in items:
+                # Handle both 5-tuple and 7-tuple returns (with or without status)
+                if len(item) >= 7:
+                    item_id, product_id, product_name, quantity, unit_price, total_price, item_status = item[:7]
+                else:
+                    item_id, product_name, quantity, unit_price, total_price = item[:5]
+                    item_status = 'pending'
+                    product_id = item_id if isinstance(item_id, int) else 0
+                
+                # Determine status color and icon
+                is_received = item_status and item_status.lower() == 'received'
+                status_color = self.colors['success'] if is_received else self.colors['warning']
+                status_text = "✅ Received" if is_received else "⏳ Pending"
+                
+                card = tk.Frame(main_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=5, padx=10)
+                
+                # Item info
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=10)
+                
+                tk.Label(
+                    info_frame,
+                    text=f"📦 {product_name}",
+                    font=('Segoe UI', 10, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['text']
+                ).pack(anchor=tk.W)
+                
+                details_text = f"Qty: {quantity} | Price: LKR {unit_price}/unit | Total: LKR {total_price}"
+                tk.Label(
+                    info_frame,
+                    text=details_text,
+                    font=('Segoe UI', 9),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light']
+                ).pack(anchor=tk.W, pady=(2, 0))
+                
+                # Status section
+                status_frame = tk.Frame(card, bg=self.colors['card'])
+                status_frame.pack(side=tk.RIGHT, padx=15, pady=10)
+                
+                # Status label
+                tk.Label(
+                    status_frame,
+                    text=status_text,
+                    font=('Segoe UI', 9, 'bold'),
+                    bg=status_color,
+                    fg='white',
+                    padx=10,
+                    pady=5
+                ).pack(side=tk.LEFT, padx=5)
+                
+                # Toggle button
+                def toggle_status(oid=order_id, pid=product_id, current=item_status):
+                    new_status = 'pending' if current and current.lower() == 'received' else 'received'
+                    success, msg = OrderService.update_order_item_status(oid, pid, new_status)
+                    if success:
+                        messagebox.showinfo("Success", msg)
+                        self.show_order_details_screen(oid)
+                    else:
+                        messagebox.showwarning("Info", f"Item status feature coming soon. Current: {current}")
+                
+                toggle_btn = tk.Button(
+                    status_frame,
+                    text="Mark as " + ("Pending" if is_received else "Received"),
+                    command=toggle_status,
+                    bg=self.colors['primary'],
+                    fg='white',
+                    font=('Segoe UI', 9),
+                    relief=tk.FLAT,
+                    cursor='hand2',
+                    padx=10,
+                    pady=5
+                )
+                toggle_btn.pack(side=tk.LEFT, padx=5)
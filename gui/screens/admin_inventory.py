@@ -0,0 +1,644 @@
+"""
+Inventory Admin Screens - Stock, expiry and category views
+Methods of ModernGroceryApp (self is the app), imported on first use through
+gui.screens
+"""
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from gui.ui_components import InfiniteScroll
+
+from services import ProductService
+
+
+class InventoryAdminScreens:
+    """Inventory, expiry and category-browsing screens"""
+
+    # ==================== INVENTORY ====================
+
+    def show_inventory_screen(self):
+        """Show inventory management screen - category selection"""
+        self.clear_window()
+        self.current_screen = 'inventory'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['secondary'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="📊 Inventory Management",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['secondary'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_admin_dashboard, 'primary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Get categories with count
+        categories = ProductService.get_categories_with_count()
+        
+        if not categories:
+            tk.Label(
+                main_frame,
+                text="✅ No categories available!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display categories
+            for cat_id, cat_name, item_count in categories:
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=8, padx=10)
+                card.config(cursor='hand2')
+                
+                # Bind click
+                card.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_inventory_category_products(cid, cname))
+                
+                # Category info frame
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=15)
+                
+                # Category name
+                cat_label = tk.Label(
+                    info_frame,
+                    text=f"📁 {cat_name}",
+                    font=('Segoe UI', 13, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['secondary'],
+                    cursor='hand2'
+                )
+                cat_label.pack(anchor=tk.W)
+                cat_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_inventory_category_products(cid, cname))
+                
+                # Item count
+                count_label = tk.Label(
+                    info_frame,
+                    text=f"{item_count} item{'s' if item_count != 1 else ''}",
+                    font=('Segoe UI', 10),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light'],
+                    cursor='hand2'
+                )
+                count_label.pack(anchor=tk.W, pady=(3, 0))
+                count_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_inventory_category_products(cid, cname))
+                
+                # Arrow
+                arrow_frame = tk.Frame(card, bg=self.colors['card'])
+                arrow_frame.pack(side=tk.RIGHT, padx=20)
+                
+                arrow_label = tk.Label(
+                    arrow_frame,
+                    text="→",
+                    font=('Segoe UI', 16),
+                    bg=self.colors['card'],
+                    fg=self.colors['secondary'],
+                    cursor='hand2'
+                )
+                arrow_label.pack()
+                arrow_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_inventory_category_products(cid, cname))
+    
+    def show_inventory_category_products(self, category_id, category_name):
+        """Show inventory items in selected category"""
+        self.clear_window()
+        self.current_screen = 'inventory_category'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['secondary'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text=f"📦 {category_name} Inventory",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['secondary'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_inventory_screen, 'primary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # First page of products in category; later pages load on scroll
+        products, next_token = ProductService.get_products_in_category_page(category_id)
+        
+        if not products:
+            tk.Label(
+                main_frame,
+                text=f"✅ No products in {category_name}!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display products
+            def render_product(row):
+                product_id, name, stock, price, unit, expiry_date = row
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=8, padx=10)
+                
+                # Product info
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=12)
+                
+                # Product name
+                tk.Label(
+                    info_frame,
+                    text=f"📦 {name}",
+                    font=('Segoe UI', 11, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['text']
+                ).pack(anchor=tk.W)
+                
+                # Product details with stock highlight
+                stock_color = self.colors['danger'] if stock < 10 else self.colors['success']
+                expiry_text = f"Expires: {expiry_date}" if expiry_date else "No expiry"
+                details_text = f"Stock: {stock} {unit} | Price: LKR {price} | {expiry_text}"
+                
+                tk.Label(
+                    info_frame,
+                    text=details_text,
+                    font=('Segoe UI', 9),
+                    bg=self.colors['card'],
+                    fg=stock_color if stock < 10 else self.colors['text_light']
+                ).pack(anchor=tk.W, pady=(3, 0))
+            
+            InfiniteScroll(
+                canvas,
+                scrollbar,
+                lambda token: ProductService.get_products_in_category_page(category_id, token),
+                render_product,
+                first_page=(products, next_token)
+            )
+    
+    # ==================== EXPIRY ====================
+
+    def show_expiring_soon_screen(self):
+        """Show items expiring soon with delete option"""
+        self.clear_window()
+        self.current_screen = 'expiring_soon'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['accent'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="⚠️ Items Expiring Soon (Next 7 Days)",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['accent'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_admin_dashboard, 'secondary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Get expiring soon items
+        items = ProductService.get_expiring_soon_items()
+        
+        if not items:
+            tk.Label(
+                main_frame,
+                text="✅ No items expiring soon!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display items
+            for product_id, name, stock, expiry_date, price in items:
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=10)
+                
+                # Product info
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=15)
+                
+                tk.Label(
+                    info_frame,
+                    text=f"📦 {name}",
+                    font=('Segoe UI', 12, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['text']
+                ).pack(anchor=tk.W)
+                
+                tk.Label(
+                    info_frame,
+                    text=f"Stock: {stock} | Expiry: {expiry_date} | Price: LKR {price}",
+                    font=('Segoe UI', 10),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light']
+                ).pack(anchor=tk.W, pady=(5, 0))
+                
+                # Action button
+                def remove_item(pid=product_id, pname=name):
+                    if messagebox.askyesno("Confirm", f"Remove {pname} from inventory?"):
+                        ProductService.remove_expired_item(pid)
+                        messagebox.showinfo("Success", f"{pname} removed from inventory")
+                        self.show_expiring_soon_screen()
+                
+                btn_frame = tk.Frame(card, bg=self.colors['card'])
+                btn_frame.pack(side=tk.RIGHT, padx=15, pady=15)
+                
+                tk.Button(
+                    btn_frame,
+                    text="🗑️ Remove from Inventory",
+                    command=remove_item,
+                    bg=self.colors['danger'],
+                    fg='white',
+                    font=('Segoe UI', 9, 'bold'),
+                    relief=tk.FLAT,
+                    padx=10,
+                    pady=8,
+                    cursor='hand2'
+                ).pack()
+    
+    def show_expired_items_screen(self):
+        """Show expired items with delete option"""
+        self.clear_window()
+        self.current_screen = 'expired_items'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['danger'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="❌ Expired Items",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['danger'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_admin_dashboard, 'secondary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Get expired items
+        items = ProductService.get_expired_items()
+        
+        if not items:
+            tk.Label(
+                main_frame,
+                text="✅ No expired items!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display items
+            for product_id, name, stock, expiry_date, price in items:
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=10)
+                
+                # Product info
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=15)
+                
+                tk.Label(
+                    info_frame,
+                    text=f"📦 {name}",
+                    font=('Segoe UI', 12, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['text']
+                ).pack(anchor=tk.W)
+                
+                tk.Label(
+                    info_frame,
+                    text=f"Stock: {stock} | Expired on: {expiry_date} | Price: LKR {price}",
+                    font=('Segoe UI', 10),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light']
+                ).pack(anchor=tk.W, pady=(5, 0))
+                
+                # Action button
+                def remove_item(pid=product_id, pname=name):
+                    if messagebox.askyesno("Confirm", f"Remove {pname} from inventory?"):
+                        ProductService.remove_expired_item(pid)
+                        messagebox.showinfo("Success", f"{pname} removed from inventory")
+                        self.show_expired_items_screen()
+                
+                btn_frame = tk.Frame(card, bg=self.colors['card'])
+                btn_frame.pack(side=tk.RIGHT, padx=15, pady=15)
+                
+                tk.Button(
+                    btn_frame,
+                    text="🗑️ Remove from Inventory",
+                    command=remove_item,
+                    bg=self.colors['danger'],
+                    fg='white',
+                    font=('Segoe UI', 9, 'bold'),
+                    relief=tk.FLAT,
+                    padx=10,
+                    pady=8,
+                    cursor='hand2'
+                ).pack()
+    
+    # ==================== CATEGORIES ====================
+
+    def show_items_by_category(self):
+        """Show categories list for admin to select"""
+        self.clear_window()
+        self.current_screen = 'categories_list'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['primary'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="📁 Categories",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_admin_dashboard, 'secondary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Get categories with count
+        categories = ProductService.get_categories_with_count()
+        
+        if not categories:
+            tk.Label(
+                main_frame,
+                text="✅ No categories available!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display categories
+            for cat_id, cat_name, item_count in categories:
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=8, padx=10)
+                card.config(cursor='hand2')
+                
+                # Click handler
+                def on_category_click(cid=cat_id, cname=cat_name):
+                    self.show_category_products(cid, cname)
+                
+                # Bind click to card
+                card.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_category_products(cid, cname))
+                
+                # Category info frame
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=15)
+                
+                # Category name
+                cat_label = tk.Label(
+                    info_frame,
+                    text=f"📁 {cat_name}",
+                    font=('Segoe UI', 13, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['primary'],
+                    cursor='hand2'
+                )
+                cat_label.pack(anchor=tk.W)
+                cat_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_category_products(cid, cname))
+                
+                # Item count
+                count_label = tk.Label(
+                    info_frame,
+                    text=f"{item_count} item{'s' if item_count != 1 else ''}",
+                    font=('Segoe UI', 10),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light'],
+                    cursor='hand2'
+                )
+                count_label.pack(anchor=tk.W, pady=(3, 0))
+                count_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_category_products(cid, cname))
+                
+                # Arrow
+                arrow_frame = tk.Frame(card, bg=self.colors['card'])
+                arrow_frame.pack(side=tk.RIGHT, padx=20)
+                
+                arrow_label = tk.Label(
+                    arrow_frame,
+                    text="→",
+                    font=('Segoe UI', 16),
+                    bg=self.colors['card'],
+                    fg=self.colors['primary'],
+                    cursor='hand2'
+                )
+                arrow_label.pack()
+                arrow_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_category_products(cid, cname))
+    
+    def show_category_products(self, category_id, category_name):
+        """Show products in selected category"""
+        self.clear_window()
+        self.current_screen = 'category_products'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['primary'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text=f"📦 {category_name}",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back to Categories", self.show_items_by_category, 'secondary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # First page of products in category; later pages load on scroll
+        products, next_token = ProductService.get_products_in_category_page(category_id)
+        
+        if not products:
+            tk.Label(
+                main_frame,
+                text=f"✅ No products in {category_name}!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display products
+            def render_product(row):
+                product_id, name, stock, price, unit, expiry_date = row
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=8, padx=10)
+                
+                # Product info
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=12)
+                
+                # Product name
+                tk.Label(
+                    info_frame,
+                    text=f"📦 {name}",
+                    font=('Segoe UI', 11, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['text']
+                ).pack(anchor=tk.W)
+                
+                # Product details
+                expiry_text = f"Expires: {expiry_date}" if expiry_date else "No expiry"
+                details_text = f"Stock: {stock} {unit} | Price: LKR {price} | {expiry_text}"
+                
+                tk.Label(
+                    info_frame,
+                    text=details_text,
+                    font=('Segoe UI', 9),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light']
+                ).pack(anchor=tk.W, pady=(3, 0))
+            
+            InfiniteScroll(
+                canvas,
+                scrollbar,
+                lambda token: ProductService.get_products_in_category_page(category_id, token),
+                render_product,
+                first_page=(products, next_token)
+            )
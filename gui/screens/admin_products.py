@@ -0,0 +1,892 @@
+"""
+Product Admin Screens - Add, browse, edit and delete products
+Methods of ModernGroceryApp (self is the app), imported on first use through
+gui.screens
+"""
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from gui.ui_components import InfiniteScroll
+
+from services import ProductService, ImageService
+
+
+class ProductAdminScreens:
+    """Product management screens"""
+
+    # ==================== PRODUCT MANAGEMENT ====================
+
+    def show_add_product_screen(self):
+        """Show add product screen with image upload"""
+        self.clear_window()
+        self.current_screen = 'add_product'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['success'], height=60)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="📝 Add New Product",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['success'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=20, pady=15)
+        
+        self.create_button(header, "Back", self.show_admin_dashboard, 
+                          'primary', 10).pack(side=tk.RIGHT, padx=20, pady=15)
+        
+        # Main content with scrollbar
+        canvas = tk.Canvas(self.root, bg=self.colors['bg'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
+        main_frame = tk.Frame(canvas, bg=self.colors['bg'])
+        
+        main_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=main_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        card = self.create_card(main_frame)
+        card.pack(fill=tk.BOTH, expand=True, padx=50, pady=30)
+        
+        # Image upload section
+        image_frame = tk.Frame(card, bg=self.colors['card'])
+        image_frame.pack(pady=20)
+        
+        image_label = tk.Label(
+            image_frame,
+            text="📸\nNo Image",
+            font=('Segoe UI', 14),
+            bg='#E5E7EB',
+            fg='#6B7280',
+            width=20,
+            height=10
+        )
+        image_label.pack()
+        
+        selected_image_path = {"path": None}
+        selected_image_label = tk.Label(image_frame, text="", bg=self.colors['card'], 
+                                       font=('Segoe UI', 9), fg=self.colors['success'])
+        
+        def select_image():
+            path = ImageService.browse_image()
+            print(f"\n{'='*80}")
+            print(f"SELECT IMAGE DEBUG:")
+            print(f"  browse_image() returned: '{path}'")
+            print(f"  Type: {type(path)}")
+            print(f"  Is None: {path is None}")
+            print(f"  Is empty: {path == ''}")
+            print(f"  Bool value: {bool(path)}")
+            
+            if path and path.strip():  # Check for non-empty string
+                import os
+                print(f"  File exists: {os.path.exists(path)}")
+                selected_image_path["path"] = path
+                print(f"  ✓ Stored in dict: {selected_image_path['path']}")
+                
+                try:
+                    img = self.image_cache.get_photo(path, (200, 200))
+                    image_label.config(image=img, text="")
+                    image_label.image = img
+                    selected_image_label.config(text=f"✓ Image selected: {os.path.basename(path)}")
+                    print(f"  ✓ Image loaded and displayed")
+                except Exception as e:
+                    print(f"  ✗ Error loading image: {e}")
+                    messagebox.showerror("Error", f"Failed to load image: {e}")
+            else:
+                print(f"  ✗ No valid path (user cancelled or error)")
+                selected_image_label.config(text="")
+            print("="*80 + "\n")
+        
+        self.create_button(image_frame, "📷 Select Image", select_image, 
+                          'secondary', 15).pack(pady=10)
+        selected_image_label.pack(pady=5)
+        
+        # Form
+        form_frame = tk.Frame(card, bg=self.colors['card'])
+        form_frame.pack(padx=40, pady=10)
+        
+        fields = {}
+        
+        # Product Name
+        tk.Label(form_frame, text="Product Name *", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=0, column=0, sticky='w', pady=10)
+        fields['name'] = self.create_entry(form_frame, width=50)
+        fields['name'].grid(row=0, column=1, padx=10, pady=10)
+        
+        # Category
+        tk.Label(form_frame, text="Category *", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=1, column=0, sticky='w', pady=10)
+        categories = ProductService.get_all_categories()
+        category_var = tk.StringVar()
+        category_dropdown = ttk.Combobox(
+            form_frame,
+            textvariable=category_var,
+            values=[f"{c[1]}" for c in categories],
+            state='readonly',
+            width=47,
+            font=('Segoe UI', 11)
+        )
+        category_dropdown.grid(row=1, column=1, padx=10, pady=10)
+        if categories:
+            category_dropdown.set(categories[0][1])
+        
+        # Description
+        tk.Label(form_frame, text="Description", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=2, column=0, sticky='w', pady=10)
+        fields['description'] = tk.Text(form_frame, height=4, width=50, 
+                                       font=('Segoe UI', 10),
+                                       bg=self.colors['input_bg'], fg=self.colors['text'],
+                                       insertbackground=self.colors['text'])
+        fields['description'].grid(row=2, column=1, padx=10, pady=10)
+        
+        # Unit Price
+        tk.Label(form_frame, text="Unit Price (LKR) *", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=3, column=0, sticky='w', pady=10)
+        fields['price'] = self.create_entry(form_frame, width=50)
+        fields['price'].grid(row=3, column=1, padx=10, pady=10)
+        
+        # Unit
+        tk.Label(form_frame, text="Unit *", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=4, column=0, sticky='w', pady=10)
+        unit_var = tk.StringVar(value='unit')
+        unit_frame = tk.Frame(form_frame, bg=self.colors['card'])
+        unit_frame.grid(row=4, column=1, sticky='w', padx=10, pady=10)
+        for unit in ['unit', 'kg', 'liter', 'pack', 'dozen']:
+            tk.Radiobutton(
+                unit_frame,
+                text=unit.title(),
+                variable=unit_var,
+                value=unit,
+                bg=self.colors['card'],
+                fg=self.colors['text'],
+                selectcolor=self.colors['input_bg'],
+                activebackground=self.colors['card'],
+                activeforeground=self.colors['text'],
+                font=('Segoe UI', 10)
+            ).pack(side=tk.LEFT, padx=10)
+        
+        # Stock Quantity
+        tk.Label(form_frame, text="Stock Quantity *", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=5, column=0, sticky='w', pady=10)
+        fields['stock'] = self.create_entry(form_frame, width=50)
+        fields['stock'].grid(row=5, column=1, padx=10, pady=10)
+        
+        # Min Stock Level
+        tk.Label(form_frame, text="Min Stock Level", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=6, column=0, sticky='w', pady=10)
+        fields['min_stock'] = self.create_entry(form_frame, width=50)
+        fields['min_stock'].insert(0, '5')
+        fields['min_stock'].grid(row=6, column=1, padx=10, pady=10)
+        
+        # Manufactured Date
+        tk.Label(form_frame, text="Manufactured Date", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=7, column=0, sticky='w', pady=10)
+        
+        manufactured_date_frame = tk.Frame(form_frame, bg=self.colors['card'])
+        manufactured_date_frame.grid(row=7, column=1, padx=10, pady=10, sticky='w')
+        
+        fields['manufactured_date'] = self.create_entry(manufactured_date_frame, width=35)
+        fields['manufactured_date'].pack(side=tk.LEFT, padx=(0, 5))
+        
+        def open_manufactured_calendar():
+            self.open_calendar_picker(fields['manufactured_date'])
+        
+        tk.Button(
+            manufactured_date_frame,
+            text="📅 Pick Date",
+            command=open_manufactured_calendar,
+            bg=self.colors['secondary'],
+            fg='white',
+            font=('Segoe UI', 9, 'bold'),
+            relief=tk.FLAT,
+            padx=10,
+            pady=5,
+            cursor='hand2'
+        ).pack(side=tk.LEFT)
+        
+        # Expiry Date
+        tk.Label(form_frame, text="Expiry Date (Required)", bg=self.colors['card'], fg=self.colors['text'],
+                font=('Segoe UI', 11, 'bold')).grid(row=8, column=0, sticky='w', pady=10)
+        
+        expiry_date_frame = tk.Frame(form_frame, bg=self.colors['card'])
+        expiry_date_frame.grid(row=8, column=1, padx=10, pady=10, sticky='w')
+        
+        fields['expiry_date'] = self.create_entry(expiry_date_frame, width=35)
+        fields['expiry_date'].pack(side=tk.LEFT, padx=(0, 5))
+        
+        def open_expiry_calendar():
+            self.open_calendar_picker(fields['expiry_date'])
+        
+        tk.Button(
+            expiry_date_frame,
+            text="📅 Pick Date",
+            command=open_expiry_calendar,
+            bg=self.colors['danger'],
+            fg='white',
+            font=('Segoe UI', 9, 'bold'),
+            relief=tk.FLAT,
+            padx=10,
+            pady=5,
+            cursor='hand2'
+        ).pack(side=tk.LEFT)
+        
+        # Submit button
+        def submit_product():
+            try:
+                name = fields['name'].get().strip()
+                category_name = category_var.get()
+                description = fields['description'].get('1.0', tk.END).strip()
+                price = float(fields['price'].get())
+                unit = unit_var.get()
+                stock = int(fields['stock'].get())
+                min_stock = int(fields['min_stock'].get())
+                manufactured_date = fields['manufactured_date'].get().strip() or None
+                expiry_date = fields['expiry_date'].get().strip()
+                
+                if not all([name, category_name, price, stock, expiry_date]):
+                    messagebox.showerror("Error", "Please fill in all required fields marked with *")
+                    return
+                
+                # Validate date format
+                from datetime import datetime
+                try:
+                    if manufactured_date:
+                        datetime.strptime(manufactured_date, '%Y-%m-%d')
+                    datetime.strptime(expiry_date, '%Y-%m-%d')
+                except ValueError:
+                    messagebox.showerror("Error", "Please use YYYY-MM-DD format for dates")
+                    return
+                
+                # Get category ID
+                category_id = next((c[0] for c in categories if c[1] == category_name), None)
+                if not category_id:
+                    messagebox.showerror("Error", "Invalid category")
+                    return
+                
+                # Save image
+                image_filename = None
+                if selected_image_path["path"]:
+                    print(f"DEBUG submit: Saving image from: {selected_image_path['path']}")
+                    image_filename = ImageService.save_product_image(selected_image_path["path"], name)
+                    print(f"DEBUG submit: Image filename returned: {image_filename}")
+                    if image_filename is None:
+                        print("ERROR: save_product_image returned None!")
+                else:
+                    print("DEBUG submit: No image selected (path is None)")
+                
+                # Add product with dates
+                print(f"DEBUG submit: Calling add_product with:")
+                print(f"  name={name}")
+                print(f"  category_id={category_id}")
+                print(f"  description={description[:50]}...")
+                print(f"  image_path={image_filename}")
+                print(f"  unit_price={price}")
+                print(f"  unit={unit}")
+                print(f"  stock_quantity={stock}")
+                print(f"  min_stock_level={min_stock}")
+                print(f"  manufactured_date={manufactured_date}")
+                print(f"  expiry_date={expiry_date}")
+                
+                product_id = ProductService.add_product(name, category_id, description, image_filename,
+                                        price, unit, stock, min_stock)
+                
+                # Update with dates
+                if product_id:
+                    ProductService.set_product_dates(product_id, manufactured_date, expiry_date)
+                
+                print(f"DEBUG submit: Product added with ID: {product_id}")
+                
+                messagebox.showinfo("Success", f"Product added successfully! ID: {product_id}")
+                self.show_admin_dashboard()
+                
+            except ValueError:
+                messagebox.showerror("Error", "Please enter valid numbers for price and stock")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to add product: {str(e)}")
+        
+        btn_frame = tk.Frame(card, bg=self.colors['card'])
+        btn_frame.pack(pady=20)
+        
+        self.create_button(btn_frame, "Add Product", submit_product, 
+                          'success', 20).pack(pady=5)
+        self.create_button(btn_frame, "Cancel", self.show_admin_dashboard, 
+                          'danger', 20).pack(pady=5)
+    
+    def show_manage_products_screen(self):
+        """Show manage products screen - category selection"""
+        self.clear_window()
+        self.current_screen = 'manage_products'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['primary'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="📋 Manage Products",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_admin_dashboard, 'secondary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Get categories with count
+        categories = ProductService.get_categories_with_count()
+        
+        if not categories:
+            tk.Label(
+                main_frame,
+                text="✅ No categories available!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display categories
+            for cat_id, cat_name, item_count in categories:
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=8, padx=10)
+                card.config(cursor='hand2')
+                
+                # Bind click
+                card.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_manage_category_products(cid, cname))
+                
+                # Category info frame
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=15)
+                
+                # Category name
+                cat_label = tk.Label(
+                    info_frame,
+                    text=f"📁 {cat_name}",
+                    font=('Segoe UI', 13, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['primary'],
+                    cursor='hand2'
+                )
+                cat_label.pack(anchor=tk.W)
+                cat_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_manage_category_products(cid, cname))
+                
+                # Item count
+                count_label = tk.Label(
+                    info_frame,
+                    text=f"{item_count} item{'s' if item_count != 1 else ''}",
+                    font=('Segoe UI', 10),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light'],
+                    cursor='hand2'
+                )
+                count_label.pack(anchor=tk.W, pady=(3, 0))
+                count_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_manage_category_products(cid, cname))
+                
+                # Arrow
+                arrow_frame = tk.Frame(card, bg=self.colors['card'])
+                arrow_frame.pack(side=tk.RIGHT, padx=20)
+                
+                arrow_label = tk.Label(
+                    arrow_frame,
+                    text="✏️",
+                    font=('Segoe UI', 16),
+                    bg=self.colors['card'],
+                    fg=self.colors['primary'],
+                    cursor='hand2'
+                )
+                arrow_label.pack()
+                arrow_label.bind('<Button-1>', lambda e, cid=cat_id, cname=cat_name: self.show_manage_category_products(cid, cname))
+    
+    def show_manage_category_products(self, category_id, category_name):
+        """Show products in selected category for editing"""
+        self.clear_window()
+        self.current_screen = 'manage_category_products'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['primary'], height=80)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text=f"✏️ Manage {category_name}",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=30, pady=25)
+        
+        self.create_button(header, "← Back", self.show_manage_products_screen, 'secondary', 10).pack(
+            side=tk.RIGHT, padx=20, pady=20)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # First page of products in category; later pages load on scroll
+        products, next_token = ProductService.get_products_in_category_page(category_id)
+        
+        if not products:
+            tk.Label(
+                main_frame,
+                text=f"✅ No products in {category_name}!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['success']
+            ).pack(pady=50)
+        else:
+            # Create scrollable frame
+            canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+            scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+            scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+            
+            scrollable_frame.bind(
+                "<Configure>",
+                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            )
+            
+            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+            
+            # Bind mousewheel
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            
+            # Display products
+            def render_product(row):
+                product_id, name, stock, price, unit, expiry_date = row
+                card = tk.Frame(scrollable_frame, bg=self.colors['card'], relief=tk.FLAT, bd=1)
+                card.pack(fill=tk.X, pady=8, padx=10)
+                
+                # Product info
+                info_frame = tk.Frame(card, bg=self.colors['card'])
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=12)
+                
+                # Product name
+                tk.Label(
+                    info_frame,
+                    text=f"📦 {name}",
+                    font=('Segoe UI', 11, 'bold'),
+                    bg=self.colors['card'],
+                    fg=self.colors['text']
+                ).pack(anchor=tk.W)
+                
+                # Product details
+                expiry_text = f"Expires: {expiry_date}" if expiry_date else "No expiry"
+                details_text = f"Stock: {stock} {unit} | Price: LKR {price} | {expiry_text}"
+                
+                tk.Label(
+                    info_frame,
+                    text=details_text,
+                    font=('Segoe UI', 9),
+                    bg=self.colors['card'],
+                    fg=self.colors['text_light']
+                ).pack(anchor=tk.W, pady=(3, 0))
+                
+                # Action button
+                btn_frame = tk.Frame(card, bg=self.colors['card'])
+                btn_frame.pack(side=tk.RIGHT, padx=15, pady=12)
+                
+                tk.Button(
+                    btn_frame,
+                    text="✏️ Edit",
+                    command=lambda pid=product_id, pname=name, pstock=stock, pprice=price, punit=unit, pexp=expiry_date, cid=category_id: self.show_edit_product_screen(pid, pname, pstock, pprice, punit, pexp, cid, category_name),
+                    bg=self.colors['primary'],
+                    fg='white',
+                    font=('Segoe UI', 9, 'bold'),
+                    relief=tk.FLAT,
+                    padx=10,
+                    pady=8,
+                    cursor='hand2'
+                ).pack(side=tk.LEFT, padx=5)
+                
+                tk.Button(
+                    btn_frame,
+                    text="🗑️ Delete",
+                    command=lambda pid=product_id, pname=name, cid=category_id, cname=category_name: self.delete_product(pid, pname, cid, cname),
+                    bg=self.colors['danger'],
+                    fg='white',
+                    font=('Segoe UI', 9, 'bold'),
+                    relief=tk.FLAT,
+                    padx=10,
+                    pady=8,
+                    cursor='hand2'
+                ).pack(side=tk.LEFT, padx=5)
+            
+            InfiniteScroll(
+                canvas,
+                scrollbar,
+                lambda token: ProductService.get_products_in_category_page(category_id, token),
+                render_product,
+                first_page=(products, next_token)
+            )
+    
+    def show_edit_product_screen(self, product_id, product_name, stock, price, unit, expiry_date, category_id, category_name):
+        """Show edit product form"""
+        self.clear_window()
+        self.current_screen = 'edit_product'
+        
+        # Get full product details from database
+        product_data = ProductService.get_product_by_id_full(product_id)
+        if product_data:
+            _, _, db_price, db_stock, db_unit, manufactured_date, db_expiry_date = product_data
+        else:
+            manufactured_date = ""
+            db_expiry_date = expiry_date
+        
+        # Header with back button
+        header = tk.Frame(self.root, bg=self.colors['primary'], height=80)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        # Back button
+        back_btn = tk.Button(
+            header,
+            text="← Back",
+            command=lambda: self.show_manage_category_products(category_id, category_name),
+            bg=self.colors['primary_dark'],
+            fg='white',
+            font=('Segoe UI', 10, 'bold'),
+            relief=tk.FLAT,
+            padx=15,
+            pady=8,
+            cursor='hand2'
+        )
+        back_btn.pack(side=tk.LEFT, padx=15, pady=15)
+        
+        title_label = tk.Label(
+            header,
+            text=f"✏️ Edit Product",
+            font=('Segoe UI', 24, 'bold'),
+            fg='white',
+            bg=self.colors['primary']
+        )
+        title_label.pack(pady=15)
+        
+        subtitle_label = tk.Label(
+            header,
+            text=f"Category: {category_name} | Product: {product_name}",
+            font=('Segoe UI', 10),
+            fg=self.colors['text_light'],
+            bg=self.colors['primary']
+        )
+        subtitle_label.pack(pady=(0, 15))
+        
+        # Main container with scroll
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Create canvas for scrolling
+        canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(main_frame, orient=tk.VERTICAL, command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # Form fields
+        form_data = {}
+        
+        # Product Name
+        tk.Label(
+            scrollable_frame,
+            text="Product Name",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(pady=(10, 5), anchor='w')
+        
+        product_name_entry = tk.Entry(
+            scrollable_frame,
+            font=('Segoe UI', 11),
+            width=40,
+            relief=tk.FLAT,
+            bg='white',
+            fg=self.colors['text']
+        )
+        product_name_entry.insert(0, product_name)
+        product_name_entry.pack(pady=(0, 15), fill=tk.X)
+        form_data['name'] = product_name_entry
+        
+        # Unit Price
+        tk.Label(
+            scrollable_frame,
+            text="Unit Price (LKR)",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(pady=(10, 5), anchor='w')
+        
+        price_entry = tk.Entry(
+            scrollable_frame,
+            font=('Segoe UI', 11),
+            width=40,
+            relief=tk.FLAT,
+            bg='white',
+            fg=self.colors['text']
+        )
+        price_entry.insert(0, str(price))
+        price_entry.pack(pady=(0, 15), fill=tk.X)
+        form_data['price'] = price_entry
+        
+        # Stock Quantity
+        tk.Label(
+            scrollable_frame,
+            text="Stock Quantity",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(pady=(10, 5), anchor='w')
+        
+        stock_entry = tk.Entry(
+            scrollable_frame,
+            font=('Segoe UI', 11),
+            width=40,
+            relief=tk.FLAT,
+            bg='white',
+            fg=self.colors['text']
+        )
+        stock_entry.insert(0, str(stock))
+        stock_entry.pack(pady=(0, 15), fill=tk.X)
+        form_data['stock'] = stock_entry
+        
+        # Unit (Dropdown)
+        tk.Label(
+            scrollable_frame,
+            text="Unit",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(pady=(10, 5), anchor='w')
+        
+        unit_var = tk.StringVar(value=unit)
+        unit_dropdown = tk.OptionMenu(
+            scrollable_frame,
+            unit_var,
+            "unit", "kg", "liter", "pack", "dozen"
+        )
+        unit_dropdown.config(
+            font=('Segoe UI', 11),
+            bg='white',
+            fg=self.colors['text'],
+            relief=tk.FLAT,
+            highlightthickness=0,
+            width=37
+        )
+        unit_dropdown.pack(pady=(0, 15), fill=tk.X)
+        form_data['unit'] = unit_var
+        
+        # Manufactured Date (READ-ONLY) - Display section
+        tk.Label(
+            scrollable_frame,
+            text="📅 Manufactured Date (Read-Only)",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(pady=(15, 8), anchor='w')
+        
+        manu_date_display_frame = tk.Frame(scrollable_frame, bg=self.colors['input_bg'], relief=tk.FLAT)
+        manu_date_display_frame.pack(pady=(0, 15), fill=tk.X, ipady=10, ipadx=10)
+        
+        manu_display = str(manufactured_date) if manufactured_date else "Not set"
+        tk.Label(
+            manu_date_display_frame,
+            text=manu_display,
+            font=('Segoe UI', 11),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_light']
+        ).pack(anchor='w')
+        form_data['manu_date'] = manufactured_date
+        
+        # Current/Old Expiry Date (READ-ONLY) - Display section
+        tk.Label(
+            scrollable_frame,
+            text="📅 Current Expiry Date (Read-Only)",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(pady=(15, 8), anchor='w')
+        
+        old_exp_date_display_frame = tk.Frame(scrollable_frame, bg=self.colors['input_bg'], relief=tk.FLAT)
+        old_exp_date_display_frame.pack(pady=(0, 15), fill=tk.X, ipady=10, ipadx=10)
+        
+        old_exp_display = str(db_expiry_date) if db_expiry_date else "Not set"
+        tk.Label(
+            old_exp_date_display_frame,
+            text=old_exp_display,
+            font=('Segoe UI', 11),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_light']
+        ).pack(anchor='w')
+        
+        # New Expiry Date (EDITABLE)
+        tk.Label(
+            scrollable_frame,
+            text="📅 Set New Expiry Date",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(pady=(15, 8), anchor='w')
+        
+        exp_date_var = tk.StringVar(value="")
+        exp_date_frame = tk.Frame(scrollable_frame, bg=self.colors['bg'])
+        exp_date_frame.pack(pady=(0, 20), fill=tk.X)
+        
+        exp_date_entry = tk.Entry(
+            exp_date_frame,
+            textvariable=exp_date_var,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            bg='white',
+            fg=self.colors['text'],
+            width=32,
+            state=tk.DISABLED
+        )
+        exp_date_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        tk.Button(
+            exp_date_frame,
+            text="📅",
+            command=lambda: self.open_calendar_picker(exp_date_entry),
+            bg=self.colors['primary'],
+            fg='white',
+            relief=tk.FLAT,
+            padx=12,
+            pady=8,
+            cursor='hand2'
+        ).pack(side=tk.LEFT, padx=(5, 0))
+        form_data['exp_date'] = exp_date_var
+        
+        # Pack canvas and scrollbar
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Buttons
+        button_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        button_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        def save_product():
+            try:
+                from datetime import datetime
+                
+                new_name = form_data['name'].get().strip()
+                new_price = float(form_data['price'].get().strip())
+                new_stock = int(form_data['stock'].get().strip())
+                new_unit = form_data['unit'].get()
+                new_exp_date = form_data['exp_date'].get() or None
+                
+                if not new_name:
+                    messagebox.showerror("Error", "Product name cannot be empty!")
+                    return
+                
+                if new_price <= 0:
+                    messagebox.showerror("Error", "Price must be greater than 0!")
+                    return
+                
+                if new_stock < 0:
+                    messagebox.showerror("Error", "Stock cannot be negative!")
+                    return
+                
+                # Validate expiry date vs manufactured date
+                if new_exp_date and manufactured_date:
+                    try:
+                        new_exp_date_obj = datetime.strptime(new_exp_date, '%Y-%m-%d').date()
+                        manu_date_obj = datetime.strptime(str(manufactured_date), '%Y-%m-%d').date()
+                        
+                        if new_exp_date_obj < manu_date_obj:
+                            messagebox.showerror(
+                                "Error",
+                                f"Expiry date ({new_exp_date}) cannot be before\nmanufactured date ({manufactured_date})!"
+                            )
+                            return
+                    except ValueError:
+                        pass  # If date parsing fails, let database handle validation
+                
+                # Update product (manufactured date stays unchanged)
+                success, msg = ProductService.update_product(product_id, new_name, new_price, new_stock, new_unit, new_exp_date, None)
+                if success:
+                    messagebox.showinfo("Success", f"Product '{new_name}' updated successfully!")
+                    self.show_manage_category_products(category_id, category_name)
+                else:
+                    messagebox.showerror("Error", "Failed to update product!")
+            except ValueError as e:
+                messagebox.showerror("Error", "Please enter valid values!")
+        
+        tk.Button(
+            button_frame,
+            text="💾 Save Changes",
+            command=save_product,
+            bg=self.colors['success'],
+            fg='white',
+            font=('Segoe UI', 11, 'bold'),
+            relief=tk.FLAT,
+            padx=20,
+            pady=10,
+            cursor='hand2'
+        ).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(
+            button_frame,
+            text="❌ Cancel",
+            command=lambda: self.show_manage_category_products(category_id, category_name),
+            bg=self.colors['text_muted'],
+            fg='white',
+            font=('Segoe UI', 11, 'bold'),
+            relief=tk.FLAT,
+            padx=20,
+            pady=10,
+            cursor='hand2'
+        ).pack(side=tk.LEFT, padx=5)
+    
+    def delete_product(self, product_id, product_name, category_id, category_name):
+        """Delete a product with confirmation"""
+        result = messagebox.askyesno(
+            "Confirm Delete",
+            f"Are you sure you want to delete '{product_name}'?\n\nThis action cannot be undone."
+        )
+        
+        if result:
+            success, msg = ProductService.delete_product(product_id)
+            if success:
+                messagebox.showinfo("Success", f"Product '{product_name}' has been deleted!")
+                # Refresh the current category's products
+                self.show_manage_category_products(category_id, category_name)
+            else:
+                messagebox.showerror("Error", "Failed to delete product!")
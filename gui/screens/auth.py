@@ -0,0 +1,621 @@
+"""
+Auth Screens - Login and customer registration
+Methods of ModernGroceryApp (self is the app), imported on first use through
+gui.screens
+"""
+import tkinter as tk
+from tkinter import messagebox
+
+from services import CartSession
+
+
+class AuthScreens:
+    """Login (customer/staff tabs) and registration screens"""
+
+    # ==================== LOGIN & REGISTRATION ====================
+
+    def show_login_screen(self):
+        """Show anime-themed login screen with dynamic effects"""
+        self.clear_window()
+        self.current_screen = 'login'
+        
+        # Configure root background
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Main container
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Center container with fixed dimensions
+        center_container = tk.Frame(main_frame, bg=self.colors['bg'])
+        center_container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        
+        # Left side - Orange Branding
+        left_frame = tk.Frame(center_container, bg=self.colors['primary'], width=400, height=650,
+                             highlightthickness=1, highlightbackground=self.colors['primary_dark'])
+        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, padx=(0, 0))
+        left_frame.pack_propagate(False)
+        
+        # Branding content
+        brand_content = tk.Frame(left_frame, bg=self.colors['primary'])
+        brand_content.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        
+        # Minimal app icon
+        tk.Label(
+            brand_content,
+            text="🛒",
+            font=('Segoe UI', 72),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(pady=(0, 30))
+        
+        # App name - buyMe branding
+        tk.Label(
+            brand_content,
+            text="buyMe",
+            font=('Segoe UI', 36, 'bold'),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(pady=(0, 5))
+        
+        tk.Label(
+            brand_content,
+            text="Grocery Stores",
+            font=('Segoe UI', 18),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(pady=(0, 30))
+        
+        # Minimal divider
+        tk.Label(
+            brand_content,
+            text="─────────────",
+            font=('Segoe UI', 14),
+            bg=self.colors['primary'],
+            fg=self.colors['accent']
+        ).pack(pady=(0, 20))
+        
+        # Sophisticated tagline
+        tk.Label(
+            brand_content,
+            text="Premium quality delivered",
+            font=('Segoe UI', 11),
+            bg=self.colors['primary'],
+            fg='white',
+            wraplength=300
+        ).pack()
+        
+        # Right side - Login form with sigma aesthetic
+        right_frame = tk.Frame(center_container, bg=self.colors['card'], width=450, height=650,
+                              highlightthickness=1, highlightbackground=self.colors['border'])
+        right_frame.pack(side=tk.LEFT, fill=tk.BOTH)
+        right_frame.pack_propagate(False)
+        
+        # Form container with padding
+        form_container = tk.Frame(right_frame, bg=self.colors['card'])
+        form_container.pack(fill=tk.BOTH, expand=True, padx=50, pady=60)
+        
+        # Welcome text - minimal and clean
+        tk.Label(
+            form_container,
+            text="Welcome Back",
+            font=('Segoe UI', 28, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 5))
+        
+        tk.Label(
+            form_container,
+            text="Sign in to continue",
+            font=('Segoe UI', 10),
+            bg=self.colors['card'],
+            fg=self.colors['text_light']
+        ).pack(anchor='w', pady=(0, 30))
+        
+        # User type selection (Anime-styled tabs)
+        user_type_var = tk.StringVar(value=self.login_tab)  # Restore previous tab selection
+        
+        tab_frame = tk.Frame(form_container, bg=self.colors['card'])
+        tab_frame.pack(fill=tk.X, pady=(0, 25))
+        
+        def select_tab(tab_type):
+            user_type_var.set(tab_type)
+            self.login_tab = tab_type  # Save tab selection
+            # Update tab styles - clean orange theme
+            if tab_type == 'customer':
+                customer_tab.config(bg=self.colors['primary'], fg='white')
+                staff_tab.config(bg=self.colors['bg'], fg=self.colors['text_light'])
+            else:
+                staff_tab.config(bg=self.colors['primary'], fg='white')
+                customer_tab.config(bg=self.colors['bg'], fg=self.colors['text_light'])
+        
+        customer_tab = tk.Label(
+            tab_frame,
+            text="Customer",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['primary'] if self.login_tab == 'customer' else self.colors['bg'],
+            fg='white' if self.login_tab == 'customer' else self.colors['text_light'],
+            padx=30,
+            pady=14,
+            cursor='hand2',
+            relief=tk.FLAT
+        )
+        customer_tab.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        customer_tab.bind('<Button-1>', lambda e: select_tab('customer'))
+        
+        staff_tab = tk.Label(
+            tab_frame,
+            text="Staff/Admin",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['primary'] if self.login_tab == 'staff' else self.colors['bg'],
+            fg='white' if self.login_tab == 'staff' else self.colors['text_light'],
+            padx=30,
+            pady=14,
+            cursor='hand2',
+            relief=tk.FLAT
+        )
+        staff_tab.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        staff_tab.bind('<Button-1>', lambda e: select_tab('staff'))
+        
+        # Username field - minimal sigma design
+        tk.Label(
+            form_container,
+            text="Username",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text_light']
+        ).pack(anchor='w', pady=(0, 8))
+        
+        username_frame = tk.Frame(form_container, bg=self.colors['input_bg'], 
+                                 highlightbackground=self.colors['border'], highlightthickness=1)
+        username_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        tk.Label(
+            username_frame,
+            text="👤",
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT, padx=(12, 8))
+        
+        username_entry = tk.Entry(
+            username_frame,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['primary']
+        )
+        username_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=12, padx=(0, 12))
+        
+        # Password field - minimal sigma design
+        tk.Label(
+            form_container,
+            text="Password",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text_light']
+        ).pack(anchor='w', pady=(0, 8))
+        
+        password_frame = tk.Frame(form_container, bg=self.colors['input_bg'], 
+                                 highlightbackground=self.colors['border'], highlightthickness=1)
+        password_frame.pack(fill=tk.X, pady=(0, 25))
+        
+        tk.Label(
+            password_frame,
+            text="🔒",
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT, padx=(12, 8))
+        
+        password_entry = tk.Entry(
+            password_frame,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            show="●",
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['primary']
+        )
+        password_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=12, padx=(0, 12))
+        
+        # Login button
+        def do_login():
+            username = username_entry.get().strip()
+            password = password_entry.get().strip()
+            user_type = user_type_var.get()
+            
+            if not username or not password:
+                messagebox.showerror("Error", "Please enter username and password")
+                return
+            if self.auth_worker.busy:
+                return
+            
+            login_btn.config(text="Signing in...", state=tk.DISABLED)
+            self.auth_worker.login(user_type, username, password,
+                                   lambda account: login_finished(user_type, account))
+        
+        def login_finished(user_type, account):
+            if not login_btn.winfo_exists():
+                return  # Left the login screen while bcrypt was running
+            login_btn.config(text="Login", state=tk.NORMAL)
+            
+            if not account:
+                messagebox.showerror("Error", "Invalid credentials")
+            elif user_type == 'customer':
+                self.current_user = account
+                self.user_type = 'customer'
+                self.cart = CartSession.open(account[0])
+                messagebox.showinfo("Success", f"Welcome {account[1]}!")
+                self.show_customer_dashboard()
+            else:
+                self.current_staff = account
+                self.user_type = 'staff'
+                messagebox.showinfo("Success", f"Welcome {account[4]}!")
+                self.show_admin_dashboard()
+        
+        login_btn = self.create_button(
+            form_container,
+            "Login",
+            do_login,
+            'primary'
+        )
+        login_btn.pack(fill=tk.X, pady=(0, 15))
+        
+        # Register section (only for customers)
+        register_section = tk.Frame(form_container, bg=self.colors['card'])
+        register_section.pack(fill=tk.X)
+        
+        # Divider
+        divider_frame = tk.Frame(register_section, bg=self.colors['card'])
+        divider_frame.pack(fill=tk.X, pady=15)
+        
+        tk.Frame(divider_frame, bg=self.colors['border'], height=1).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        tk.Label(
+            divider_frame,
+            text="  OR  ",
+            font=('Segoe UI', 9),
+            bg=self.colors['card'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT)
+        tk.Frame(divider_frame, bg=self.colors['border'], height=1).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Register button
+        register_btn = tk.Button(
+            register_section,
+            text="Create New Account",
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['primary'],
+            relief=tk.FLAT,
+            padx=20,
+            pady=12,
+            cursor='hand2',
+            borderwidth=1,
+            highlightbackground=self.colors['primary'],
+            highlightthickness=1,
+            command=self.show_registration_screen
+        )
+        register_btn.pack(fill=tk.X)
+        register_btn.bind('<Enter>', lambda e: register_btn.config(bg=self.colors['hover']))
+        register_btn.bind('<Leave>', lambda e: register_btn.config(bg=self.colors['card']))
+        
+        # Update select_tab to show/hide register section
+        def update_select_tab(tab_type):
+            select_tab(tab_type)
+            if tab_type == 'customer':
+                register_section.pack(fill=tk.X)
+            else:
+                register_section.pack_forget()
+        
+        customer_tab.bind('<Button-1>', lambda e: update_select_tab('customer'))
+        staff_tab.bind('<Button-1>', lambda e: update_select_tab('staff'))
+    
+    def show_registration_screen(self):
+        """Show modern registration screen"""
+        self.clear_window()
+        
+        # Configure root background
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Main container
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Center container
+        center_container = tk.Frame(main_frame, bg=self.colors['bg'])
+        center_container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        
+        # Registration card with fixed dimensions
+        card = tk.Frame(center_container, bg=self.colors['card'], width=550, height=700)
+        card.pack(fill=tk.BOTH, padx=20, pady=20)
+        card.pack_propagate(False)
+        
+        # Scrollable form
+        canvas = tk.Canvas(card, bg=self.colors['card'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(card, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.colors['card'])
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # Form container
+        form_container = tk.Frame(scrollable_frame, bg=self.colors['card'])
+        form_container.pack(fill=tk.BOTH, expand=True, padx=50, pady=40)
+        
+        # Header
+        tk.Label(
+            form_container,
+            text="Create Account",
+            font=('Segoe UI', 28, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 5))
+        
+        tk.Label(
+            form_container,
+            text="Join us and start shopping today!",
+            font=('Segoe UI', 10),
+            bg=self.colors['card'],
+            fg=self.colors['text_light']
+        ).pack(anchor='w', pady=(0, 30))
+        
+        # Form fields
+        fields = {}
+        
+        # Username
+        tk.Label(
+            form_container,
+            text="Username",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 8))
+        
+        username_frame = tk.Frame(form_container, bg=self.colors['input_bg'], highlightbackground=self.colors['border'], highlightthickness=1)
+        username_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        tk.Label(
+            username_frame,
+            text="👤",
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT, padx=(12, 8))
+        
+        username_entry = tk.Entry(
+            username_frame,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text']
+        )
+        username_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=12, padx=(0, 12))
+        fields['username'] = username_entry
+        
+        # Password
+        tk.Label(
+            form_container,
+            text="Password",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 8))
+        
+        password_frame = tk.Frame(form_container, bg=self.colors['input_bg'], highlightbackground=self.colors['border'], highlightthickness=1)
+        password_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        tk.Label(
+            password_frame,
+            text="🔒",
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT, padx=(12, 8))
+        
+        password_entry = tk.Entry(
+            password_frame,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            show="●",
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text']
+        )
+        password_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=12, padx=(0, 12))
+        fields['password'] = password_entry
+        
+        # Email
+        tk.Label(
+            form_container,
+            text="Email",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 8))
+        
+        email_frame = tk.Frame(form_container, bg=self.colors['input_bg'], highlightbackground=self.colors['border'], highlightthickness=1)
+        email_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        tk.Label(
+            email_frame,
+            text="📧",
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT, padx=(12, 8))
+        
+        email_entry = tk.Entry(
+            email_frame,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text']
+        )
+        email_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=12, padx=(0, 12))
+        fields['email'] = email_entry
+        
+        # Full Name
+        tk.Label(
+            form_container,
+            text="Full Name",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 8))
+        
+        name_frame = tk.Frame(form_container, bg=self.colors['input_bg'], highlightbackground=self.colors['border'], highlightthickness=1)
+        name_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        tk.Label(
+            name_frame,
+            text="✏️",
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT, padx=(12, 8))
+        
+        name_entry = tk.Entry(
+            name_frame,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text']
+        )
+        name_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=12, padx=(0, 12))
+        fields['full_name'] = name_entry
+        
+        # Phone
+        tk.Label(
+            form_container,
+            text="Phone",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 8))
+        
+        phone_frame = tk.Frame(form_container, bg=self.colors['input_bg'], highlightbackground=self.colors['border'], highlightthickness=1)
+        phone_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        tk.Label(
+            phone_frame,
+            text="📱",
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT, padx=(12, 8))
+        
+        phone_entry = tk.Entry(
+            phone_frame,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text']
+        )
+        phone_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=12, padx=(0, 12))
+        fields['phone'] = phone_entry
+        
+        # Address
+        tk.Label(
+            form_container,
+            text="Address",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 8))
+        
+        address_frame = tk.Frame(form_container, bg=self.colors['input_bg'], highlightbackground=self.colors['border'], highlightthickness=1)
+        address_frame.pack(fill=tk.X, pady=(0, 25))
+        
+        tk.Label(
+            address_frame,
+            text="🏠",
+            font=('Segoe UI', 14),
+            bg=self.colors['input_bg'],
+            fg=self.colors['text_muted']
+        ).pack(side=tk.LEFT, padx=(12, 8), anchor='n', pady=12)
+        
+        address_entry = tk.Text(
+            address_frame,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            bg=self.colors['input_bg'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text'],
+            height=3,
+            width=30
+        )
+        address_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=12, padx=(0, 12))
+        fields['address'] = address_entry
+        
+        def do_register():
+            username = fields['username'].get().strip()
+            password = fields['password'].get().strip()
+            email = fields['email'].get().strip()
+            full_name = fields['full_name'].get().strip()
+            phone = fields['phone'].get().strip()
+            address = fields['address'].get("1.0", tk.END).strip()
+            
+            if not all([username, password, email, full_name, phone, address]):
+                messagebox.showerror("Error", "Please fill all fields")
+                return
+            if self.auth_worker.busy:
+                return
+            
+            self.auth_worker.register(username, password, email, full_name, phone, address,
+                                      register_finished, register_failed)
+        
+        def register_finished(outcome):
+            success, result = outcome
+            if success:
+                messagebox.showinfo("Success", "Registration successful! Please login.")
+                self.show_login_screen()
+            else:
+                messagebox.showerror("Error", "Registration failed. Username might already exist.")
+        
+        def register_failed(error):
+            messagebox.showerror("Error", f"Registration failed: {str(error)}")
+        
+        self.create_button(
+            form_container,
+            "Create Account",
+            do_register,
+            'success'
+        ).pack(fill=tk.X, pady=(0, 15))
+        
+        # Back to login
+        back_frame = tk.Frame(form_container, bg=self.colors['card'])
+        back_frame.pack(fill=tk.X)
+        
+        tk.Label(
+            back_frame,
+            text="Already have an account?",
+            font=('Segoe UI', 10),
+            bg=self.colors['card'],
+            fg=self.colors['text_light']
+        ).pack(side=tk.LEFT)
+        
+        login_link = tk.Label(
+            back_frame,
+            text=" Login here",
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['primary'],
+            cursor='hand2'
+        )
+        login_link.pack(side=tk.LEFT)
+        login_link.bind('<Button-1>', lambda e: self.show_login_screen())
+        
+        # Pack canvas and scrollbar
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
@@ -0,0 +1,541 @@
+"""
+Checkout Screens - Cart, checkout and payment portal
+Methods of ModernGroceryApp (self is the app), imported on first use through
+gui.screens
+"""
+import tkinter as tk
+from tkinter import messagebox
+
+from services import UserService, OrderService
+
+
+class CheckoutScreens:
+    """Cart, checkout and payment screens"""
+
+    # ==================== CART & CHECKOUT ====================
+
+    def show_cart_screen(self):
+        """Show shopping cart"""
+        self.clear_window()
+        self.current_screen = 'cart'
+        
+        # Configure root background
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['secondary'], height=60)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="🛒 My Shopping Cart",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['secondary'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=20, pady=15)
+        
+        self.create_button(header, "Back", self.show_customer_dashboard, 
+                          'primary', 10).pack(side=tk.RIGHT, padx=20, pady=15)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        cart_items = self.cart.items()
+        
+        if not cart_items:
+            tk.Label(
+                main_frame,
+                text="Your cart is empty! 🛒",
+                font=('Segoe UI', 16),
+                bg=self.colors['bg'],
+                fg=self.colors['text_light']
+            ).pack(pady=100)
+            
+            self.create_button(
+                main_frame,
+                "Start Shopping",
+                self.show_shop_screen,
+                'primary'
+            ).pack()
+            return
+        
+        # Cart items list
+        items_frame = tk.Frame(main_frame, bg=self.colors['card'])
+        items_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+        
+        total_amount = 0
+        
+        for item in cart_items:
+            cart_id, product_id, name, image, price, quantity, subtotal, stock, discount = item
+            
+            item_card = tk.Frame(items_frame, bg=self.colors['card'], relief=tk.SOLID, borderwidth=1)
+            item_card.pack(fill=tk.X, padx=10, pady=5)
+            
+            # Product info
+            info_frame = tk.Frame(item_card, bg=self.colors['card'])
+            info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+            
+            tk.Label(
+                info_frame,
+                text=name,
+                font=('Segoe UI', 12, 'bold'),
+                bg=self.colors['card'],
+                fg=self.colors['text']
+            ).pack(anchor='w')
+            
+            tk.Label(
+                info_frame,
+                text=f"LKR {price:.2f} × {quantity} = LKR {subtotal:.2f}",
+                font=('Segoe UI', 11),
+                bg=self.colors['card'],
+                fg=self.colors['text_light']
+            ).pack(anchor='w', pady=5)
+            
+            # Controls
+            control_frame = tk.Frame(item_card, bg=self.colors['card'])
+            control_frame.pack(side=tk.RIGHT, padx=10, pady=10)
+            
+            # Quantity update
+            qty_frame = tk.Frame(control_frame, bg=self.colors['card'])
+            qty_frame.pack(side=tk.LEFT, padx=10)
+            
+            tk.Button(
+                qty_frame,
+                text="-",
+                command=lambda pid=product_id, q=quantity: self.update_cart(pid, q-1),
+                bg=self.colors['secondary'],
+                fg='white',
+                width=2,
+                cursor='hand2'
+            ).pack(side=tk.LEFT)
+            
+            tk.Label(
+                qty_frame,
+                text=str(quantity),
+                font=('Segoe UI', 11, 'bold'),
+                bg=self.colors['card'],
+                fg=self.colors['text'],
+                width=3
+            ).pack(side=tk.LEFT, padx=5)
+            
+            tk.Button(
+                qty_frame,
+                text="+",
+                command=lambda pid=product_id, q=quantity: self.update_cart(pid, q+1),
+                bg=self.colors['secondary'],
+                fg='white',
+                width=2,
+                cursor='hand2'
+            ).pack(side=tk.LEFT)
+            
+            # Remove button
+            tk.Button(
+                control_frame,
+                text="🗑️ Remove",
+                command=lambda pid=product_id: self.remove_cart_item(pid),
+                bg=self.colors['danger'],
+                fg='white',
+                font=('Segoe UI', 9),
+                relief=tk.FLAT
+            ).pack(side=tk.LEFT, padx=10)
+            
+            total_amount += subtotal
+        
+        # Total and checkout
+        total_frame = self.create_card(main_frame)
+        total_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Label(
+            total_frame,
+            text=f"Total Amount: LKR {total_amount:.2f}",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['primary']
+        ).pack(pady=20)
+        
+        self.create_button(
+            total_frame,
+            "Proceed to Checkout",
+            self.show_checkout_screen,
+            'success',
+            25
+        ).pack(pady=(0, 20))
+    
+    def show_checkout_screen(self):
+        """Show checkout form"""
+        self.clear_window()
+        self.current_screen = 'checkout'
+        
+        # Configure root background
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['success'], height=60)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="✅ Checkout",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['success'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=20, pady=15)
+        
+        self.create_button(header, "Back to Cart", self.show_cart_screen, 
+                          'secondary', 12).pack(side=tk.RIGHT, padx=20, pady=15)
+        
+        # Main content - simple frame without canvas
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=30)
+        
+        # Content card
+        card = self.create_card(main_frame)
+        card.pack()
+        
+        tk.Label(
+            card,
+            text="Delivery Information",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(pady=20)
+        
+        # Get user info
+        user_info = UserService.get_user_info(self.current_user[0])
+        
+        # Form
+        form_frame = tk.Frame(card, bg=self.colors['card'])
+        form_frame.pack(padx=40, pady=10)
+        
+        tk.Label(form_frame, text="Delivery Address", bg=self.colors['card'],
+                fg=self.colors['text'], font=('Segoe UI', 11, 'bold')).grid(row=0, column=0, sticky='w', pady=10)
+        address_text = tk.Text(form_frame, height=4, width=50, font=('Segoe UI', 10),
+                              bg=self.colors['input_bg'], fg=self.colors['text'], insertbackground=self.colors['text'])
+        address_text.grid(row=0, column=1, padx=10, pady=10)
+        if user_info and user_info[6]:
+            address_text.insert('1.0', user_info[6])
+        
+        tk.Label(form_frame, text="Phone Number", bg=self.colors['card'],
+                fg=self.colors['text'], font=('Segoe UI', 11, 'bold')).grid(row=1, column=0, sticky='w', pady=10)
+        phone_entry = tk.Entry(form_frame, width=50, font=('Segoe UI', 11),
+                              bg=self.colors['input_bg'], fg=self.colors['text'], insertbackground=self.colors['text'])
+        phone_entry.grid(row=1, column=1, padx=10, pady=10)
+        if user_info and user_info[5]:
+            phone_entry.insert(0, user_info[5])
+        
+        tk.Label(form_frame, text="Payment Method", bg=self.colors['card'],
+                fg=self.colors['text'], font=('Segoe UI', 11, 'bold')).grid(row=2, column=0, sticky='w', pady=10)
+        payment_var = tk.StringVar(value='cash')
+        payment_frame = tk.Frame(form_frame, bg=self.colors['card'])
+        payment_frame.grid(row=2, column=1, sticky='w', padx=10, pady=10)
+        
+        for method in ['cash', 'card', 'online']:
+            tk.Radiobutton(
+                payment_frame,
+                text=method.title(),
+                variable=payment_var,
+                value=method,
+                bg=self.colors['card'],
+                fg=self.colors['text'],
+                selectcolor=self.colors['input_bg'],
+                font=('Segoe UI', 10)
+            ).pack(side=tk.LEFT, padx=10)
+        
+        # Place order button
+        def do_place_order():
+            address = address_text.get('1.0', tk.END).strip()
+            phone = phone_entry.get().strip()
+            payment = payment_var.get()
+            
+            if not address or not phone:
+                messagebox.showerror("Error", "Please fill in all fields")
+                return
+            
+        # Import PaymentService
+        from services import PaymentService
+        
+        # Place order button
+        def do_place_order():
+            address = address_text.get('1.0', tk.END).strip()
+            phone = phone_entry.get().strip()
+            payment = payment_var.get()
+            
+            if not address or not phone:
+                messagebox.showerror("Error", "Please fill in all fields")
+                return
+            
+            # If payment method is online or card, redirect to payment portal
+            if payment in ['card', 'online']:
+                self.show_payment_portal(address, phone, payment)
+            else:
+                # For cash payment, place order directly
+                success, msg = self.place_cart_order(address, phone, payment)
+                if success:
+                    messagebox.showinfo("Success", msg)
+                    self.show_customer_dashboard()
+                else:
+                    messagebox.showerror("Error", msg)
+        
+        # Button frame
+        button_frame = tk.Frame(card, bg=self.colors['card'])
+        button_frame.pack(pady=30)
+        
+        # Create the button
+        place_order_btn = self.create_button(
+            button_frame,
+            "Place Order",
+            do_place_order,
+            'success',
+            25
+        )
+        place_order_btn.pack()
+    
+    # ==================== PAYMENT ====================
+
+    def show_payment_portal(self, address, phone, payment_method):
+        """Show payment portal for online/card payments"""
+        from services import PaymentService
+        
+        self.clear_window()
+        self.current_screen = 'payment_portal'
+        
+        # Get cart total (from the saved cart, which is what the order will use)
+        if not self.flush_cart():
+            messagebox.showerror("Error", "Could not save your cart. Please try again.")
+            self.show_checkout_screen()
+            return
+        cart_items = OrderService.get_cart_items(self.current_user[0])
+        if not cart_items:
+            messagebox.showerror("Error", "Cart is empty")
+            self.show_checkout_screen()
+            return
+        
+        # Calculate total from cart subtotals (item[6] is subtotal)
+        total_amount = sum(float(item[6]) if item[6] else 0 for item in cart_items)
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['primary'], height=60)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="💳 Payment Portal",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=20, pady=15)
+        
+        self.create_button(header, "Back", lambda: self.show_checkout_screen(), 
+                          'secondary', 12).pack(side=tk.RIGHT, padx=20, pady=15)
+        
+        # Main content with scrollbar
+        canvas = tk.Canvas(self.root, bg=self.colors['bg'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
+        main_frame = tk.Frame(canvas, bg=self.colors['bg'])
+        
+        main_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=main_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Amount card
+        amount_card = self.create_card(main_frame)
+        amount_card.pack(fill=tk.X, padx=50, pady=20)
+        
+        tk.Label(
+            amount_card,
+            text="Payment Amount",
+            font=('Segoe UI', 12, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(pady=10)
+        
+        tk.Label(
+            amount_card,
+            text=f"LKR {total_amount:.2f}",
+            font=('Segoe UI', 24, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['success']
+        ).pack(pady=10)
+        
+        # Payment method card
+        payment_card = self.create_card(main_frame)
+        payment_card.pack(fill=tk.X, padx=50, pady=20)
+        
+        if payment_method == 'card':
+            # Credit/Debit Card Payment
+            tk.Label(
+                payment_card,
+                text="💳 Card Payment",
+                font=('Segoe UI', 14, 'bold'),
+                bg=self.colors['card'],
+                fg=self.colors['text']
+            ).pack(pady=15)
+            
+            form_frame = tk.Frame(payment_card, bg=self.colors['card'])
+            form_frame.pack(padx=30, pady=15)
+            
+            # Cardholder Name
+            tk.Label(form_frame, text="Cardholder Name", bg=self.colors['card'],
+                    fg=self.colors['text'], font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, sticky='w', pady=10)
+            cardholder_entry = tk.Entry(form_frame, width=40, font=('Segoe UI', 10),
+                                       bg=self.colors['input_bg'], fg=self.colors['text'], insertbackground=self.colors['text'])
+            cardholder_entry.grid(row=0, column=1, padx=10, pady=10)
+            
+            # Card Number
+            tk.Label(form_frame, text="Card Number", bg=self.colors['card'],
+                    fg=self.colors['text'], font=('Segoe UI', 10, 'bold')).grid(row=1, column=0, sticky='w', pady=10)
+            card_number_entry = tk.Entry(form_frame, width=40, font=('Segoe UI', 10),
+                                        bg=self.colors['input_bg'], fg=self.colors['text'], insertbackground=self.colors['text'])
+            card_number_entry.grid(row=1, column=1, padx=10, pady=10)
+            tk.Label(form_frame, text="16 digits", bg=self.colors['card'],
+                    fg=self.colors['text_light'], font=('Segoe UI', 8)).grid(row=1, column=2, sticky='w', padx=5)
+            
+            # Expiry and CVV
+            tk.Label(form_frame, text="Expiry Date", bg=self.colors['card'],
+                    fg=self.colors['text'], font=('Segoe UI', 10, 'bold')).grid(row=2, column=0, sticky='w', pady=10)
+            expiry_entry = tk.Entry(form_frame, width=15, font=('Segoe UI', 10),
+                                   bg=self.colors['input_bg'], fg=self.colors['text'], insertbackground=self.colors['text'])
+            expiry_entry.grid(row=2, column=1, padx=10, pady=10, sticky='w')
+            tk.Label(form_frame, text="MM/YY", bg=self.colors['card'],
+                    fg=self.colors['text_light'], font=('Segoe UI', 8)).grid(row=2, column=2, sticky='w', padx=5)
+            
+            tk.Label(form_frame, text="CVV", bg=self.colors['card'],
+                    fg=self.colors['text'], font=('Segoe UI', 10, 'bold')).grid(row=2, column=3, sticky='w', padx=(20, 0), pady=10)
+            cvv_entry = tk.Entry(form_frame, width=10, font=('Segoe UI', 10),
+                                bg=self.colors['input_bg'], fg=self.colors['text'], insertbackground=self.colors['text'])
+            cvv_entry.grid(row=2, column=4, padx=10, pady=10)
+            
+            def process_card():
+                cardholder = cardholder_entry.get().strip()
+                card_number = card_number_entry.get().strip()
+                expiry = expiry_entry.get().strip()
+                cvv = cvv_entry.get().strip()
+                
+                if not all([cardholder, card_number, expiry, cvv]):
+                    messagebox.showerror("Error", "Please fill in all card details")
+                    return
+                
+                success, result = PaymentService.process_card_payment(card_number, expiry, cvv, total_amount, cardholder)
+                
+                if success:
+                    # Place order after successful payment
+                    order_success, order_msg = self.place_cart_order(address, phone, 'card',
+                                                                     result['transaction_id'])
+                    if order_success:
+                        messagebox.showinfo("Success", f"Payment Successful!\nTransaction ID: {result['transaction_id']}\n\n{order_msg}")
+                        self.show_customer_dashboard()
+                    else:
+                        messagebox.showerror("Error", f"Payment successful but order failed: {order_msg}")
+                else:
+                    messagebox.showerror("Payment Failed", result)
+            
+            pay_btn = self.create_button(payment_card, "Pay Now", process_card, 'success', 12)
+            pay_btn.pack(pady=20)
+            
+        elif payment_method == 'online':
+            # Online Payment (PayPal/Google Pay)
+            tk.Label(
+                payment_card,
+                text="💰 Online Payment",
+                font=('Segoe UI', 14, 'bold'),
+                bg=self.colors['card'],
+                fg=self.colors['text']
+            ).pack(pady=15)
+            
+            # Payment method selection
+            payment_type_var = tk.StringVar(value='paypal')
+            type_frame = tk.Frame(payment_card, bg=self.colors['card'])
+            type_frame.pack(pady=15)
+            
+            tk.Label(type_frame, text="Select Payment Method:", bg=self.colors['card'],
+                    fg=self.colors['text'], font=('Segoe UI', 10)).pack(side=tk.LEFT, padx=10)
+            
+            tk.Radiobutton(type_frame, text="PayPal", variable=payment_type_var, value='paypal',
+                          bg=self.colors['card'], fg=self.colors['text'], font=('Segoe UI', 10)).pack(side=tk.LEFT, padx=5)
+            tk.Radiobutton(type_frame, text="Google Pay", variable=payment_type_var, value='gpay',
+                          bg=self.colors['card'], fg=self.colors['text'], font=('Segoe UI', 10)).pack(side=tk.LEFT, padx=5)
+            
+            form_frame = tk.Frame(payment_card, bg=self.colors['card'])
+            form_frame.pack(padx=30, pady=15)
+            
+            # PayPal fields
+            paypal_frame = tk.Frame(form_frame, bg=self.colors['card'])
+            paypal_frame.pack()
+            
+            tk.Label(paypal_frame, text="PayPal Email", bg=self.colors['card'],
+                    fg=self.colors['text'], font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, sticky='w', pady=10)
+            paypal_entry = tk.Entry(paypal_frame, width=40, font=('Segoe UI', 10),
+                                   bg=self.colors['input_bg'], fg=self.colors['text'], insertbackground=self.colors['text'])
+            paypal_entry.grid(row=0, column=1, padx=10, pady=10)
+            tk.Label(paypal_frame, text="example@email.com", bg=self.colors['card'],
+                    fg=self.colors['text_light'], font=('Segoe UI', 8)).grid(row=0, column=2, sticky='w', padx=5)
+            
+            # Google Pay fields
+            gpay_frame = tk.Frame(form_frame, bg=self.colors['card'])
+            
+            tk.Label(gpay_frame, text="Phone Number", bg=self.colors['card'],
+                    fg=self.colors['text'], font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, sticky='w', pady=10)
+            gpay_entry = tk.Entry(gpay_frame, width=40, font=('Segoe UI', 10),
+                                 bg=self.colors['input_bg'], fg=self.colors['text'], insertbackground=self.colors['text'])
+            gpay_entry.grid(row=0, column=1, padx=10, pady=10)
+            tk.Label(gpay_frame, text="10+ digits", bg=self.colors['card'],
+                    fg=self.colors['text_light'], font=('Segoe UI', 8)).grid(row=0, column=2, sticky='w', padx=5)
+            
+            def update_payment_form(*args):
+                if payment_type_var.get() == 'paypal':
+                    gpay_frame.pack_forget()
+                    paypal_frame.pack()
+                else:
+                    paypal_frame.pack_forget()
+                    gpay_frame.pack()
+            
+            payment_type_var.trace('w', update_payment_form)
+            
+            def process_online():
+                if payment_type_var.get() == 'paypal':
+                    email = paypal_entry.get().strip()
+                    if not email:
+                        messagebox.showerror("Error", "Please enter PayPal email")
+                        return
+                    
+                    success, result = PaymentService.process_paypal_payment(email, total_amount)
+                    
+                    if success:
+                        order_success, order_msg = self.place_cart_order(address, phone, 'online',
+                                                                         result['transaction_id'])
+                        if order_success:
+                            messagebox.showinfo("Success", f"Payment Successful!\nTransaction ID: {result['transaction_id']}\n\n{order_msg}")
+                            self.show_customer_dashboard()
+                        else:
+                            messagebox.showerror("Error", f"Payment successful but order failed: {order_msg}")
+                    else:
+                        messagebox.showerror("Payment Failed", result)
+                else:
+                    phone_num = gpay_entry.get().strip()
+                    if not phone_num:
+                        messagebox.showerror("Error", "Please enter phone number")
+                        return
+                    
+                    success, result = PaymentService.process_gpay_payment(phone_num, total_amount)
+                    
+                    if success:
+                        order_success, order_msg = self.place_cart_order(address, phone, 'online',
+                                                                         result['transaction_id'])
+                        if order_success:
+                            messagebox.showinfo("Success", f"Payment Successful!\nTransaction ID: {result['transaction_id']}\n\n{order_msg}")
+                            self.show_customer_dashboard()
+                        else:
+                            messagebox.showerror("Error", f"Payment successful but order failed: {order_msg}")
+                    else:
+                        messagebox.showerror("Payment Failed", result)
+            
+            pay_btn = self.create_button(payment_card, "Pay Now", process_online, 'success', 12)
+            pay_btn.pack(pady=20)
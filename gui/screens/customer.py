@@ -0,0 +1,770 @@
+"""
+Customer Screens - Dashboard, order history, notifications and profile
+Methods of ModernGroceryApp (self is the app), imported on first use through
+gui.screens
+"""
+import tkinter as tk
+from tkinter import messagebox
+
+from services import UserService, OrderService
+
+
+class CustomerScreens:
+    """Customer account screens"""
+
+    # ==================== CUSTOMER DASHBOARD ====================
+
+    def show_customer_dashboard(self):
+        """Show customer main dashboard - Modern e-commerce design"""
+        if self.restore_screen('customer_dashboard'):
+            return
+        self.clear_window()
+        self.current_screen = 'customer_dashboard'
+        
+        # Configure root background
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Modern Header
+        header = tk.Frame(self.root, bg='white', height=70)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        header_content = tk.Frame(header, bg='white')
+        header_content.pack(fill=tk.BOTH, expand=True, padx=40, pady=15)
+        
+        # Greeting message
+        greeting = tk.Label(
+            header_content,
+            text=f"Hello, {self.current_user[4] or self.current_user[1]}!",
+            font=('Segoe UI', 18, 'bold'),
+            bg='white',
+            fg=self.colors['text']
+        )
+        greeting.pack(side=tk.LEFT)
+        
+        # Right side - Notification and Logout
+        right_header = tk.Frame(header_content, bg='white')
+        right_header.pack(side=tk.RIGHT)
+        
+        unread_count = OrderService.get_unread_count(self.current_user[0])
+        notif_text = f"🔔" if unread_count == 0 else f"🔔 {unread_count}"
+        
+        notif_btn = tk.Label(
+            right_header,
+            text=notif_text,
+            font=('Segoe UI', 18),
+            bg='white',
+            fg=self.colors['primary'] if unread_count > 0 else self.colors['text_light'],
+            cursor='hand2'
+        )
+        notif_btn.pack(side=tk.LEFT, padx=15)
+        notif_btn.bind('<Button-1>', lambda e: self.show_notifications())
+        
+        # Logout button
+        logout_btn = tk.Button(
+            right_header,
+            text="🚪 Logout",
+            command=self.logout,
+            bg='#E53935',
+            fg='white',
+            font=('Segoe UI', 10, 'bold'),
+            relief=tk.FLAT,
+            padx=15,
+            pady=8,
+            cursor='hand2',
+            borderwidth=0
+        )
+        logout_btn.pack(side=tk.LEFT, padx=10)
+        logout_btn.bind('<Enter>', lambda e: logout_btn.config(bg='#C62828'))
+        logout_btn.bind('<Leave>', lambda e: logout_btn.config(bg='#E53935'))
+        
+        # Divider
+        tk.Frame(self.root, bg=self.colors['border'], height=1).pack(fill=tk.X)
+        
+        # Main content - centered layout
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=80, pady=60)
+        
+        # Title for menu section
+        tk.Label(
+            main_frame,
+            text="What would you like to do?",
+            font=('Segoe UI', 14),
+            bg=self.colors['bg'],
+            fg=self.colors['text_light']
+        ).pack(pady=(0, 50))
+        
+        # Menu cards grid
+        menu_frame = tk.Frame(main_frame, bg=self.colors['bg'])
+        menu_frame.pack(expand=True)
+        
+        menus = [
+            ("🛍️", "Shop Now", "Browse products by category", self.show_shop_screen, self.colors['primary']),
+            ("🛒", "My Cart", "View and manage your cart", self.show_cart_screen, '#FFC107'),
+            ("📦", "My Orders", "Track your orders", self.show_order_history, '#2196F3'),
+            ("👤", "My Profile", "Manage your account", self.show_profile_screen, '#4CAF50'),
+        ]
+        
+        row_frame = None
+        for i, (icon, title, desc, command, color) in enumerate(menus):
+            if i % 2 == 0:
+                row_frame = tk.Frame(menu_frame, bg=self.colors['bg'])
+                row_frame.pack(pady=20)
+            
+            # Card container
+            card = tk.Frame(row_frame, bg='white', relief=tk.FLAT, borderwidth=0,
+                          highlightthickness=2, highlightbackground='#E0E0E0')
+            card.pack(side=tk.LEFT, padx=25, fill=tk.BOTH, expand=True)
+            card.config(width=280, height=180)
+            card.pack_propagate(False)
+            
+            # Make card clickable
+            card.bind('<Button-1>', lambda e, cmd=command: cmd())
+            card.config(cursor='hand2')
+            
+            # Content frame inside card
+            content = tk.Frame(card, bg='white', cursor='hand2')
+            content.pack(fill=tk.BOTH, expand=True, padx=25, pady=20)
+            content.bind('<Button-1>', lambda e, cmd=command: cmd())
+            
+            # Icon
+            icon_label = tk.Label(
+                content,
+                text=icon,
+                font=('Segoe UI', 40),
+                bg='white',
+                fg=color,
+                cursor='hand2'
+            )
+            icon_label.pack(pady=(0, 10))
+            icon_label.bind('<Button-1>', lambda e, cmd=command: cmd())
+            
+            # Title
+            title_label = tk.Label(
+                content,
+                text=title,
+                font=('Segoe UI', 13, 'bold'),
+                bg='white',
+                fg=self.colors['text'],
+                cursor='hand2'
+            )
+            title_label.pack()
+            title_label.bind('<Button-1>', lambda e, cmd=command: cmd())
+            
+            # Description
+            desc_label = tk.Label(
+                content,
+                text=desc,
+                font=('Segoe UI', 10),
+                bg='white',
+                fg=self.colors['text_light'],
+                cursor='hand2'
+            )
+            desc_label.pack(pady=(5, 20))
+            desc_label.bind('<Button-1>', lambda e, cmd=command: cmd())
+            
+            # Button
+            btn = tk.Button(
+                content,
+                text="Open →",
+                command=command,
+                bg=color,
+                fg='white',
+                font=('Segoe UI', 11, 'bold'),
+                relief=tk.FLAT,
+                padx=35,
+                pady=12,
+                cursor='hand2',
+                borderwidth=0
+            )
+            btn.pack()
+            
+            # Hover effect for button
+            def on_btn_enter(e, button=btn, original_color=color):
+                button.config(bg=self.darken_color(original_color))
+            
+            def on_btn_leave(e, button=btn, original_color=color):
+                button.config(bg=original_color)
+            
+            btn.bind('<Enter>', on_btn_enter)
+            btn.bind('<Leave>', on_btn_leave)
+            
+            # Card hover effect
+            def on_card_enter(e, card_widget=card, color_val=color):
+                card_widget.config(highlightbackground=color_val, highlightthickness=3)
+            
+            def on_card_leave(e, card_widget=card):
+                card_widget.config(highlightbackground='#E0E0E0', highlightthickness=2)
+            
+            card.bind('<Enter>', on_card_enter)
+            card.bind('<Leave>', on_card_leave)
+            
+            # Bind all child widgets to card hover
+            for widget in content.winfo_children():
+                widget.bind('<Enter>', on_card_enter)
+                widget.bind('<Leave>', on_card_leave)
+        
+        # Kept for the next visit; only the greeting and unread badge change
+        def refresh():
+            greeting.config(text=f"Hello, {self.current_user[4] or self.current_user[1]}!")
+            unread = OrderService.get_unread_count(self.current_user[0])
+            notif_btn.config(
+                text="🔔" if unread == 0 else f"🔔 {unread}",
+                fg=self.colors['primary'] if unread > 0 else self.colors['text_light']
+            )
+        
+        self.retain_screen(refresh)
+    
+    # ==================== ORDERS & NOTIFICATIONS ====================
+
+    def show_order_history(self):
+        """Show customer order history"""
+        self.clear_window()
+        self.current_screen = 'orders'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['accent'], height=60)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="📦 My Orders",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['accent'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=20, pady=15)
+        
+        self.create_button(header, "Back", self.show_customer_dashboard, 
+                          'primary', 10).pack(side=tk.RIGHT, padx=20, pady=15)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        orders = OrderService.get_user_orders(self.current_user[0])
+        
+        if not orders:
+            tk.Label(
+                main_frame,
+                text="No orders yet!",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['text_light']
+            ).pack(pady=100)
+            return
+        
+        # Orders list with scrollbar
+        canvas = tk.Canvas(main_frame, bg=self.colors['bg'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+        orders_frame = tk.Frame(canvas, bg=self.colors['bg'])
+        
+        orders_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=orders_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Display orders
+        for order in orders:
+            order_id, order_number, total, discount, final_amount, payment, pay_status, order_status, address, order_date, delivered_at = order
+            
+            order_card = self.create_card(orders_frame)
+            order_card.pack(fill=tk.X, pady=10, padx=10)
+            
+            # Order header
+            header_frame = tk.Frame(order_card, bg=self.colors['card'])
+            header_frame.pack(fill=tk.X, padx=15, pady=10)
+            
+            tk.Label(
+                header_frame,
+                text=f"Order #{order_number}",
+                font=('Segoe UI', 14, 'bold'),
+                bg=self.colors['card'],
+                fg=self.colors['primary']
+            ).pack(side=tk.LEFT)
+            
+            status_colors = {
+                'pending': 'accent',
+                'confirmed': 'secondary',
+                'processing': 'secondary',
+                'shipped': 'success',
+                'delivered': 'success',
+                'cancelled': 'danger'
+            }
+            
+            tk.Label(
+                header_frame,
+                text=order_status.upper(),
+                font=('Segoe UI', 10, 'bold'),
+                bg=self.colors.get(status_colors.get(order_status, 'secondary')),
+                fg='white',
+                padx=10,
+                pady=5
+            ).pack(side=tk.RIGHT)
+            
+            # Order details
+            details_frame = tk.Frame(order_card, bg=self.colors['card'])
+            details_frame.pack(fill=tk.X, padx=15, pady=(0, 10))
+            
+            tk.Label(
+                details_frame,
+                text=f"Date: {order_date}",
+                font=('Segoe UI', 10),
+                bg=self.colors['card'],
+                fg=self.colors['text_light']
+            ).pack(anchor='w')
+            
+            tk.Label(
+                details_frame,
+                text=f"Amount: LKR {final_amount:.2f}",
+                font=('Segoe UI', 12, 'bold'),
+                bg=self.colors['card'],
+                fg=self.colors['primary']
+            ).pack(anchor='w', pady=5)
+    
+    def show_notifications(self):
+        """Show user notifications"""
+        self.clear_window()
+        self.current_screen = 'notifications'
+        
+        # Header
+        header = tk.Frame(self.root, bg=self.colors['accent'], height=60)
+        header.pack(fill=tk.X)
+        
+        tk.Label(
+            header,
+            text="🔔 Notifications",
+            font=('Segoe UI', 16, 'bold'),
+            bg=self.colors['accent'],
+            fg='white'
+        ).pack(side=tk.LEFT, padx=20, pady=15)
+        
+        self.create_button(header, "Back", self.show_customer_dashboard, 
+                          'primary', 10).pack(side=tk.RIGHT, padx=20, pady=15)
+        
+        # Main content
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        notifications = OrderService.get_user_notifications(self.current_user[0])
+        
+        if not notifications:
+            tk.Label(
+                main_frame,
+                text="No notifications",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['text_light']
+            ).pack(pady=100)
+            return
+        
+        # Notifications list
+        for notif in notifications:
+            notif_id, notif_type, title, message, order_id, is_read, created_at = notif
+            
+            notif_card = self.create_card(main_frame)
+            notif_card.pack(fill=tk.X, pady=5)
+            
+            bg_color = self.colors['card'] if is_read else '#e3f2fd'
+            notif_card.config(bg=bg_color)
+            
+            frame = tk.Frame(notif_card, bg=bg_color)
+            frame.pack(fill=tk.BOTH, padx=15, pady=10)
+            
+            tk.Label(
+                frame,
+                text=title,
+                font=('Segoe UI', 12, 'bold'),
+                bg=bg_color
+            ).pack(anchor='w')
+            
+            tk.Label(
+                frame,
+                text=message,
+                font=('Segoe UI', 10),
+                bg=bg_color,
+                fg=self.colors['text_light']
+            ).pack(anchor='w', pady=5)
+            
+            tk.Label(
+                frame,
+                text=str(created_at),
+                font=('Segoe UI', 9),
+                bg=bg_color,
+                fg=self.colors['text_light']
+            ).pack(anchor='w')
+            
+        
+        # Everything shown is now read: one watermark update, not one per row.
+        # Anything that arrived after the list was fetched stays unread
+        if any(not notif[5] for notif in notifications):
+            OrderService.mark_all_notifications_read(self.current_user[0], notifications[0][0])
+    
+    # ==================== PROFILE ====================
+
+    def show_profile_screen(self):
+        """Show user profile - editable details"""
+        self.clear_window()
+        self.current_screen = 'profile'
+        
+        # Configure root background
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Header with back button
+        header = tk.Frame(self.root, bg='white', height=70)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        header_content = tk.Frame(header, bg='white')
+        header_content.pack(fill=tk.BOTH, expand=True, padx=40, pady=15)
+        
+        # Back button
+        back_btn = tk.Label(
+            header_content,
+            text="← Back to Dashboard",
+            font=('Segoe UI', 12),
+            bg='white',
+            fg=self.colors['primary'],
+            cursor='hand2'
+        )
+        back_btn.pack(side=tk.LEFT)
+        back_btn.bind('<Button-1>', lambda e: self.show_customer_dashboard())
+        
+        # Title
+        tk.Label(
+            header_content,
+            text="My Profile",
+            font=('Segoe UI', 16, 'bold'),
+            bg='white',
+            fg=self.colors['text']
+        ).pack(side=tk.LEFT, padx=20)
+        
+        # Logout button on right
+        logout_btn = tk.Button(
+            header_content,
+            text="🚪 Logout",
+            command=self.logout,
+            bg='#E53935',
+            fg='white',
+            font=('Segoe UI', 11, 'bold'),
+            relief=tk.FLAT,
+            padx=20,
+            pady=8,
+            cursor='hand2',
+            borderwidth=0
+        )
+        logout_btn.pack(side=tk.RIGHT)
+        logout_btn.bind('<Enter>', lambda e: logout_btn.config(bg='#C62828'))
+        logout_btn.bind('<Leave>', lambda e: logout_btn.config(bg='#E53935'))
+        
+        # Divider
+        tk.Frame(self.root, bg=self.colors['border'], height=1).pack(fill=tk.X)
+        
+        # Main content area with scrollbar
+        content_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        content_frame.pack(fill=tk.BOTH, expand=True)
+        
+        canvas = tk.Canvas(content_frame, bg=self.colors['bg'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(content_frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Profile form container
+        form_container = tk.Frame(scrollable_frame, bg=self.colors['bg'])
+        form_container.pack(padx=60, pady=40, fill=tk.BOTH, expand=True)
+        
+        # Profile card
+        profile_card = tk.Frame(form_container, bg='white', relief=tk.FLAT, borderwidth=0,
+                               highlightthickness=1, highlightbackground=self.colors['border'])
+        profile_card.pack(fill=tk.BOTH, expand=True)
+        
+        # Card content
+        card_content = tk.Frame(profile_card, bg='white')
+        card_content.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
+        
+        # Title
+        tk.Label(
+            card_content,
+            text="Edit Your Profile",
+            font=('Segoe UI', 18, 'bold'),
+            bg='white',
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(0, 30))
+        
+        # Get current user info
+        current_info = UserService.get_user_info(self.current_user[0])
+        
+        entries = {}
+        
+        # ===== SECTION 1: BASIC INFO =====
+        tk.Label(
+            card_content,
+            text="Basic Information",
+            font=('Segoe UI', 14, 'bold'),
+            bg='white',
+            fg=self.colors['primary']
+        ).pack(anchor='w', pady=(0, 20))
+        
+        # Form fields - Basic Info
+        basic_fields = [
+            ("Username", current_info[1] if current_info else "", False),  # Read-only
+            ("Email", current_info[3] if current_info else "", False),      # Read-only
+            ("Full Name", current_info[4] if current_info else "", True),
+            ("Phone Number", current_info[5] if current_info else "", True),
+            ("Address", current_info[6] if current_info else "", True),
+        ]
+        
+        for label, value, editable in basic_fields:
+            # Label
+            tk.Label(
+                card_content,
+                text=label,
+                font=('Segoe UI', 11, 'bold'),
+                bg='white',
+                fg=self.colors['text']
+            ).pack(anchor='w', pady=(10, 5))
+            
+            # Entry field
+            entry = tk.Entry(
+                card_content,
+                font=('Segoe UI', 11),
+                relief=tk.SOLID,
+                borderwidth=1,
+                bg='white' if editable else '#F5F5F5',
+                fg=self.colors['text']
+            )
+            entry.pack(fill=tk.X, ipady=10, pady=(0, 5))
+            entry.insert(0, value)
+            entry.config(state=tk.NORMAL if editable else tk.DISABLED)
+            
+            if label not in ["Username", "Email"]:
+                entries[label] = entry
+        
+        # Divider
+        tk.Frame(card_content, bg=self.colors['border'], height=1).pack(fill=tk.X, pady=25)
+        
+        # ===== SECTION 2: CHANGE USERNAME =====
+        tk.Label(
+            card_content,
+            text="Change Username",
+            font=('Segoe UI', 14, 'bold'),
+            bg='white',
+            fg=self.colors['primary']
+        ).pack(anchor='w', pady=(0, 20))
+        
+        # New Username
+        tk.Label(
+            card_content,
+            text="New Username",
+            font=('Segoe UI', 11, 'bold'),
+            bg='white',
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(10, 5))
+        
+        new_username_entry = tk.Entry(
+            card_content,
+            font=('Segoe UI', 11),
+            relief=tk.SOLID,
+            borderwidth=1,
+            bg='white',
+            fg=self.colors['text']
+        )
+        new_username_entry.pack(fill=tk.X, ipady=10, pady=(0, 5))
+        entries['new_username'] = new_username_entry
+        
+        # Divider
+        tk.Frame(card_content, bg=self.colors['border'], height=1).pack(fill=tk.X, pady=25)
+        
+        # ===== SECTION 3: CHANGE PASSWORD =====
+        tk.Label(
+            card_content,
+            text="Change Password",
+            font=('Segoe UI', 14, 'bold'),
+            bg='white',
+            fg=self.colors['primary']
+        ).pack(anchor='w', pady=(0, 20))
+        
+        # Current Password
+        tk.Label(
+            card_content,
+            text="Current Password",
+            font=('Segoe UI', 11, 'bold'),
+            bg='white',
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(10, 5))
+        
+        current_password_entry = tk.Entry(
+            card_content,
+            font=('Segoe UI', 11),
+            relief=tk.SOLID,
+            borderwidth=1,
+            bg='white',
+            fg=self.colors['text'],
+            show='●'
+        )
+        current_password_entry.pack(fill=tk.X, ipady=10, pady=(0, 5))
+        entries['current_password'] = current_password_entry
+        
+        # New Password
+        tk.Label(
+            card_content,
+            text="New Password",
+            font=('Segoe UI', 11, 'bold'),
+            bg='white',
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(10, 5))
+        
+        new_password_entry = tk.Entry(
+            card_content,
+            font=('Segoe UI', 11),
+            relief=tk.SOLID,
+            borderwidth=1,
+            bg='white',
+            fg=self.colors['text'],
+            show='●'
+        )
+        new_password_entry.pack(fill=tk.X, ipady=10, pady=(0, 5))
+        entries['new_password'] = new_password_entry
+        
+        # Confirm Password
+        tk.Label(
+            card_content,
+            text="Confirm New Password",
+            font=('Segoe UI', 11, 'bold'),
+            bg='white',
+            fg=self.colors['text']
+        ).pack(anchor='w', pady=(10, 5))
+        
+        confirm_password_entry = tk.Entry(
+            card_content,
+            font=('Segoe UI', 11),
+            relief=tk.SOLID,
+            borderwidth=1,
+            bg='white',
+            fg=self.colors['text'],
+            show='●'
+        )
+        confirm_password_entry.pack(fill=tk.X, ipady=10, pady=(0, 5))
+        entries['confirm_password'] = confirm_password_entry
+        
+        # Button container
+        button_frame = tk.Frame(card_content, bg='white')
+        button_frame.pack(fill=tk.X, pady=(30, 0))
+        
+        def save_profile():
+            try:
+                full_name = entries["Full Name"].get()
+                phone = entries["Phone Number"].get()
+                address = entries["Address"].get()
+                new_username = entries['new_username'].get()
+                current_password = entries['current_password'].get()
+                new_password = entries['new_password'].get()
+                confirm_password = entries['confirm_password'].get()
+                
+                # Validate basic info
+                if not full_name or not phone or not address:
+                    messagebox.showwarning("Validation", "Please fill all basic information fields")
+                    return
+                
+                # Update basic profile info
+                UserService.update_user_profile(self.current_user[0], full_name, phone, address)
+                
+                # Update username if provided
+                if new_username and new_username.strip():
+                    success, msg = UserService.update_username(self.current_user[0], new_username)
+                    if not success:
+                        messagebox.showwarning("Username Error", msg)
+                        return
+                    # Update current_user with new username
+                    self.current_user = list(self.current_user)
+                    self.current_user[1] = new_username
+                
+                # Update password if provided
+                if current_password and new_password:
+                    if new_password != confirm_password:
+                        messagebox.showwarning("Password Error", "New passwords do not match")
+                        return
+                    
+                    if len(new_password) < 6:
+                        messagebox.showwarning("Password Error", "Password must be at least 6 characters")
+                        return
+                    
+                    save_btn.config(state=tk.DISABLED)
+                    self.auth_worker.change_password(self.current_user[0], current_password, new_password,
+                                                     password_changed, profile_failed)
+                    return
+                
+                profile_saved()
+            except Exception as e:
+                profile_failed(e)
+        
+        def password_changed(outcome):
+            success, msg = outcome
+            if not save_btn.winfo_exists():
+                # Left the profile screen while bcrypt was running; still report it
+                (messagebox.showinfo if success else messagebox.showwarning)("Password", msg)
+            elif not success:
+                save_btn.config(state=tk.NORMAL)
+                messagebox.showwarning("Password Error", msg)
+            else:
+                profile_saved()
+        
+        def profile_saved():
+            messagebox.showinfo("Success", "✓ Profile updated successfully!")
+            self.show_customer_dashboard()
+        
+        def profile_failed(error):
+            if save_btn.winfo_exists():
+                save_btn.config(state=tk.NORMAL)
+            messagebox.showerror("Error", f"Failed to update profile: {str(error)}")
+        
+        # Save button
+        save_btn = tk.Button(
+            button_frame,
+            text="💾 Save Changes",
+            command=save_profile,
+            bg=self.colors['primary'],
+            fg='white',
+            font=('Segoe UI', 12, 'bold'),
+            relief=tk.FLAT,
+            padx=40,
+            pady=12,
+            cursor='hand2',
+            borderwidth=0
+        )
+        save_btn.pack(side=tk.LEFT, padx=(0, 15))
+        save_btn.bind('<Enter>', lambda e: save_btn.config(bg=self.darken_color(self.colors['primary'])))
+        save_btn.bind('<Leave>', lambda e: save_btn.config(bg=self.colors['primary']))
+        
+        # Cancel button
+        cancel_btn = tk.Button(
+            button_frame,
+            text="Cancel",
+            command=self.show_customer_dashboard,
+            bg='#E0E0E0',
+            fg=self.colors['text'],
+            font=('Segoe UI', 12, 'bold'),
+            relief=tk.FLAT,
+            padx=40,
+            pady=12,
+            cursor='hand2',
+            borderwidth=0
+        )
+        cancel_btn.pack(side=tk.LEFT)
+        cancel_btn.bind('<Enter>', lambda e: cancel_btn.config(bg='#D0D0D0'))
+        cancel_btn.bind('<Leave>', lambda e: cancel_btn.config(bg='#E0E0E0'))
@@ -0,0 +1,815 @@
+"""
+Shop Screens - Product grid, search and product detail
+Methods of ModernGroceryApp (self is the app), imported on first use through
+gui.screens
+"""
+import tkinter as tk
+from tkinter import messagebox
+
+from gui.ui_components import DebouncedSearch, VirtualGrid
+
+from services import ProductService
+
+
+class ShopScreens:
+    """Shop grid (virtualized cards, debounced search) and product detail"""
+
+    # ==================== SHOP ====================
+
+    def show_shop_screen(self):
+        """Show product browsing screen - Modern Daraz-inspired design"""
+        if self.restore_screen('shop'):
+            return
+        self.clear_window()
+        self.current_screen = 'shop'
+        
+        # Configure root background
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Modern Header with search
+        header = tk.Frame(self.root, bg=self.colors['primary'], height=80)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        # Header content container
+        header_content = tk.Frame(header, bg=self.colors['primary'])
+        header_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+        
+        # Left: Back button
+        back_btn = tk.Label(
+            header_content,
+            text="←",
+            font=('Segoe UI', 20),
+            bg=self.colors['primary'],
+            fg='white',
+            cursor='hand2'
+        )
+        back_btn.pack(side=tk.LEFT, padx=(0, 15))
+        back_btn.bind('<Button-1>', lambda e: self.show_customer_dashboard())
+        
+        # Center: Title
+        tk.Label(
+            header_content,
+            text="Grocery Shop",
+            font=('Segoe UI', 18, 'bold'),
+            bg=self.colors['primary'],
+            fg='white'
+        ).pack(side=tk.LEFT)
+        
+        # Right: Search and icons
+        right_icons = tk.Frame(header_content, bg=self.colors['primary'])
+        right_icons.pack(side=tk.RIGHT)
+        
+        search_icon = tk.Label(
+            right_icons,
+            text="🔍",
+            font=('Segoe UI', 16),
+            bg=self.colors['primary'],
+            fg='white',
+            cursor='hand2'
+        )
+        search_icon.pack(side=tk.LEFT, padx=10)
+        
+        # Search bar section (below header)
+        search_section = tk.Frame(self.root, bg=self.colors['primary'], height=60)
+        search_section.pack(fill=tk.X)
+        search_section.pack_propagate(False)
+        
+        search_container = tk.Frame(search_section, bg=self.colors['primary'])
+        search_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=12)
+        
+        search_entry = tk.Entry(
+            search_container,
+            font=('Segoe UI', 11),
+            relief=tk.FLAT,
+            bg='white',
+            fg=self.colors['text_light'],
+            insertbackground=self.colors['primary'],
+            width=50
+        )
+        search_entry.pack(fill=tk.X, ipady=10)
+        search_entry.insert(0, "Search for products...")
+        
+        def clear_search(e):
+            if search_entry.get() == "Search for products...":
+                search_entry.delete(0, tk.END)
+                search_entry.config(fg=self.colors['text'])
+        
+        def restore_search(e):
+            if not search_entry.get():
+                search_entry.insert(0, "Search for products...")
+                search_entry.config(fg=self.colors['text_light'])
+        
+        def run_search(search_term):
+            # Runs on a search worker thread - database work only, no widgets
+            if search_term:
+                # Version first, like load_products: the results are never older than it
+                etag, _ = ProductService.get_catalog_version()
+                return etag, ProductService.search_products(search_term)
+            return None
+        
+        def show_search_results(search_term, results):
+            if not product_grid.canvas.winfo_exists():
+                return
+            if search_term:
+                etag, products = results
+                self.display_search_results(products, product_grid, version=('search', search_term, etag))
+            else:
+                self.load_products(None, product_grid)
+        
+        search_pipeline = DebouncedSearch(self.root, run_search, show_search_results)
+        self.search_pipeline = search_pipeline
+        last_search = {'term': ''}
+        
+        def on_search_change(*args):
+            search_term = search_entry.get()
+            if search_term == "Search for products...":
+                return
+            search_term = search_term.strip()
+            # Arrow keys, Shift etc. also fire KeyRelease without changing the text
+            if search_term == last_search['term']:
+                return
+            last_search['term'] = search_term
+            self.search_pipeline.submit(search_term)
+        
+        search_entry.bind('<FocusIn>', clear_search)
+        search_entry.bind('<FocusOut>', restore_search)
+        search_entry.bind('<KeyRelease>', on_search_change)
+        
+        # Main content area - Categories sidebar + Products grid
+        content = tk.Frame(self.root, bg=self.colors['bg'])
+        content.pack(fill=tk.BOTH, expand=True)
+        
+        # Categories sidebar
+        sidebar = tk.Frame(content, bg=self.colors['card'], width=250)
+        sidebar.pack(side=tk.LEFT, fill=tk.Y, padx=(10, 5), pady=10)
+        sidebar.pack_propagate(False)
+        
+        tk.Label(
+            sidebar,
+            text="Categories",
+            font=('Segoe UI', 14, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text']
+        ).pack(pady=15)
+        
+        # Version first, like load_products: the sidebar is never older than it
+        categories_etag, _ = ProductService.get_categories_version()
+        categories = ProductService.get_all_categories()
+        
+        # All products button
+        btn = tk.Button(
+            sidebar,
+            text="🏪 All Products",
+            command=lambda: self.load_products(None, product_grid),
+            bg=self.colors['bg_secondary'],
+            fg=self.colors['text'],
+            font=('Segoe UI', 11, 'bold'),
+            relief=tk.FLAT,
+            anchor='w',
+            padx=20,
+            pady=10,
+            cursor='hand2',
+            activebackground=self.colors['hover'],
+            activeforeground=self.colors['text']
+        )
+        btn.pack(fill=tk.X, padx=10, pady=2)
+        btn.bind('<Enter>', lambda e: btn.config(bg=self.colors['hover']))
+        btn.bind('<Leave>', lambda e: btn.config(bg=self.colors['bg_secondary']))
+        
+        # Category buttons
+        for cat in categories:
+            cat_id, cat_name, icon = cat
+            btn = tk.Button(
+                sidebar,
+                text=f"{icon} {cat_name}",
+                command=lambda cid=cat_id: self.load_products(cid, product_grid),
+                bg=self.colors['bg_secondary'],
+                fg=self.colors['text'],
+                font=('Segoe UI', 11),
+                relief=tk.FLAT,
+                anchor='w',
+                padx=20,
+                pady=10,
+                cursor='hand2',
+                activebackground=self.colors['hover'],
+                activeforeground=self.colors['text']
+            )
+            btn.pack(fill=tk.X, padx=10, pady=2)
+            btn.bind('<Enter>', lambda e, b=btn: b.config(bg=self.colors['hover']))
+            btn.bind('<Leave>', lambda e, b=btn: b.config(bg=self.colors['bg_secondary']))
+        
+        # Products area with scrollbar
+        products_container = tk.Frame(content, bg=self.colors['bg'])
+        products_container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 10), pady=10)
+        
+        # Only the cards around the viewport exist; they are recycled on scroll
+        product_grid = VirtualGrid(
+            products_container,
+            self.build_product_card,
+            self.bind_product_card,
+            columns=3,
+            cell_width=216,
+            cell_height=300,
+            bg=self.colors['bg'],
+            empty_fg=self.colors['text_light']
+        )
+        
+        # Load all products initially
+        self.load_products(None, product_grid)
+        
+        # Kept for the next visit (e.g. back from a product); the category
+        # list and the product grid are only reloaded if their version changed
+        def refresh():
+            if ProductService.get_categories_version()[0] != categories_etag:
+                return False  # Sidebar is stale - rebuild the screen
+            self.search_pipeline = search_pipeline
+            if product_grid.version is not None and product_grid.version[0] == 'search':
+                _, search_term, etag = product_grid.version
+                if ProductService.get_catalog_version()[0] != etag:
+                    # Run the search again; its results replace the stale ones
+                    search_pipeline.submit(search_term)
+            elif product_grid.version is not None:
+                category_id = product_grid.version[0]
+                etag, _ = ProductService.get_catalog_version(category_id)
+                if (category_id, etag) != product_grid.version:
+                    self.load_products(category_id, product_grid)
+                    return True
+            # Image loads were cancelled when the screen was hidden
+            product_grid.rebind()
+            return True
+        
+        def on_hide():
+            search_pipeline.cancel()
+            product_grid.canvas.unbind_all("<MouseWheel>")
+        
+        self.retain_screen(refresh, on_hide, search_pipeline.close)
+    
+    def load_products(self, category_id, grid):
+        """Load and display products, a page at a time as the grid scrolls
+        
+        Showing the same category again is skipped unless its catalog
+        version changed.
+        """
+        # A category click supersedes any pending search
+        if self.search_pipeline is not None:
+            self.search_pipeline.cancel()
+        
+        # Version first: the rows loaded below are never older than it
+        etag, _ = ProductService.get_catalog_version(category_id)
+        total = ProductService.count_products(category_id)
+        grid.set_source(
+            total,
+            lambda token: ProductService.get_products_keyset_page(category_id, token, grid.page_size),
+            "No products available",
+            version=(category_id, etag)
+        )
+    
+    def display_search_results(self, products, grid, version=None):
+        """Display search results (version: ('search', term, catalog etag))"""
+        grid.set_rows(products, "No products found", version=version)
+    
+    def build_product_card(self, parent):
+        """Create an empty modern e-commerce product card (Daraz-style)
+        
+        The shop grid recycles cards while scrolling; bind_product_card fills
+        one in for a product, and every handler reads the current card.product.
+        """
+        card = tk.Frame(parent, bg=self.colors['card'], relief=tk.FLAT, borderwidth=0,
+                       highlightthickness=1, highlightbackground=self.colors['border'])
+        card.pack_propagate(False)
+        card.config(width=200, height=280)
+        card.product = None
+        
+        # Product image container
+        image_container = tk.Frame(card, bg=self.colors['input_bg'], height=150)
+        image_container.pack(fill=tk.X, padx=0, pady=0)
+        image_container.pack_propagate(False)
+        
+        card.image_label = tk.Label(image_container, bg=self.colors['input_bg'])
+        card.image_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        
+        # Discount badge (placed only for discounted products)
+        card.badge = tk.Label(
+            image_container,
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['badge'],
+            fg='white',
+            padx=8,
+            pady=4
+        )
+        
+        # Product info container
+        info_frame = tk.Frame(card, bg=self.colors['card'])
+        info_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=10)
+        
+        # Product name
+        card.name_label = tk.Label(
+            info_frame,
+            font=('Segoe UI', 11, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['text'],
+            anchor='w',
+            justify='left',
+            wraplength=150
+        )
+        card.name_label.pack(anchor='w', pady=(0, 4))
+        
+        # Category
+        card.category_label = tk.Label(
+            info_frame,
+            font=('Segoe UI', 8),
+            bg=self.colors['card'],
+            fg=self.colors['text_light'],
+            anchor='w'
+        )
+        card.category_label.pack(anchor='w', pady=(0, 8))
+        
+        # Price row
+        price_frame = tk.Frame(info_frame, bg=self.colors['card'])
+        price_frame.pack(anchor='w', pady=(0, 8))
+        
+        card.price_label = tk.Label(
+            price_frame,
+            font=('Segoe UI', 12, 'bold'),
+            bg=self.colors['card'],
+            fg=self.colors['primary']
+        )
+        card.price_label.pack(side=tk.LEFT)
+        
+        # Original price (packed only for discounted products)
+        card.old_price_label = tk.Label(
+            price_frame,
+            font=('Segoe UI', 9),
+            bg=self.colors['card'],
+            fg=self.colors['text_light']
+        )
+        
+        # Add to cart button
+        def add_to_cart_action():
+            product = card.product
+            if product[6] > 0:
+                success, msg = self.cart.add(product[0], 1)
+                self.cart_changed()
+                if success:
+                    messagebox.showinfo("Success", "Added to cart!")
+                else:
+                    messagebox.showerror("Error", msg)
+            else:
+                messagebox.showwarning("Out of Stock", "Product is out of stock")
+        
+        add_btn = tk.Button(
+            info_frame,
+            text="Add to Cart",
+            command=add_to_cart_action,
+            bg=self.colors['primary'],
+            fg='white',
+            font=('Segoe UI', 9, 'bold'),
+            relief=tk.FLAT,
+            padx=0,
+            pady=8,
+            cursor='hand2',
+            borderwidth=0
+        )
+        add_btn.pack(fill=tk.X)
+        add_btn.bind('<Enter>', lambda e: add_btn.config(bg=self.colors['primary_dark']))
+        add_btn.bind('<Leave>', lambda e: add_btn.config(bg=self.colors['primary']))
+        
+        # Click to open product detail
+        def on_card_click(e):
+            # Don't open detail if clicking on the Add to Cart button
+            if e.widget != add_btn:
+                self.show_product_detail(card.product)
+        
+        # Hover effect for the entire card
+        def on_enter(e):
+            card.config(highlightbackground=self.colors['primary'], highlightthickness=2)
+            card.config(cursor='hand2')
+        
+        def on_leave(e):
+            card.config(highlightbackground=self.colors['border'], highlightthickness=1)
+            card.config(cursor='')
+        
+        card.bind('<Enter>', on_enter)
+        card.bind('<Leave>', on_leave)
+        card.bind('<Button-1>', on_card_click)
+        image_container.bind('<Button-1>', on_card_click)
+        info_frame.bind('<Button-1>', on_card_click)
+        card.image_label.bind('<Button-1>', on_card_click)
+        
+        # Bind image container and info frame to hover
+        image_container.bind('<Enter>', on_enter)
+        image_container.bind('<Leave>', on_leave)
+        info_frame.bind('<Enter>', on_enter)
+        info_frame.bind('<Leave>', on_leave)
+        
+        # Bind all child labels to click and hover
+        for widget in info_frame.winfo_children():
+            if isinstance(widget, tk.Button):
+                continue
+            widget.bind('<Button-1>', on_card_click)
+            widget.bind('<Enter>', on_enter)
+            widget.bind('<Leave>', on_leave)
+        
+        return card
+    
+    def bind_product_card(self, card, product, index=0):
+        """Fill a product card for product (index = position in the grid)"""
+        card.product = product
+        card.config(highlightbackground=self.colors['border'], highlightthickness=1)
+        
+        # Placeholder first; the image loader swaps in the decoded image.
+        # Cards are queued in display order, so the top rows decode first.
+        # Always request: it also drops the recycled label's previous request
+        card.image_label.config(image='', text="📦", font=('Segoe UI', 40), fg=self.colors['text_muted'])
+        card.image_label.image = None
+        self.image_loader.request(card.image_label, product[3], (150, 150), priority=index)
+        
+        card.name_label.config(text=product[1][:20])
+        card.category_label.config(text=product[9][:15])
+        
+        price = product[4]
+        discount = product[8]
+        final_price = price * (1 - discount / 100) if discount > 0 else price
+        card.price_label.config(text=f"LKR {final_price:.2f}")
+        
+        if discount > 0:
+            card.badge.config(text=f"-{int(discount)}%")
+            card.badge.place(relx=0.05, rely=0.08)
+            card.old_price_label.config(text=f" LKR {price:.2f}")
+            card.old_price_label.pack(side=tk.LEFT)
+        else:
+            card.badge.place_forget()
+            card.old_price_label.pack_forget()
+    
+    # ==================== PRODUCT DETAIL ====================
+
+    def show_product_detail(self, product):
+        """Show product detail screen - Professional PC-optimized design"""
+        self.clear_window()
+        self.root.configure(bg=self.colors['bg'])
+        
+        stock = product[6]
+        price = product[4]
+        discount = product[8]
+        final_price = price * (1 - discount / 100) if discount > 0 else price
+        
+        # Defer sold count query - get it in background
+        sold_count = 0
+        try:
+            sold_count = ProductService.get_product_sold_count(product[0])
+        except:
+            sold_count = 0
+        
+        # ==== HEADER ====
+        header = tk.Frame(self.root, bg='white', height=70)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        header_content = tk.Frame(header, bg='white')
+        header_content.pack(fill=tk.BOTH, expand=True, padx=40, pady=15)
+        
+        # Back button
+        back_btn = tk.Label(
+            header_content,
+            text="← Back to Shop",
+            font=('Segoe UI', 12),
+            bg='white',
+            fg=self.colors['primary'],
+            cursor='hand2'
+        )
+        back_btn.pack(side=tk.LEFT)
+        back_btn.bind('<Button-1>', lambda e: self.show_shop_screen())
+        
+        # Breadcrumb/Title
+        tk.Label(
+            header_content,
+            text=f"/ {product[1][:30]}",
+            font=('Segoe UI', 11),
+            bg='white',
+            fg=self.colors['text_light']
+        ).pack(side=tk.LEFT, padx=15)
+        
+        # Divider line below header
+        tk.Frame(self.root, bg=self.colors['border'], height=1).pack(fill=tk.X)
+        
+        # ==== MAIN CONTENT (Two-column layout) ====
+        main_container = tk.Frame(self.root, bg=self.colors['bg'])
+        main_container.pack(fill=tk.BOTH, expand=True, padx=40, pady=30)
+        
+        # LEFT COLUMN - Image (Optimized with lazy loading)
+        left_column = tk.Frame(main_container, bg=self.colors['bg'])
+        left_column.pack(side=tk.LEFT, fill=tk.BOTH, expand=False, padx=(0, 60))
+        
+        # Product image container
+        image_bg = tk.Frame(left_column, bg='white', width=450, height=500)
+        image_bg.pack(side=tk.TOP)
+        image_bg.pack_propagate(False)
+        
+        image_label = tk.Label(image_bg, bg='white')
+        image_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        
+        # Show placeholder immediately, load image asynchronously
+        image_label.config(text="📦", font=('Segoe UI', 120), fg=self.colors['text_muted'])
+        
+        # Decode on a worker thread, ahead of any queued card images
+        if product[3]:
+            self.image_loader.request(image_label, product[3], (400, 400), priority=-1)
+        
+        # Image navigation dots
+        dots_frame = tk.Frame(left_column, bg=self.colors['bg'])
+        dots_frame.pack(pady=20)
+        for i in range(4):
+            color = self.colors['primary'] if i == 0 else '#E0E0E0'
+            tk.Label(dots_frame, text="●", font=('Segoe UI', 12), bg=self.colors['bg'], fg=color).pack(side=tk.LEFT, padx=8)
+        
+        # RIGHT COLUMN - Product Info (Scrollable)
+        right_scroll_frame = tk.Frame(main_container, bg=self.colors['bg'])
+        right_scroll_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        canvas = tk.Canvas(right_scroll_frame, bg=self.colors['bg'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(right_scroll_frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Bind mousewheel scrolling
+        def _on_mousewheel(event):
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        
+        right_column = scrollable_frame
+        
+        # Product name
+        tk.Label(
+            right_column,
+            text=product[1],
+            font=('Segoe UI', 24, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text'],
+            wraplength=500,
+            justify='left'
+        ).pack(anchor='w', pady=(0, 20))
+        
+        # Sold count info (from database)
+        sold_info = tk.Frame(right_column, bg=self.colors['bg'])
+        sold_info.pack(anchor='w', pady=(0, 20))
+        
+        tk.Label(
+            sold_info,
+            text=f"Units Sold: {sold_count}",
+            font=('Segoe UI', 11),
+            bg=self.colors['bg'],
+            fg=self.colors['text_light']
+        ).pack(side=tk.LEFT)
+        
+        # Divider
+        tk.Frame(right_column, bg=self.colors['border'], height=2).pack(fill=tk.X, pady=20)
+        
+        # ==== PRICING SECTION ====
+        price_main = tk.Frame(right_column, bg=self.colors['bg'])
+        price_main.pack(fill=tk.X, pady=(0, 25))
+        
+        # Current price (large)
+        tk.Label(
+            price_main,
+            text=f"LKR {final_price:.2f}",
+            font=('Segoe UI', 40, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['primary']
+        ).pack(side=tk.LEFT)
+        
+        if discount > 0:
+            price_info = tk.Frame(price_main, bg=self.colors['bg'])
+            price_info.pack(side=tk.LEFT, padx=25)
+            
+            tk.Label(
+                price_info,
+                text=f"LKR {price:.2f}",
+                font=('Segoe UI', 14),
+                bg=self.colors['bg'],
+                fg=self.colors['text_light']
+            ).pack(anchor='w')
+            
+            discount_badge = tk.Frame(price_info, bg=self.colors['badge'], highlightthickness=0)
+            discount_badge.pack(anchor='w', pady=(8, 0))
+            
+            tk.Label(
+                discount_badge,
+                text=f"  Save {int(discount)}%  ",
+                font=('Segoe UI', 10, 'bold'),
+                bg=self.colors['badge'],
+                fg='white',
+                padx=10,
+                pady=4
+            ).pack()
+        
+        # Divider
+        tk.Frame(right_column, bg=self.colors['border'], height=1).pack(fill=tk.X, pady=20)
+        
+        # ==== PRODUCT SPECIFICATIONS (Only Category, Unit, Stock) ====
+        spec_title = tk.Label(
+            right_column,
+            text="Product Details",
+            font=('Segoe UI', 13, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        )
+        spec_title.pack(anchor='w', pady=(0, 15))
+        
+        specs_data = [
+            ("Category", product[9]),
+            ("Unit", product[5]),
+            ("Stock Available", f"{stock} units")
+        ]
+        
+        for label, value in specs_data:
+            spec_row = tk.Frame(right_column, bg=self.colors['bg'])
+            spec_row.pack(fill=tk.X, pady=8)
+            
+            tk.Label(
+                spec_row,
+                text=label + ":",
+                font=('Segoe UI', 10),
+                bg=self.colors['bg'],
+                fg=self.colors['text_light'],
+                width=20,
+                anchor='w'
+            ).pack(side=tk.LEFT)
+            
+            tk.Label(
+                spec_row,
+                text=value,
+                font=('Segoe UI', 10, 'bold'),
+                bg=self.colors['bg'],
+                fg=self.colors['text']
+            ).pack(side=tk.LEFT)
+        
+        # Divider
+        tk.Frame(right_column, bg=self.colors['border'], height=1).pack(fill=tk.X, pady=20)
+        
+        # ==== DESCRIPTION ====
+        if product[2]:
+            desc_title = tk.Label(
+                right_column,
+                text="Description",
+                font=('Segoe UI', 13, 'bold'),
+                bg=self.colors['bg'],
+                fg=self.colors['text']
+            )
+            desc_title.pack(anchor='w', pady=(0, 12))
+            
+            desc_label = tk.Label(
+                right_column,
+                text=product[2],
+                font=('Segoe UI', 11),
+                bg=self.colors['bg'],
+                fg=self.colors['text_light'],
+                wraplength=500,
+                justify='left',
+                anchor='w'
+            )
+            desc_label.pack(anchor='w', pady=(0, 40))
+        
+        # ==== ACTION BUTTONS (Fixed at bottom) ====
+        button_container = tk.Frame(self.root, bg='white', height=130)
+        button_container.pack(fill=tk.X, side=tk.BOTTOM)
+        button_container.pack_propagate(False)
+        
+        # Divider
+        tk.Frame(button_container, bg=self.colors['border'], height=1).pack(fill=tk.X)
+        
+        button_content = tk.Frame(button_container, bg='white')
+        button_content.pack(fill=tk.BOTH, expand=True, padx=40, pady=15)
+        
+        # Quantity selector section
+        qty_section = tk.Frame(button_content, bg='white')
+        qty_section.pack(fill=tk.X, pady=(0, 15))
+        
+        tk.Label(
+            qty_section,
+            text="Quantity:",
+            font=('Segoe UI', 11, 'bold'),
+            bg='white',
+            fg=self.colors['text']
+        ).pack(side=tk.LEFT)
+        
+        # Quantity frame with minus, input, plus buttons
+        qty_frame = tk.Frame(qty_section, bg='white')
+        qty_frame.pack(side=tk.LEFT, padx=(15, 0))
+        
+        qty_var = tk.StringVar(value="1")
+        
+        def decrease_qty():
+            try:
+                current = int(qty_var.get())
+                if current > 1:
+                    qty_var.set(str(current - 1))
+            except:
+                qty_var.set("1")
+        
+        def increase_qty():
+            try:
+                current = int(qty_var.get())
+                if current < stock:
+                    qty_var.set(str(current + 1))
+            except:
+                qty_var.set("1")
+        
+        # Minus button
+        minus_btn = tk.Button(
+            qty_frame,
+            text="−",
+            command=decrease_qty,
+            bg=self.colors['border'],
+            fg=self.colors['text'],
+            font=('Segoe UI', 14, 'bold'),
+            relief=tk.FLAT,
+            width=3,
+            height=1,
+            cursor='hand2',
+            borderwidth=0
+        )
+        minus_btn.pack(side=tk.LEFT)
+        
+        # Quantity input
+        qty_input = tk.Entry(
+            qty_frame,
+            textvariable=qty_var,
+            font=('Segoe UI', 11, 'bold'),
+            width=5,
+            justify=tk.CENTER,
+            relief=tk.SOLID,
+            borderwidth=1
+        )
+        qty_input.pack(side=tk.LEFT, padx=5)
+        
+        # Plus button
+        plus_btn = tk.Button(
+            qty_frame,
+            text="＋",
+            command=increase_qty,
+            bg=self.colors['border'],
+            fg=self.colors['text'],
+            font=('Segoe UI', 14, 'bold'),
+            relief=tk.FLAT,
+            width=3,
+            height=1,
+            cursor='hand2',
+            borderwidth=0
+        )
+        plus_btn.pack(side=tk.LEFT)
+        
+        # Stock info
+        tk.Label(
+            qty_section,
+            text=f"(Available: {stock})",
+            font=('Segoe UI', 10),
+            bg='white',
+            fg=self.colors['text_light']
+        ).pack(side=tk.LEFT, padx=(20, 0))
+        
+        def add_to_cart_action():
+            try:
+                quantity = int(qty_var.get())
+                if quantity < 1:
+                    messagebox.showwarning("Invalid Quantity", "Please enter a valid quantity")
+                    return
+                if quantity > stock:
+                    messagebox.showwarning("Insufficient Stock", f"Only {stock} units available")
+                    return
+                success, msg = self.cart.add(product[0], quantity)
+                self.cart_changed()
+                if success:
+                    messagebox.showinfo("Success", f"✓ Added {quantity} item(s) to cart!")
+                    self.show_shop_screen()
+                else:
+                    messagebox.showerror("Error", msg)
+            except:
+                messagebox.showwarning("Invalid Input", "Please enter a valid quantity")
+        
+        # Add to Cart Button (full width below quantity selector)
+        add_cart_btn = tk.Button(
+            button_content,
+            text="🛒  Add to Cart",
+            command=add_to_cart_action,
+            bg=self.colors['primary'],
+            fg='white',
+            font=('Segoe UI', 12, 'bold'),
+            relief=tk.FLAT,
+            pady=16,
+            cursor='hand2',
+            borderwidth=0
+        )
+        add_cart_btn.pack(fill=tk.X)
+        add_cart_btn.bind('<Enter>', lambda e: add_cart_btn.config(bg=self.colors['primary_dark']))
+        add_cart_btn.bind('<Leave>', lambda e: add_cart_btn.config(bg=self.colors['primary']))
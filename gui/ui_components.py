@@ -5,6 +5,9 @@ Extracted from modern_app.py to keep it clean and maintainable
 import tkinter as tk
 from datetime import datetime, timedelta
 import calendar
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 
 class UIColors:
@@ -372,3 +375,414 @@ class CalendarPickerDialog:
                     
                     btn.bind('<Enter>', on_enter)
                     btn.bind('<Leave>', on_leave)
+
+
+class DebouncedSearch:
+    """Debounced, cancellable search pipeline for Tk screens
+
+    Keystrokes restart a short timer; only when typing pauses is the query
+    handed to a worker thread. Results come back through a queue polled with
+    after(), and any result belonging to an older query is dropped, so only
+    the latest result set ever reaches on_results (on the Tk thread).
+
+    scheduler is anything with Tk's after/after_cancel (usually root).
+    """
+    
+    def __init__(self, scheduler, search_fn, on_results, delay_ms=250, poll_ms=30,
+                 executor=None, on_error=None):
+        self.scheduler = scheduler
+        self.search_fn = search_fn
+        self.on_results = on_results
+        self.on_error = on_error
+        self.delay_ms = delay_ms
+        self.poll_ms = poll_ms
+        self._executor = executor or ThreadPoolExecutor(max_workers=2, thread_name_prefix='search')
+        self._owns_executor = executor is None
+        self._results = queue.Queue()
+        self._generation = 0
+        self._timer = None
+        self._poller = None
+        self._in_flight = 0
+        self._closed = False
+        self.stats = {'keystrokes': 0, 'queries': 0, 'skipped': 0, 'dropped': 0, 'rendered': 0}
+    
+    def submit(self, term):
+        """Register a keystroke; (re)start the debounce timer"""
+        if self._closed:
+            return
+        self.stats['keystrokes'] += 1
+        self._generation += 1
+        if self._timer is not None:
+            self.scheduler.after_cancel(self._timer)
+        self._timer = self.scheduler.after(self.delay_ms, self._fire, self._generation, term)
+    
+    def cancel(self):
+        """Forget the pending keystroke and every in-flight query"""
+        self._generation += 1
+        if self._timer is not None:
+            self.scheduler.after_cancel(self._timer)
+            self._timer = None
+    
+    def close(self):
+        """Cancel everything and stop polling (call when leaving the screen)"""
+        self.cancel()
+        self._closed = True
+        if self._poller is not None:
+            self.scheduler.after_cancel(self._poller)
+            self._poller = None
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+    
+    def _fire(self, generation, term):
+        self._timer = None
+        if generation != self._generation:
+            return
+        self.stats['queries'] += 1
+        self._in_flight += 1
+        self._executor.submit(self._run_query, generation, term)
+        if self._poller is None:
+            self._poller = self.scheduler.after(self.poll_ms, self._poll)
+    
+    def _run_query(self, generation, term):
+        # Worker thread: skip queries that went stale while queued
+        if generation != self._generation:
+            self._results.put((generation, term, None, None, True))
+            return
+        try:
+            self._results.put((generation, term, self.search_fn(term), None, False))
+        except Exception as e:
+            self._results.put((generation, term, None, e, False))
+    
+    def _poll(self):
+        self._poller = None
+        if self._closed:
+            return
+        while True:
+            try:
+                generation, term, results, error, skipped = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._in_flight -= 1
+            if skipped:
+                self.stats['skipped'] += 1
+            elif generation != self._generation:
+                self.stats['dropped'] += 1
+            elif error is not None:
+                if self.on_error:
+                    self.on_error(term, error)
+                else:
+                    print(f"Search failed for '{term}': {error}")
+            else:
+                self.stats['rendered'] += 1
+                self.on_results(term, results)
+        if self._in_flight > 0:
+            self._poller = self.scheduler.after(self.poll_ms, self._poll)
+
+
+class VirtualGrid:
+    """Windowed card grid for long product lists
+
+    Only the rows in and just around the viewport have widgets. Cards are
+    created once by create_card(canvas) and recycled as the canvas scrolls:
+    bind_card(card, item, index) refills a card for a new item. Items come
+    from page_loader(page_token) -> (rows, next_token), the keyset page APIs,
+    fetched a page at a time on a worker thread and kept in a small LRU, so
+    a catalog of thousands costs a few dozen widgets and the pages actually
+    scrolled past. Cells of a page still loading stay empty until it lands.
+    """
+    
+    def __init__(self, parent, create_card, bind_card, columns=3, cell_width=216,
+                 cell_height=300, padding=10, overscan_rows=2, page_size=60,
+                 max_pages=8, bg=None, empty_fg=None, poll_ms=30):
+        self.create_card = create_card
+        self.bind_card = bind_card
+        self.columns = columns
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.padding = padding
+        self.overscan_rows = overscan_rows
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.poll_ms = poll_ms
+        
+        self.canvas = tk.Canvas(parent, bg=bg, highlightthickness=0, yscrollincrement=20)
+        self.scrollbar = tk.Scrollbar(parent, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self._empty_item = self.canvas.create_text(0, 50, text="", anchor="n",
+                                                   font=('Segoe UI', 14), fill=empty_fg)
+        
+        self.canvas.bind('<Configure>', lambda e: self._schedule_refresh())
+        self.canvas.bind('<Enter>', lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
+        self.canvas.bind('<Leave>', lambda e: self.canvas.unbind_all("<MouseWheel>"))
+        self.canvas.bind('<Destroy>', lambda e: self.close() if e.widget is self.canvas else None)
+        
+        self.total = 0
+        self.version = None           # caller's tag for the data currently shown
+        self._page_loader = None
+        self._in_background = True
+        self._pages = OrderedDict()   # page number -> rows
+        self._tokens = {0: None}      # page number -> token that fetches it
+        self._loading = None          # page number being fetched, if any
+        self._generation = 0
+        self._executor = None
+        self._loaded = queue.Queue()
+        self._poller = None
+        self._active = {}             # item index -> card
+        self._free = []               # unbound cards, ready for reuse
+        self._windows = {}            # card -> canvas window item
+        self._refresh_pending = None
+        self.stats = {'cards_created': 0, 'binds': 0, 'pages_loaded': 0}
+    
+    # ==================== DATA SOURCE ====================
+    
+    def set_source(self, total, page_loader, empty_text="", version=None, background=True):
+        """Show total items from page_loader(page_token), scrolled to the top
+        
+        If version equals the one already shown, the loaded pages and bound
+        cards are kept and the grid is only scrolled back to the top.
+        Returns False when that happened. background=False loads pages on
+        the Tk thread (for rows already in memory).
+        """
+        if version is not None and version == self.version:
+            self.canvas.yview_moveto(0)
+            self._schedule_refresh()
+            return False
+        self.version = version
+        self.total = total
+        self._page_loader = page_loader
+        self._in_background = background
+        self._generation += 1  # Pages still in flight belong to the old source
+        self._pages.clear()
+        self._tokens = {0: None}
+        self._loading = None
+        for index in list(self._active):
+            self._release(index)
+        
+        rows = (total + self.columns - 1) // self.columns
+        height = rows * self.cell_height + 2 * self.padding
+        self.canvas.configure(scrollregion=(0, 0, self._content_width(), height))
+        self.canvas.itemconfigure(self._empty_item, text="" if total else empty_text)
+        self.canvas.yview_moveto(0)
+        self.refresh()
+        return True
+    
+    def rebind(self):
+        """Bind the visible cards again from the loaded pages, keeping the scroll position"""
+        for index in list(self._active):
+            self._release(index)
+        self.refresh()
+    
+    def set_rows(self, rows, empty_text="", version=None):
+        """Show an already-loaded list (e.g. search results), tagged like set_source"""
+        rows = list(rows)
+        size = self.page_size
+        
+        def page_loader(offset):
+            offset = offset or 0
+            return rows[offset:offset + size], (offset + size if offset + size < len(rows) else None)
+        
+        self.set_source(len(rows), page_loader, empty_text, version, background=False)
+    
+    def close(self):
+        """Stop loading pages (runs when the canvas is destroyed)"""
+        self._generation += 1
+        self._loading = None
+        if self._poller is not None:
+            try:
+                self.canvas.after_cancel(self._poller)
+            except tk.TclError:
+                pass
+            self._poller = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def _item(self, index):
+        """Item at index, or None while its page is loading"""
+        page, slot = divmod(index, self.page_size)
+        rows = self._pages.get(page)
+        if rows is None:
+            self._request(page)
+            rows = self._pages.get(page)  # Loaded inline when not in the background
+            if rows is None:
+                return None
+        else:
+            self._pages.move_to_end(page)
+        return rows[slot] if slot < len(rows) else None
+    
+    def _request(self, page):
+        # A keyset page needs the token from the page before it, so a jump
+        # far down walks the pages in between first (their tokens are kept)
+        if self._loading is not None:
+            return
+        known = max(p for p in self._tokens if p <= page)
+        if self._tokens[known] is None and known > 0:
+            return  # Past the last page
+        if not self._in_background:
+            self._store(known, *self._page_loader(self._tokens[known]))
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='grid-pages')
+        self._loading = known
+        self._executor.submit(self._load_page, self._generation, known, self._page_loader,
+                              self._tokens[known])
+        if self._poller is None:
+            self._poller = self.canvas.after(self.poll_ms, self._poll)
+    
+    def _load_page(self, generation, page, page_loader, token):
+        # Worker thread
+        try:
+            rows, next_token = page_loader(token)
+            self._loaded.put((generation, page, rows, next_token, None))
+        except Exception as e:
+            self._loaded.put((generation, page, None, None, e))
+    
+    def _poll(self):
+        self._poller = None
+        if not self.canvas.winfo_exists():
+            return
+        while True:
+            try:
+                generation, page, rows, next_token, error = self._loaded.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation:
+                continue  # Source changed while it was loading
+            self._loading = None
+            if error is not None:
+                print(f"Error loading products page {page}: {error}")
+                continue
+            self._store(page, rows, next_token)
+            self._schedule_refresh()
+        if self._loading is not None:
+            self._poller = self.canvas.after(self.poll_ms, self._poll)
+    
+    def _store(self, page, rows, next_token):
+        self._tokens[page + 1] = next_token
+        self.stats['pages_loaded'] += 1
+        self._pages[page] = rows
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+    
+    # ==================== WINDOWING ====================
+    
+    def refresh(self):
+        """Bind cards to the rows around the viewport and recycle the rest"""
+        self._refresh_pending = None
+        if not self.canvas.winfo_exists():
+            return
+        width = self.canvas.winfo_width()
+        self.canvas.coords(self._empty_item, max(width, self._content_width()) // 2, 50)
+        first, last = self._visible_indexes()
+        
+        for index in [i for i in self._active if not first <= i < last]:
+            self._release(index)
+        for index in range(first, last):
+            if index in self._active:
+                continue
+            item = self._item(index)
+            if item is None:
+                continue
+            card = self._free.pop() if self._free else self._new_card()
+            self.bind_card(card, item, index)
+            self.stats['binds'] += 1
+            row, column = divmod(index, self.columns)
+            self.canvas.coords(self._windows[card],
+                               self.padding + column * self.cell_width,
+                               self.padding + row * self.cell_height)
+            self._active[index] = card
+    
+    def _visible_indexes(self):
+        """[first, last) item indexes of the viewport plus overscan rows"""
+        if not self.total:
+            return 0, 0
+        top = self.canvas.canvasy(0) - self.padding
+        height = max(self.canvas.winfo_height(), self.cell_height)
+        first_row = max(0, int(top // self.cell_height) - self.overscan_rows)
+        last_row = int((top + height) // self.cell_height) + 1 + self.overscan_rows
+        return first_row * self.columns, min(self.total, last_row * self.columns)
+    
+    def _new_card(self):
+        card = self.create_card(self.canvas)
+        self._windows[card] = self.canvas.create_window(0, 0, window=card, anchor="nw")
+        self.stats['cards_created'] += 1
+        return card
+    
+    def _release(self, index):
+        card = self._active.pop(index)
+        # Park the card above the scroll region instead of destroying it
+        self.canvas.coords(self._windows[card], 0, -2 * self.cell_height)
+        self._free.append(card)
+    
+    def _content_width(self):
+        return self.columns * self.cell_width + 2 * self.padding
+    
+    # ==================== EVENTS ====================
+    
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_refresh()
+    
+    def _schedule_refresh(self):
+        # Coalesce bursts of scroll/configure events into one refresh
+        if self._refresh_pending is None:
+            self._refresh_pending = self.canvas.after_idle(self.refresh)
+    
+    def _on_mousewheel(self, event):
+        self.canvas.yview_scroll(int(-1 * (event.delta / 120)) * 3, "units")
+
+
+class InfiniteScroll:
+    """Appends pages to a scrollable list as its canvas nears the bottom
+
+    fetch_page(token) returns (rows, next_token) like the keyset page APIs
+    (next_token None on the last page); render_row(row) adds one row's
+    widgets. Takes over the canvas's yscrollcommand and forwards it to the
+    scrollbar, so a page is fetched only when the user scrolls towards it.
+    """
+    
+    def __init__(self, canvas, scrollbar, fetch_page, render_row, first_page=None, threshold=0.9):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.fetch_page = fetch_page
+        self.render_row = render_row
+        self.threshold = threshold
+        self.next_token = None
+        self.exhausted = False
+        self._pending = None
+        self.stats = {'pages': 0, 'rows': 0}
+        canvas.configure(yscrollcommand=self._on_scroll)
+        
+        if first_page is not None:
+            self._render(*first_page)
+        else:
+            self.load_more()
+    
+    def load_more(self):
+        """Fetch and render the next page (no-op after the last page)"""
+        self._pending = None
+        if self.exhausted or not self.canvas.winfo_exists():
+            return
+        try:
+            rows, next_token = self.fetch_page(self.next_token)
+        except Exception as e:
+            print(f"Error loading next page: {e}")
+            self.exhausted = True
+            return
+        self._render(rows, next_token)
+    
+    def _render(self, rows, next_token):
+        for row in rows:
+            self.render_row(row)
+        self.next_token = next_token
+        self.exhausted = next_token is None
+        self.stats['pages'] += 1
+        self.stats['rows'] += len(rows)
+    
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # Also fires when a short page does not fill the view (last == 1.0)
+        if float(last) >= self.threshold and not self.exhausted and self._pending is None:
+            self._pending = self.canvas.after_idle(self.load_more)
@@ -0,0 +1,216 @@
+"""
+UI Profiler - Tk main-loop stall probe and per-screen render timings
+A heartbeat after() measures how late the event loop runs it (a stall is
+the UI being frozen); each show_* screen transition is split into data
+fetch (time holding DB connections), widget build and first paint, with the
+screen's widget count. Optionally a cProfile capture per transition is
+dumped as a .prof file (pstats, snakeviz).
+Off unless GROCERY_UI_PROFILE=1.
+"""
+import cProfile
+import functools
+import os
+import re
+import statistics
+import time
+from collections import deque
+
+from config.db_pool import thread_db_seconds
+
+
+class UIProfiler:
+    """Heartbeat stall probe plus screen transition timings for one Tk root
+
+    - heartbeat_ms: probe interval; the probe's lateness is the loop stall
+    - stall_ms: stalls at least this long are kept (and printed) with their screen
+    - profile_dir: when set, each transition is captured with cProfile and
+      dumped there as <n>_<screen>.prof
+    """
+
+    def __init__(self, root, heartbeat_ms=50, stall_ms=200, profile_dir=None):
+        self.root = root
+        self.heartbeat_ms = heartbeat_ms
+        self.stall_ms = stall_ms
+        self.profile_dir = profile_dir
+        self.screen = None
+        self._lags = deque(maxlen=5000)  # ms late, every heartbeat
+        self._stalls = deque(maxlen=500)  # (screen, ms)
+        self._screens = {}  # screen -> list of transition dicts
+        self._transition = None  # measured until its first paint
+        self._depth = 0
+        self._captures = 0
+        self._expected = None
+        self._heartbeat = None
+
+    # ==================== SETUP ====================
+
+    def instrument(self, app):
+        """Wrap every show_* method of app so each call is timed as a screen transition
+
+        Methods are looked up when called, so lazily imported screens stay
+        lazy (their import counts towards the first visit's build time).
+        """
+        for name in dir(app):
+            if name.startswith('show_'):
+                setattr(app, name, self._wrap(name[len('show_'):], self._resolver(app, name)))
+
+    @staticmethod
+    def _resolver(app, name):
+        cls = type(app)
+        if name in vars(cls):
+            return getattr(cls, name).__get__(app)
+        return lambda *args, **kwargs: cls.__getattr__(app, name)(*args, **kwargs)
+
+    def start(self):
+        """Start the heartbeat probe"""
+        if self._heartbeat is None:
+            self._expected = time.perf_counter() + self.heartbeat_ms / 1000
+            self._heartbeat = self.root.after(self.heartbeat_ms, self._beat)
+
+    def stop(self):
+        if self._heartbeat is not None:
+            self.root.after_cancel(self._heartbeat)
+            self._heartbeat = None
+        self._finish_transition()
+
+    # ==================== HEARTBEAT ====================
+
+    def _beat(self):
+        now = time.perf_counter()
+        lag = max(0.0, (now - self._expected) * 1000)
+        self._lags.append(lag)
+        if lag >= self.stall_ms:
+            self._stalls.append((self.screen, lag))
+            print(f"UI stall: main loop blocked {lag:.0f} ms (screen {self.screen})")
+        self._expected = now + self.heartbeat_ms / 1000
+        self._heartbeat = self.root.after(self.heartbeat_ms, self._beat)
+
+    # ==================== SCREEN TRANSITIONS ====================
+
+    def _wrap(self, screen, show):
+        @functools.wraps(show)
+        def timed(*args, **kwargs):
+            if self._depth:  # a screen that hands over to another one
+                return show(*args, **kwargs)
+            self._begin(screen)
+            self._depth += 1
+            try:
+                return show(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                self._built()
+        return timed
+
+    def _begin(self, screen):
+        self._finish_transition()  # the previous screen never got to paint
+        self.screen = screen
+        profile = None
+        if self.profile_dir:
+            profile = cProfile.Profile()
+            profile.enable()
+        self._transition = {
+            'screen': screen,
+            'started': time.perf_counter(),
+            'db_started': thread_db_seconds(),
+            'profile': profile,
+        }
+
+    def _built(self):
+        transition = self._transition
+        if transition is None:
+            return
+        now = time.perf_counter()
+        fetch = (thread_db_seconds() - transition['db_started']) * 1000
+        total = (now - transition['started']) * 1000
+        transition['fetch_ms'] = fetch
+        transition['build_ms'] = max(0.0, total - fetch)
+        transition['built_at'] = now
+        # Idle callbacks run in order, so this one runs after the pending redraws
+        self.root.after_idle(lambda: self._painted(transition))
+
+    def _painted(self, transition):
+        if transition is not self._transition:
+            return
+        transition['paint_ms'] = (time.perf_counter() - transition['built_at']) * 1000
+        self._finish_transition()
+
+    def _finish_transition(self):
+        transition, self._transition = self._transition, None
+        if transition is None or 'built_at' not in transition:
+            return
+        profile = transition.pop('profile')
+        if profile is not None:
+            profile.disable()
+            self._dump(profile, transition['screen'])
+        transition.setdefault('paint_ms', None)  # replaced before it painted
+        transition['widgets'] = self.count_widgets(self.root)
+        self._screens.setdefault(transition['screen'], []).append(transition)
+
+    def _dump(self, profile, screen):
+        self._captures += 1
+        os.makedirs(self.profile_dir, exist_ok=True)
+        name = re.sub(r'\W+', '_', screen)
+        path = os.path.join(self.profile_dir, f"{self._captures:04d}_{name}.prof")
+        profile.dump_stats(path)
+
+    @staticmethod
+    def count_widgets(widget):
+        """Widgets in the tree under (and including) widget"""
+        count, stack = 0, [widget]
+        while stack:
+            current = stack.pop()
+            count += 1
+            stack.extend(current.winfo_children())
+        return count
+
+    # ==================== REPORTS ====================
+
+    def loop_stats(self):
+        """Heartbeat lateness: p50/p99/max in ms and the kept stalls"""
+        lags = sorted(self._lags)
+        if not lags:
+            return {'beats': 0, 'p50': 0.0, 'p99': 0.0, 'max': 0.0, 'stalls': list(self._stalls)}
+        return {
+            'beats': len(lags),
+            'p50': lags[len(lags) // 2],
+            'p99': lags[min(len(lags) - 1, int(len(lags) * 0.99))],
+            'max': lags[-1],
+            'stalls': list(self._stalls),
+        }
+
+    def screen_stats(self):
+        """{screen: {'visits', 'fetch_ms', 'build_ms', 'paint_ms', 'widgets', 'widgets_max'}} (medians)"""
+        stats = {}
+        for screen, transitions in self._screens.items():
+            painted = [t['paint_ms'] for t in transitions if t['paint_ms'] is not None]
+            stats[screen] = {
+                'visits': len(transitions),
+                'fetch_ms': statistics.median(t['fetch_ms'] for t in transitions),
+                'build_ms': statistics.median(t['build_ms'] for t in transitions),
+                'paint_ms': statistics.median(painted) if painted else None,
+                'widgets': transitions[-1]['widgets'],
+                'widgets_max': max(t['widgets'] for t in transitions),
+            }
+        return stats
+
+    def format_report(self):
+        loop = self.loop_stats()
+        lines = [f"Main loop: {loop['beats']} heartbeats, late p50 {loop['p50']:.1f} ms, "
+                 f"p99 {loop['p99']:.1f} ms, max {loop['max']:.1f} ms, "
+                 f"{len(loop['stalls'])} stall(s) >= {self.stall_ms} ms"]
+        stalls_by_screen = {}
+        for screen, lag in loop['stalls']:
+            stalls_by_screen.setdefault(screen, []).append(lag)
+        lines.append(f"{'screen':<28}{'visits':>7}{'fetch':>9}{'build':>9}{'paint':>9}"
+                     f"{'widgets':>9}{'max':>7}{'stalls':>8}")
+        screens = sorted(self.screen_stats().items(),
+                         key=lambda item: item[1]['fetch_ms'] + item[1]['build_ms'], reverse=True)
+        for screen, figures in screens:
+            paint = '-' if figures['paint_ms'] is None else f"{figures['paint_ms']:.1f}"
+            lines.append(f"{screen:<28}{figures['visits']:>7}{figures['fetch_ms']:>9.1f}"
+                         f"{figures['build_ms']:>9.1f}{paint:>9}{figures['widgets']:>9}"
+                         f"{figures['widgets_max']:>7}{len(stalls_by_screen.get(screen, [])):>8}")
+        lines.append("(median milliseconds per visit; fetch = time holding DB connections)")
+        if self.profile_dir and self._captures:
+            lines.append(f"{self._captures} cProfile capture(s) in {self.profile_dir}")
+        return '\n'.join(lines)
@@ -0,0 +1,4 @@
+"""
+Jobs Package - Maintenance jobs run from cron or by hand
+Each module is runnable with `python -m jobs.<name>`
+"""
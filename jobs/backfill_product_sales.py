@@ -0,0 +1,47 @@
+"""
+Product Sales Backfill - Rebuild the product_sales and product_sales_daily
+rollups from the full order history, a batch of orders per transaction.
+
+Run once after creating the tables, or whenever the rollups are suspected
+to be off; run with --refresh nightly to roll the 7/30-day windows forward
+(readers also do this lazily on the first read of the day).
+
+Usage:
+    python -m jobs.backfill_product_sales                 # full rebuild
+    python -m jobs.backfill_product_sales --batch 20000
+    python -m jobs.backfill_product_sales --refresh       # windows only
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.sales_service import SalesService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--batch', type=int, default=SalesService.BACKFILL_BATCH_ORDERS,
+                        help="orders replayed per transaction")
+    parser.add_argument('--refresh', action='store_true',
+                        help="only recompute the 7/30-day windows")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.refresh:
+        refreshed = SalesService.refresh_windows(force=True)
+        print(f"Refreshed sales windows for {refreshed} products in {time.perf_counter() - start:.2f}s")
+        return 0
+
+    def progress(done, total):
+        print(f"  replayed orders up to #{done} of #{total}")
+
+    orders = SalesService.backfill(batch_orders=args.batch, progress=progress)
+    print(f"Backfilled sales rollups from {orders} orders in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
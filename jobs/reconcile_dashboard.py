@@ -0,0 +1,51 @@
+"""
+Dashboard Reconciliation - Recompute the admin dashboard summary from the
+products and inventory tables, report any drift from the maintained
+dashboard_expiry_summary and rebuild it.
+
+Drift means a write bypassed the service layer (manual SQL, the legacy
+models package); run nightly, or once after creating the table.
+
+Usage:
+    python -m jobs.reconcile_dashboard             # report drift and fix it
+    python -m jobs.reconcile_dashboard --check     # report only, exit 1 on drift
+    python -m jobs.reconcile_dashboard --rebuild   # rebuild unconditionally
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.dashboard_service import DashboardService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--check', action='store_true', help="report drift without fixing it")
+    group.add_argument('--rebuild', action='store_true', help="rebuild without comparing")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        DashboardService.rebuild()
+        print("Dashboard summary rebuilt")
+        return 0
+
+    drift = DashboardService.reconcile(fix=not args.check)
+    if not drift:
+        print("Dashboard summary is in sync")
+        return 0
+
+    print(f"{'source':<10} {'expiry':<11} {'summary (items/units/value)':>30} {'actual':>30}")
+    for source, expiry_date, have, want in drift:
+        print(f"{source:<10} {expiry_date:<11} {'/'.join(map(str, have)):>30} {'/'.join(map(str, want)):>30}")
+    if args.check:
+        print(f"{len(drift)} bucket(s) out of sync")
+        return 1
+    print(f"{len(drift)} bucket(s) out of sync - summary rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 """Inventory Model - Stock management with batch tracking and expiry dates
 """
-from datetime import datetime, date
+from datetime import date
 
 try:
     from config.db_config import connect_db
@@ -9,35 +9,10 @@ except ImportError:
 
 def add_inventory_batch(product_id, quantity_received, purchase_price, supplier_name, 
                        received_date, expiry_date, added_by_staff_id, batch_number='', notes=''):
-    """Add new inventory batch (Admin only)"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    # Generate batch number if not provided
-    if not batch_number:
-        batch_number = f"BATCH-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    
-    query = """
-        INSERT INTO inventory (product_id, batch_number, quantity_received, quantity_remaining,
-                              purchase_price, supplier_name, received_date, expiry_date, 
-                              added_by, notes)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
-    cursor.execute(query, (product_id, batch_number, quantity_received, quantity_received,
-                          purchase_price, supplier_name, received_date, expiry_date, 
-                          added_by_staff_id, notes))
-    
-    # Update product stock
-    cursor.execute("""
-        UPDATE products 
-        SET stock_quantity = stock_quantity + %s 
-        WHERE product_id = %s
-    """, (quantity_received, product_id))
-    
-    db.commit()
-    inventory_id = cursor.lastrowid
-    db.close()
-    return inventory_id
+    """Add new inventory batch (Admin only; keeps the dashboard summary current)"""
+    from services.inventory_service import InventoryService
+    return InventoryService.add_inventory_batch(product_id, quantity_received, purchase_price, supplier_name,
+                                                received_date, expiry_date, added_by_staff_id, batch_number, notes)
 
 def get_product_inventory(product_id):
     """Get all inventory batches for a product"""
@@ -117,19 +92,9 @@ def get_expired_inventory():
     return batches
 
 def update_inventory_quantity(inventory_id, quantity_change):
-    """Update inventory batch quantity"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    cursor.execute("""
-        UPDATE inventory 
-        SET quantity_remaining = quantity_remaining + %s 
-        WHERE inventory_id = %s
-    """, (quantity_change, inventory_id))
-    
-    db.commit()
-    db.close()
-    return True
+    """Update inventory batch quantity (keeps the dashboard summary current)"""
+    from services.inventory_service import InventoryService
+    return InventoryService.update_inventory_quantity(inventory_id, quantity_change)
 
 def get_inventory_stats():
     """Get inventory statistics"""
@@ -172,38 +137,6 @@ def get_inventory_stats():
     return stats
 
 def dispose_expired_inventory(inventory_id):
-    """Mark expired inventory as disposed"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    # Get product_id and quantity
-    cursor.execute("""
-        SELECT product_id, quantity_remaining 
-        FROM inventory 
-        WHERE inventory_id = %s
-    """, (inventory_id,))
-    result = cursor.fetchone()
-    
-    if result:
-        product_id, quantity = result
-        
-        # Update inventory to 0
-        cursor.execute("""
-            UPDATE inventory 
-            SET quantity_remaining = 0, notes = CONCAT(IFNULL(notes, ''), ' [DISPOSED ON ', CURDATE(), ']')
-            WHERE inventory_id = %s
-        """, (inventory_id,))
-        
-        # Update product stock
-        cursor.execute("""
-            UPDATE products 
-            SET stock_quantity = stock_quantity - %s 
-            WHERE product_id = %s
-        """, (quantity, product_id))
-        
-        db.commit()
-        db.close()
-        return True
-    
-    db.close()
-    return False
+    """Mark expired inventory as disposed (keeps the dashboard summary current)"""
+    from services.inventory_service import InventoryService
+    return InventoryService.dispose_expired_inventory(inventory_id)
@@ -118,79 +118,9 @@ def get_cart_total(user_id):
 # ==================== ORDER FUNCTIONS ====================
 
 def place_order(user_id, delivery_address, delivery_phone, payment_method='cash'):
-    """Place order from cart"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    # Get cart items
-    cursor.execute("""
-        SELECT sc.product_id, sc.quantity, p.unit_price, p.stock_quantity
-        FROM shopping_cart sc
-        JOIN products p ON sc.product_id = p.product_id
-        WHERE sc.user_id = %s
-    """, (user_id,))
-    cart_items = cursor.fetchall()
-    
-    if not cart_items:
-        db.close()
-        return False, "Cart is empty"
-    
-    # Check stock for all items
-    for product_id, quantity, price, stock in cart_items:
-        if stock < quantity:
-            db.close()
-            return False, f"Insufficient stock for product ID {product_id}"
-    
-    # Calculate total
-    total_amount = sum(item[1] * item[2] for item in cart_items)
-    final_amount = total_amount  # Same as total since no discounts
-    
-    # Generate order number
-    order_number = f"ORD-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    
-    # Create order
-    cursor.execute("""
-        INSERT INTO orders (user_id, order_number, total_amount, final_amount,
-                           payment_method, delivery_address, delivery_phone, order_status)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, 'pending')
-    """, (user_id, order_number, total_amount, final_amount,
-          payment_method, delivery_address, delivery_phone))
-    
-    order_id = cursor.lastrowid
-    
-    # Add order items and update stock
-    for product_id, quantity, price, stock, *rest in cart_items:
-        # Get product name
-        cursor.execute("SELECT name FROM products WHERE product_id = %s", (product_id,))
-        product_name = cursor.fetchone()[0]
-        
-        subtotal = quantity * price
-        
-        cursor.execute("""
-            INSERT INTO order_items (order_id, product_id, product_name, quantity, 
-                                   unit_price, subtotal)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (order_id, product_id, product_name, quantity, price, subtotal))
-        
-        # Update stock
-        cursor.execute("""
-            UPDATE products 
-            SET stock_quantity = stock_quantity - %s 
-            WHERE product_id = %s
-        """, (quantity, product_id))
-    
-    # Create notification
-    create_notification(cursor, user_id, 'order_placed', 
-                       'Order Placed Successfully!',
-                       f'Your order {order_number} has been placed successfully. Total: ₹{final_amount:.2f}',
-                       order_id)
-    
-    # Clear cart
-    cursor.execute("DELETE FROM shopping_cart WHERE user_id = %s", (user_id,))
-    
-    db.commit()
-    db.close()
-    return True, f"Order {order_number} placed successfully!"
+    """Place order from cart (OrderService checkout: stock locking, sales rollups and dashboard summary)"""
+    from services.order_service import OrderService
+    return OrderService.place_order(user_id, delivery_address, delivery_phone, payment_method)
 
 def get_user_orders(user_id, limit=None):
     """Get user's order history"""
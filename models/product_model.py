@@ -50,25 +50,9 @@ def get_products_by_category(category_id=None):
     return products
 
 def search_products(search_term):
-    """Search products by name or description"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    query = """
-        SELECT p.product_id, p.name, p.description, p.image_path, 
-               p.unit_price, p.unit, p.stock_quantity, p.is_available,
-               p.discount_percent, c.category_name
-        FROM products p
-        JOIN categories c ON p.category_id = c.category_id
-        WHERE (p.name LIKE %s OR p.description LIKE %s) 
-        AND p.is_available = TRUE
-        ORDER BY p.name
-    """
-    search_pattern = f"%{search_term}%"
-    cursor.execute(query, (search_pattern, search_pattern))
-    products = cursor.fetchall()
-    db.close()
-    return products
+    """Search products by name or description (shared ranked search index)"""
+    from services.product_service import ProductService
+    return ProductService.search_products(search_term)
 
 def get_product_details(product_id):
     """Get detailed information about a product"""
@@ -90,81 +74,26 @@ def get_product_details(product_id):
     return product
 
 def add_product(name, category_id, description, image_path, unit_price, unit, stock_quantity, min_stock_level=5):
-    """Add a new product (Admin only)"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    # DEBUG: Print exactly what we're inserting
-    print(f"\n{'='*80}")
-    print(f"add_product() called with parameters:")
-    print(f"  name: {name}")
-    print(f"  category_id: {category_id}")
-    print(f"  description: {description[:50] if description else None}...")
-    print(f"  image_path: '{image_path}' (type: {type(image_path).__name__}, is None: {image_path is None})")
-    print(f"  unit_price: {unit_price}")
-    print(f"  unit: {unit}")
-    print(f"  stock_quantity: {stock_quantity}")
-    print(f"  min_stock_level: {min_stock_level}")
-    print(f"{'='*80}\n")
-    
-    query = """
-        INSERT INTO products (name, category_id, description, image_path, 
-                            unit_price, unit, stock_quantity, min_stock_level, is_available)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, TRUE)
-    """
-    
-    values = (name, category_id, description, image_path, 
-              unit_price, unit, stock_quantity, min_stock_level)
-    
-    print(f"Executing SQL with values: {values}")
-    
-    cursor.execute(query, values)
-    db.commit()
-    product_id = cursor.lastrowid
-    
-    # Verify what was actually saved
-    cursor.execute("SELECT image_path FROM products WHERE product_id = %s", (product_id,))
-    saved_image = cursor.fetchone()[0]
-    print(f"✓ Product {product_id} created. Verified image_path in DB: '{saved_image}'")
-    
-    db.close()
-    return product_id
+    """Add a new product (Admin only; refreshes the catalog cache and search index)"""
+    from services.product_service import ProductService
+    return ProductService.add_product(name, category_id, description, image_path, unit_price, unit,
+                                      stock_quantity, min_stock_level)
 
 def update_product(product_id, name, category_id, description, image_path, unit_price, unit, stock_quantity, min_stock_level):
-    """Update product details (Admin only)"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    query = """
-        UPDATE products 
-        SET name = %s, category_id = %s, description = %s, image_path = %s,
-            unit_price = %s, unit = %s, stock_quantity = %s, min_stock_level = %s
-        WHERE product_id = %s
-    """
-    cursor.execute(query, (name, category_id, description, image_path, 
-                          unit_price, unit, stock_quantity, min_stock_level, product_id))
-    db.commit()
-    db.close()
-    return True
+    """Update product details (Admin only; refreshes the catalog cache and search index)"""
+    from services.product_service import ProductService
+    return ProductService.update_product(product_id, name, category_id, description, image_path, unit_price,
+                                         unit, stock_quantity, min_stock_level)
 
 def delete_product(product_id):
-    """Delete a product (Admin only)"""
-    db = connect_db()
-    cursor = db.cursor()
-    cursor.execute("DELETE FROM products WHERE product_id = %s", (product_id,))
-    db.commit()
-    db.close()
-    return True
+    """Delete a product (Admin only; refreshes the catalog cache and search index)"""
+    from services.product_service import ProductService
+    return ProductService.delete_product(product_id)
 
 def toggle_product_availability(product_id, is_available):
-    """Enable/disable product (Admin only)"""
-    db = connect_db()
-    cursor = db.cursor()
-    cursor.execute("UPDATE products SET is_available = %s WHERE product_id = %s", 
-                  (is_available, product_id))
-    db.commit()
-    db.close()
-    return True
+    """Enable/disable product (Admin only; refreshes the catalog cache and search index)"""
+    from services.product_service import ProductService
+    return ProductService.toggle_product_availability(product_id, is_available)
 
 def get_low_stock_products():
     """Get products with stock below minimum level"""
@@ -176,17 +105,9 @@ def get_low_stock_products():
     return products
 
 def update_product_stock(product_id, quantity_change):
-    """Update product stock quantity"""
-    db = connect_db()
-    cursor = db.cursor()
-    cursor.execute("""
-        UPDATE products 
-        SET stock_quantity = stock_quantity + %s 
-        WHERE product_id = %s
-    """, (quantity_change, product_id))
-    db.commit()
-    db.close()
-    return True
+    """Update product stock quantity (keeps the dashboard summary current)"""
+    from services.product_service import ProductService
+    return ProductService.update_product_stock(product_id, quantity_change)
 
 def calculate_discounted_price(unit_price, discount_percent):
     """Calculate final price after discount"""
@@ -292,15 +213,9 @@ def get_expired_items():
     return items
 
 def remove_expired_item(product_id):
-    """Remove/delete expired item from inventory by setting stock to 0"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    query = "UPDATE products SET stock_quantity = 0 WHERE product_id = %s"
-    cursor.execute(query, (product_id,))
-    db.commit()
-    db.close()
-    return True
+    """Remove/delete expired item from inventory by setting stock to 0 (keeps the dashboard summary current)"""
+    from services.product_service import ProductService
+    return ProductService.remove_expired_item(product_id)
 
 def get_inventory_by_category():
     """Get all items grouped by category with stock details"""
@@ -389,44 +304,12 @@ def get_product_by_id_full(product_id):
     db.close()
     return product
 
-def update_product_details(product_id, name, price, stock, unit, expiry_date, manufactured_date):
-    """Update product details - manufactured_date is not updated (only expiry_date can change)"""
-    db = connect_db()
-    cursor = db.cursor()
-    
-    query = """
-        UPDATE products 
-        SET name = %s, unit_price = %s, stock_quantity = %s, unit = %s, 
-            expiry_date = %s
-        WHERE product_id = %s
-    """
-    cursor.execute(query, (name, price, stock, unit, expiry_date, product_id))
-    db.commit()
-    db.close()
-    return True
-
-
-def delete_product_by_id(product_id):
-    """Delete product from inventory by setting is_available to FALSE"""
-    try:
-        db = connect_db()
-        cursor = db.cursor()
-        
-        query = "UPDATE products SET is_available = FALSE WHERE product_id = %s"
-        cursor.execute(query, (product_id,))
-        db.commit()
-        db.close()
-        print(f"✓ Product {product_id} deleted successfully (is_available set to FALSE)")
-        return True
-    except Exception as e:
-        print(f"✗ Error deleting product {product_id}: {str(e)}")
-        return False
-
-
 # Wrapper functions for compatibility with modern_app.py
 def update_product_details(product_id, name, category_id, description, image_path, unit_price, unit, stock_quantity, min_stock_level):
-    """Wrapper for update_product - updates product details"""
-    return update_product(product_id, name, category_id, description, image_path, unit_price, unit, stock_quantity, min_stock_level)
+    """Wrapper for update_product - updates product details (keeps the dashboard summary current)"""
+    from services.product_service import ProductService
+    return ProductService.update_product_details(product_id, name, category_id, description, image_path,
+                                                 unit_price, unit, stock_quantity, min_stock_level)
 
 def delete_product_by_id(product_id):
     """Wrapper for delete_product - deletes product by ID"""
@@ -9,6 +9,9 @@ from .order_service import OrderService
 from .inventory_service import InventoryService
 from .image_service import ImageService
 from .payment_service import PaymentService
+from .dashboard_service import DashboardService
+from .sales_service import SalesService
+from .cart_session import CartSession
 
 __all__ = [
     'UserService',
@@ -16,5 +19,8 @@ __all__ = [
     'OrderService',
     'InventoryService',
     'ImageService',
-    'PaymentService'
+    'PaymentService',
+    'DashboardService',
+    'SalesService',
+    'CartSession'
 ]
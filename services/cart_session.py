@@ -0,0 +1,274 @@
+"""
+Cart Session - In-memory shopping cart for a logged-in customer
+Reads are served locally and quantity changes are coalesced, then written
+to shopping_cart in one batch; a local journal makes unsaved changes
+survive a crash
+"""
+import json
+import os
+from collections import OrderedDict
+
+try:
+    from config.db_config import connect_db
+except ImportError:
+    from db_config import connect_db
+
+
+class CartSession:
+    """Write-behind cart for one user
+
+    Every change is first appended (and fsynced) to a per-user journal of
+    absolute quantities, then applied in memory. flush() writes all pending
+    lines with one INSERT ... ON DUPLICATE KEY UPDATE (plus one DELETE for
+    removed lines) and truncates the journal once committed. Replaying the
+    journal is idempotent, so open() recovers whatever a crash left behind.
+
+    The GUI calls flush() when idle, before checkout and on logout/exit.
+    """
+
+    FLUSH_IDLE_MS = 1500
+    JOURNAL_DIR = os.environ.get(
+        'GROCERY_CART_JOURNAL_DIR',
+        os.path.join(os.path.expanduser('~'), '.buyme_grocery', 'cart')
+    )
+
+    def __init__(self, user_id, journal_dir=None):
+        self.user_id = user_id
+        self.journal_dir = journal_dir or CartSession.JOURNAL_DIR
+        self.journal_path = os.path.join(self.journal_dir, f"cart-{user_id}.jsonl")
+        # product_id -> [cart_id, name, image_path, unit_price, quantity, stock, discount], newest first
+        self._lines = OrderedDict()
+        self._pending = {}  # product_id -> quantity to write (0 = delete)
+        self._journal = None
+
+    @classmethod
+    def open(cls, user_id, journal_dir=None):
+        """Session for user_id, with any changes a previous crash left unsaved recovered"""
+        session = cls(user_id, journal_dir)
+        session._pending = session._read_journal()
+        if session._pending:
+            session.flush()
+        session.reload()
+        return session
+
+    # ==================== READS (LOCAL) ====================
+
+    def items(self):
+        """Cart lines shaped like OrderService.get_cart_items()
+
+        (cart_id, product_id, name, image_path, unit_price, quantity, subtotal,
+        stock, discount); cart_id is None for lines not yet written.
+        """
+        return [
+            (cart_id, product_id, name, image_path, unit_price, quantity,
+             unit_price * quantity, stock, discount)
+            for product_id, (cart_id, name, image_path, unit_price, quantity, stock, discount)
+            in self._lines.items()
+        ]
+
+    def quantity(self, product_id):
+        """Quantity of product_id in the cart (0 if absent)"""
+        line = self._lines.get(product_id)
+        return line[4] if line else 0
+
+    def total(self):
+        """Cart total amount"""
+        return sum(line[3] * line[4] for line in self._lines.values())
+
+    def __len__(self):
+        return len(self._lines)
+
+    @property
+    def has_pending(self):
+        """True while changes are waiting to be flushed"""
+        return bool(self._pending)
+
+    # ==================== CHANGES ====================
+
+    def add(self, product_id, quantity):
+        """Add quantity of a product; returns (success, message)"""
+        line = self._lines.get(product_id)
+        if line is None:
+            details = self._fetch_products([product_id]).get(product_id)
+            if details is None:
+                return False, "Product not found"
+            line = [None, *details[:3], 0, *details[3:]]
+        new_quantity = line[4] + quantity
+        if line[5] < new_quantity:
+            return False, "Insufficient stock"
+        line[4] = new_quantity
+        self._lines[product_id] = line
+        self._lines.move_to_end(product_id, last=False)
+        self._record(product_id, new_quantity)
+        return True, "Added to cart"
+
+    def set_quantity(self, product_id, quantity):
+        """Set a line's quantity; 0 or less removes it"""
+        if product_id not in self._lines:
+            return False
+        if quantity <= 0:
+            return self.remove(product_id)
+        self._lines[product_id][4] = quantity
+        self._record(product_id, quantity)
+        return True
+
+    def remove(self, product_id):
+        """Remove a line from the cart"""
+        if self._lines.pop(product_id, None) is None:
+            return False
+        self._record(product_id, 0)
+        return True
+
+    def _record(self, product_id, quantity):
+        # Journal first: a change is only pending once it would survive a crash
+        if self._journal is None:
+            os.makedirs(self.journal_dir, exist_ok=True)
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        self._journal.write(json.dumps([product_id, quantity]) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._pending[product_id] = quantity
+
+    # ==================== WRITE-BEHIND ====================
+
+    def flush(self):
+        """Write pending changes in one transaction; returns True when nothing is left pending"""
+        if not self._pending:
+            return True
+        upserts = [(pid, qty) for pid, qty in self._pending.items() if qty > 0]
+        deletes = [pid for pid, qty in self._pending.items() if qty <= 0]
+
+        db = connect_db()
+        cursor = db.cursor()
+        try:
+            if upserts:
+                # Through products, so a line whose product was deleted since
+                # is skipped instead of failing the whole batch on the FK
+                cases = ' '.join(['WHEN %s THEN %s'] * len(upserts))
+                placeholders = ', '.join(['%s'] * len(upserts))
+                params = [self.user_id]
+                for product_id, quantity in upserts:
+                    params.extend((product_id, quantity))
+                params.extend(product_id for product_id, _ in upserts)
+                cursor.execute(f"""
+                    INSERT INTO shopping_cart (user_id, product_id, quantity)
+                    SELECT %s, p.product_id, CASE p.product_id {cases} END
+                    FROM products p
+                    WHERE p.product_id IN ({placeholders})
+                    ON DUPLICATE KEY UPDATE quantity = VALUES(quantity)
+                """, tuple(params))
+            if deletes:
+                placeholders = ', '.join(['%s'] * len(deletes))
+                cursor.execute(f"""
+                    DELETE FROM shopping_cart
+                    WHERE user_id = %s AND product_id IN ({placeholders})
+                """, (self.user_id, *deletes))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Error saving cart: {e}")
+            return False
+        finally:
+            db.close()
+
+        self._pending.clear()
+        self._truncate_journal()
+        return True
+
+    def reload(self):
+        """Reload the cart from shopping_cart, keeping changes not yet flushed"""
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute("""
+            SELECT sc.cart_id, sc.product_id, p.name, p.image_path, p.unit_price,
+                   sc.quantity, p.stock_quantity, p.discount_percent
+            FROM shopping_cart sc
+            JOIN products p ON sc.product_id = p.product_id
+            WHERE sc.user_id = %s
+            ORDER BY sc.added_at DESC
+        """, (self.user_id,))
+        rows = cursor.fetchall()
+        db.close()
+
+        lines = OrderedDict(
+            (product_id, [cart_id, name, image_path, unit_price, quantity, stock, discount])
+            for cart_id, product_id, name, image_path, unit_price, quantity, stock, discount in rows
+        )
+        missing = [pid for pid, qty in self._pending.items() if qty > 0 and pid not in lines]
+        details = self._fetch_products(missing) if missing else {}
+        deleted = [pid for pid in missing if pid not in details]
+        if deleted:
+            # Products deleted since they were added can never be saved
+            for product_id in deleted:
+                del self._pending[product_id]
+            self._rewrite_journal()
+        for product_id, quantity in self._pending.items():
+            if quantity <= 0:
+                lines.pop(product_id, None)
+            elif product_id in lines:
+                lines[product_id][4] = quantity
+            elif product_id in details:
+                name, image_path, unit_price, stock, discount = details[product_id]
+                lines[product_id] = [None, name, image_path, unit_price, quantity, stock, discount]
+                lines.move_to_end(product_id, last=False)
+        self._lines = lines
+
+    def close(self):
+        """Flush and release the journal (logout / exit); returns flush()'s result"""
+        flushed = self.flush()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        return flushed
+
+    # ==================== HELPERS ====================
+
+    @staticmethod
+    def _fetch_products(product_ids):
+        """product_id -> (name, image_path, unit_price, stock, discount)"""
+        placeholders = ', '.join(['%s'] * len(product_ids))
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute(f"""
+            SELECT product_id, name, image_path, unit_price, stock_quantity, discount_percent
+            FROM products
+            WHERE product_id IN ({placeholders})
+        """, tuple(product_ids))
+        rows = cursor.fetchall()
+        db.close()
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    def _read_journal(self):
+        """Pending quantities left in the journal (last write per product wins)"""
+        pending = {}
+        try:
+            with open(self.journal_path, encoding='utf-8') as journal:
+                for line in journal:
+                    try:
+                        product_id, quantity = json.loads(line)
+                    except ValueError:
+                        break  # Torn final write from a crash
+                    pending[product_id] = quantity
+        except FileNotFoundError:
+            pass
+        return pending
+
+    def _rewrite_journal(self):
+        """Journal holding exactly the pending changes"""
+        self._truncate_journal()
+        if self._pending:
+            if self._journal is None:
+                os.makedirs(self.journal_dir, exist_ok=True)
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+            for product_id, quantity in self._pending.items():
+                self._journal.write(json.dumps([product_id, quantity]) + "\n")
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+
+    def _truncate_journal(self):
+        if self._journal is not None:
+            self._journal.truncate(0)
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        elif os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
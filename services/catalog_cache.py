@@ -0,0 +1,107 @@
+"""
+Catalog Cache - In-process cache for product catalog reads
+TTL + version-stamped entries; any catalog write bumps the version so
+every cached read is invalidated at once (write-through invalidation)
+"""
+import functools
+import os
+import threading
+import time
+
+
+class CatalogCache:
+    """Thread-safe TTL cache whose entries are tied to a catalog version"""
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> (value, version, stored_at)
+        self._version = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'invalidations': 0,
+            'stale_served_max': 0.0,   # oldest entry age (s) served on a hit
+            'stale_served_total': 0.0,
+        }
+
+    # ==================== READS ====================
+
+    def get_or_load(self, key, loader):
+        """Return the cached value for key, calling loader() on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, version, stored_at = entry
+                age = now - stored_at
+                if version == self._version and age < self.ttl:
+                    self._stats['hits'] += 1
+                    self._stats['stale_served_total'] += age
+                    self._stats['stale_served_max'] = max(self._stats['stale_served_max'], age)
+                    return value
+                if version == self._version:
+                    self._stats['expired'] += 1
+                del self._entries[key]
+            self._stats['misses'] += 1
+            version = self._version
+
+        value = loader()
+
+        with self._lock:
+            # Skip storing if a write landed while we were loading
+            if version == self._version:
+                self._entries[key] = (value, version, time.monotonic())
+        return value
+
+    def cached(self, func):
+        """Decorator: cache a read function keyed by its name and arguments"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            value = self.get_or_load(key, lambda: func(*args, **kwargs))
+            # Hand out a copy of row lists so callers cannot mutate the cached one
+            return list(value) if isinstance(value, list) else value
+        return wrapper
+
+    # ==================== INVALIDATION ====================
+
+    def invalidate(self):
+        """Bump the catalog version, invalidating every cached entry"""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._stats['invalidations'] += 1
+
+    def invalidates(self, func):
+        """Decorator: invalidate the cache after a catalog write"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.invalidate()
+        return wrapper
+
+    @property
+    def version(self):
+        return self._version
+
+    # ==================== STATISTICS ====================
+
+    def stats(self):
+        """Snapshot of hit ratio and staleness statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['version'] = self._version
+            stats['ttl'] = self.ttl
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        stats['stale_served_avg'] = stats['stale_served_total'] / stats['hits'] if stats['hits'] else 0.0
+        return stats
+
+
+# Shared cache for catalog reads (categories, product lists, product details)
+catalog_cache = CatalogCache(ttl=float(os.environ.get('GROCERY_CATALOG_CACHE_TTL', 300)))
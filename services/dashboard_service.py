@@ -0,0 +1,217 @@
+"""
+Dashboard Service - Admin dashboard statistics from a maintained summary
+Stock value, unit totals and item counts bucketed by expiry day, kept
+current by the product/inventory write paths and read in one query
+"""
+from contextlib import contextmanager
+
+try:
+    from config.db_config import connect_db
+except ImportError:
+    from db_config import connect_db
+
+
+class DashboardService:
+    """Service class for the dashboard_expiry_summary table
+
+    Each summary row holds the contribution of one source ('products' or
+    'inventory') to one expiry day. Writers retract the old contribution of
+    the rows they touch and add the new one inside their own transaction,
+    so the summary commits (or rolls back) together with the data.
+    """
+
+    NO_EXPIRY = '9999-12-31'   # bucket for rows without an expiry date
+    EXPIRING_DAYS = 7
+    SLOTS = 8                  # each bucket is split over slots to spread row-lock contention
+
+    # Per source: table, id column, row filter, quantity and value expressions
+    _SOURCES = {
+        'products': ('products', 'product_id',
+                     "is_available = TRUE AND stock_quantity > 0",
+                     "stock_quantity", "stock_quantity * unit_price"),
+        'inventory': ('inventory', 'inventory_id',
+                      "quantity_remaining > 0",
+                      "quantity_remaining", "quantity_remaining * purchase_price"),
+    }
+
+    # ==================== READS ====================
+
+    @staticmethod
+    def get_dashboard_stats():
+        """All dashboard figures for both sources in a single query
+
+        Returns {'products': {...}, 'inventory': {...}}, each with total_value,
+        total_units, total_items, expiring_soon and expired.
+        """
+        db = connect_db()
+        cursor = db.cursor()
+        # Products count as expiring from tomorrow, inventory batches from
+        # today (the windows the per-table queries have always used)
+        cursor.execute("""
+            SELECT source,
+                   SUM(stock_value), SUM(units), SUM(item_count),
+                   SUM(CASE WHEN expiry_date <= CURDATE() + INTERVAL %s DAY
+                             AND (expiry_date > CURDATE()
+                                  OR (source = 'inventory' AND expiry_date = CURDATE()))
+                            THEN item_count ELSE 0 END),
+                   SUM(CASE WHEN expiry_date < CURDATE() THEN item_count ELSE 0 END)
+            FROM dashboard_expiry_summary
+            GROUP BY source
+        """, (DashboardService.EXPIRING_DAYS,))
+        rows = cursor.fetchall()
+        db.close()
+
+        stats = {source: DashboardService._stats_dict() for source in DashboardService._SOURCES}
+        for source, value, units, items, expiring, expired in rows:
+            stats[source] = DashboardService._stats_dict(value, units, items, expiring, expired)
+        return stats
+
+    @staticmethod
+    def _stats_dict(value=0, units=0, items=0, expiring=0, expired=0):
+        return {
+            'total_value': value or 0,
+            'total_units': int(units or 0),
+            'total_items': int(items or 0),
+            'expiring_soon': int(expiring or 0),
+            'expired': int(expired or 0),
+        }
+
+    # ==================== WRITE-PATH MAINTENANCE ====================
+
+    @staticmethod
+    @contextmanager
+    def tracking(cursor, source, ids):
+        """Keep the summary right across a write to the given source rows
+
+            with DashboardService.tracking(cursor, 'products', [product_id]):
+                cursor.execute("UPDATE products ...")
+
+        Locks the rows, retracts their current contribution, runs the body
+        and adds the new contribution - all on the caller's transaction.
+        Deleted rows simply contribute nothing afterwards.
+        """
+        ids = sorted(set(ids))
+        if ids:
+            table, id_column = DashboardService._SOURCES[source][:2]
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f"""
+                SELECT {id_column} FROM {table}
+                WHERE {id_column} IN ({placeholders})
+                ORDER BY {id_column}
+                FOR UPDATE
+            """, tuple(ids))
+            cursor.fetchall()
+            DashboardService.apply(cursor, source, ids, -1)
+        yield
+        if ids:
+            DashboardService.apply(cursor, source, ids, +1)
+
+    @staticmethod
+    def apply(cursor, source, ids, sign=+1):
+        """Add (sign=+1) or retract (sign=-1) the contribution of rows to the summary"""
+        ids = list(ids)
+        if not ids:
+            return
+        table, id_column, row_filter, quantity, value = DashboardService._SOURCES[source]
+        placeholders = ', '.join(['%s'] * len(ids))
+        cursor.execute(f"""
+            INSERT INTO dashboard_expiry_summary
+                (source, expiry_date, slot, item_count, units, stock_value)
+            SELECT %s, COALESCE(expiry_date, %s), MOD(CONNECTION_ID(), %s),
+                   %s * COUNT(*), %s * SUM({quantity}), %s * SUM({value})
+            FROM {table}
+            WHERE {id_column} IN ({placeholders}) AND {row_filter}
+            GROUP BY COALESCE(expiry_date, %s)
+            ON DUPLICATE KEY UPDATE
+                item_count = item_count + VALUES(item_count),
+                units = units + VALUES(units),
+                stock_value = stock_value + VALUES(stock_value)
+        """, (source, DashboardService.NO_EXPIRY, DashboardService.SLOTS,
+              sign, sign, sign, *ids, DashboardService.NO_EXPIRY))
+
+    # ==================== RECONCILIATION ====================
+
+    @staticmethod
+    def _fresh_buckets(cursor):
+        """(source, expiry_date) -> (item_count, units, stock_value), computed from scratch"""
+        buckets = {}
+        for source, (table, _, row_filter, quantity, value) in DashboardService._SOURCES.items():
+            cursor.execute(f"""
+                SELECT COALESCE(expiry_date, %s), COUNT(*), SUM({quantity}), SUM({value})
+                FROM {table}
+                WHERE {row_filter}
+                GROUP BY COALESCE(expiry_date, %s)
+            """, (DashboardService.NO_EXPIRY, DashboardService.NO_EXPIRY))
+            for expiry_date, items, units, stock_value in cursor.fetchall():
+                buckets[(source, str(expiry_date))] = (int(items), int(units or 0), stock_value or 0)
+        return buckets
+
+    @staticmethod
+    def reconcile(fix=True):
+        """Compare the summary with a full recomputation; rebuild it if they differ
+
+        Returns the list of drifted buckets as
+        (source, expiry_date, summary (items, units, value), actual (items, units, value)).
+        """
+        db = connect_db()
+        cursor = db.cursor()
+        try:
+            cursor.execute("""
+                SELECT source, expiry_date, SUM(item_count), SUM(units), SUM(stock_value)
+                FROM dashboard_expiry_summary
+                GROUP BY source, expiry_date
+            """)
+            summary = {(source, str(expiry_date)): (int(items), int(units), value)
+                       for source, expiry_date, items, units, value in cursor.fetchall()
+                       if items or units or value}
+            actual = DashboardService._fresh_buckets(cursor)
+
+            drift = []
+            for key in sorted(set(summary) | set(actual)):
+                have = summary.get(key, (0, 0, 0))
+                want = actual.get(key, (0, 0, 0))
+                if have != want:
+                    drift.append((key[0], key[1], have, want))
+
+            if drift and fix:
+                DashboardService._rebuild(cursor)
+                db.commit()
+            else:
+                db.rollback()
+            return drift
+        except Exception as e:
+            db.rollback()
+            print(f"Error reconciling dashboard summary: {e}")
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def rebuild():
+        """Recompute the whole summary from the products and inventory tables"""
+        db = connect_db()
+        cursor = db.cursor()
+        try:
+            DashboardService._rebuild(cursor)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Error rebuilding dashboard summary: {e}")
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def _rebuild(cursor):
+        # INSERT ... SELECT share-locks the scanned rows, so writers wait
+        # for the rebuild to commit instead of racing it
+        cursor.execute("DELETE FROM dashboard_expiry_summary")
+        for source, (table, _, row_filter, quantity, value) in DashboardService._SOURCES.items():
+            cursor.execute(f"""
+                INSERT INTO dashboard_expiry_summary
+                    (source, expiry_date, slot, item_count, units, stock_value)
+                SELECT %s, COALESCE(expiry_date, %s), 0, COUNT(*), SUM({quantity}), SUM({value})
+                FROM {table}
+                WHERE {row_filter}
+                GROUP BY COALESCE(expiry_date, %s)
+            """, (source, DashboardService.NO_EXPIRY, DashboardService.NO_EXPIRY))
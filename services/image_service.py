@@ -5,7 +5,8 @@ Image loading, saving, and display for tkinter GUI
 import os
 import shutil
 from tkinter import filedialog
-from PIL import Image, ImageTk
+
+from .thumbnail_service import ThumbnailService
 
 
 class ImageService:
@@ -87,10 +88,16 @@ class ImageService:
         try:
             shutil.copy2(source_path, dest_path)
             print(f"Image copied: {source_path} -> {dest_filename}")
-            return dest_filename  # Return relative path
         except Exception as e:
             print(f"Error saving image: {e}")
             return None
+        
+        # Pre-generate card/detail thumbnails so the first render is cheap
+        try:
+            ThumbnailService.generate_thumbnails(dest_path)
+        except Exception as e:
+            print(f"Could not generate thumbnails for {dest_filename}: {e}")
+        return dest_filename  # Return relative path
 
     @staticmethod
     def delete_product_image(filename):
@@ -108,45 +115,62 @@ class ImageService:
 
     # ==================== IMAGE LOADING FOR DISPLAY ====================
     
+    @staticmethod
+    def resolve_image_path(image_path):
+        """Find the file for a stored image path (absolute, in IMAGE_DIR, or by basename)"""
+        if not image_path:
+            return None
+        # Try multiple path options
+        paths_to_try = [
+            image_path,  # As absolute path
+            os.path.join(ImageService.IMAGE_DIR, image_path),  # Relative to IMAGE_DIR
+        ]
+        # Try just the filename
+        if os.path.basename(image_path) != image_path:
+            paths_to_try.append(os.path.join(ImageService.IMAGE_DIR, os.path.basename(image_path)))
+        for path in paths_to_try:
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def load_pil_image(image_path, size=(100, 100)):
+        """Load image_path resized to size as a PIL image (grey placeholder if missing)"""
+        from PIL import Image  # Pillow is slow to import; load it on first use
+        path = ImageService.resolve_image_path(image_path)
+        img = ImageService.load_resized(path, size) if path else None
+        if img is None:
+            print(f"Could not load image: {image_path}, using placeholder")
+            img = Image.new('RGB', size, color='#E0E0E0')
+        return img
+
     @staticmethod
     def load_image_for_display(image_path, size=(100, 100)):
         """Load and resize image for tkinter display"""
+        from PIL import Image, ImageTk
         try:
-            # Try multiple path options
-            paths_to_try = []
-            
-            if image_path:
-                # Try as absolute path
-                paths_to_try.append(image_path)
-                # Try as relative path from IMAGE_DIR
-                paths_to_try.append(os.path.join(ImageService.IMAGE_DIR, image_path))
-                # Try just the filename
-                if os.path.basename(image_path) != image_path:
-                    paths_to_try.append(os.path.join(ImageService.IMAGE_DIR, os.path.basename(image_path)))
-            
-            img = None
-            for path in paths_to_try:
-                if os.path.exists(path):
-                    try:
-                        img = Image.open(path)
-                        break
-                    except Exception as e:
-                        print(f"Failed to open {path}: {e}")
-                        continue
-            
-            if img is None:
-                # Return placeholder
-                print(f"Could not load image: {image_path}, using placeholder")
-                img = Image.new('RGB', size, color='#E0E0E0')
-            
-            img = img.resize(size, Image.Resampling.LANCZOS)
-            return ImageTk.PhotoImage(img)
+            return ImageTk.PhotoImage(ImageService.load_pil_image(image_path, size))
         except Exception as e:
             print(f"Error loading image {image_path}: {e}")
             # Return placeholder
             img = Image.new('RGB', size, color='#E0E0E0')
             return ImageTk.PhotoImage(img)
 
+    @staticmethod
+    def load_resized(path, size):
+        """Get a PIL image resized to size, from the thumbnail cache when possible"""
+        from PIL import Image
+        try:
+            return ThumbnailService.get_thumbnail(path, size)
+        except Exception as e:
+            print(f"Thumbnail unavailable for {path}: {e}")
+        try:
+            with Image.open(path) as img:
+                return img.resize(size, Image.Resampling.LANCZOS)
+        except Exception as e:
+            print(f"Failed to open {path}: {e}")
+            return None
+
     @staticmethod
     def load_image_tk(image_path, size=(100, 100)):
         """Alias for load_image_for_display for backward compatibility"""
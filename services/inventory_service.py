@@ -2,13 +2,18 @@
 Inventory Service - Handles all inventory batch tracking and stock management
 Batch management, expiry date tracking, inventory statistics
 """
-from datetime import datetime, date
+from datetime import date
 
 try:
     from config.db_config import connect_db
 except ImportError:
     from db_config import connect_db
 
+from .catalog_cache import catalog_cache
+from .dashboard_service import DashboardService
+from .id_generator import new_batch_number
+from .pagination import clamp_page_size, decode_token, page_result, seek_condition
+
 
 class InventoryService:
     """Service class for inventory operations"""
@@ -16,6 +21,7 @@ class InventoryService:
     # ==================== BATCH MANAGEMENT ====================
     
     @staticmethod
+    @catalog_cache.invalidates
     def add_inventory_batch(product_id, quantity_received, purchase_price, supplier_name, 
                            received_date, expiry_date, added_by_staff_id, batch_number='', notes=''):
         """Add new inventory batch (Admin only)"""
@@ -24,7 +30,7 @@ class InventoryService:
         
         # Generate batch number if not provided
         if not batch_number:
-            batch_number = f"BATCH-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            batch_number = new_batch_number()
         
         query = """
             INSERT INTO inventory (product_id, batch_number, quantity_received, quantity_remaining,
@@ -35,16 +41,18 @@ class InventoryService:
         cursor.execute(query, (product_id, batch_number, quantity_received, quantity_received,
                               purchase_price, supplier_name, received_date, expiry_date, 
                               added_by_staff_id, notes))
+        inventory_id = cursor.lastrowid
+        DashboardService.apply(cursor, 'inventory', [inventory_id])
         
         # Update product stock
-        cursor.execute("""
-            UPDATE products 
-            SET stock_quantity = stock_quantity + %s 
-            WHERE product_id = %s
-        """, (quantity_received, product_id))
+        with DashboardService.tracking(cursor, 'products', [product_id]):
+            cursor.execute("""
+                UPDATE products 
+                SET stock_quantity = stock_quantity + %s 
+                WHERE product_id = %s
+            """, (quantity_received, product_id))
         
         db.commit()
-        inventory_id = cursor.lastrowid
         db.close()
         return inventory_id
 
@@ -87,17 +95,50 @@ class InventoryService:
         db.close()
         return batches
 
+    @staticmethod
+    def get_inventory_page(page_token=None, page_size=None):
+        """One page of inventory batches, soonest expiry first
+        
+        Keyset pagination on (expiry_date, inventory_id); batches without an
+        expiry date come first, as in get_all_inventory. Returns
+        (batches, next_token), next_token None on the last page.
+        """
+        page_size = clamp_page_size(page_size)
+        scope = ('inventory',)
+        where, params = '', []
+        if page_token:
+            where, params = seek_condition('i.expiry_date', 'i.inventory_id',
+                                           decode_token(page_token, scope), nullable=True)
+            where = f"WHERE {where}"
+        
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute(f"""
+            SELECT i.inventory_id, p.name, i.batch_number, i.quantity_received, 
+                   i.quantity_remaining, i.purchase_price, i.supplier_name, 
+                   i.received_date, i.expiry_date
+            FROM inventory i
+            JOIN products p ON i.product_id = p.product_id
+            {where}
+            ORDER BY i.expiry_date ASC, i.inventory_id ASC
+            LIMIT %s
+        """, (*params, page_size + 1))
+        batches = cursor.fetchall()
+        db.close()
+        return page_result(batches, page_size, scope, lambda row: (row[8], row[0]))
+
     @staticmethod
     def update_inventory_quantity(inventory_id, quantity_change):
         """Update inventory batch quantity"""
         db = connect_db()
         cursor = db.cursor()
         
-        cursor.execute("""
-            UPDATE inventory 
-            SET quantity_remaining = quantity_remaining + %s 
-            WHERE inventory_id = %s
-        """, (quantity_change, inventory_id))
+        with DashboardService.tracking(cursor, 'inventory', [inventory_id]):
+            cursor.execute("""
+                UPDATE inventory 
+                SET quantity_remaining = quantity_remaining + %s 
+                WHERE inventory_id = %s
+            """, (quantity_change, inventory_id))
         
         db.commit()
         db.close()
@@ -148,6 +189,7 @@ class InventoryService:
         return batches
 
     @staticmethod
+    @catalog_cache.invalidates
     def dispose_expired_inventory(inventory_id):
         """Mark expired inventory as disposed"""
         db = connect_db()
@@ -165,18 +207,20 @@ class InventoryService:
             product_id, quantity = result
             
             # Update inventory to 0
-            cursor.execute("""
-                UPDATE inventory 
-                SET quantity_remaining = 0, notes = CONCAT(IFNULL(notes, ''), ' [DISPOSED ON ', CURDATE(), ']')
-                WHERE inventory_id = %s
-            """, (inventory_id,))
+            with DashboardService.tracking(cursor, 'inventory', [inventory_id]):
+                cursor.execute("""
+                    UPDATE inventory 
+                    SET quantity_remaining = 0, notes = CONCAT(IFNULL(notes, ''), ' [DISPOSED ON ', CURDATE(), ']')
+                    WHERE inventory_id = %s
+                """, (inventory_id,))
             
             # Update product stock
-            cursor.execute("""
-                UPDATE products 
-                SET stock_quantity = stock_quantity - %s 
-                WHERE product_id = %s
-            """, (quantity, product_id))
+            with DashboardService.tracking(cursor, 'products', [product_id]):
+                cursor.execute("""
+                    UPDATE products 
+                    SET stock_quantity = stock_quantity - %s 
+                    WHERE product_id = %s
+                """, (quantity, product_id))
             
             db.commit()
             db.close()
@@ -189,41 +233,11 @@ class InventoryService:
 
     @staticmethod
     def get_inventory_stats():
-        """Get inventory statistics"""
-        db = connect_db()
-        cursor = db.cursor()
-        
-        stats = {}
-        
-        # Total inventory value (at purchase price)
-        cursor.execute("""
-            SELECT SUM(quantity_remaining * purchase_price) 
-            FROM inventory 
-            WHERE quantity_remaining > 0
-        """)
-        stats['total_value'] = cursor.fetchone()[0] or 0
-        
-        # Total inventory items
-        cursor.execute("SELECT SUM(quantity_remaining) FROM inventory")
-        stats['total_items'] = cursor.fetchone()[0] or 0
-        
-        # Expiring soon count
-        cursor.execute("""
-            SELECT COUNT(*) FROM inventory 
-            WHERE expiry_date IS NOT NULL 
-            AND quantity_remaining > 0
-            AND DATEDIFF(expiry_date, CURDATE()) <= 7
-            AND DATEDIFF(expiry_date, CURDATE()) >= 0
-        """)
-        stats['expiring_soon'] = cursor.fetchone()[0] or 0
-        
-        # Expired count
-        cursor.execute("""
-            SELECT COUNT(*) FROM inventory 
-            WHERE expiry_date < CURDATE() 
-            AND quantity_remaining > 0
-        """)
-        stats['expired'] = cursor.fetchone()[0] or 0
-        
-        db.close()
-        return stats
+        """Get inventory statistics (from the maintained dashboard summary)"""
+        stats = DashboardService.get_dashboard_stats()['inventory']
+        return {
+            'total_value': stats['total_value'],
+            'total_items': stats['total_units'],
+            'expiring_soon': stats['expiring_soon'],
+            'expired': stats['expired']
+        }
@@ -2,6 +2,8 @@
 Order Service - Handles all order and shopping cart operations
 Cart management, order placement, notifications, order tracking
 """
+import random
+import time
 from datetime import datetime
 
 try:
@@ -9,10 +11,25 @@ try:
 except ImportError:
     from db_config import connect_db
 
+from .catalog_cache import catalog_cache
+from .dashboard_service import DashboardService
+from .id_generator import new_order_number
+from .sales_service import SalesService
+from .pagination import clamp_page_size, decode_token, page_result, seek_condition
+
+
+class PaymentMismatch(Exception):
+    """Raised when the cart total at checkout differs from the amount paid for it"""
+
 
 class OrderService:
     """Service class for order operations"""
     
+    # Checkout retry policy for deadlocks (1213) and lock wait timeouts (1205)
+    RETRYABLE_ERRORS = (1205, 1213)
+    CHECKOUT_MAX_RETRIES = 3
+    CHECKOUT_RETRY_BACKOFF = 0.05  # seconds, doubled on every attempt
+    
     # ==================== SHOPPING CART FUNCTIONS ====================
     
     @staticmethod
@@ -91,6 +108,26 @@ class OrderService:
         db.close()
         return True
 
+    @staticmethod
+    def set_cart_quantity(user_id, product_id, quantity):
+        """Set the quantity of a product in a user's cart (0 or less removes it)"""
+        db = connect_db()
+        cursor = db.cursor()
+
+        if quantity <= 0:
+            cursor.execute("DELETE FROM shopping_cart WHERE user_id = %s AND product_id = %s",
+                          (user_id, product_id))
+        else:
+            cursor.execute("""
+                INSERT INTO shopping_cart (user_id, product_id, quantity)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE quantity = VALUES(quantity)
+            """, (user_id, product_id, quantity))
+
+        db.commit()
+        db.close()
+        return True
+
     @staticmethod
     def remove_from_cart(cart_id):
         """Remove item from cart"""
@@ -130,42 +167,127 @@ class OrderService:
     # ==================== ORDER FUNCTIONS ====================
 
     @staticmethod
-    def place_order(user_id, delivery_address, delivery_phone, payment_method='cash'):
-        """Place order from cart"""
-        from datetime import timedelta
+    def place_order(user_id, delivery_address, delivery_phone, payment_method='cash',
+                    transaction_id=None, paid_amount=None):
+        """Place order from cart
+
+        The order is only marked paid when transaction_id (from PaymentService)
+        is given; each transaction can pay for one order. With paid_amount,
+        the total computed under the row locks must equal it, otherwise the
+        checkout is rolled back and PaymentMismatch raised.
+
+        Set-based checkout: the number of statements is constant no matter how
+        many lines are in the cart. Stock is decremented by one conditional
+        multi-row UPDATE which either covers every cart line or is rolled back.
+
+        The cart's product rows are locked with SELECT ... FOR UPDATE in
+        product_id order first, so concurrent checkouts over the same
+        products queue up instead of deadlocking (the dashboard summary
+        update needs those locks too).
+        Deadlocks and lock wait timeouts are retried with bounded backoff.
+        """
+        attempt = 0
+        while True:
+            try:
+                return OrderService._place_order_once(user_id, delivery_address, delivery_phone,
+                                                      payment_method, transaction_id, paid_amount)
+            except Exception as e:
+                if getattr(e, 'errno', None) not in OrderService.RETRYABLE_ERRORS \
+                        or attempt >= OrderService.CHECKOUT_MAX_RETRIES:
+                    raise
+                attempt += 1
+                delay = OrderService.CHECKOUT_RETRY_BACKOFF * (2 ** (attempt - 1))
+                time.sleep(delay * random.uniform(0.5, 1.0))
+
+    @staticmethod
+    def _place_order_once(user_id, delivery_address, delivery_phone, payment_method,
+                          transaction_id=None, paid_amount=None):
+        """Single checkout attempt (see place_order)"""
         db = connect_db()
         cursor = db.cursor()
+        try:
+            return OrderService._checkout(db, cursor, user_id, delivery_address, delivery_phone,
+                                          payment_method, transaction_id, paid_amount)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def _lock_cart_products(cursor, user_id):
+        """Lock the cart's product rows in ascending product_id order"""
+        cursor.execute("""
+            SELECT product_id FROM shopping_cart 
+            WHERE user_id = %s 
+            ORDER BY product_id
+        """, (user_id,))
+        product_ids = [row[0] for row in cursor.fetchall()]
+        if product_ids:
+            placeholders = ', '.join(['%s'] * len(product_ids))
+            cursor.execute(f"""
+                SELECT product_id FROM products 
+                WHERE product_id IN ({placeholders}) 
+                ORDER BY product_id 
+                FOR UPDATE
+            """, tuple(product_ids))
+            cursor.fetchall()
+        return product_ids
+
+    @staticmethod
+    def _checkout(db, cursor, user_id, delivery_address, delivery_phone, payment_method,
+                  transaction_id=None, paid_amount=None):
+        """Checkout statements; the caller owns commit/rollback on error and close"""
+        if transaction_id:
+            cursor.execute("SELECT 1 FROM orders WHERE transaction_id = %s", (transaction_id,))
+            if cursor.fetchone():
+                return False, "This payment has already been used for an order"
+        
+        cart_product_ids = OrderService._lock_cart_products(cursor, user_id)
+        if not cart_product_ids:
+            return False, "Cart is empty"
         
-        # Get cart items
+        # Cart summary (line count and total) in one query
         cursor.execute("""
-            SELECT sc.product_id, sc.quantity, p.unit_price, p.stock_quantity
+            SELECT COUNT(*), COALESCE(SUM(sc.quantity * p.unit_price), 0)
             FROM shopping_cart sc
             JOIN products p ON sc.product_id = p.product_id
             WHERE sc.user_id = %s
         """, (user_id,))
-        cart_items = cursor.fetchall()
+        line_count, total_amount = cursor.fetchone()
         
-        if not cart_items:
-            db.close()
+        if not line_count:
             return False, "Cart is empty"
         
-        # Check stock for all items
-        for product_id, quantity, price, stock in cart_items:
-            if stock < quantity:
-                db.close()
-                return False, f"Insufficient stock for product ID {product_id}"
+        # The cart can change between payment and checkout; the rows are
+        # locked now, so this total is the one the order is created for
+        if paid_amount is not None and round(float(total_amount), 2) != round(float(paid_amount), 2):
+            raise PaymentMismatch("Cart changed since payment, please pay again")
+        
+        # Decrement stock for every cart line at once; a line without enough
+        # stock is not matched, so a short rowcount means oversell
+        with DashboardService.tracking(cursor, 'products', cart_product_ids):
+            cursor.execute("""
+                UPDATE products p
+                JOIN shopping_cart sc ON sc.product_id = p.product_id
+                SET p.stock_quantity = p.stock_quantity - sc.quantity
+                WHERE sc.user_id = %s AND p.stock_quantity >= sc.quantity
+            """, (user_id,))
+            updated_lines = cursor.rowcount
+        
+        if updated_lines != line_count:
+            db.rollback()
+            product_id = OrderService._first_short_product(cursor, user_id)
+            return False, f"Insufficient stock for product ID {product_id}"
         
-        # Calculate total
-        total_amount = sum(item[1] * item[2] for item in cart_items)
         final_amount = total_amount  # Same as total since no discounts
         
-        # Generate order number
-        order_number = f"ORD-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        # Generate order number (unique without a DB round trip)
+        order_number = new_order_number()
         
-        # Set payment status based on payment method
-        # For cash payment: pending (will be marked paid on delivery)
-        # For online/card payment: paid (simulated payment already processed)
-        payment_status = 'pending' if payment_method == 'cash' else 'paid'
+        # Paid only against a processed payment; cash (and anything the
+        # client merely claims) stays pending until settled
+        payment_status = 'paid' if transaction_id else 'pending'
         
         # Set order status and dates
         # All orders are automatically confirmed upon placement
@@ -175,35 +297,28 @@ class OrderService:
         # Create order with automatic confirmation
         cursor.execute("""
             INSERT INTO orders (user_id, order_number, total_amount, final_amount,
-                               payment_method, payment_status, delivery_address, delivery_phone, 
-                               order_status, confirmed_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                               payment_method, payment_status, transaction_id, delivery_address,
+                               delivery_phone, order_status, confirmed_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """, (user_id, order_number, total_amount, final_amount,
-              payment_method, payment_status, delivery_address, delivery_phone, 
-              order_status, current_time))
+              payment_method, payment_status, transaction_id, delivery_address,
+              delivery_phone, order_status, current_time))
         
         order_id = cursor.lastrowid
         
-        # Add order items and update stock
-        for product_id, quantity, price, stock in cart_items:
-            # Get product name
-            cursor.execute("SELECT name FROM products WHERE product_id = %s", (product_id,))
-            product_name = cursor.fetchone()[0]
-            
-            subtotal = quantity * price
-            
-            cursor.execute("""
-                INSERT INTO order_items (order_id, product_id, product_name, quantity, 
-                                       unit_price, subtotal)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (order_id, product_id, product_name, quantity, price, subtotal))
-            
-            # Update stock
-            cursor.execute("""
-                UPDATE products 
-                SET stock_quantity = stock_quantity - %s 
-                WHERE product_id = %s
-            """, (quantity, product_id))
+        # Copy all cart lines into order_items in one statement
+        cursor.execute("""
+            INSERT INTO order_items (order_id, product_id, product_name, quantity, 
+                                   unit_price, subtotal)
+            SELECT %s, sc.product_id, p.name, sc.quantity, p.unit_price, 
+                   sc.quantity * p.unit_price
+            FROM shopping_cart sc
+            JOIN products p ON sc.product_id = p.product_id
+            WHERE sc.user_id = %s
+        """, (order_id, user_id))
+        
+        # Sales rollups commit (or roll back) with the order
+        SalesService.record_order(cursor, order_id)
         
         # Create notification
         OrderService._create_notification(cursor, user_id, 'order_placed', 
@@ -215,9 +330,21 @@ class OrderService:
         cursor.execute("DELETE FROM shopping_cart WHERE user_id = %s", (user_id,))
         
         db.commit()
-        db.close()
+        catalog_cache.invalidate()  # stock levels shown in the catalog changed
         return True, f"Order {order_number} placed successfully!"
 
+    @staticmethod
+    def _first_short_product(cursor, user_id):
+        """Get the first cart product whose stock cannot cover the cart quantity"""
+        cursor.execute("""
+            SELECT MIN(sc.product_id)
+            FROM shopping_cart sc
+            JOIN products p ON sc.product_id = p.product_id
+            WHERE sc.user_id = %s AND p.stock_quantity < sc.quantity
+        """, (user_id,))
+        result = cursor.fetchone()
+        return result[0] if result else None
+
     @staticmethod
     def get_user_orders(user_id, limit=None):
         """Get user's order history"""
@@ -232,11 +359,13 @@ class OrderService:
             WHERE user_id = %s
             ORDER BY order_date DESC
         """
+        params = [user_id]
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT %s"
+            params.append(int(limit))
         
-        cursor.execute(query, (user_id,))
+        cursor.execute(query, tuple(params))
         orders = cursor.fetchall()
         db.close()
         return orders
@@ -281,15 +410,19 @@ class OrderService:
             JOIN users u ON o.user_id = u.user_id
         """
         
+        params = []
+        
         if status:
-            query += f" WHERE o.order_status = '{status}'"
+            query += " WHERE o.order_status = %s"
+            params.append(status)
         
         query += " ORDER BY o.order_date DESC"
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT %s"
+            params.append(int(limit))
         
-        cursor.execute(query)
+        cursor.execute(query, tuple(params))
         orders = cursor.fetchall()
         db.close()
         return orders
@@ -340,23 +473,35 @@ class OrderService:
             INSERT INTO notifications (user_id, type, title, message, order_id)
             VALUES (%s, %s, %s, %s, %s)
         """, (user_id, notif_type, title, message, order_id))
+        # Unread counter commits with the notification
+        cursor.execute("""
+            INSERT INTO notification_state (user_id, unread_count) VALUES (%s, 1)
+            ON DUPLICATE KEY UPDATE unread_count = unread_count + 1
+        """, (user_id,))
 
     @staticmethod
     def get_user_notifications(user_id, unread_only=False):
-        """Get user's notifications"""
+        """Get user's notifications (newest 50)
+
+        A notification is read if it is at or below the user's last-read
+        watermark or was marked read individually.
+        """
         db = connect_db()
         cursor = db.cursor()
         
         query = """
-            SELECT notification_id, type, title, message, order_id, is_read, created_at
-            FROM notifications
-            WHERE user_id = %s
+            SELECT n.notification_id, n.type, n.title, n.message, n.order_id,
+                   (n.is_read OR n.notification_id <= COALESCE(s.last_read_id, 0)) AS is_read,
+                   n.created_at
+            FROM notifications n
+            LEFT JOIN notification_state s ON s.user_id = n.user_id
+            WHERE n.user_id = %s
         """
         
         if unread_only:
-            query += " AND is_read = FALSE"
+            query += " AND n.is_read = FALSE AND n.notification_id > COALESCE(s.last_read_id, 0)"
         
-        query += " ORDER BY created_at DESC LIMIT 50"
+        query += " ORDER BY n.created_at DESC, n.notification_id DESC LIMIT 50"
         
         cursor.execute(query, (user_id,))
         notifications = cursor.fetchall()
@@ -368,22 +513,81 @@ class OrderService:
         """Mark notification as read"""
         db = connect_db()
         cursor = db.cursor()
-        cursor.execute("UPDATE notifications SET is_read = TRUE WHERE notification_id = %s", 
-                      (notification_id,))
+        # Flag and counter in one transaction; no-op if already read. Two
+        # single-table UPDATEs so the statement runs on every storage backend
+        cursor.execute("""
+            UPDATE notifications SET is_read = TRUE
+            WHERE notification_id = %s AND is_read = FALSE
+              AND notification_id > (SELECT s.last_read_id FROM notification_state s
+                                     WHERE s.user_id = notifications.user_id)
+        """, (notification_id,))
+        if cursor.rowcount:
+            cursor.execute("""
+                UPDATE notification_state
+                SET unread_count = GREATEST(unread_count - 1, 0)
+                WHERE user_id = (SELECT user_id FROM notifications WHERE notification_id = %s)
+            """, (notification_id,))
         db.commit()
         db.close()
         return True
 
+    @staticmethod
+    def mark_all_notifications_read(user_id, up_to_id=None):
+        """Mark every notification up to up_to_id (default: the newest) as read
+
+        Moves the user's watermark instead of updating notification rows, so
+        the cost does not depend on how many notifications there are.
+        Pass the newest id the user has seen so later arrivals stay unread.
+        """
+        db = connect_db()
+        cursor = db.cursor()
+        try:
+            cursor.execute("INSERT IGNORE INTO notification_state (user_id) VALUES (%s)", (user_id,))
+            # Locking the state row orders us against _create_notification
+            cursor.execute("SELECT last_read_id FROM notification_state WHERE user_id = %s FOR UPDATE",
+                          (user_id,))
+            last_read_id = cursor.fetchone()[0]
+            
+            if up_to_id is None:
+                cursor.execute("""
+                    SELECT notification_id FROM notifications
+                    WHERE user_id = %s
+                    ORDER BY created_at DESC, notification_id DESC
+                    LIMIT 1
+                """, (user_id,))
+                row = cursor.fetchone()
+                up_to_id = row[0] if row else 0
+            watermark = max(last_read_id, up_to_id)
+            
+            # Only notifications newer than the watermark can still be unread
+            cursor.execute("""
+                SELECT COUNT(*) FROM notifications
+                WHERE user_id = %s AND notification_id > %s AND is_read = FALSE
+            """, (user_id, watermark))
+            unread_count = cursor.fetchone()[0]
+            
+            cursor.execute("""
+                UPDATE notification_state SET last_read_id = %s, unread_count = %s
+                WHERE user_id = %s
+            """, (watermark, unread_count, user_id))
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            print(f"Error marking notifications read: {e}")
+            return False
+        finally:
+            db.close()
+
     @staticmethod
     def get_unread_count(user_id):
-        """Get count of unread notifications"""
+        """Get count of unread notifications (maintained counter, one key lookup)"""
         db = connect_db()
         cursor = db.cursor()
-        cursor.execute("SELECT COUNT(*) FROM notifications WHERE user_id = %s AND is_read = FALSE", 
-                      (user_id,))
-        count = cursor.fetchone()[0]
+        cursor.execute("SELECT unread_count FROM notification_state WHERE user_id = %s", (user_id,))
+        result = cursor.fetchone()
         db.close()
-        return count
+        return result[0] if result else 0
 
     # ==================== LEGACY COMPATIBILITY ====================
 
@@ -407,6 +611,39 @@ class OrderService:
         db.close()
         return orders
 
+    @staticmethod
+    def get_admin_orders_page(page_token=None, page_size=None):
+        """One page of get_all_admin_orders, newest first
+        
+        Keyset pagination on (order_date, order_id): returns (orders, next_token),
+        next_token None on the last page. Pass next_token back for the next page.
+        """
+        page_size = clamp_page_size(page_size)
+        scope = ('admin_orders',)
+        where, params = '', []
+        if page_token:
+            where, params = seek_condition('o.order_date', 'o.order_id',
+                                           decode_token(page_token, scope),
+                                           descending=True, nullable=True)
+            where = f"WHERE {where}"
+        
+        db = connect_db()
+        cursor = db.cursor()
+        # Page the orders first; item counts only for the rows on this page
+        cursor.execute(f"""
+            SELECT o.order_id, o.user_id, u.full_name, u.phone, o.order_date,
+                   o.total_amount, o.delivery_address,
+                   (SELECT COUNT(*) FROM order_items oi WHERE oi.order_id = o.order_id) as item_count
+            FROM orders o
+            JOIN users u ON o.user_id = u.user_id
+            {where}
+            ORDER BY o.order_date DESC, o.order_id DESC
+            LIMIT %s
+        """, (*params, page_size + 1))
+        orders = cursor.fetchall()
+        db.close()
+        return page_result(orders, page_size, scope, lambda row: (row[4], row[0]))
+
     @staticmethod
     def view_orders(user_id):
         """Legacy function for backward compatibility"""
@@ -0,0 +1,94 @@
+"""
+Pagination - Opaque page tokens for keyset (seek) pagination
+A token carries the sort key of the last row served and the listing it
+belongs to; the next page seeks past that key instead of using OFFSET,
+so page N costs the same as page 1 however large the table grows
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class InvalidPageToken(ValueError):
+    """Raised for tokens that are malformed or belong to another listing"""
+
+
+# ==================== TOKENS ====================
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    return value
+
+
+def _load_value(value):
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return date.fromisoformat(value['d'])
+        raise InvalidPageToken("Unknown value in page token")
+    return value
+
+
+def encode_token(scope, key):
+    """Opaque token for the row whose sort key is key, within listing scope"""
+    payload = json.dumps([list(scope), [_dump_value(v) for v in key]], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_token(token, scope):
+    """Sort key stored in token; raises InvalidPageToken if it is not for scope"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        token_scope, key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidPageToken(f"Malformed page token: {e}") from e
+    if token_scope != list(scope):
+        raise InvalidPageToken("Page token belongs to a different listing")
+    return [_load_value(v) for v in key]
+
+
+# ==================== QUERY HELPERS ====================
+
+def clamp_page_size(page_size):
+    """Page size limited to 1..MAX_PAGE_SIZE (None -> DEFAULT_PAGE_SIZE)"""
+    if not page_size:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(page_size), MAX_PAGE_SIZE))
+
+
+def seek_condition(sort_column, id_column, last_key, descending=False, nullable=False):
+    """WHERE fragment and params selecting rows after last_key = (sort value, id)
+
+    Written as OR-ed ranges rather than a row constructor so MySQL can use
+    the (sort_column, primary key) index. nullable follows MySQL's NULL
+    ordering: NULLs come first ascending and last descending.
+    """
+    value, last_id = last_key
+    op = '<' if descending else '>'
+
+    if value is None:
+        condition = f"({sort_column} IS NULL AND {id_column} {op} %s)"
+        params = [last_id]
+        if nullable and not descending:
+            condition = f"({condition} OR {sort_column} IS NOT NULL)"
+        return condition, params
+
+    condition = (f"({sort_column} {op} %s OR ({sort_column} = %s AND {id_column} {op} %s)"
+                 + (f" OR {sort_column} IS NULL)" if nullable and descending else ")"))
+    return condition, [value, value, last_id]
+
+
+def page_result(rows, page_size, scope, key_of):
+    """Split a page_size + 1 fetch into (rows, next_token or None)"""
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_token(scope, key_of(rows[-1]))
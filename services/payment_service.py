@@ -2,10 +2,10 @@
 Payment Service
 Handles payment processing for online and card payments
 """
-import random
-import string
 from datetime import datetime
 
+from .id_generator import new_transaction_id
+
 class PaymentService:
     """Service for handling payment operations"""
     
@@ -68,9 +68,7 @@ class PaymentService:
     @staticmethod
     def generate_transaction_id():
         """Generate unique transaction ID"""
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        random_str = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-        return f"TXN{timestamp}{random_str}"
+        return new_transaction_id()
     
     @staticmethod
     def process_card_payment(card_number, expiry, cvv, amount, cardholder_name):
@@ -8,15 +8,29 @@ try:
 except ImportError:
     from db_config import connect_db
 
+import os
 from datetime import datetime
 
+from .catalog_cache import catalog_cache
+from .dashboard_service import DashboardService
+from .sales_service import SalesService
+from .pagination import clamp_page_size, decode_token, page_result, seek_condition
+from .search_index import ProductSearchIndex, tokenize
+
 
 class ProductService:
     """Service class for product operations"""
     
+    # Search backend: 'fulltext' (MySQL FULLTEXT, falling back to the in-memory
+    # index for typos or when the FULLTEXT index is missing) or 'memory'
+    SEARCH_BACKEND = os.environ.get('GROCERY_SEARCH_BACKEND', 'fulltext')
+    SEARCH_RESULT_LIMIT = 100
+    _fulltext_available = True
+    
     # ==================== CATEGORY FUNCTIONS ====================
     
     @staticmethod
+    @catalog_cache.cached
     def get_all_categories():
         """Get all product categories"""
         db = connect_db()
@@ -49,6 +63,7 @@ class ProductService:
     # ==================== PRODUCT RETRIEVAL FUNCTIONS ====================
 
     @staticmethod
+    @catalog_cache.cached
     def get_products_by_category(category_id=None):
         """Get products by category or all products"""
         db = connect_db()
@@ -81,29 +96,208 @@ class ProductService:
         db.close()
         return products
 
+    @staticmethod
+    @catalog_cache.cached
+    def count_products(category_id=None):
+        """Number of available products in a category (or in all categories)"""
+        db = connect_db()
+        cursor = db.cursor()
+        if category_id:
+            cursor.execute("""
+                SELECT COUNT(*) FROM products
+                WHERE category_id = %s AND is_available = TRUE
+            """, (category_id,))
+        else:
+            cursor.execute("SELECT COUNT(*) FROM products WHERE is_available = TRUE")
+        count = cursor.fetchone()[0]
+        db.close()
+        return count
+
+    @staticmethod
+    @catalog_cache.cached
+    def get_products_page(category_id=None, offset=0, limit=60):
+        """One page of get_products_by_category (same order, product_id as tie-breaker)"""
+        db = connect_db()
+        cursor = db.cursor()
+
+        if category_id:
+            query = """
+                SELECT p.product_id, p.name, p.description, p.image_path,
+                       p.unit_price, p.unit, p.stock_quantity, p.is_available,
+                       p.discount_percent, c.category_name
+                FROM products p
+                JOIN categories c ON p.category_id = c.category_id
+                WHERE p.category_id = %s AND p.is_available = TRUE
+                ORDER BY p.name, p.product_id
+                LIMIT %s OFFSET %s
+            """
+            cursor.execute(query, (category_id, limit, offset))
+        else:
+            query = """
+                SELECT p.product_id, p.name, p.description, p.image_path,
+                       p.unit_price, p.unit, p.stock_quantity, p.is_available,
+                       p.discount_percent, c.category_name
+                FROM products p
+                JOIN categories c ON p.category_id = c.category_id
+                WHERE p.is_available = TRUE
+                ORDER BY c.category_name, p.name, p.product_id
+                LIMIT %s OFFSET %s
+            """
+            cursor.execute(query, (limit, offset))
+
+        products = cursor.fetchall()
+        db.close()
+        return products
+
+    @staticmethod
+    @catalog_cache.cached
+    def get_products_keyset_page(category_id=None, page_token=None, page_size=None):
+        """One page of get_products_by_category, seeking past page_token
+
+        Same rows and order as get_products_page; returns (products,
+        next_token), next_token None on the last page.
+        """
+        page_size = clamp_page_size(page_size)
+        scope = ('catalog_products', category_id)
+        seek, params = '', []
+        if page_token:
+            last_key = decode_token(page_token, scope)
+            if category_id:
+                seek, params = seek_condition('p.name', 'p.product_id', last_key)
+            else:
+                # All categories sort by category name first, then as above
+                category_name, name, product_id = last_key
+                inner, params = seek_condition('p.name', 'p.product_id', (name, product_id))
+                seek = f"(c.category_name > %s OR (c.category_name = %s AND {inner}))"
+                params = [category_name, category_name, *params]
+            seek = f"AND {seek}"
+
+        db = connect_db()
+        cursor = db.cursor()
+        category_filter = "AND p.category_id = %s" if category_id else ""
+        order = "p.name, p.product_id" if category_id else "c.category_name, p.name, p.product_id"
+        cursor.execute(f"""
+            SELECT p.product_id, p.name, p.description, p.image_path,
+                   p.unit_price, p.unit, p.stock_quantity, p.is_available,
+                   p.discount_percent, c.category_name
+            FROM products p
+            JOIN categories c ON p.category_id = c.category_id
+            WHERE p.is_available = TRUE {category_filter}
+                {seek}
+            ORDER BY {order}
+            LIMIT %s
+        """, (*([category_id] if category_id else []), *params, page_size + 1))
+        products = cursor.fetchall()
+        db.close()
+        return page_result(products, page_size, scope,
+                           lambda row: (row[1], row[0]) if category_id else (row[9], row[1], row[0]))
+
     @staticmethod
     def search_products(search_term):
-        """Search products by name or description"""
+        """Search products by name or description (ranked, prefix and typo tolerant)"""
+        product_ids = ProductService.search_product_ids(search_term)
+        return ProductService.get_products_by_ids(product_ids)
+
+    @staticmethod
+    def search_product_ids(search_term, limit=None):
+        """Get ids of available products matching search_term, best match first"""
+        limit = limit or ProductService.SEARCH_RESULT_LIMIT
+        if ProductService.SEARCH_BACKEND == 'fulltext' and ProductService._fulltext_available:
+            product_ids = ProductService._fulltext_search_ids(search_term, limit)
+            if product_ids:
+                return product_ids
+        return product_search_index.search(search_term, limit)
+
+    @staticmethod
+    def _fulltext_search_ids(search_term, limit):
+        """MySQL FULLTEXT search: every word required, each as a prefix"""
+        tokens = tokenize(search_term)
+        if not tokens:
+            return []
+        boolean_query = ' '.join(f"+{token}*" for token in tokens)
+        
+        db = connect_db()
+        cursor = db.cursor()
+        try:
+            cursor.execute("""
+                SELECT product_id
+                FROM products
+                WHERE MATCH(name, description) AGAINST (%s IN BOOLEAN MODE)
+                AND is_available = TRUE
+                ORDER BY MATCH(name, description) AGAINST (%s IN BOOLEAN MODE) DESC, name
+                LIMIT %s
+            """, (boolean_query, boolean_query, limit))
+            product_ids = [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            if getattr(e, 'errno', None) != 1191:  # ER_FT_MATCHING_KEY_NOT_FOUND
+                raise
+            print("FULLTEXT index ft_product_search missing, using in-memory search index")
+            ProductService._fulltext_available = False
+            product_ids = []
+        db.close()
+        return product_ids
+
+    @staticmethod
+    def get_products_by_ids(product_ids):
+        """Get product rows for the given ids, in the same order"""
+        if not product_ids:
+            return []
         db = connect_db()
         cursor = db.cursor()
         
-        query = """
+        placeholders = ', '.join(['%s'] * len(product_ids))
+        query = f"""
             SELECT p.product_id, p.name, p.description, p.image_path, 
                    p.unit_price, p.unit, p.stock_quantity, p.is_available,
                    p.discount_percent, c.category_name
             FROM products p
             JOIN categories c ON p.category_id = c.category_id
-            WHERE (p.name LIKE %s OR p.description LIKE %s) 
-            AND p.is_available = TRUE
-            ORDER BY p.name
+            WHERE p.product_id IN ({placeholders})
         """
-        search_pattern = f"%{search_term}%"
-        cursor.execute(query, (search_pattern, search_pattern))
-        products = cursor.fetchall()
+        cursor.execute(query, tuple(product_ids))
+        rows = {row[0]: row for row in cursor.fetchall()}
         db.close()
-        return products
+        return [rows[pid] for pid in product_ids if pid in rows]
+
+    @staticmethod
+    def _get_search_rows(product_ids=None, since=None):
+        """Rows for the in-memory search index: (product_id, name, description, is_available)
+
+        All products, those in product_ids, or those written at or after since.
+        """
+        db = connect_db()
+        cursor = db.cursor()
+        if since is not None:
+            cursor.execute("""
+                SELECT product_id, name, description, is_available
+                FROM products
+                WHERE updated_at >= %s
+            """, (since,))
+        elif product_ids:
+            placeholders = ', '.join(['%s'] * len(product_ids))
+            cursor.execute(f"""
+                SELECT product_id, name, description, is_available
+                FROM products
+                WHERE product_id IN ({placeholders})
+            """, tuple(product_ids))
+        else:
+            cursor.execute("SELECT product_id, name, description, is_available FROM products")
+        rows = cursor.fetchall()
+        db.close()
+        return rows
+
+    @staticmethod
+    def _get_search_version():
+        """(product count, newest updated_at) - moves on any product write, from any process"""
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM products")
+        version = cursor.fetchone()
+        db.close()
+        return tuple(version)
 
     @staticmethod
+    @catalog_cache.cached
     def get_product_details(product_id):
         """Get detailed information about a product"""
         db = connect_db()
@@ -159,9 +353,40 @@ class ProductService:
         db.close()
         return products
 
+    @staticmethod
+    def get_products_in_category_page(category_id, page_token=None, page_size=None):
+        """One page of get_products_in_category
+        
+        Keyset pagination on (name, product_id): returns (products, next_token),
+        next_token None on the last page.
+        """
+        page_size = clamp_page_size(page_size)
+        scope = ('category_products', category_id)
+        seek, params = '', []
+        if page_token:
+            seek, params = seek_condition('name', 'product_id', decode_token(page_token, scope))
+            seek = f"AND {seek}"
+        
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute(f"""
+            SELECT product_id, name, stock_quantity, unit_price, unit, expiry_date
+            FROM products 
+            WHERE category_id = %s 
+                AND (is_available = TRUE OR is_available IS NULL) 
+                AND stock_quantity > 0
+                {seek}
+            ORDER BY name, product_id
+            LIMIT %s
+        """, (category_id, *params, page_size + 1))
+        products = cursor.fetchall()
+        db.close()
+        return page_result(products, page_size, scope, lambda row: (row[1], row[0]))
+
     # ==================== PRODUCT CREATION & MODIFICATION ====================
 
     @staticmethod
+    @catalog_cache.invalidates
     def add_product(name, category_id, description, image_path, unit_price, unit, stock_quantity, min_stock_level=5):
         """Add a new product (Admin only)"""
         db = connect_db()
@@ -177,12 +402,15 @@ class ProductService:
                   unit_price, unit, stock_quantity, min_stock_level)
         
         cursor.execute(query, values)
-        db.commit()
         product_id = cursor.lastrowid
+        DashboardService.apply(cursor, 'products', [product_id])
+        db.commit()
         db.close()
+        product_search_index.mark_dirty(product_id)
         return product_id
 
     @staticmethod
+    @catalog_cache.invalidates
     def update_product(product_id, name, category_id, description, image_path, unit_price, unit, stock_quantity, min_stock_level):
         """Update product details (Admin only)"""
         db = connect_db()
@@ -194,10 +422,12 @@ class ProductService:
                 unit_price = %s, unit = %s, stock_quantity = %s, min_stock_level = %s
             WHERE product_id = %s
         """
-        cursor.execute(query, (name, category_id, description, image_path, 
-                              unit_price, unit, stock_quantity, min_stock_level, product_id))
+        with DashboardService.tracking(cursor, 'products', [product_id]):
+            cursor.execute(query, (name, category_id, description, image_path, 
+                                  unit_price, unit, stock_quantity, min_stock_level, product_id))
         db.commit()
         db.close()
+        product_search_index.mark_dirty(product_id)
         return True
 
     @staticmethod
@@ -206,13 +436,20 @@ class ProductService:
         return ProductService.update_product(product_id, name, category_id, description, image_path, unit_price, unit, stock_quantity, min_stock_level)
 
     @staticmethod
+    @catalog_cache.invalidates
     def delete_product(product_id):
         """Delete a product (Admin only)"""
         db = connect_db()
         cursor = db.cursor()
-        cursor.execute("DELETE FROM products WHERE product_id = %s", (product_id,))
+        # Deleting a product cascades to its inventory batches
+        cursor.execute("SELECT inventory_id FROM inventory WHERE product_id = %s", (product_id,))
+        inventory_ids = [row[0] for row in cursor.fetchall()]
+        with DashboardService.tracking(cursor, 'products', [product_id]), \
+                DashboardService.tracking(cursor, 'inventory', inventory_ids):
+            cursor.execute("DELETE FROM products WHERE product_id = %s", (product_id,))
         db.commit()
         db.close()
+        product_search_index.mark_dirty(product_id)
         return True
 
     @staticmethod
@@ -223,26 +460,46 @@ class ProductService:
     # ==================== PRODUCT STOCK & AVAILABILITY ====================
 
     @staticmethod
+    @catalog_cache.invalidates
     def toggle_product_availability(product_id, is_available):
         """Enable/disable product (Admin only)"""
         db = connect_db()
         cursor = db.cursor()
-        cursor.execute("UPDATE products SET is_available = %s WHERE product_id = %s", 
-                      (is_available, product_id))
+        with DashboardService.tracking(cursor, 'products', [product_id]):
+            cursor.execute("UPDATE products SET is_available = %s WHERE product_id = %s", 
+                          (is_available, product_id))
         db.commit()
         db.close()
+        product_search_index.mark_dirty(product_id)
         return True
 
     @staticmethod
+    @catalog_cache.invalidates
     def update_product_stock(product_id, quantity_change):
         """Update product stock quantity"""
         db = connect_db()
         cursor = db.cursor()
-        cursor.execute("""
-            UPDATE products 
-            SET stock_quantity = stock_quantity + %s 
-            WHERE product_id = %s
-        """, (quantity_change, product_id))
+        with DashboardService.tracking(cursor, 'products', [product_id]):
+            cursor.execute("""
+                UPDATE products 
+                SET stock_quantity = stock_quantity + %s 
+                WHERE product_id = %s
+            """, (quantity_change, product_id))
+        db.commit()
+        db.close()
+        return True
+
+    @staticmethod
+    @catalog_cache.invalidates
+    def set_product_dates(product_id, manufactured_date, expiry_date):
+        """Set a product's manufactured and expiry dates"""
+        db = connect_db()
+        cursor = db.cursor()
+        with DashboardService.tracking(cursor, 'products', [product_id]):
+            cursor.execute("""
+                UPDATE products SET manufactured_date = %s, expiry_date = %s
+                WHERE product_id = %s
+            """, (manufactured_date, expiry_date, product_id))
         db.commit()
         db.close()
         return True
@@ -257,6 +514,92 @@ class ProductService:
         db.close()
         return products
 
+    # ==================== CATALOG CACHE ====================
+
+    @staticmethod
+    def invalidate_catalog_cache():
+        """Drop cached catalog reads (call after writing products outside this service)"""
+        catalog_cache.invalidate()
+
+    @staticmethod
+    def get_catalog_cache_stats():
+        """Get catalog cache hit ratio and staleness statistics"""
+        return catalog_cache.stats()
+
+    # ==================== CATALOG VERSIONING ====================
+    # A version is (etag, last_modified) built from row counts (catch deletes)
+    # and the newest updated_at (catch every other write, stock included).
+    # Clients compare etags instead of re-reading and re-rendering rows.
+    # Never cached: they are cheap indexed COUNT/MAX reads, and reading them
+    # every time is what notices writes made by other processes.
+
+    _seen_versions = {}  # version key -> etag last read from the database
+
+    @staticmethod
+    def get_catalog_version(category_id=None):
+        """Version of the product list of a category (or of all products)"""
+        db = connect_db()
+        cursor = db.cursor()
+        if category_id:
+            cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM products WHERE category_id = %s",
+                           (category_id,))
+        else:
+            cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM products")
+        products = cursor.fetchone()
+        # Product rows carry their category name
+        cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM categories")
+        categories = cursor.fetchone()
+        db.close()
+        return ProductService._make_version(('products', category_id), products, categories)
+
+    @staticmethod
+    def get_categories_version(with_counts=False):
+        """Version of the category list (with_counts also follows every product)"""
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM categories")
+        parts = [cursor.fetchone()]
+        if with_counts:
+            cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM products")
+            parts.append(cursor.fetchone())
+        db.close()
+        return ProductService._make_version(('categories', with_counts), *parts)
+
+    @staticmethod
+    def get_product_version(product_id):
+        """Version of one product's details, or None if it does not exist"""
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute("""
+            SELECT 1, p.updated_at, 1, c.updated_at
+            FROM products p
+            JOIN categories c ON p.category_id = c.category_id
+            WHERE p.product_id = %s
+        """, (product_id,))
+        row = cursor.fetchone()
+        db.close()
+        if row is None:
+            return None
+        return ProductService._make_version(('product', product_id), row[:2], row[2:])
+
+    @staticmethod
+    def _make_version(key, *parts):
+        """Build (etag, last_modified) from (count, max updated_at) pairs
+
+        A fingerprint that moved since this process last read it means another
+        process (GUI, API worker, admin tool) wrote the catalog, so drop every
+        cached read: a body served under the new etag is never older than it.
+        """
+        etag = '.'.join(
+            f"{count}-{stamp.strftime('%Y%m%d%H%M%S%f') if stamp else 0}" for count, stamp in parts
+        )
+        stamps = [stamp for _, stamp in parts if stamp]
+        previous = ProductService._seen_versions.get(key)
+        ProductService._seen_versions[key] = etag
+        if previous is not None and previous != etag:
+            catalog_cache.invalidate()
+        return etag, max(stamps) if stamps else None
+
     # ==================== PRODUCT ANALYSIS & STATISTICS ====================
 
     @staticmethod
@@ -269,56 +612,22 @@ class ProductService:
 
     @staticmethod
     def get_product_sold_count(product_id):
-        """Get total units sold for a product (from all orders)"""
-        db = connect_db()
-        cursor = db.cursor()
-        
-        query = """
-            SELECT COALESCE(SUM(oi.quantity), 0) as total_sold
-            FROM order_items oi
-            WHERE oi.product_id = %s
-        """
-        cursor.execute(query, (product_id,))
-        result = cursor.fetchone()
-        db.close()
-        return result[0] if result else 0
+        """Get total units sold for a product (from the product_sales rollup)"""
+        return SalesService.get_sold_count(product_id)
+
+    @staticmethod
+    def get_best_sellers(window='30d', limit=20, category_id=None):
+        """Best-selling products in a window ('7d', '30d' or 'lifetime')"""
+        return SalesService.get_best_sellers(window, limit, category_id)
 
     @staticmethod
     def get_inventory_stats():
         """Get inventory statistics including expiring soon and expired items"""
-        db = connect_db()
-        cursor = db.cursor()
-        
-        # Total items (count of products, not stock quantity)
-        cursor.execute("SELECT COUNT(*) FROM products WHERE is_available = TRUE AND stock_quantity > 0")
-        total_items = cursor.fetchone()[0]
-        
-        # Expiring soon (between today and 7 days from today)
-        cursor.execute("""
-            SELECT COUNT(*) FROM products 
-            WHERE is_available = TRUE 
-            AND expiry_date IS NOT NULL
-            AND expiry_date > CURDATE() 
-            AND expiry_date <= DATE_ADD(CURDATE(), INTERVAL 7 DAY)
-            AND stock_quantity > 0
-        """)
-        expiring_soon = cursor.fetchone()[0]
-        
-        # Expired items (past expiry date)
-        cursor.execute("""
-            SELECT COUNT(*) FROM products 
-            WHERE is_available = TRUE 
-            AND expiry_date IS NOT NULL
-            AND expiry_date < CURDATE()
-            AND stock_quantity > 0
-        """)
-        expired = cursor.fetchone()[0]
-        
-        db.close()
+        stats = DashboardService.get_dashboard_stats()['products']
         return {
-            'total_items': total_items,
-            'expiring_soon': expiring_soon,
-            'expired': expired
+            'total_items': stats['total_items'],
+            'expiring_soon': stats['expiring_soon'],
+            'expired': stats['expired']
         }
 
     # ==================== EXPIRY MANAGEMENT ====================
@@ -365,13 +674,15 @@ class ProductService:
         return items
 
     @staticmethod
+    @catalog_cache.invalidates
     def remove_expired_item(product_id):
         """Remove/delete expired item from inventory by setting stock to 0"""
         db = connect_db()
         cursor = db.cursor()
         
         query = "UPDATE products SET stock_quantity = 0 WHERE product_id = %s"
-        cursor.execute(query, (product_id,))
+        with DashboardService.tracking(cursor, 'products', [product_id]):
+            cursor.execute(query, (product_id,))
         db.commit()
         db.close()
         return True
@@ -419,3 +730,12 @@ class ProductService:
     def view_all_products():
         """Legacy function - returns all products"""
         return ProductService.get_products_by_category()
+
+
+# Shared in-memory search index, built from the products table on first use
+product_search_index = ProductSearchIndex(
+    loader=lambda: ProductService._get_search_rows(),
+    row_loader=lambda product_ids: ProductService._get_search_rows(product_ids),
+    version_loader=ProductService._get_search_version,
+    changed_loader=lambda since: ProductService._get_search_rows(since=since)
+)
@@ -0,0 +1,235 @@
+"""
+Sales Service - Per-product sales rollups
+Lifetime, 7-day and 30-day units and revenue per product, updated inside
+the checkout transaction so reads never scan order history
+"""
+from datetime import date
+
+try:
+    from config.db_config import connect_db
+except ImportError:
+    from db_config import connect_db
+
+
+class SalesService:
+    """Service class for the product_sales / product_sales_daily rollups
+
+    product_sales_daily holds units and revenue per product per day;
+    product_sales holds one row per product with lifetime totals and the
+    7/30-day windows. Checkout adds to both. The windows only shrink when
+    days fall out of them, which refresh_windows() does from the daily
+    table (bounded work: at most 30 rows per product).
+    """
+
+    WINDOWS = {
+        '7d': ('units_7d', 'revenue_7d'),
+        '30d': ('units_30d', 'revenue_30d'),
+        'lifetime': ('units_sold', 'revenue'),
+    }
+    BACKFILL_BATCH_ORDERS = 5000
+    _windows_refreshed_on = None  # rows only go stale when the date changes
+
+    # ==================== WRITE PATH ====================
+
+    @staticmethod
+    def record_order(cursor, order_id):
+        """Add an order's items to the rollups (call inside the checkout transaction)"""
+        cursor.execute("""
+            INSERT INTO product_sales_daily (product_id, sale_date, units, revenue)
+            SELECT product_id, CURDATE(), SUM(quantity), SUM(subtotal)
+            FROM order_items
+            WHERE order_id = %s
+            GROUP BY product_id
+            ON DUPLICATE KEY UPDATE
+                units = units + VALUES(units),
+                revenue = revenue + VALUES(revenue)
+        """, (order_id,))
+        cursor.execute("""
+            INSERT INTO product_sales (product_id, units_sold, revenue, units_7d, revenue_7d,
+                                       units_30d, revenue_30d, windows_as_of, last_sold_at)
+            SELECT product_id, SUM(quantity), SUM(subtotal), SUM(quantity), SUM(subtotal),
+                   SUM(quantity), SUM(subtotal), CURDATE(), NOW()
+            FROM order_items
+            WHERE order_id = %s
+            GROUP BY product_id
+            ON DUPLICATE KEY UPDATE
+                units_sold = units_sold + VALUES(units_sold),
+                revenue = revenue + VALUES(revenue),
+                units_7d = units_7d + VALUES(units_7d),
+                revenue_7d = revenue_7d + VALUES(revenue_7d),
+                units_30d = units_30d + VALUES(units_30d),
+                revenue_30d = revenue_30d + VALUES(revenue_30d),
+                last_sold_at = VALUES(last_sold_at)
+        """, (order_id,))
+
+    # ==================== READS ====================
+
+    @staticmethod
+    def get_sold_count(product_id):
+        """Lifetime units sold for a product (one primary-key lookup)"""
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute("SELECT units_sold FROM product_sales WHERE product_id = %s", (product_id,))
+        result = cursor.fetchone()
+        db.close()
+        return result[0] if result else 0
+
+    @staticmethod
+    def get_product_sales(product_id):
+        """Lifetime / 7-day / 30-day units and revenue for a product"""
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute("""
+            SELECT units_sold, revenue, units_7d, revenue_7d, units_30d, revenue_30d, last_sold_at
+            FROM product_sales
+            WHERE product_id = %s
+        """, (product_id,))
+        row = cursor.fetchone()
+        db.close()
+        if not row:
+            return {'units_sold': 0, 'revenue': 0, 'units_7d': 0, 'revenue_7d': 0,
+                    'units_30d': 0, 'revenue_30d': 0, 'last_sold_at': None}
+        keys = ('units_sold', 'revenue', 'units_7d', 'revenue_7d', 'units_30d', 'revenue_30d', 'last_sold_at')
+        return dict(zip(keys, row))
+
+    @staticmethod
+    def get_best_sellers(window='30d', limit=20, category_id=None):
+        """Top products by units sold in a window ('7d', '30d' or 'lifetime')
+
+        Returns rows of (product_id, name, category_name, units, revenue).
+        """
+        units_column, revenue_column = SalesService.WINDOWS[window]
+        SalesService.refresh_windows()
+
+        params = []
+        where = f"WHERE ps.{units_column} > 0"
+        if category_id:
+            where += " AND p.category_id = %s"
+            params.append(category_id)
+        params.append(int(limit))
+
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute(f"""
+            SELECT p.product_id, p.name, c.category_name, ps.{units_column}, ps.{revenue_column}
+            FROM product_sales ps
+            JOIN products p ON ps.product_id = p.product_id
+            JOIN categories c ON p.category_id = c.category_id
+            {where}
+            ORDER BY ps.{units_column} DESC, ps.product_id
+            LIMIT %s
+        """, tuple(params))
+        rows = cursor.fetchall()
+        db.close()
+        return rows
+
+    # ==================== MAINTENANCE ====================
+
+    @staticmethod
+    def refresh_windows(force=False):
+        """Recompute 7/30-day windows of rows last refreshed before today
+
+        Free after the first call of the day in this process and one indexed
+        probe otherwise, so readers call it before relying on the windows;
+        the nightly job calls it too. Returns the number of products refreshed.
+        """
+        today = date.today()
+        if not force and SalesService._windows_refreshed_on == today:
+            return 0
+        db = connect_db()
+        cursor = db.cursor()
+        try:
+            cursor.execute("SELECT 1 FROM product_sales WHERE windows_as_of < CURDATE() LIMIT 1")
+            if cursor.fetchone() is None:
+                SalesService._windows_refreshed_on = today
+                return 0
+            cursor.execute("""
+                UPDATE product_sales ps
+                LEFT JOIN (
+                    SELECT product_id,
+                           SUM(CASE WHEN sale_date > CURDATE() - INTERVAL 7 DAY THEN units ELSE 0 END) AS units_7d,
+                           SUM(CASE WHEN sale_date > CURDATE() - INTERVAL 7 DAY THEN revenue ELSE 0 END) AS revenue_7d,
+                           SUM(units) AS units_30d,
+                           SUM(revenue) AS revenue_30d
+                    FROM product_sales_daily
+                    WHERE sale_date > CURDATE() - INTERVAL 30 DAY
+                    GROUP BY product_id
+                ) d ON d.product_id = ps.product_id
+                SET ps.units_7d = COALESCE(d.units_7d, 0),
+                    ps.revenue_7d = COALESCE(d.revenue_7d, 0),
+                    ps.units_30d = COALESCE(d.units_30d, 0),
+                    ps.revenue_30d = COALESCE(d.revenue_30d, 0),
+                    ps.windows_as_of = CURDATE()
+                WHERE ps.windows_as_of < CURDATE()
+            """)
+            refreshed = cursor.rowcount
+            db.commit()
+            SalesService._windows_refreshed_on = today
+            return refreshed
+        except Exception as e:
+            db.rollback()
+            print(f"Error refreshing sales windows: {e}")
+            return 0
+        finally:
+            db.close()
+
+    @staticmethod
+    def backfill(batch_orders=None, progress=None):
+        """Rebuild both rollups from orders/order_items, a batch of orders at a time
+
+        Orders placed while the backfill runs are recorded by checkout on
+        top of the rebuilt rows; only orders up to the starting maximum id
+        are replayed. progress(done_up_to_order_id, max_order_id) is called
+        after each batch. Returns the number of orders replayed.
+        """
+        batch_orders = batch_orders or SalesService.BACKFILL_BATCH_ORDERS
+        db = connect_db()
+        cursor = db.cursor()
+        try:
+            cursor.execute("SELECT COALESCE(MAX(order_id), 0), COUNT(*) FROM orders")
+            max_order_id, order_count = cursor.fetchone()
+            cursor.execute("DELETE FROM product_sales_daily")
+            cursor.execute("DELETE FROM product_sales")
+            db.commit()
+
+            start = 0
+            while start < max_order_id:
+                end = min(start + batch_orders, max_order_id)
+                cursor.execute("""
+                    INSERT INTO product_sales_daily (product_id, sale_date, units, revenue)
+                    SELECT oi.product_id, DATE(o.order_date), SUM(oi.quantity), SUM(oi.subtotal)
+                    FROM orders o
+                    JOIN order_items oi ON oi.order_id = o.order_id
+                    WHERE o.order_id > %s AND o.order_id <= %s
+                    GROUP BY oi.product_id, DATE(o.order_date)
+                    ON DUPLICATE KEY UPDATE
+                        units = units + VALUES(units),
+                        revenue = revenue + VALUES(revenue)
+                """, (start, end))
+                cursor.execute("""
+                    INSERT INTO product_sales (product_id, units_sold, revenue, windows_as_of, last_sold_at)
+                    SELECT oi.product_id, SUM(oi.quantity), SUM(oi.subtotal), '1970-01-01', MAX(o.order_date)
+                    FROM orders o
+                    JOIN order_items oi ON oi.order_id = o.order_id
+                    WHERE o.order_id > %s AND o.order_id <= %s
+                    GROUP BY oi.product_id
+                    ON DUPLICATE KEY UPDATE
+                        units_sold = units_sold + VALUES(units_sold),
+                        revenue = revenue + VALUES(revenue),
+                        windows_as_of = '1970-01-01',
+                        last_sold_at = GREATEST(COALESCE(last_sold_at, VALUES(last_sold_at)), VALUES(last_sold_at))
+                """, (start, end))
+                db.commit()
+                start = end
+                if progress:
+                    progress(end, max_order_id)
+        except Exception as e:
+            db.rollback()
+            print(f"Error backfilling sales rollups: {e}")
+            raise
+        finally:
+            db.close()
+
+        # Every row was marked stale above, so this fills in all the windows
+        SalesService.refresh_windows(force=True)
+        return order_count
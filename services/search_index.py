@@ -0,0 +1,293 @@
+"""
+Product Search Index - In-memory inverted + trigram index over product names
+and descriptions. Ranked results, prefix matching and typo tolerance;
+kept current incrementally as products are written (by any process).
+"""
+import bisect
+import re
+import threading
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+# Relevance weights
+NAME_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.3
+EXACT_SCORE = 10.0
+PREFIX_SCORE = 6.0
+FUZZY_SCORE = 4.0  # minus 1 per edit
+
+MAX_PREFIX_EXPANSIONS = 200
+MAX_FUZZY_CANDIDATES = 500
+
+
+def tokenize(text):
+    """Lower-case alphanumeric tokens of text"""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def trigrams(token):
+    """Padded trigrams of a token ('$mi', 'mil', 'ilk', 'lk$')"""
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_typos(token):
+    """Edits tolerated for a query token of this length"""
+    if len(token) < 4:
+        return 0
+    return 1 if len(token) <= 6 else 2
+
+
+def bounded_edit_distance(a, b, limit):
+    """Levenshtein distance (with adjacent transpositions), or limit+1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class ProductSearchIndex:
+    """Inverted index (token -> product ids) plus trigram index (trigram -> tokens)
+
+    loader() returns rows of (product_id, name, description, is_available);
+    row_loader(product_ids) returns the same rows for a subset. The index is
+    built lazily on first search; writes only mark products dirty, and dirty
+    products are re-read in one batch before the next search.
+
+    Writes made by other processes (API workers, other terminals) are found
+    through version_loader() -> (product count, newest updated_at), read
+    before every search: when it moved, changed_loader(since) re-reads the
+    rows written since, and a count that still differs (deletes) rebuilds.
+    """
+
+    def __init__(self, loader=None, row_loader=None, version_loader=None, changed_loader=None):
+        self._loader = loader
+        self._row_loader = row_loader
+        self._version_loader = version_loader
+        self._changed_loader = changed_loader
+        self._lock = threading.RLock()
+        self._built = False
+        self._version = None  # version_loader() as of the rows indexed
+        self._dirty = set()
+        self._docs = {}               # product_id -> (name, name_tokens, desc_tokens, is_available)
+        self._name_postings = {}      # token -> set(product_id)
+        self._desc_postings = {}      # token -> set(product_id)
+        self._trigram_tokens = {}     # trigram -> set(token)
+        self._vocab = []              # sorted tokens, for prefix lookups
+
+    # ==================== BUILD & INCREMENTAL UPDATES ====================
+
+    def build(self, rows=None):
+        """(Re)build the whole index from rows (or from loader())"""
+        # Version first: the rows read below are never older than it
+        version = self._version_loader() if rows is None and self._version_loader else None
+        rows = self._loader() if rows is None else rows
+        with self._lock:
+            self._version = version
+            self._docs.clear()
+            self._name_postings.clear()
+            self._desc_postings.clear()
+            self._trigram_tokens.clear()
+            self._vocab = []
+            vocab = set()
+            for row in rows:
+                vocab.update(self._add(*row, update_vocab=False))
+            self._vocab = sorted(vocab)
+            for token in self._vocab:
+                self._index_trigrams(token)
+            self._built = True
+            self._dirty.clear()
+
+    @property
+    def is_built(self):
+        return self._built
+
+    def __len__(self):
+        return len(self._docs)
+
+    def mark_dirty(self, product_id):
+        """Note a product write; it is re-read before the next search"""
+        with self._lock:
+            if self._built:
+                self._dirty.add(product_id)
+
+    def upsert(self, product_id, name, description, is_available=True):
+        """Add or replace one product"""
+        with self._lock:
+            self._remove(product_id)
+            self._add(product_id, name, description, is_available)
+
+    def remove(self, product_id):
+        """Drop one product from the index"""
+        with self._lock:
+            self._remove(product_id)
+
+    def _add(self, product_id, name, description, is_available, update_vocab=True):
+        name_tokens = set(tokenize(name))
+        desc_tokens = set(tokenize(description)) - name_tokens
+        self._docs[product_id] = (name or '', name_tokens, desc_tokens, bool(is_available))
+        for postings, tokens in ((self._name_postings, name_tokens), (self._desc_postings, desc_tokens)):
+            for token in tokens:
+                ids = postings.get(token)
+                if ids is None:
+                    ids = postings[token] = set()
+                ids.add(product_id)
+        tokens = name_tokens | desc_tokens
+        if update_vocab:
+            for token in tokens:
+                index = bisect.bisect_left(self._vocab, token)
+                if index == len(self._vocab) or self._vocab[index] != token:
+                    self._vocab.insert(index, token)
+                    self._index_trigrams(token)
+        return tokens
+
+    def _index_trigrams(self, token):
+        for gram in trigrams(token):
+            bucket = self._trigram_tokens.get(gram)
+            if bucket is None:
+                bucket = self._trigram_tokens[gram] = set()
+            bucket.add(token)
+
+    def _remove(self, product_id):
+        doc = self._docs.pop(product_id, None)
+        if doc is None:
+            return
+        _, name_tokens, desc_tokens, _ = doc
+        for postings, tokens in ((self._name_postings, name_tokens), (self._desc_postings, desc_tokens)):
+            for token in tokens:
+                ids = postings.get(token)
+                if ids is not None:
+                    ids.discard(product_id)
+                    if not ids:
+                        del postings[token]
+        # Tokens left without postings stay in the vocabulary/trigram sets;
+        # lookups skip them because they match no products
+
+    def _sync_version(self):
+        if self._version_loader is None:
+            return
+        version = self._version_loader()
+        if version == self._version:
+            return
+        previous, self._version = self._version, version
+        if previous is None or previous[1] is None or self._changed_loader is None:
+            self.build()
+            return
+        # >= rather than >: a row written in the same instant as the last
+        # one seen may not have been read yet
+        for row in self._changed_loader(previous[1]):
+            self.upsert(*row)
+        if len(self._docs) != version[0]:
+            self.build()  # Products were deleted
+
+    def _refresh_dirty(self):
+        if not self._dirty or self._row_loader is None:
+            return
+        product_ids = sorted(self._dirty)
+        self._dirty.clear()
+        rows = self._row_loader(product_ids)
+        found = set()
+        for row in rows:
+            found.add(row[0])
+            self.upsert(*row)
+        for product_id in product_ids:
+            if product_id not in found:
+                self._remove(product_id)
+
+    # ==================== SEARCH ====================
+
+    def search(self, query, limit=100, available_only=True):
+        """Ranked product ids matching every query token (exact, prefix or fuzzy)"""
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return []
+        with self._lock:
+            if not self._built:
+                self.build()
+            else:
+                self._sync_version()
+            self._refresh_dirty()
+
+            scores = None
+            for token in query_tokens:
+                token_scores = self._score_token(token)
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {pid: score + token_scores[pid]
+                              for pid, score in scores.items() if pid in token_scores}
+                if not scores:
+                    return []
+
+            results = []
+            for pid, score in scores.items():
+                name, _, _, is_available = self._docs[pid]
+                if available_only and not is_available:
+                    continue
+                results.append((-score, len(name), name.lower(), pid))
+            results.sort()
+            return [pid for _, _, _, pid in results[:limit]]
+
+    def _score_token(self, token):
+        """product_id -> best score for one query token"""
+        scores = {}
+
+        def credit(matched_token, base):
+            for postings, weight in ((self._name_postings, NAME_WEIGHT),
+                                     (self._desc_postings, DESCRIPTION_WEIGHT)):
+                for pid in postings.get(matched_token, ()):
+                    value = base * weight
+                    if value > scores.get(pid, 0.0):
+                        scores[pid] = value
+
+        credit(token, EXACT_SCORE)
+
+        index = bisect.bisect_left(self._vocab, token)
+        expansions = 0
+        while index < len(self._vocab) and expansions < MAX_PREFIX_EXPANSIONS:
+            candidate = self._vocab[index]
+            if not candidate.startswith(token):
+                break
+            if candidate != token:
+                credit(candidate, PREFIX_SCORE)
+                expansions += 1
+            index += 1
+
+        limit = max_typos(token)
+        if limit:
+            for candidate, distance in self._fuzzy_candidates(token, limit):
+                credit(candidate, FUZZY_SCORE - distance)
+        return scores
+
+    def _fuzzy_candidates(self, token, limit):
+        """Vocabulary tokens within `limit` edits of token (trigram-filtered)"""
+        grams = trigrams(token)
+        shared = {}
+        for gram in grams:
+            for candidate in self._trigram_tokens.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        # q-gram lemma: one edit touches at most 3 trigrams (4 for a transposition)
+        needed = max(1, len(grams) - 4 * limit)
+        candidates = sorted((c for c, n in shared.items() if n >= needed and c != token),
+                            key=lambda c: -shared[c])[:MAX_FUZZY_CANDIDATES]
+        matches = []
+        for candidate in candidates:
+            distance = bounded_edit_distance(token, candidate, limit)
+            if distance <= limit:
+                matches.append((candidate, distance))
+        return matches
@@ -0,0 +1,188 @@
+"""
+Thumbnail Service - Pre-resized product image cache on disk
+Size-bucketed thumbnails keyed by content hash, with a manifest so known
+files are matched by mtime/size without re-reading them
+"""
+import hashlib
+import json
+import os
+import threading
+
+
+class ThumbnailService:
+    """Service class for generating and serving cached thumbnails"""
+
+    # Constants
+    IMAGE_DIR = "product_images"
+    CACHE_DIR = os.path.join(IMAGE_DIR, ".thumbnails")
+    MANIFEST = os.path.join(CACHE_DIR, "manifest.json")
+    BUCKETS = (150, 200, 400)
+    JPEG_QUALITY = 88
+
+    _lock = threading.RLock()
+    _manifest = None  # abs path -> [mtime_ns, size, content_hash]
+
+    # ==================== PUBLIC API ====================
+
+    @staticmethod
+    def bucket_for(size):
+        """Smallest bucket that covers the requested (width, height)"""
+        target = max(size)
+        for bucket in ThumbnailService.BUCKETS:
+            if bucket >= target:
+                return bucket
+        return ThumbnailService.BUCKETS[-1]
+
+    @staticmethod
+    def get_thumbnail(source_path, size):
+        """Get a PIL image of source_path resized to size, via the thumbnail cache"""
+        from PIL import Image  # Pillow is slow to import; load it on first use
+        bucket = ThumbnailService.bucket_for(size)
+        thumb_path = ThumbnailService.ensure_thumbnail(source_path, bucket)
+        img = Image.open(thumb_path)
+        img.load()
+        if img.size != tuple(size):
+            # Small thumbnail -> requested size: cheap compared to the original decode
+            img = img.resize(size, Image.Resampling.LANCZOS)
+        return img
+
+    @staticmethod
+    def ensure_thumbnail(source_path, bucket):
+        """Path of the bucket thumbnail for source_path, generating it if missing"""
+        content_hash = ThumbnailService._content_hash(source_path)
+        thumb_path = ThumbnailService._find_thumbnail(content_hash, bucket)
+        if thumb_path is None:
+            ThumbnailService.generate_thumbnails(source_path, buckets=(bucket,), content_hash=content_hash)
+            thumb_path = ThumbnailService._find_thumbnail(content_hash, bucket)
+        return thumb_path
+
+    @staticmethod
+    def generate_thumbnails(source_path, buckets=None, content_hash=None):
+        """Generate thumbnails for every bucket (called when an image is saved)"""
+        from PIL import Image
+        buckets = sorted(buckets or ThumbnailService.BUCKETS, reverse=True)
+        content_hash = content_hash or ThumbnailService._content_hash(source_path)
+        os.makedirs(ThumbnailService.CACHE_DIR, exist_ok=True)
+
+        with Image.open(source_path) as original:
+            # Decode once at the largest bucket; smaller buckets derive from it
+            img = ThumbnailService._fast_decode(original, buckets[0])
+
+        for bucket in buckets:
+            if ThumbnailService._find_thumbnail(content_hash, bucket):
+                continue
+            thumb = ThumbnailService._reduce(img, bucket).resize((bucket, bucket), Image.Resampling.LANCZOS)
+            ThumbnailService._write(thumb, content_hash, bucket)
+
+    @staticmethod
+    def warm_directory(directory=None):
+        """Generate missing thumbnails for every image already in the directory"""
+        directory = directory or ThumbnailService.IMAGE_DIR
+        generated = 0
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not os.path.isfile(path):
+                continue
+            try:
+                content_hash = ThumbnailService._content_hash(path)
+                missing = [b for b in ThumbnailService.BUCKETS
+                           if not ThumbnailService._find_thumbnail(content_hash, b)]
+                if missing:
+                    ThumbnailService.generate_thumbnails(path, missing, content_hash)
+                    generated += len(missing)
+            except Exception as e:
+                print(f"Skipping thumbnail for {name}: {e}")
+        return generated
+
+    # ==================== DECODING ====================
+
+    @staticmethod
+    def _fast_decode(img, bucket):
+        """Decode the original at reduced resolution where the format allows it"""
+        if img.format == 'JPEG':
+            # JPEG DCT scaling: decode directly at 1/2, 1/4 or 1/8 size,
+            # staying at least 2x the bucket for a clean final resample
+            img.draft('RGB', (bucket * 2, bucket * 2))
+        img.load()
+        if img.mode not in ('RGB', 'RGBA'):
+            has_alpha = img.mode in ('LA', 'PA') or 'transparency' in img.info
+            img = img.convert('RGBA' if has_alpha else 'RGB')
+        return img
+
+    @staticmethod
+    def _reduce(img, bucket):
+        """Integer box downscale (Image.reduce) while still >= 2x the bucket"""
+        factor = min(img.width, img.height) // (bucket * 2)
+        if factor >= 2:
+            return img.reduce(factor)
+        return img
+
+    # ==================== CACHE BOOKKEEPING ====================
+
+    @staticmethod
+    def _thumbnail_path(content_hash, bucket, ext):
+        return os.path.join(ThumbnailService.CACHE_DIR, f"{content_hash}_{bucket}.{ext}")
+
+    @staticmethod
+    def _find_thumbnail(content_hash, bucket):
+        for ext in ('jpg', 'png'):
+            path = ThumbnailService._thumbnail_path(content_hash, bucket, ext)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def _write(thumb, content_hash, bucket):
+        # Keep transparency in PNG, everything else as compact JPEG
+        if thumb.mode == 'RGBA':
+            path = ThumbnailService._thumbnail_path(content_hash, bucket, 'png')
+            fmt, options = 'PNG', {'optimize': True}
+        else:
+            path = ThumbnailService._thumbnail_path(content_hash, bucket, 'jpg')
+            fmt, options = 'JPEG', {'quality': ThumbnailService.JPEG_QUALITY}
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        thumb.save(tmp_path, fmt, **options)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _content_hash(source_path):
+        """SHA-1 of the file, remembered in the manifest by (mtime, size)"""
+        abs_path = os.path.abspath(source_path)
+        stat = os.stat(abs_path)
+        with ThumbnailService._lock:
+            manifest = ThumbnailService._load_manifest()
+            entry = manifest.get(abs_path)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                return entry[2]
+
+        digest = hashlib.sha1()
+        with open(abs_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+
+        with ThumbnailService._lock:
+            manifest[abs_path] = [stat.st_mtime_ns, stat.st_size, content_hash]
+            ThumbnailService._save_manifest()
+        return content_hash
+
+    @staticmethod
+    def _load_manifest():
+        if ThumbnailService._manifest is None:
+            try:
+                with open(ThumbnailService.MANIFEST, encoding='utf-8') as f:
+                    ThumbnailService._manifest = json.load(f)
+            except (OSError, ValueError):
+                ThumbnailService._manifest = {}
+        return ThumbnailService._manifest
+
+    @staticmethod
+    def _save_manifest():
+        os.makedirs(ThumbnailService.CACHE_DIR, exist_ok=True)
+        tmp_path = f"{ThumbnailService.MANIFEST}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(ThumbnailService._manifest, f)
+            os.replace(tmp_path, ThumbnailService.MANIFEST)
+        except OSError as e:
+            print(f"Could not save thumbnail manifest: {e}")
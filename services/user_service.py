@@ -2,7 +2,7 @@
 User Service - Handles all user-related operations
 Customer and Staff authentication, profile management
 """
-import bcrypt
+import os
 from datetime import datetime
 
 try:
@@ -12,37 +12,128 @@ except ImportError:
 
 
 class UserService:
-    """Service class for user operations"""
+    """Service class for user operations
+
+    bcrypt is slow on purpose, so it never runs while a pooled connection is
+    held, and the GUI calls the login/register/password methods from
+    gui/auth_worker.py rather than on the Tk thread.
+    """
+    
+    # bcrypt work factor for new hashes; older hashes are upgraded on login
+    BCRYPT_ROUNDS = max(4, min(int(os.environ.get('GROCERY_BCRYPT_ROUNDS', 12)), 31))
+    
+    # Same column order as the tables (SELECT * before), so callers' indexes hold
+    USER_COLUMNS = ("user_id, username, password, email, full_name, phone, address, "
+                    "created_at, last_login, is_active")
+    STAFF_COLUMNS = ("staff_id, username, password, email, full_name, phone, role, "
+                     "created_at, last_login, is_active")
+    
+    # ==================== PASSWORD HASHING ====================
+    
+    @staticmethod
+    def hash_password(password, rounds=None):
+        """bcrypt hash of password at BCRYPT_ROUNDS (or rounds)"""
+        import bcrypt  # loaded on first use, off the startup path
+        salt = bcrypt.gensalt(rounds or UserService.BCRYPT_ROUNDS)
+        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    
+    @staticmethod
+    def check_password(password, hashed):
+        """True if password matches the stored bcrypt hash"""
+        import bcrypt
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    
+    @staticmethod
+    def needs_rehash(hashed):
+        """True if the hash was made with a different work factor than BCRYPT_ROUNDS"""
+        try:
+            return int(hashed.split('$')[2]) != UserService.BCRYPT_ROUNDS
+        except (IndexError, ValueError):
+            return True
+    
+    @staticmethod
+    def _login(table, id_column, columns, username, password):
+        """Shared customer/staff login; returns the row without its hash, or None"""
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute(f"SELECT {columns} FROM {table} WHERE username = %s AND is_active = TRUE",
+                      (username,))
+        row = cursor.fetchone()
+        db.close()
+        
+        if not row or not UserService.check_password(password, row[2]):
+            return None
+        
+        # Update last login, upgrading the hash to the current cost while we have the password
+        assignments, params = "last_login = %s", [datetime.now()]
+        if UserService.needs_rehash(row[2]):
+            assignments += ", password = %s"
+            params.append(UserService.hash_password(password))
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute(f"UPDATE {table} SET {assignments} WHERE {id_column} = %s",
+                      (*params, row[0]))
+        db.commit()
+        db.close()
+        return row[:2] + (None,) + row[3:]
+    
+    @staticmethod
+    def _change_password(table, id_column, entity_id, old_password, new_password, not_found):
+        """Shared customer/staff password change"""
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute(f"SELECT password FROM {table} WHERE {id_column} = %s", (entity_id,))
+        result = cursor.fetchone()
+        db.close()
+        
+        if not result:
+            return False, not_found
+        
+        # Verify old password
+        if not UserService.check_password(old_password, result[0]):
+            return False, "Incorrect old password"
+        
+        # Hash new password
+        hashed_password = UserService.hash_password(new_password)
+        
+        # Update password
+        db = connect_db()
+        cursor = db.cursor()
+        cursor.execute(f"UPDATE {table} SET password = %s WHERE {id_column} = %s",
+                      (hashed_password, entity_id))
+        db.commit()
+        db.close()
+        return True, "Password changed successfully"
     
     # ==================== CUSTOMER FUNCTIONS ====================
     
     @staticmethod
     def register_user(username, password, email, full_name='', phone='', address=''):
         """Register a new customer"""
+        # Hash the password (before taking a connection - this is the slow part)
+        hashed_password = UserService.hash_password(password)
+
         db = connect_db()
         cursor = db.cursor()
 
         # Check if username already exists
-        cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
+        cursor.execute("SELECT 1 FROM users WHERE username = %s", (username,))
         if cursor.fetchone():
             db.close()
             return False, "Username already exists"
         
         # Check if email already exists
-        cursor.execute("SELECT * FROM users WHERE email = %s", (email,))
+        cursor.execute("SELECT 1 FROM users WHERE email = %s", (email,))
         if cursor.fetchone():
             db.close()
             return False, "Email already exists"
 
-        # Hash the password
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-
         # Insert user
         query = """
             INSERT INTO users (username, password, email, full_name, phone, address) 
             VALUES (%s, %s, %s, %s, %s, %s)
         """
-        cursor.execute(query, (username, hashed_password.decode('utf-8'), email, full_name, phone, address))
+        cursor.execute(query, (username, hashed_password, email, full_name, phone, address))
         db.commit()
         user_id = cursor.lastrowid
         db.close()
@@ -50,23 +141,8 @@ class UserService:
 
     @staticmethod
     def login_user(username, password):
-        """Login customer"""
-        db = connect_db()
-        cursor = db.cursor()
-
-        cursor.execute("SELECT * FROM users WHERE username = %s AND is_active = TRUE", (username,))
-        user = cursor.fetchone()
-        
-        # Update last login
-        if user and bcrypt.checkpw(password.encode('utf-8'), user[2].encode('utf-8')):
-            cursor.execute("UPDATE users SET last_login = %s WHERE user_id = %s", 
-                          (datetime.now(), user[0]))
-            db.commit()
-            db.close()
-            return user
-        
-        db.close()
-        return None
+        """Login customer (the returned row has None in place of the password hash)"""
+        return UserService._login('users', 'user_id', UserService.USER_COLUMNS, username, password)
 
     @staticmethod
     def update_user_profile(user_id, full_name, phone, address):
@@ -89,7 +165,7 @@ class UserService:
         """Get customer information"""
         db = connect_db()
         cursor = db.cursor()
-        cursor.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
+        cursor.execute(f"SELECT {UserService.USER_COLUMNS} FROM users WHERE user_id = %s", (user_id,))
         user = cursor.fetchone()
         db.close()
         return user
@@ -97,31 +173,8 @@ class UserService:
     @staticmethod
     def change_password(user_id, old_password, new_password):
         """Change customer password"""
-        db = connect_db()
-        cursor = db.cursor()
-        
-        # Get current password
-        cursor.execute("SELECT password FROM users WHERE user_id = %s", (user_id,))
-        result = cursor.fetchone()
-        
-        if not result:
-            db.close()
-            return False, "User not found"
-        
-        # Verify old password
-        if not bcrypt.checkpw(old_password.encode('utf-8'), result[0].encode('utf-8')):
-            db.close()
-            return False, "Incorrect old password"
-        
-        # Hash new password
-        hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt())
-        
-        # Update password
-        cursor.execute("UPDATE users SET password = %s WHERE user_id = %s", 
-                      (hashed_password.decode('utf-8'), user_id))
-        db.commit()
-        db.close()
-        return True, "Password changed successfully"
+        return UserService._change_password('users', 'user_id', user_id, old_password, new_password,
+                                            "User not found")
 
     @staticmethod
     def update_username(user_id, new_username):
@@ -130,7 +183,7 @@ class UserService:
         cursor = db.cursor()
         
         # Check if new username already exists
-        cursor.execute("SELECT * FROM users WHERE username = %s AND user_id != %s", (new_username, user_id))
+        cursor.execute("SELECT 1 FROM users WHERE username = %s AND user_id != %s", (new_username, user_id))
         if cursor.fetchone():
             db.close()
             return False, "Username already exists"
@@ -145,45 +198,30 @@ class UserService:
 
     @staticmethod
     def login_staff(username, password):
-        """Login staff/admin"""
-        db = connect_db()
-        cursor = db.cursor()
-
-        cursor.execute("SELECT * FROM staff WHERE username = %s AND is_active = TRUE", (username,))
-        staff = cursor.fetchone()
-        
-        # Update last login
-        if staff and bcrypt.checkpw(password.encode('utf-8'), staff[2].encode('utf-8')):
-            cursor.execute("UPDATE staff SET last_login = %s WHERE staff_id = %s", 
-                          (datetime.now(), staff[0]))
-            db.commit()
-            db.close()
-            return staff
-        
-        db.close()
-        return None
+        """Login staff/admin (the returned row has None in place of the password hash)"""
+        return UserService._login('staff', 'staff_id', UserService.STAFF_COLUMNS, username, password)
 
     @staticmethod
     def register_staff(username, password, email, full_name, phone='', role='staff'):
         """Register a new staff member (Admin only)"""
+        # Hash the password (before taking a connection - this is the slow part)
+        hashed_password = UserService.hash_password(password)
+
         db = connect_db()
         cursor = db.cursor()
 
         # Check if username already exists
-        cursor.execute("SELECT * FROM staff WHERE username = %s", (username,))
+        cursor.execute("SELECT 1 FROM staff WHERE username = %s", (username,))
         if cursor.fetchone():
             db.close()
             return False, "Username already exists"
 
-        # Hash the password
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-
         # Insert staff
         query = """
             INSERT INTO staff (username, password, email, full_name, phone, role) 
             VALUES (%s, %s, %s, %s, %s, %s)
         """
-        cursor.execute(query, (username, hashed_password.decode('utf-8'), email, full_name, phone, role))
+        cursor.execute(query, (username, hashed_password, email, full_name, phone, role))
         db.commit()
         staff_id = cursor.lastrowid
         db.close()
@@ -224,31 +262,8 @@ class UserService:
     @staticmethod
     def change_staff_password(staff_id, old_password, new_password):
         """Change staff password"""
-        db = connect_db()
-        cursor = db.cursor()
-        
-        # Get current password
-        cursor.execute("SELECT password FROM staff WHERE staff_id = %s", (staff_id,))
-        result = cursor.fetchone()
-        
-        if not result:
-            db.close()
-            return False, "Staff not found"
-        
-        # Verify old password
-        if not bcrypt.checkpw(old_password.encode('utf-8'), result[0].encode('utf-8')):
-            db.close()
-            return False, "Incorrect old password"
-        
-        # Hash new password
-        hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt())
-        
-        # Update password
-        cursor.execute("UPDATE staff SET password = %s WHERE staff_id = %s", 
-                      (hashed_password.decode('utf-8'), staff_id))
-        db.commit()
-        db.close()
-        return True, "Password changed successfully"
+        return UserService._change_password('staff', 'staff_id', staff_id, old_password, new_password,
+                                            "Staff not found")
 
     # ==================== HELPER FUNCTIONS ====================
 
@@ -0,0 +1,58 @@
+"""
+Payment endpoint tests - Flask test client against a throwaway SQLite database
+Run from the project root: python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import db_config
+from services import OrderService, ProductService, UserService
+from services.catalog_cache import catalog_cache
+
+CARD = {'card_number': '4111111111111111', 'expiry': '12/30', 'cvv': '123', 'cardholder_name': 'Test'}
+
+
+@pytest.fixture
+def client(tmp_path):
+    db_config.use_backend('sqlite', str(tmp_path / 'grocery.db'))
+    catalog_cache.invalidate()
+    from api import create_app
+    app = create_app({'TESTING': True, 'SECRET_KEY': 'test'})
+    return app.test_client()
+
+
+@pytest.fixture
+def customer(client):
+    """Auth header of a customer with one product in the cart"""
+    category_id = ProductService.get_all_categories()[0][0]
+    product_id = ProductService.add_product('Test Milk', category_id, '', None, 2.0, 'l', 50)
+    UserService.register_user('payer', 'secret123', 'payer@example.com', 'Payer', '0300', 'Street 1')
+    token = client.post('/api/auth/login', json={'username': 'payer', 'password': 'secret123'}).get_json()['token']
+    headers = {'Authorization': f'Bearer {token}'}
+    user_id = UserService.login_user('payer', 'secret123')[0]
+    OrderService.add_to_cart(user_id, product_id, 2)
+    return headers
+
+
+def test_card_payment_returns_token(client, customer):
+    response = client.post('/api/payments/card', json=CARD, headers=customer)
+    assert response.status_code == 200
+    assert response.get_json()['payment_token']
+
+
+def test_non_text_card_field_is_rejected(client, customer):
+    response = client.post('/api/payments/card', json=dict(CARD, card_number=4111111111111111),
+                           headers=customer)
+    assert response.status_code == 400
+    assert 'card_number' in response.get_json()['error']
+
+
+def test_missing_card_field_is_rejected(client, customer):
+    body = dict(CARD)
+    del body['cvv']
+    response = client.post('/api/payments/card', json=body, headers=customer)
+    assert response.status_code == 400
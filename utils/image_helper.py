@@ -6,6 +6,8 @@ import shutil
 from tkinter import filedialog
 from PIL import Image, ImageTk
 
+from services.thumbnail_service import ThumbnailService
+
 # Image directory
 IMAGE_DIR = "product_images"
 DEFAULT_IMAGE = os.path.join(IMAGE_DIR, "default.png")
@@ -66,10 +68,15 @@ def save_product_image(source_path, product_name):
     try:
         shutil.copy2(source_path, dest_path)
         print(f"✓ Image copied: {source_path} -> {dest_filename}")
-        return dest_filename  # Return relative path
     except Exception as e:
         print(f"Error saving image: {e}")
         return None
+    
+    try:
+        ThumbnailService.generate_thumbnails(dest_path)
+    except Exception as e:
+        print(f"Could not generate thumbnails for {dest_filename}: {e}")
+    return dest_filename  # Return relative path
 
 def load_image_for_display(image_path, size=(100, 100)):
     """Load and resize image for tkinter display"""
@@ -90,7 +97,7 @@ def load_image_for_display(image_path, size=(100, 100)):
         for path in paths_to_try:
             if os.path.exists(path):
                 try:
-                    img = Image.open(path)
+                    img = ThumbnailService.get_thumbnail(path, size)
                     break
                 except Exception as e:
                     print(f"Failed to open {path}: {e}")
@@ -101,7 +108,6 @@ def load_image_for_display(image_path, size=(100, 100)):
             print(f"Could not load image: {image_path}, using placeholder")
             img = Image.new('RGB', size, color='#E0E0E0')
         
-        img = img.resize(size, Image.Resampling.LANCZOS)
         return ImageTk.PhotoImage(img)
     except Exception as e:
         print(f"Error loading image {image_path}: {e}")